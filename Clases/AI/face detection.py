@@ -1,9 +1,11 @@
 import cv2
-import mediapipe as mp
+import os
+import sys
 
-# Inicializar MediaPipe Face Detection
-mp_face_detection = mp.solutions.face_detection
-mp_drawing = mp.solutions.drawing_utils
+# Raíz del repositorio en el path para importar tello_utils
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from tello_utils.cadencia import CadenciaAdaptativa
+from tello_utils.detectores import Preprocesador, DetectorRostros
 
 # Parámetros de control
 threshold_x = 50
@@ -11,35 +13,34 @@ threshold_y = 50
 
 # Iniciar captura de video
 cap = cv2.VideoCapture(0)
+preprocesador = Preprocesador(espejo=True)
 
-with mp_face_detection.FaceDetection(model_selection=0, min_detection_confidence=0.6) as face_detection:
+# MediaPipe Face Detection (detector de tello_utils.detectores). El modelo
+# solo corre si hubo movimiento o el último resultado no fue confiable
+with DetectorRostros(modelo=0, confianza_deteccion=0.6, cadencia=CadenciaAdaptativa()) as detector:
     while True:
         ret, frame = cap.read()
         if not ret:
             break
 
         # Flip horizontal para efecto espejo
-        frame = cv2.flip(frame, 1)
+        preparado = preprocesador.preparar(frame)
+        frame = preparado.bgr
         h, w, _ = frame.shape
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
         # Detección de rostro
-        results = face_detection.process(frame_rgb)
+        rostros = detector.detectar(preparado)
 
         # Calcular centro de la imagen
         centro_img = (w // 2, h // 2)
 
-        if results.detections:
-            for detection in results.detections:
-                # Obtener bounding box normalizado (entre 0 y 1)
-                bbox = detection.location_data.relative_bounding_box
-                x = int(bbox.xmin * w)
-                y = int(bbox.ymin * h)
-                ancho = int(bbox.width * w)
-                alto = int(bbox.height * h)
+        if rostros:
+            for rostro in rostros:
+                # Bounding box en pixeles
+                x, y, ancho, alto = rostro.bbox
 
                 # Calcular centro del rostro
-                centro_rostro = (x + ancho // 2, y + alto // 2)
+                centro_rostro = (rostro.cx, rostro.cy)
 
                 # Dibujar bbox
                 cv2.rectangle(frame, (x, y), (x + ancho, y + alto), (0, 255, 0), 2)
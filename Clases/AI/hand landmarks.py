@@ -1,10 +1,19 @@
 import cv2
 import mediapipe as mp
+import os
+import sys
 
-# Inicializar MediaPipe Hands
+# Raíz del repositorio en el path para importar tello_utils
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from tello_utils.cadencia import CadenciaAdaptativa
+from tello_utils.detectores import Preprocesador, DetectorManos
+
+# Inicializar MediaPipe Hands (detector de tello_utils.detectores). El modelo
+# solo corre si hubo movimiento o el último resultado no fue confiable
 mp_hands = mp.solutions.hands
 mp_drawing = mp.solutions.drawing_utils
-hands = mp_hands.Hands(static_image_mode=False, max_num_hands=1, min_detection_confidence=0.7)
+detector = DetectorManos(max_manos=1, confianza_deteccion=0.7, cadencia=CadenciaAdaptativa())
+preprocesador = Preprocesador(espejo=True)
 
 # Coordenadas 
 thumb_tip = 4
@@ -24,26 +33,25 @@ while True:
     if not ret:
         break
 
-    # Flip para espejo
-    frame = cv2.flip(frame, 1)
+    # Flip para espejo (el RGB para el modelo se calcula una vez, si corre)
+    preparado = preprocesador.preparar(frame)
+    frame = preparado.bgr
     h, w, _ = frame.shape
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
-    result = hands.process(rgb)
+    manos = detector.detectar(preparado)
     label = "No se detecta mano"
 
-    if result.multi_hand_landmarks and result.multi_handedness:
-        hand_landmarks = result.multi_hand_landmarks[0]
-        handedness = result.multi_handedness[0]
+    if manos:
+        mano = manos[0]
 
-        landmarks = hand_landmarks.landmark
-        if landmarks[thumb_tip].y < landmarks[index_base].y:
+        landmarks = mano.landmarks          # (21, 3): x, y, z normalizados
+        if landmarks[thumb_tip, 1] < landmarks[index_base, 1]:
             label = "Pulgar arriba detectado"
         else:
             label = "Otro gesto"
 
         # Dibujar puntos de la mano
-        mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+        mp_drawing.draw_landmarks(frame, mano.crudo, mp_hands.HAND_CONNECTIONS)
 
     # Mostrar resultado
     cv2.putText(frame, label, (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 255, 0), 3)
@@ -1,5 +1,12 @@
 import cv2
 import mediapipe as mp
+import os
+import sys
+
+# Raíz del repositorio en el path para importar tello_utils
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from tello_utils.cadencia import CadenciaAdaptativa
+from tello_utils.detectores import Preprocesador, DetectorPose
 
 # Inicializar MediaPipe Pose
 mp_pose = mp.solutions.pose
@@ -7,33 +14,39 @@ mp_drawing = mp.solutions.drawing_utils
 
 # Captura de video
 cap = cv2.VideoCapture(0)
+preprocesador = Preprocesador(espejo=True)
 
-with mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5) as pose:
+# Detector de pose de tello_utils.detectores. El modelo solo corre si hubo
+# movimiento o el último resultado no fue confiable
+with DetectorPose(confianza_deteccion=0.5, confianza_seguimiento=0.5, cadencia=CadenciaAdaptativa()) as detector:
     while True:
         ret, frame = cap.read()
         if not ret:
             break
 
         # Espejo
-        frame = cv2.flip(frame, 1)
+        preparado = preprocesador.preparar(frame)
+        frame = preparado.bgr
         h, w, _ = frame.shape
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
-        results = pose.process(rgb)
+        poses = detector.detectar(preparado)
 
-        if results.pose_landmarks:
-            mp_drawing.draw_landmarks(frame, results.pose_landmarks, mp_pose.POSE_CONNECTIONS)
+        if poses:
+            pose = poses[0]
+            mp_drawing.draw_landmarks(frame, pose.crudo, mp_pose.POSE_CONNECTIONS)
 
-            hombro_izq = results.pose_landmarks.landmark[mp_pose.PoseLandmark.LEFT_SHOULDER.value]
-            codo_izq = results.pose_landmarks.landmark[mp_pose.PoseLandmark.LEFT_ELBOW.value]
-            muneca_izq = results.pose_landmarks.landmark[mp_pose.PoseLandmark.LEFT_WRIST.value]
+            # Coordenada y (normalizada) de cada articulación
+            y = pose.landmarks[:, 1]
+            hombro_izq = y[mp_pose.PoseLandmark.LEFT_SHOULDER.value]
+            codo_izq = y[mp_pose.PoseLandmark.LEFT_ELBOW.value]
+            muneca_izq = y[mp_pose.PoseLandmark.LEFT_WRIST.value]
 
-            hombro_der = results.pose_landmarks.landmark[mp_pose.PoseLandmark.RIGHT_SHOULDER.value]
-            codo_der = results.pose_landmarks.landmark[mp_pose.PoseLandmark.RIGHT_ELBOW.value]
-            muneca_der = results.pose_landmarks.landmark[mp_pose.PoseLandmark.RIGHT_WRIST.value]
+            hombro_der = y[mp_pose.PoseLandmark.RIGHT_SHOULDER.value]
+            codo_der = y[mp_pose.PoseLandmark.RIGHT_ELBOW.value]
+            muneca_der = y[mp_pose.PoseLandmark.RIGHT_WRIST.value]
 
             # Verificar si ambas muñecas están por encima de los hombros y extendidas hacia arriba
-            if (muneca_izq.y < hombro_izq.y) and (codo_izq.y < hombro_izq.y) and (muneca_der.y < hombro_der.y) and (codo_der.y < hombro_der.y):
+            if (muneca_izq < hombro_izq) and (codo_izq < hombro_izq) and (muneca_der < hombro_der) and (codo_der < hombro_der):
                 mensaje = "Despegue activado"
             else:
                 mensaje = "Esperando comando"
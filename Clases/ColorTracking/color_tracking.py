@@ -2,6 +2,13 @@ import cv2
 # pip install opencv-python
 import numpy as np
 # pip install numpy
+import os
+import sys
+
+# Raíz del repositorio en el path para importar tello_utils
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from tello_utils.segmentacion import SegmentadorHSV, SegmentadorMultiColor, objetivo_de_mascara
+from tello_utils.clasificador import PRESETS_HSV
 
 width = 800
 height = 600
@@ -39,6 +46,17 @@ V_Max_init = 255
 
 area_min = 0.05 * (width * height)
 
+# Motor de segmentación: blur 15x15 y 2 iteraciones de erosión/dilatación,
+# con buffers preasignados del tamaño de la ventana
+segmentador = SegmentadorHSV(width, height, blur_ksize=15, iteraciones=2)
+
+# Modo multicolor: además del rango de las trackbars, busca todos los presets
+# compartiendo la conversión HSV y el desenfoque del frame
+MODO_MULTICOLOR = False
+area_min_multi = 0.002 * (width * height)
+colores_dibujo = {'Verde Rubix': (0, 255, 0), 'Amarillo Rubix': (0, 255, 255), 'USB Azul': (255, 0, 0)}
+multicolor = SegmentadorMultiColor(width, height, PRESETS_HSV, blur_ksize=15, iteraciones=2)
+
 # Crea trackbars para ajustar los valores H, S, V
 cv2.createTrackbar('H Min', 'Trackbars', H_Min_init , 179, callback)
 cv2.createTrackbar('H Max', 'Trackbars', H_Max_init , 179, callback)
@@ -54,10 +72,7 @@ while True:
     if not ret:
         break
 
-    frame = cv2.resize(frame, (width, height)) 
-
-    # Convierte la imagen de BGR a HSV
-    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    frame = segmentador.redimensionar(frame)
 
     # Obtiene los valores de las trackbars
     h_min = cv2.getTrackbarPos('H Min', 'Trackbars')
@@ -68,21 +83,26 @@ while True:
     v_max = cv2.getTrackbarPos('V Max', 'Trackbars')
 
     # Define los límites del filtro HSV
-    lower_hsv = np.array([h_min, s_min, v_min])
-    upper_hsv = np.array([h_max, s_max, v_max])
-
-    # Aplica desenfoque gaussiano para reducir el ruido
-    blurred = cv2.GaussianBlur(hsv, (15, 15), 0)
-
-    # Aplica el filtro de color en la imagen desenfocada
-    mask = cv2.inRange(blurred, lower_hsv, upper_hsv)
-
-    # Erosión y dilatación para eliminar ruido en la máscara
-    mask = cv2.erode(mask, None, iterations=2)
-    mask = cv2.dilate(mask, None, iterations=2)
+    lower_hsv = (h_min, s_min, v_min)
+    upper_hsv = (h_max, s_max, v_max)
+
+    if MODO_MULTICOLOR:
+        # Una sola conversión HSV + blur para las trackbars y todos los presets
+        multicolor.definir('Trackbars', lower_hsv, upper_hsv)
+        mascaras = multicolor.mascaras(multicolor.convertir(frame))
+        mask = mascaras.pop('Trackbars')
+        for nombre, mascara in mascaras.items():
+            objetivo = objetivo_de_mascara(nombre, mascara, area_min_multi)
+            if objetivo is not None:
+                x, y, w, h = objetivo.bbox
+                cv2.rectangle(frame, (x, y), (x + w, y + h), colores_dibujo[nombre], 3)
+                cv2.putText(frame, nombre, (x, y - 8), cv2.FONT_HERSHEY_SIMPLEX, 0.6, colores_dibujo[nombre], 2)
+    else:
+        # BGR -> HSV, desenfoque, filtro de color y erosión/dilatación en un solo paso
+        mask = segmentador.procesar(frame, lower_hsv, upper_hsv)
 
     # Aplica la máscara a la imagen original
-    result = cv2.bitwise_and(frame, frame, mask=mask)
+    result = segmentador.aplicar_mascara(frame, mask)
 
     # Encuentra objetos segun el filtro de color
     contours, hierarchy = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
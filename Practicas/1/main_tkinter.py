@@ -18,12 +18,30 @@ Fecha de entrega:
 from djitellopy import Tello           # Librería para controlar drones Tello
 import cv2                             # Librería para visión por computadora
 import time                            # Para funciones de tiempo
-import tkinter as tk                   # Para interfaz gráfica (GUI)
-from PIL import Image, ImageTk         # Para convertir imágenes a formato compatible con Tkinter
+import os
+import sys
+
+# Raíz del repositorio en el path para importar tello_utils
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from tello_utils.asincrono import RuntimeAsyncio
+from tello_utils.comandos import CommandScheduler
+from tello_utils.interfaz import cargar_config, crear_raiz, PanelTk, Metricas
+from tello_utils.overlay import Overlay
+from tello_utils.perfilado import Perfilador
 
 # Tamaño de la ventana de video
 width, height = 1280, 960
 
+# Configuración de ejecución (TELLO_CONFIG=archivo.json o TELLO_HEADLESS=1):
+# en headless no se abre la ventana y solo se imprimen métricas
+config = cargar_config()
+HEADLESS = config['headless']
+OVERLAY = config['overlay']
+metricas = Metricas('P1', cada_s=config['metricas_cada_s'], ruta=config['metricas'])
+
+# Perfilado de update_frame: tecla 'p' o "perfil": "perfil_p1.folded" en la configuración
+perfil = Perfilador('P1', activo=bool(config.get('perfil')))
+
 # Inicialización del dron
 drone = Tello()
 drone.connect()          # Conecta al dron vía WiFi
@@ -34,6 +52,10 @@ time.sleep(3)            # Da tiempo para que el stream se estabilice
 # Muestra el nivel de batería al comenzar
 print(f'Batería: {drone.get_battery()}%')
 
+# Hilo que envía rc a frecuencia fija; teclado y loop solo publican el setpoint
+rc = CommandScheduler(drone, frecuencia=30, keepalive=0.5)
+rc.iniciar()
+
 # Bandera que indica si el dron está volando
 flying = False
 
@@ -45,13 +67,27 @@ warning_msg = ""             # Mensaje de advertencia actual
 warning_time = 0             # Momento en que se mostró la advertencia
 WARNING_DURATION = 3         # Duración de la advertencia en pantalla (segundos)
 
-# Crear ventana principal
-root = tk.Tk()
-root.title("Drone Camera")
+# Crear ventana principal (o bucle sin ventana en headless)
+root = crear_raiz(config, "Drone Camera")
+
+# Runtime de asyncio: el loop de video y la ventana son tareas, y takeoff/land
+# corren en un hilo aparte para no congelar el video mientras el dron responde
+runtime = RuntimeAsyncio(root)
 
 # Componente donde se mostrará el video
-label = tk.Label(root)
-label.pack()
+if not HEADLESS:
+    import tkinter as tk
+    label = tk.Label(root)
+    label.pack()
+    # Una sola PhotoImage que se actualiza en su lugar (redibujo limitado a 60 Hz)
+    panel = PanelTk(label, width, height)
+
+# HUD: cada texto se vuelve a dibujar solo cuando cambia su valor
+hud = Overlay(width, height)
+hud.campo('bateria', (10, 20))
+hud.campo('altura', (10, 45))
+hud.campo('estado', (10, 70))
+hud.campo('aviso', (10, height - 30), escala=0.7, color=(0, 0, 255))
 
 # Variables de velocidad por cada eje de movimiento
 lr_vel = 0    # Izquierda / Derecha
@@ -66,16 +102,55 @@ def clean_exit():
     """
     global flying
     print("\nInterrupción detectada. Cerrando el programa...")
+    runtime.terminar_accion()
     if flying:
-        drone.send_rc_control(0, 0, 0, 0)
+        rc.pausar()
         time.sleep(0.5)
         drone.land()
         flying = False
+    rc.detener()
+    print(f"Comandos rc: {rc.resumen()}")
+    print(f"Runtime: {runtime.resumen()}")
+    metricas.cerrar()
+    if perfil.muestras:
+        print(perfil.tabla())
+        ruta = config.get('perfil') or 'perfil_p1.folded'
+        print(f"Perfil: {perfil.exportar(ruta)} pilas en {ruta}")
     drone.streamoff()
     drone.end()
     print("Programa cerrado correctamente.")
-    root.destroy()
+    runtime.detener()
 
+def despegar():
+    """
+    takeoff en un hilo del runtime: el video sigue mientras el dron sube.
+    flying se marca de inmediato (rc sigue en pausa hasta que el dron confirma).
+    """
+    global flying
+    if runtime.accion('takeoff', drone.takeoff, al_terminar=al_despegar) is not None:
+        flying = True
+
+def al_despegar(ok):
+    """Confirmación del takeoff: empieza a enviar rc, o regresa a tierra si falló."""
+    global flying
+    if runtime.accion_en_curso is not None:
+        # Se pidió aterrizar durante el despegue: el land ya está en cola
+        return
+    flying = ok
+    if ok:
+        rc.reanudar()
+
+def aterrizar():
+    """
+    Hover inmediato y land en un hilo del runtime tras 0.5 s (antes: time.sleep
+    en la GUI); si el takeoff aún no regresa, el land queda en cola tras él.
+    """
+    global flying
+    rc.pausar()
+    flying = False
+    runtime.accion('land', drone.land, espera_s=0.5, encolar=True)
+
+@perfil.medir
 def update_frame():
     """
     Captura y actualiza el frame de video en la interfaz gráfica.
@@ -83,32 +158,36 @@ def update_frame():
     """
     global fb_vel, lr_vel, ud_vel, yaw_vel, flying, warning_msg, warning_time
     try:
+        t_inicio = time.perf_counter()
+
         # Captura el frame actual del dron
         frame = drone.get_frame_read().frame
-        frame = cv2.resize(frame, (width, height))
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
         # Obtiene datos del dron
         bateria = drone.get_battery()
         altura = drone.get_height()
         estado = "Volando" if flying else "Detenido"
 
-        # Superpone texto informativo
-        cv2.putText(frame, f'Bateria: {bateria}%', (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-        cv2.putText(frame, f'Altura: {altura}cm', (10, 45), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-        cv2.putText(frame, f'Estado: {estado}', (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+        # Despliegue (solo con ventana): escala, overlay y panel de Tkinter
+        t_gui = time.perf_counter()
+        if not HEADLESS:
+            frame = cv2.resize(frame, (width, height))
 
-        # Muestra advertencia si sigue vigente
-        if warning_msg and time.time() - warning_time < WARNING_DURATION:
-            cv2.putText(frame, warning_msg, (10, height - 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2)
-        else:
-            warning_msg = ""
+            # Muestra advertencia si sigue vigente
+            if not (warning_msg and time.time() - warning_time < WARNING_DURATION):
+                warning_msg = ""
 
-        # Convierte a formato compatible con Tkinter
-        img = Image.fromarray(frame)
-        imgtk = ImageTk.PhotoImage(image=img)
-        label.imgtk = imgtk
-        label.configure(image=imgtk)
+            # Superpone texto informativo
+            if OVERLAY:
+                hud.campos['bateria'].fijar(f'Bateria: {bateria}%')
+                hud.campos['altura'].fijar(f'Altura: {altura}cm')
+                hud.campos['estado'].fijar(f'Estado: {estado}')
+                hud.campos['aviso'].fijar(warning_msg)
+                hud.componer(frame)
+
+            # El panel convierte BGR→RGBA sobre su PhotoImage persistente
+            panel.mostrar(frame)
+        gui_s = time.perf_counter() - t_gui
 
         # Seguridad: aterrizaje automático si batería crítica
         if flying and bateria <= 10:
@@ -116,18 +195,9 @@ def update_frame():
             print(f"\n{msg}")
             warning_msg = msg
             warning_time = time.time()
-            drone.land()
-            flying = False
-
-        # Envía comandos de movimiento si está en el aire
-        if flying:
-            if lr_vel == 0 and fb_vel == 0 and ud_vel == 0 and yaw_vel == 0:
-                drone.send_rc_control(0, 0, 0, 0)
-            else:
-                drone.send_rc_control(lr_vel, fb_vel, ud_vel, yaw_vel)
+            aterrizar()
 
-        # Repite cada 30ms (frecuencia de actualización de video)
-        label.after(30, update_frame)
+        metricas.frame(time.perf_counter() - t_inicio - gui_s, gui_s)
 
     except Exception as e:
         print(f"Error al actualizar frame: {e}")
@@ -145,6 +215,10 @@ def key_press(event):
         print("\nTecla M presionada. Saliendo del programa...")
         clean_exit()
 
+    elif key == 'p':
+        perfil.alternar()
+        return
+
     elif key == 't':
         # Intenta despegar si no está volando y la batería es suficiente
         if not flying:
@@ -155,17 +229,13 @@ def key_press(event):
                 warning_time = time.time()
                 return
             print("Despegando...")
-            drone.takeoff()
-            flying = True
+            despegar()
 
     elif key == 'l':
         # Aterriza si está volando
         if flying:
             print("Aterrizando...")
-            drone.send_rc_control(0, 0, 0, 0)
-            time.sleep(0.5)
-            drone.land()
-            flying = False
+            aterrizar()
 
     # Movimiento direccional
     elif key == 'w':
@@ -193,6 +263,9 @@ def key_press(event):
     elif key == 'q':
         yaw_vel = -60
 
+    # Publica el setpoint; el hilo de comandos lo envía en su siguiente tick
+    rc.fijar(lr_vel, fb_vel, ud_vel, yaw_vel)
+
 def key_release(event):
     """
     Detiene el movimiento correspondiente al soltar la tecla.
@@ -207,16 +280,19 @@ def key_release(event):
         ud_vel = 0
     elif key in ['e', 'q']:
         yaw_vel = 0
+    rc.fijar(lr_vel, fb_vel, ud_vel, yaw_vel)
 
 # Asigna funciones a eventos de teclado
 root.bind("<KeyPress>", key_press)
 root.bind("<KeyRelease>", key_release)
 
-# Inicia el ciclo principal de actualización de video
-update_frame()
+# Ciclo de actualización de video: tarea del runtime cada 30 ms
+if config['duracion_s']:
+    runtime.after(int(config['duracion_s'] * 1000), clean_exit)
+runtime.cada(0.03, update_frame)
 
 # Ejecuta la interfaz hasta que se cierre manualmente o con tecla 'm'
 try:
-    root.mainloop()
+    runtime.correr()
 except KeyboardInterrupt:
     clean_exit()
@@ -3,6 +3,12 @@ import cv2
 import time
 import tkinter as tk
 from PIL import Image, ImageTk
+import os
+import sys
+
+# Raíz del repositorio en el path para importar tello_utils
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from tello_utils.overlay import Overlay
 
 # Tamaño del video en la interfaz
 width, height = 640, 480
@@ -55,9 +61,10 @@ def clean_exit():
     print("Programa cerrado correctamente.")
     root.destroy()
 
-def draw_help(frame):
+def draw_help(capa):
     """
-    Dibuja el panel de ayuda con los controles sobre el frame.
+    Dibuja una sola vez el panel de ayuda con los controles en una capa
+    estática del HUD; por frame solo se compone.
     """
     lines = [
         "Controles:",
@@ -70,9 +77,17 @@ def draw_help(frame):
     ]
     y = 100
     for line in lines:
-        cv2.putText(frame, line, (10, y), cv2.FONT_HERSHEY_PLAIN, 1.1, (255, 255, 255), 1)
+        capa.texto(line, (10, y), 1.1, (255, 255, 255), 1, cv2.FONT_HERSHEY_PLAIN)
         y += 18
 
+# HUD: ayuda fija en una capa y textos de estado que solo se vuelven a
+# dibujar cuando cambian
+hud = Overlay(width, height)
+draw_help(hud.capa('ayuda'))
+hud.campo('bateria', (10, 20))
+hud.campo('altura', (10, 45))
+hud.campo('estado', (10, 70))
+
 def update_frame():
     global fb_vel, lr_vel, ud_vel, yaw_vel, flying
     try:
@@ -84,11 +99,10 @@ def update_frame():
         altura = drone.get_height()
         estado = "Volando" if flying else "Detenido"
 
-        cv2.putText(frame, f'Bateria: {bateria}%', (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-        cv2.putText(frame, f'Altura: {altura}cm', (10, 45), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-        cv2.putText(frame, f'Estado: {estado}', (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-
-        draw_help(frame)
+        hud.campos['bateria'].fijar(f'Bateria: {bateria}%')
+        hud.campos['altura'].fijar(f'Altura: {altura}cm')
+        hud.campos['estado'].fijar(f'Estado: {estado}')
+        hud.componer(frame)
 
         img = Image.fromarray(frame)
         imgtk = ImageTk.PhotoImage(image=img)
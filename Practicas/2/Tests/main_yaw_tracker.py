@@ -13,6 +13,11 @@ import time
 import tkinter as tk
 from PIL import Image, ImageTk
 import sys
+import os
+
+# Raíz del repositorio en el path para importar tello_utils
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from tello_utils.pid import PID, GANANCIAS_SEGUIMIENTO
 
 # ───────────────────────────
 # Configuración general
@@ -25,6 +30,10 @@ area_min = 0.001 * (width * height)
 MAX_HEIGHT_CM = 300
 WARNING_DURATION = 3
 speed = 60
+YAW_SPEED = 15  # Velocidad máxima del seguimiento en yaw
+
+# Controlador PID por eje (salida limitada por YAW_SPEED)
+pid_yaw = PID(*GANANCIAS_SEGUIMIENTO['yaw'], zona_muerta=5)
 
 # ───────────────────────────
 # Variables de estado globales
@@ -234,6 +243,7 @@ def update_frame():
 
     try:
         frame = drone.get_frame_read().frame
+        t_frame = time.monotonic()  # Tiempo del frame para el dt de los PID
         frame = cv2.resize(frame, (width, height))
         hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
 
@@ -248,13 +258,10 @@ def update_frame():
 
         # Seguimiento automático yaw (si no hay input manual)
         if flying and follow_yaw and center_object_x is not None and not manual_yaw:
-            center_x = width // 2
-            if center_object_x < (center_x - x_threshold):
-                yaw_vel = -15
-            elif center_object_x > (center_x + x_threshold):
-                yaw_vel = 15
-            else:
-                yaw_vel = 0  # En el centro
+            pid_yaw.limite = YAW_SPEED
+            yaw_vel = pid_yaw.actualizar(center_object_x - width // 2, t_frame)
+        else:
+            pid_yaw.reiniciar()
 
         # Enviar comandos de movimiento
         if flying:
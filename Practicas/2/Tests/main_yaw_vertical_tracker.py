@@ -13,6 +13,11 @@ import time
 import tkinter as tk
 from PIL import Image, ImageTk
 import sys
+import os
+
+# Raíz del repositorio en el path para importar tello_utils
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from tello_utils.pid import PID, GANANCIAS_SEGUIMIENTO
 
 # ───────────────────────────
 # Configuración general
@@ -26,6 +31,10 @@ MAX_HEIGHT_CM = 300
 WARNING_DURATION = 3
 speed = 20
 
+# Controlador PID por eje (salida limitada por la velocidad)
+pid_yaw = PID(*GANANCIAS_SEGUIMIENTO['yaw'], zona_muerta=5)
+pid_ud = PID(*GANANCIAS_SEGUIMIENTO['ud'], zona_muerta=5)
+
 # ───────────────────────────
 # Variables de estado globales
 # ───────────────────────────
@@ -245,6 +254,7 @@ def update_frame():
 
     try:
         frame = drone.get_frame_read().frame
+        t_frame = time.monotonic()  # Tiempo del frame para el dt de los PID
         frame = cv2.resize(frame, (width, height))
         hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
 
@@ -259,23 +269,17 @@ def update_frame():
 
         # Seguimiento automático yaw
         if flying and follow_yaw and center_object_x is not None and not manual_yaw:
-            center_x = width // 2
-            if center_object_x < (center_x - x_threshold):
-                yaw_vel = -speed
-            elif center_object_x > (center_x + x_threshold):
-                yaw_vel = speed
-            else:
-                yaw_vel = 0
+            pid_yaw.limite = speed
+            yaw_vel = pid_yaw.actualizar(center_object_x - width // 2, t_frame)
+        else:
+            pid_yaw.reiniciar()
 
         # Seguimiento automático vertical (ud_vel)
         if flying and follow_yaw and center_object_y is not None and not manual_ud:
-            center_y = height // 2
-            if center_object_y < (center_y - y_threshold):
-                ud_vel = speed
-            elif center_object_y > (center_y + y_threshold):
-                ud_vel = -speed
-            else:
-                ud_vel = 0
+            pid_ud.limite = speed
+            ud_vel = pid_ud.actualizar(height // 2 - center_object_y, t_frame)
+        else:
+            pid_ud.reiniciar()
 
         if flying:
             drone.send_rc_control(lr_vel, fb_vel, ud_vel, yaw_vel)
@@ -15,13 +15,30 @@ Fecha de entrega:
     12 de mayo de 2025
 """
 
-from djitellopy import Tello
 import cv2
 import numpy as np
 import time
-import tkinter as tk
-from PIL import Image, ImageTk
 import sys
+import os
+
+# Raíz del repositorio en el path para importar tello_utils
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from tello_utils.captura import CapturaTello, FrameGrabber
+from tello_utils.telemetria import TelemetryCache
+from tello_utils.segmentacion import SegmentadorHSV, SegmentadorMultiColor, elegir_objetivo
+from tello_utils.clasificador import ClasificadorLUT, PRESETS_HSV
+from tello_utils.roi import RastreadorROI
+from tello_utils.kalman import FiltroKalmanObjetivo
+from tello_utils.pid import PID, GANANCIAS_SEGUIMIENTO, error_distancia
+from tello_utils.comandos import CommandScheduler
+from tello_utils.asincrono import RuntimeAsyncio
+from tello_utils.grabacion import GrabadorSesion
+from tello_utils.conexion import crear_dron, finalizar
+from tello_utils.interfaz import cargar_config, crear_raiz, PanelTk, Metricas
+from tello_utils.overlay import Overlay
+from tello_utils.trazas import Trazador
+from tello_utils.perfilado import Perfilador
+from tello_utils.multiproceso import PipelineMultiproceso, detector_hsv
 
 # =============================================================================
 # CONFIGURACIÓN GLOBAL
@@ -41,11 +58,48 @@ area_min = 0.001 * (width * height)  # Área mínima dinámica de detección
 MAX_HEIGHT_CM = 300  # Altura máxima permitida
 WARNING_DURATION = 3  # Duración de mensajes de advertencia
 speed = 20  # Velocidad base
+POLL_MS = 5  # Espera entre revisiones cuando aún no llega un frame nuevo
 
 # Umbrales para mantener distancia frente al objeto detectado
 AREA_TOO_SMALL = 1500
 AREA_TOO_LARGE = 20000
 
+# Clasificación por tabla (LUT) en lugar de cv2.inRange. Con un solo rango
+# inRange suele ganar; correr benchmarks/bench_clasificador.py en cada laptop
+USAR_LUT = False
+
+# Motor de segmentación con buffers del tamaño del stream (sin asignar memoria por frame)
+segmentador = SegmentadorHSV(width, height, iteraciones=1,
+                             clasificador=ClasificadorLUT() if USAR_LUT else None)
+
+# Modo multicolor: segmenta todos los presets con una sola conversión HSV
+# y sigue al primero detectado según PRIORIDAD_COLORES
+MODO_MULTICOLOR = False
+PRIORIDAD_COLORES = ['Verde Rubix', 'Amarillo Rubix', 'USB Azul']
+COLORES_DIBUJO = {'Verde Rubix': (0, 255, 0), 'Amarillo Rubix': (0, 255, 255), 'USB Azul': (255, 0, 0)}
+multicolor = SegmentadorMultiColor(width, height, PRESETS_HSV, iteraciones=1)
+
+# Modo ROI: con el objeto ubicado, segmenta solo una ventana alrededor de su
+# posición predicha; tras ROI_MAX_FALLOS fallos vuelve a buscar en todo el frame
+MODO_ROI = True
+ROI_MAX_FALLOS = 5
+roi = RastreadorROI(width, height, max_fallos=ROI_MAX_FALLOS)
+
+# Filtro de Kalman del objetivo: suaviza centro/área para los controladores y
+# predice durante huecos; la detección corre cada DETECTAR_CADA frames y en
+# los intermedios el control usa la predicción
+DETECTAR_CADA = 2
+kalman = FiltroKalmanObjetivo(max_prediccion=0.5)
+
+# Controladores PID por eje: la salida es proporcional al error y el trackbar
+# Speed pasa a ser el límite de velocidad. Con USAR_PID = False se usan los
+# escalones -speed / 0 / +speed originales
+USAR_PID = True
+AREA_OBJETIVO = (AREA_TOO_SMALL * AREA_TOO_LARGE) ** 0.5  # Centro (geométrico) del rango de distancia
+pid_yaw = PID(*GANANCIAS_SEGUIMIENTO['yaw'], zona_muerta=5)
+pid_ud = PID(*GANANCIAS_SEGUIMIENTO['ud'], zona_muerta=5)
+pid_fb = PID(*GANANCIAS_SEGUIMIENTO['fb'], zona_muerta=10)
+
 # ───────────────────────────
 # Variables de estado globales
 # ───────────────────────────
@@ -63,31 +117,111 @@ manual_fb = False
 center_object_x = None
 center_object_y = None
 area = None
+ultimo_seq = 0  # Secuencia del último frame procesado
+procesados = 0  # Frames procesados (el seq salta los que descartó el grabber)
 
 # ───────────────────────────
-# Rango HSV inicial - Amarillo Rubix
+# Rango HSV inicial ('Verde Rubix', 'Amarillo Rubix', 'USB Azul')
 # ───────────────────────────
-#H_Min_init, H_Max_init = 20, 40
-#S_Min_init, S_Max_init = 148, 255
-#V_Min_init, V_Max_init = 89, 255
+PRESET_INICIAL = 'Verde Rubix'
+(H_Min_init, S_Min_init, V_Min_init), (H_Max_init, S_Max_init, V_Max_init) = PRESETS_HSV[PRESET_INICIAL]
 
 # ───────────────────────────
-# Rango HSV inicial - Verde Rubix
+# Configuración de ejecución (TELLO_CONFIG=archivo.json o TELLO_HEADLESS=1)
+# En headless no hay ventanas ni trackbars: los parámetros salen del archivo
+# y el loop solo imprime métricas; overlay y ventana son salidas opcionales
 # ───────────────────────────
-H_Min_init, H_Max_init = 40, 80
-S_Min_init, S_Max_init = 50, 255
-V_Min_init, V_Max_init = 50, 255
+config = cargar_config(parametros={
+    'h_min': H_Min_init, 'h_max': H_Max_init,
+    's_min': S_Min_init, 's_max': S_Max_init,
+    'v_min': V_Min_init, 'v_max': V_Max_init,
+    'speed': speed, 'area_min': int(area_min),
+})
+HEADLESS = config['headless']
+OVERLAY = config['overlay']
+parametros = config['parametros']
+metricas = Metricas('P2', cada_s=config['metricas_cada_s'], ruta=config['metricas'])
+
+# Trazas por etapa de cada frame (decodificar → ... → enviar) y latencia
+# vidrio → comando; se activan con "trazas": "traza_p2.json" en la configuración
+traza = Trazador('P2', activo=bool(config.get('trazas')))
+
+# Perfilado de las funciones calientes (tiempo, llamadas y objetos creados):
+# tecla 'p' o "perfil": "perfil_p2.folded" en la configuración
+perfil = Perfilador('P2', activo=bool(config.get('perfil')))
+
+# HUD: las guías se dibujan una sola vez en una capa y cada texto es un campo
+# que solo se vuelve a dibujar cuando cambia su valor (ver draw_guides/draw_status)
+hud = Overlay(width, height)
+for nombre, org in (('bateria', (10, 20)), ('altura', (10, 45)), ('estado', (10, 70)),
+                    ('objetivo', (10, 150)), ('centro', (10, height - 45)), ('area', (10, height - 75))):
+    hud.campo(nombre, org)
+hud.campo('speed', (width-150, 50), color=(0,255,255))
+hud.campo('telemetria', (width-250, 20), color=(0,0,255))
+hud.campo('aviso', (10, height-20), color=(0,0,255))
+hud.campo('direccion_x', (10, 110), escala=0.7)
+hud.campo('direccion_y', (10, 130), escala=0.7)
 
 # ───────────────────────────
 # Inicialización del dron
 # ───────────────────────────
-drone = Tello()
+drone = crear_dron()  # Tello real, o sesión grabada si TELLO_REPRODUCIR está definida
 drone.connect()
 drone.streamoff()
 drone.streamon()
 time.sleep(3)
 print(f'Batería: {drone.get_battery()}%')
 
+# Modo multiproceso ({"multiproceso": N} en la configuración): captura y N
+# procesos de detección HSV fuera del proceso de la interfaz, con los frames
+# en memoria compartida. Detecta en todos los frames (sin ROI ni DETECTAR_CADA)
+# y no aplica al modo multicolor ni a una reproducción.
+MULTIPROCESO = int(config.get('multiproceso', 0))
+if MULTIPROCESO and (MODO_MULTICOLOR or getattr(drone, 'reproduccion', False) or os.name == 'nt'):
+    print("Modo multiproceso no disponible aquí; se usa el hilo de captura")
+    MULTIPROCESO = 0
+
+pipeline = None
+if MULTIPROCESO:
+    direccion = drone.get_udp_video_address()
+    pipeline = PipelineMultiproceso(lambda: CapturaTello(direccion),
+                                    lambda: detector_hsv(width, height), width, height,
+                                    trabajadores=MULTIPROCESO, parametros=7, en_vivo=True)
+    pipeline.iniciar()
+    metricas.extras = pipeline.resumen
+    grabber = None
+    fuente = pipeline
+else:
+    # Hilo de captura: decodifica el stream y conserva solo el frame más reciente
+    grabber = FrameGrabber.desde_tello(drone)
+    grabber.trazador = traza
+    grabber.iniciar()
+    fuente = grabber
+
+# Caché de telemetría: un snapshot por paquete de estado para todos los consumidores
+telemetria = TelemetryCache(drone, max_edad=1.0)
+telemetria.iniciar()
+
+# Programador de comandos: envía rc a frecuencia fija, independiente de lo
+# que tarde el procesamiento de cada frame
+RC_HZ = 30
+rc = CommandScheduler(drone, frecuencia=RC_HZ, keepalive=0.5)
+rc.trazador = traza
+rc.iniciar()
+
+# Grabación de la sesión (frames, telemetría y comandos en un .tlog indexado)
+# para ajustar rangos HSV y seguidores sin volver a volar
+GRABAR = False
+grabador = None
+if GRABAR:
+    grabador = GrabadorSesion(time.strftime('sesion_p2_%Y%m%d_%H%M%S.tlog')).iniciar()
+    grabador.conectar(grabber=grabber, telemetria=telemetria, rc=rc)
+
+# En una reproducción el dron ya va "en el aire" para ejercitar los seguidores
+if getattr(drone, 'reproduccion', False):
+    flying = True
+    rc.reanudar()
+
 # ───────────────────────────
 # Trackbars
 # ───────────────────────────
@@ -119,6 +253,9 @@ def setup_trackbars():
 # Descripción: Obtiene valores actualizados de los controles deslizantes
 # =============================================================================
 def get_trackbar_values():
+    # En headless los valores son fijos (archivo de configuración)
+    if HEADLESS:
+        return parametros
     # Devuelve los valores actuales de los sliders
     return {
         'h_min': cv2.getTrackbarPos('H Min', 'Trackbars'),
@@ -127,33 +264,39 @@ def get_trackbar_values():
         's_max': cv2.getTrackbarPos('S Max', 'Trackbars'),
         'v_min': cv2.getTrackbarPos('V Min', 'Trackbars'),
         'v_max': cv2.getTrackbarPos('V Max', 'Trackbars'),
-        'speed': cv2.getTrackbarPos('Speed', 'Trackbars')
+        'speed': cv2.getTrackbarPos('Speed', 'Trackbars'),
+        'area_min': cv2.getTrackbarPos('Area Min', 'Trackbars')
     }
 
 # =============================================================================
-# detect_and_draw(frame, hsv, lower, upper)
+# detect_and_draw(frame, hsv, lower, upper, area_min_dynamic, ventana)
 # Params:
 #   frame: Imagen de video actual
-#   hsv: Versión en espacio de color HSV del frame
-#   lower/upper: Límites HSV para detección
-# Outputs: None (actualiza variables globales de posición/área)
+#   hsv: Versión en espacio de color HSV del frame (o solo de la ventana)
+#   lower/upper: Límites HSV para detección (tuplas h, s, v)
+#   area_min_dynamic: Área mínima del contorno (trackbar 'Area Min')
+#   ventana: (x0, y0, x1, y1) de la región convertida, o None si es el frame completo
+# Outputs: bbox (x, y, w, h) del objeto detectado o None (actualiza variables globales)
 # Descripción: Detecta objetos por color y dibuja contornos/marcadores
 # =============================================================================
-def detect_and_draw(frame, hsv, lower, upper):
+@perfil.medir
+def detect_and_draw(frame, hsv, lower, upper, area_min_dynamic, ventana=None):
     global center_object_x, center_object_y, area
 
     # Filtra por color y encuentra contornos del objeto
     center_object_x = None
     center_object_y = None
     area = None
+    bbox = None
 
-    mask = cv2.inRange(hsv, lower, upper)
-    mask = cv2.erode(mask, None, iterations=1)
-    mask = cv2.dilate(mask, None, iterations=1)
+    # inRange + erosión/dilatación sobre buffers preasignados
+    with traza.tramo('segmentar', ultimo_seq):
+        mask = segmentador.segmentar(hsv, lower, upper)
 
-    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
-
-    area_min_dynamic = cv2.getTrackbarPos('Area Min', 'Trackbars')
+    # Los contornos de la ventana se desplazan a coordenadas del frame completo
+    offset = (ventana[0], ventana[1]) if ventana is not None else (0, 0)
+    with traza.tramo('contornos', ultimo_seq):
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE, offset=offset)
 
     for cnt in contours:
         a = cv2.contourArea(cnt)
@@ -167,89 +310,168 @@ def detect_and_draw(frame, hsv, lower, upper):
             cy = y + h // 2
             center_object_x = cx
             center_object_y = cy
+            bbox = (x, y, w, h)
 
             # Dibuja contorno y línea al centro del objeto detectado
-            cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 255), 2)
-            cv2.line(frame, (width//2, height//2), (cx, cy), (0, 0, 255), 2)
-
-            # Muestra dirección del objeto respecto al centro
-            if cx < width // 2 - x_threshold:
-                cv2.putText(frame, "Izquierda", (10, 110), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-            elif cx > width // 2 + x_threshold:
-                cv2.putText(frame, "Derecha", (10, 110), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-            else:
-                cv2.putText(frame, "Centro X", (10, 110), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+            if OVERLAY:
+                cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 255), 2)
+                cv2.line(frame, (width//2, height//2), (cx, cy), (0, 0, 255), 2)
+                draw_direction(cx, cy)
 
-            if cy < height // 2 - y_threshold:
-                cv2.putText(frame, "Arriba", (10, 130), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-            elif cy > height // 2 + y_threshold:
-                cv2.putText(frame, "Abajo", (10, 130), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-            else:
-                cv2.putText(frame, "Centro Y", (10, 130), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+    return bbox
 
 # =============================================================================
-# draw_guides(frame)
-# Params: frame - Imagen donde dibujar
-# Outputs: None (modifica frame)
-# Descripción: Dibuja líneas guía para zona central de seguimiento
+# detect_multi_and_draw(frame, hsv, area_min_dynamic)
+# Params:
+#   frame: Imagen de video actual
+#   hsv: Versión en espacio de color HSV del frame
+#   area_min_dynamic: Área mínima del contorno (trackbar 'Area Min')
+# Outputs: None (actualiza variables globales de posición/área)
+# Descripción: Detecta todos los perfiles de color en una pasada y sigue al
+#              de mayor prioridad
 # =============================================================================
-def draw_guides(frame):
+@perfil.medir
+def detect_multi_and_draw(frame, hsv, area_min_dynamic):
+    global center_object_x, center_object_y, area
+
+    center_object_x = None
+    center_object_y = None
+    area = None
+
+    multicolor.area_min = area_min_dynamic
+    with traza.tramo('segmentar', ultimo_seq):
+        objetivos = multicolor.segmentar(hsv)
+
+    # Dibuja todos los objetos detectados con el color de su perfil
+    for obj in objetivos.values():
+        if obj is None or not OVERLAY:
+            continue
+        x, y, w, h = obj.bbox
+        color = COLORES_DIBUJO.get(obj.nombre, (255, 0, 255))
+        cv2.rectangle(frame, (x, y), (x + w, y + h), color, 2)
+        cv2.putText(frame, obj.nombre, (x, y - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
+
+    elegido = elegir_objetivo(objetivos, PRIORIDAD_COLORES)
+    if elegido is not None:
+        center_object_x = elegido.cx
+        center_object_y = elegido.cy
+        area = elegido.area
+        if not OVERLAY:
+            return
+        cv2.line(frame, (width//2, height//2), (elegido.cx, elegido.cy), (0, 0, 255), 2)
+        hud.campos['objetivo'].fijar(f'Objetivo: {elegido.nombre}')
+        draw_direction(elegido.cx, elegido.cy)
+
+# =============================================================================
+# draw_direction(cx, cy)
+# Params:
+#   cx, cy: Centro del objeto seguido
+# Outputs: None (actualiza los campos del HUD)
+# Descripción: Muestra la dirección del objeto respecto al centro
+# =============================================================================
+def draw_direction(cx, cy):
+    if cx < width // 2 - x_threshold:
+        hud.campos['direccion_x'].fijar("Izquierda")
+    elif cx > width // 2 + x_threshold:
+        hud.campos['direccion_x'].fijar("Derecha")
+    else:
+        hud.campos['direccion_x'].fijar("Centro X")
+
+    if cy < height // 2 - y_threshold:
+        hud.campos['direccion_y'].fijar("Arriba")
+    elif cy > height // 2 + y_threshold:
+        hud.campos['direccion_y'].fijar("Abajo")
+    else:
+        hud.campos['direccion_y'].fijar("Centro Y")
+
+# =============================================================================
+# draw_guides(capa)
+# Params: capa - Capa estática del HUD
+# Outputs: None (agrega las líneas a la capa)
+# Descripción: Dibuja una sola vez las líneas guía de la zona central de
+#              seguimiento; por frame solo se componen
+# =============================================================================
+def draw_guides(capa):
     # Líneas verticales a los lados del centro (margen de seguimiento en X)
-    cv2.line(frame, (width//2 - x_threshold, 0), (width//2 - x_threshold, height), (255,0,0), 2)
-    cv2.line(frame, (width//2 + x_threshold, 0), (width//2 + x_threshold, height), (255,0,0), 2)
+    capa.linea((width//2 - x_threshold, 0), (width//2 - x_threshold, height), (255,0,0), 2)
+    capa.linea((width//2 + x_threshold, 0), (width//2 + x_threshold, height), (255,0,0), 2)
     # Líneas horizontales arriba y abajo del centro (margen de seguimiento en Y)
-    cv2.line(frame, (0, height//2 - y_threshold), (width, height//2 - y_threshold), (255,0,0), 2)
-    cv2.line(frame, (0, height//2 + y_threshold), (width, height//2 + y_threshold), (255,0,0), 2)
+    capa.linea((0, height//2 - y_threshold), (width, height//2 - y_threshold), (255,0,0), 2)
+    capa.linea((0, height//2 + y_threshold), (width, height//2 + y_threshold), (255,0,0), 2)
 
 # =============================================================================
-# draw_status(frame, speed)
+# draw_status(frame, speed, tele)
 # Params:
 #   frame: Imagen donde mostrar datos
 #   speed: Velocidad actual del dron
-# Outputs: None (dibuja en frame)
-# Descripción: Muestra información de batería, altura y estado del dron
+#   tele: Snapshot de telemetría del ciclo actual
+# Outputs: None (compone el HUD sobre frame)
+# Descripción: Muestra información de batería, altura y estado del dron; los
+#              textos que no cambiaron no se vuelven a dibujar
 # =============================================================================─
-def draw_status(frame, speed):
-    global warning_msg, warning_time, flying
-    bateria = drone.get_battery()
-    altura = drone.get_height()
+@perfil.medir
+def draw_status(frame, speed, tele):
+    bateria = tele.bateria
+    altura = tele.altura
     estado = "Volando" if flying else "Detenido"
 
     # Mostrar información básica
-    cv2.putText(frame, f'Bateria: {bateria}%', (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,255,0), 2)
-    cv2.putText(frame, f'Altura: {altura}cm', (10, 45), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,255,0), 2)
-    cv2.putText(frame, f'Estado: {estado}', (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,255,0), 2)
-    cv2.putText(frame, f'Speed: {speed}', (width-150, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,255,255), 2)
+    campos = hud.campos
+    campos['bateria'].fijar(f'Bateria: {bateria}%')
+    campos['altura'].fijar(f'Altura: {altura}cm')
+    campos['estado'].fijar(f'Estado: {estado}')
+    campos['speed'].fijar(f'Speed: {speed}')
+
+    # Avisar si la telemetría dejó de actualizarse
+    campos['telemetria'].fijar(None if telemetria.vigente() else 'Telemetria sin actualizar')
 
     # Mostrar coordenadas del centro del objeto (si está detectado)
     if center_object_x is not None and center_object_y is not None:
-        texto_centro = f'Centro: ({center_object_x}, {center_object_y})'
-        cv2.putText(frame, texto_centro, (10, height - 45), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+        campos['centro'].fijar(f'Centro: ({center_object_x}, {center_object_y})')
+    else:
+        campos['centro'].ocultar()
 
     # Mostrar área del objeto detectado (si hay detección)
-    if area is not None:
-        texto_area = f'Area: {int(area)}'
-        cv2.putText(frame, texto_area, (10, height - 75), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    campos['area'].fijar(f'Area: {int(area)}' if area is not None else None)
 
     # Mostrar mensaje de advertencia temporal
-    if warning_msg and time.time() - warning_time < WARNING_DURATION:
-        cv2.putText(frame, warning_msg, (10, height-20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,0,255), 2)
+    vigente = warning_msg and time.time() - warning_time < WARNING_DURATION
+    campos['aviso'].fijar(warning_msg if vigente else None)
 
+    hud.componer(frame)
+
+# =============================================================================
+# check_battery(tele)
+# Params: tele - Snapshot de telemetría del ciclo actual
+# Outputs: None (aterriza si hace falta)
+# Descripción: Seguridad de batería, independiente de que haya overlay
+# =============================================================================
+def check_battery(tele):
+    global warning_msg, warning_time, flying
     # Si la batería está crítica, forzar aterrizaje
-    if flying and bateria <= 10:
+    if flying and tele.bateria <= 10:
         warning_msg = "Advertencia: Bateria crítica (<=10%)"
         warning_time = time.time()
-        drone.land()
-        flying = False
+        aterrizar()
+
+# Capa estática de guías: se dibuja aquí una vez y por frame solo se compone
+draw_guides(hud.capa('guias'))
 
 # ───────────────────────────
-# Inicialización de la ventana principal (Tkinter)
+# Inicialización de la ventana principal (Tkinter, o bucle sin ventana en headless)
 # ───────────────────────────
-root = tk.Tk()
-root.title("Drone Camera")
+root = crear_raiz(config, "Drone Camera")
+
+# Runtime de asyncio: update_frame y la ventana son tareas; takeoff/land
+# corren en un hilo aparte y el video no se congela mientras el dron responde
+runtime = RuntimeAsyncio(root)
 
-label = tk.Label(root)
-label.pack()
+if not HEADLESS:
+    import tkinter as tk
+    label = tk.Label(root)
+    label.pack()
+    # Una sola PhotoImage que se actualiza en su lugar (redibujo limitado a 60 Hz)
+    panel = PanelTk(label, width, height)
 
 # ───────────────────────────
 # Limpieza y salida del programa
@@ -257,16 +479,67 @@ label.pack()
 def clean_exit():
     global flying
     print("\nCerrando programa...")
+    runtime.terminar_accion()
     if flying:
-        drone.send_rc_control(0,0,0,0)
+        rc.pausar()
         time.sleep(0.5)
         drone.land()
+    rc.detener()
+    print(f"Comandos rc: {rc.resumen()}")
+    print(f"Runtime: {runtime.resumen()}")
+    if pipeline is not None:
+        print(f"Pipeline multiproceso: {pipeline.resumen()}")
+    fuente.detener()
+    if grabador is not None:
+        grabador.detener()
+        print(f"Grabación {grabador.ruta}: {grabador.resumen()}")
+    telemetria.detener()
+    metricas.cerrar()
+    if traza.activo:
+        print(traza.tabla())
+        print(f"Trazas: {traza.exportar(config['trazas'])} tramos en {config['trazas']}")
+    if perfil.muestras:
+        print(perfil.tabla())
+        ruta = config.get('perfil') or 'perfil_p2.folded'
+        print(f"Perfil: {perfil.exportar(ruta)} pilas en {ruta}")
+    finalizar(drone)
     drone.streamoff()
     drone.end()
-    cv2.destroyAllWindows()
-    root.destroy()
+    if not HEADLESS:
+        cv2.destroyAllWindows()
+    runtime.detener()
     sys.exit()
 
+# =============================================================================
+# despegar() / aterrizar()
+# Params: Ninguno
+# Outputs: None (actualizan flying)
+# Descripción: takeoff/land en un hilo del runtime; el video y el seguimiento
+#              siguen mientras el dron responde. flying se marca al pedir el
+#              despegue (rc sigue en pausa hasta que el dron lo confirma)
+# =============================================================================
+def despegar():
+    global flying
+    if runtime.accion('takeoff', drone.takeoff, al_terminar=al_despegar) is not None:
+        flying = True
+
+def al_despegar(ok):
+    global flying
+    if runtime.accion_en_curso is not None:
+        # Se pidió aterrizar durante el despegue: el land ya está en cola
+        return
+    flying = ok
+    if ok:
+        rc.reanudar()
+
+def aterrizar():
+    global flying
+    # Hover inmediato; el land sale 0.5 s después desde el hilo de la acción
+    # (en cola tras el takeoff si el dron aún no lo confirma)
+    rc.pausar()
+    flying = False
+    runtime.accion('land', drone.land, espera_s=0.5, encolar=True)
+
 # =============================================================================
 # key_press(event)
 # Params: event - Evento de tecla presionada
@@ -280,22 +553,22 @@ def key_press(event):
     # Tecla para salir (m)
     if key == 'm':
         clean_exit()
+    # Tecla para encender/apagar el perfilado (p)
+    elif key == 'p':
+        perfil.alternar()
+        return
     # Tecla para despegar (t)
     elif key == 't' and not flying:
-        if drone.get_battery() <= 15:
+        if telemetria.actual().bateria <= 15:
             warning_msg = "Advertencia: Bateria baja (<=15%)"
             warning_time = time.time()
             return
         print("Despegando...")
-        drone.takeoff()
-        flying = True
+        despegar()
     # Tecla para aterrizar (l)
     elif key == 'l' and flying:
         print("Aterrizando...")
-        drone.send_rc_control(0,0,0,0)
-        time.sleep(0.5)
-        drone.land()
-        flying = False
+        aterrizar()
     # Movimiento manual: adelante/atrás (w/s)
     elif key == 'w': 
         fb_vel = speed
@@ -310,7 +583,7 @@ def key_press(event):
         lr_vel = speed
     # Movimiento vertical (r/f)
     elif key == 'r':
-        if drone.get_height() < MAX_HEIGHT_CM:
+        if telemetria.actual().altura < MAX_HEIGHT_CM:
             ud_vel = speed
             manual_ud = True
         else:
@@ -327,6 +600,7 @@ def key_press(event):
     elif key == 'q':
         yaw_vel = -speed
         manual_yaw = True
+    rc.fijar(lr_vel, fb_vel, ud_vel, yaw_vel)
 
 # =============================================================================
 # key_release(event)
@@ -350,6 +624,7 @@ def key_release(event):
     elif key in ['e','q']:
         yaw_vel = 0
         manual_yaw = False
+    rc.fijar(lr_vel, fb_vel, ud_vel, yaw_vel)
 
 # Asociar las funciones de teclado al GUI
 root.bind("<KeyPress>", key_press)
@@ -361,68 +636,154 @@ root.bind("<KeyRelease>", key_release)
 # Outputs: Ninguno (actualiza interfaz continuamente)
 # Descripción: Loop principal que procesa video, control y seguimiento
 # =============================================================================
+@perfil.medir
 def update_frame():
-    global lr_vel, fb_vel, ud_vel, yaw_vel, flying, warning_msg, warning_time, speed, center_object_x, center_object_y, manual_yaw, manual_ud
+    global lr_vel, fb_vel, ud_vel, yaw_vel, flying, warning_msg, warning_time, speed, center_object_x, center_object_y, area, manual_yaw, manual_ud, ultimo_seq, procesados
 
     try:
-        # Captura el frame del dron
-        frame = drone.get_frame_read().frame
-        frame = cv2.resize(frame, (width, height))
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        # Toma el frame más reciente del hilo de captura; si es el mismo que
+        # ya se procesó, no se repite el trabajo y se vuelve a revisar pronto
+        paquete = fuente.siguiente(ultimo_seq)
+        if paquete is None:
+            if fuente.terminado:
+                # Fin de la sesión reproducida
+                clean_exit()
+            return
+        t_inicio = time.perf_counter()
+        ultimo_seq = paquete.seq
+        # Dirección y objetivo solo se muestran en los frames con detección
+        hud.ocultar('direccion_x', 'direccion_y', 'objetivo')
+        t_frame = paquete.timestamp
+        if pipeline is not None:
+            # Ya viene a width x height; se dibuja directo sobre el slot
+            traza.capturado(ultimo_seq, t_frame)
+            frame = paquete.imagen
+        else:
+            with traza.tramo('redimensionar', ultimo_seq):
+                frame = segmentador.redimensionar(paquete.imagen)
 
         # Obtener valores actuales de sliders
         vals = get_trackbar_values()
         speed = vals['speed']
-        lower = np.array([vals['h_min'], vals['s_min'], vals['v_min']])
-        upper = np.array([vals['h_max'], vals['s_max'], vals['v_max']])
-
-        # Procesar detección
-        detect_and_draw(frame, hsv, lower, upper)
-        draw_guides(frame)
-        draw_status(frame, speed)
+        lower = (vals['h_min'], vals['s_min'], vals['v_min'])
+        upper = (vals['h_max'], vals['s_max'], vals['v_max'])
+
+        if pipeline is not None:
+            # La detección de este frame ya la hizo un proceso de detección; los
+            # sliders aplican desde los frames que aún no se procesan
+            pipeline.fijar_parametros((*lower, *upper, vals['area_min']))
+            objetivo = paquete.deteccion
+            if objetivo is not None:
+                center_object_x, center_object_y, area = objetivo.cx, objetivo.cy, objetivo.area
+                kalman.corregir(objetivo.cx, objetivo.cy, objetivo.area, t_frame)
+                if OVERLAY:
+                    x, y, w, h = objetivo.bbox
+                    cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 255), 2)
+                    cv2.line(frame, (width//2, height//2), (objetivo.cx, objetivo.cy), (0, 0, 255), 2)
+                    draw_direction(objetivo.cx, objetivo.cy)
+
+        # Detectar solo cada DETECTAR_CADA frames procesados (o siempre si no hay
+        # objetivo); con el seq del grabber los descartes podrían dejar solo impares
+        procesados += 1
+        detectar = pipeline is None and (procesados % DETECTAR_CADA == 0 or not kalman.inicializado)
+        if detectar:
+            # Ventana de búsqueda alrededor de la posición predicha (None = frame completo)
+            ventana = roi.ventana(t_frame) if MODO_ROI and not MODO_MULTICOLOR else None
+            with traza.tramo('convertir', ultimo_seq):
+                hsv = segmentador.convertir(frame, ventana)
+
+            # Procesar detección
+            if MODO_MULTICOLOR:
+                detect_multi_and_draw(frame, hsv, vals['area_min'])
+            else:
+                bbox = detect_and_draw(frame, hsv, lower, upper, vals['area_min'], ventana)
+                if MODO_ROI:
+                    roi.actualizar(bbox, t_frame, ventana)
+                    if ventana is not None and OVERLAY:
+                        cv2.rectangle(frame, ventana[:2], ventana[2:], (0, 255, 255), 1)
+
+            if center_object_x is not None:
+                kalman.corregir(center_object_x, center_object_y, area, t_frame)
+
+        # Estado filtrado (o predicho) que usan el overlay y los controladores
+        estimacion = kalman.predecir(t_frame)
+        if estimacion is not None:
+            center_object_x = int(estimacion.cx)
+            center_object_y = int(estimacion.cy)
+            area = estimacion.area
+            if OVERLAY:
+                cv2.circle(frame, (center_object_x, center_object_y), 5, (255, 255, 0), cv2.FILLED)
+        else:
+            center_object_x = center_object_y = area = None
+        tele = telemetria.actual()
+        check_battery(tele)
+        t_gui = time.perf_counter()
+        if OVERLAY:
+            with traza.tramo('overlay', ultimo_seq):
+                draw_status(frame, speed, tele)
+        gui_s = time.perf_counter() - t_gui
 
         # Seguimiento automático horizontal (Yaw)
+        t_control = traza.reloj()
         if flying and follow_yaw and center_object_x is not None and not manual_yaw:
             center_x = width // 2
-            if center_object_x < (center_x - x_threshold):
+            if USAR_PID:
+                pid_yaw.limite = speed
+                yaw_vel = pid_yaw.actualizar(center_object_x - center_x, t_frame)
+            elif center_object_x < (center_x - x_threshold):
                 yaw_vel = -speed
             elif center_object_x > (center_x + x_threshold):
                 yaw_vel = speed
             else:
                 yaw_vel = 0
+        else:
+            pid_yaw.reiniciar()
 
         # Seguimiento automático vertical (UD)
         if flying and follow_yaw and center_object_y is not None and not manual_ud:
             center_y = height // 2
-            if center_object_y < (center_y - y_threshold):
+            if USAR_PID:
+                pid_ud.limite = speed
+                ud_vel = pid_ud.actualizar(center_y - center_object_y, t_frame)
+            elif center_object_y < (center_y - y_threshold):
                 ud_vel = speed
             elif center_object_y > (center_y + y_threshold):
                 ud_vel = -speed
             else:
                 ud_vel = 0
+        else:
+            pid_ud.reiniciar()
         
         # Seguimiento automático de distancia (frontal)
         if flying and area is not None and not manual_fb:
-            if area < AREA_TOO_SMALL:
+            if USAR_PID:
+                pid_fb.limite = speed
+                fb_vel = pid_fb.actualizar(error_distancia(area, AREA_OBJETIVO), t_frame)
+            elif area < AREA_TOO_SMALL:
                 fb_vel = speed 
             elif area > AREA_TOO_LARGE:
                 fb_vel = -speed
             else:
                 fb_vel = 0
+        else:
+            pid_fb.reiniciar()
 
 
-        # Enviar velocidades si el dron está volando
-        if flying:
-            drone.send_rc_control(lr_vel, fb_vel, ud_vel, yaw_vel)
+        # Publicar velocidades; el programador las envía en su propio ciclo
+        # (con la secuencia del frame para la latencia vidrio → comando)
+        rc.fijar(lr_vel, fb_vel, ud_vel, yaw_vel, seq=paquete.seq)
+        traza.registrar('control', paquete.seq, t_control, traza.reloj())
 
         # Mostrar imagen en la interfaz
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        img = Image.fromarray(frame_rgb)
-        imgtk = ImageTk.PhotoImage(image=img)
-        label.imgtk = imgtk
-        label.configure(image=imgtk)
-        cv2.waitKey(1)
-        label.after(30, update_frame)
+        t_gui = time.perf_counter()
+        if not HEADLESS:
+            with traza.tramo('mostrar', ultimo_seq):
+                panel.mostrar(frame)
+                cv2.waitKey(1)
+        if pipeline is not None:
+            pipeline.liberar()
+        gui_s += time.perf_counter() - t_gui
+        metricas.frame(time.perf_counter() - t_inicio - gui_s, gui_s)
 
     except Exception as e:
         print(f"Error en update_frame: {e}")
@@ -432,10 +793,14 @@ def update_frame():
 # BLOQUE DE INICIO
 # Descripción: Configuración inicial y arranque del sistema
 # =============================================================================
-setup_trackbars()
-update_frame()
+if not HEADLESS:
+    setup_trackbars()
+if config['duracion_s']:
+    runtime.after(int(config['duracion_s'] * 1000), clean_exit)
+# update_frame corre como tarea cada POLL_MS (sin frame nuevo regresa de inmediato)
+runtime.cada(POLL_MS / 1000, update_frame)
 try:
-    root.mainloop()
+    runtime.correr()
 except KeyboardInterrupt:
     clean_exit()
     
\ No newline at end of file
@@ -19,72 +19,64 @@ Fecha de entrega:
 import cv2                             # OpenCV: procesar imágenes y acceso a cámaras
 import mediapipe as mp                 # MediaPipe: detección de manos
 import time                            # Para temporizaciones
-import tkinter as tk                   # Tkinter: GUI
-from PIL import Image, ImageTk         # Para convertir frames a formato compatible con Tkinter
-from djitellopy import Tello           # djitellopy: control del dron Tello
-
-# =====================================================================
-# LANDMARKS DE INTERÉS (dedos) – índices fijos de MediaPipe Hands
-# =====================================================================
-THUMB_TIP = 4
-THUMB_IP = 3
-INDEX_TIP = 8
-MIDDLE_TIP = 12
-RING_TIP = 16
-PINKY_TIP = 20
-
-# =====================================================================
-# UTILIDADES DE GESTOS – clasificadores sencillos basados en posiciones Y
-# =====================================================================
-def contar_dedos(lm):
-    # Cuenta dedos levantados (índice/middle/anular/meñique)
-    return sum(lm[i].y < lm[i - 2].y for i in [INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
-
-
-def pulgar_extendido(lm):
-    # Pulgar extendido si la punta (TIP) está a la izquierda de la articulación (IP)
-    return lm[THUMB_TIP].x < lm[THUMB_IP].x
-
-
-def is_fist(lm):
-    # Fist = todos los dedos (índice, medio, anular, meñique) doblados
-    return all(lm[i].y > lm[i - 2].y for i in [INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
-
-
-def is_only_pinky(lm):
-    # Solo meñique levantado
-    return (contar_dedos(lm) == 1 and lm[PINKY_TIP].y < lm[PINKY_TIP - 2].y)
-
-
-def is_cuernito(lm):
-    # “Cuernito” = índice y meñique levantados, resto doblados
-    return (lm[INDEX_TIP].y < lm[INDEX_TIP - 2].y and
-            lm[PINKY_TIP].y < lm[PINKY_TIP - 2].y and
-            all(lm[i].y > lm[i - 2].y for i in [MIDDLE_TIP, RING_TIP]))
-
-
-def is_CW(lm):
-    # Gesto CW = pulgar + solo índice levantado, resto doblado
-    return (pulgar_extendido(lm) and 
-            lm[INDEX_TIP].y < lm[INDEX_TIP - 2].y and
-            all(lm[i].y > lm[i - 2].y for i in [MIDDLE_TIP, RING_TIP, PINKY_TIP]))
-
+import os
+import sys
+
+# Raíz del repositorio en el path para importar tello_utils
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from tello_utils.captura import FrameGrabber
+from tello_utils.telemetria import TelemetryCache
+from tello_utils.comandos import CommandScheduler
+from tello_utils.asincrono import RuntimeAsyncio
+from tello_utils.grabacion import GrabadorSesion, CANAL_DRON, CANAL_GESTOS
+from tello_utils.conexion import crear_dron, crear_captura_gestos, finalizar
+from tello_utils.interfaz import cargar_config, crear_raiz, PanelTk, ValorFijo, Metricas
+from tello_utils.inferencia import InferenceWorker
+from tello_utils.cadencia import CadenciaAdaptativa
+from tello_utils.detectores import Preprocesador, DetectorManos
+from tello_utils.gestos import clasificar_mano, FiltroGestos, PUNO, SUBIR
+from tello_utils.trazas import Trazador
+from tello_utils.perfilado import Perfilador
 
 # =====================================================================
 # CONFIGURACIÓN DEL DRON TELLO
 # =====================================================================
 DRONE_WIDTH, DRONE_HEIGHT = 640, 320
 
-drone = Tello()
+drone = crear_dron()  # Tello real, o sesión grabada si TELLO_REPRODUCIR está definida
 drone.connect()
 drone.streamoff()
 drone.streamon()
 time.sleep(3)
 print(f'🔋 Batería inicial: {drone.get_battery()}%')
 
+# Caché de telemetría: overlay, seguridad y teclado leen el mismo snapshot
+telemetria = TelemetryCache(drone, max_edad=1.0)
+telemetria.iniciar()
+
+# Programador de comandos: gestos y teclado publican el setpoint y un hilo lo
+# envía a frecuencia fija (registra latencia y errores en lugar de ignorarlos)
+rc = CommandScheduler(drone, frecuencia=30, keepalive=0.5)
+rc.iniciar()
+
+# Grabación de la sesión: feed del dron (canal 0), cámara de gestos (canal 1),
+# telemetría y comandos en un .tlog indexado para ajustar umbrales sin volar
+GRABAR = False
+grabador = None
+if GRABAR:
+    grabador = GrabadorSesion(time.strftime('sesion_p3_%Y%m%d_%H%M%S.tlog')).iniciar()
+    grabador.conectar(telemetria=telemetria, rc=rc)
+
 flying = False
 MAX_HEIGHT_CM = 300          # Altura máxima = 3 m
 
+# En una reproducción el dron ya va "en el aire" y el loop corre sin pausa
+# si el reloj es virtual (TELLO_REPRODUCIR_MODO=rapido)
+if getattr(drone, 'reproduccion', False):
+    flying = True
+    rc.reanudar()
+PERIODO_MS = 1 if getattr(drone, 'reloj_virtual', False) else 50
+
 # Advertencias visuales
 warning_msg = ""
 warning_time = 0
@@ -99,60 +91,142 @@ key_active = False
 # Variable de speed (se ajustará con trackbar)
 speed = 60
 
+# Configuración de ejecución (TELLO_CONFIG=archivo.json o TELLO_HEADLESS=1):
+# en headless no hay ventana, speed/altura máxima salen del archivo y solo
+# se imprimen métricas
+config = cargar_config(parametros={'speed': speed, 'max_altura': MAX_HEIGHT_CM})
+HEADLESS = config['headless']
+OVERLAY = config['overlay']
+metricas = Metricas('P3', cada_s=config['metricas_cada_s'], ruta=config['metricas'])
+
+# Trazas por etapa de cada frame de gestos (decodificar → cola → inferencia →
+# gestos → enviar) y latencia vidrio → comando; "trazas": "traza_p3.json"
+traza = Trazador('P3', activo=bool(config.get('trazas')))
+rc.trazador = traza
+
+# Perfilado de update_frame y process_gestures_and_commands: tecla 'p' o
+# "perfil": "perfil_p3.folded" en la configuración
+perfil = Perfilador('P3', activo=bool(config.get('perfil')))
+
 # =====================================================================
 # CONFIG DE MEDIAPIPE + CÁMARA LAPTOP (res 320×240)
 # =====================================================================
 mp_hands = mp.solutions.hands
-hands = mp_hands.Hands(
-    max_num_hands=1,
-    min_detection_confidence=0.6,
-    min_tracking_confidence=0.5
-)
 mp_draw = mp.solutions.drawing_utils
 
-gesture_cap = cv2.VideoCapture(0)
+gesture_cap = crear_captura_gestos(drone, 0)
 # Forzar resolución reducida en la laptop para no saturar:
 gesture_cap.set(cv2.CAP_PROP_FRAME_WIDTH, 320)
 gesture_cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 240)
 
-# Variables de control del puño (1 s hold)
-fist_start_time = None
-fist_confirmed = False
+
+# Cadencia adaptativa: con la mano quieta y un resultado confiable se
+# reutiliza la última salida de MediaPipe en lugar de correrlo en cada frame.
+# Ajustable con la clave "cadencia" del archivo de configuración, p. ej.
+# {"cadencia": {"presupuesto_cpu": 0.3}}. En reproducción rápida usa el
+# reloj virtual y por defecto no hay presupuesto, que depende del tiempo
+# real del modelo y haría la corrida no determinista.
+if getattr(drone, 'reloj_virtual', False):
+    cadencia_manos = CadenciaAdaptativa(reloj=drone.ahora, **config.get('cadencia', {}))
+else:
+    cadencia_manos = CadenciaAdaptativa(**{'presupuesto_cpu': 0.5, **config.get('cadencia', {})})
+
+# Detector de manos (tello_utils.detectores). Con FiltroGestos un frame mal
+# clasificado ya no es un comando: se usa el modelo ligero y menos confianza
+# para ahorrar CPU
+preprocesador_gestos = Preprocesador(320, 240, espejo=True)
+detector_manos = DetectorManos(max_manos=1, confianza_deteccion=0.5, confianza_seguimiento=0.5,
+                               complejidad=0, cadencia=cadencia_manos)
+
+
+def detectar_manos(frame):
+    """
+    Modelo del worker: espejo + MediaPipe Hands (según cadencia_manos).
+    Regresa (frame espejado, detecciones de manos).
+    """
+    frame = preprocesador_gestos.preparar(frame)
+    return frame.bgr, detector_manos.detectar(frame)
+
+
+# Worker de inferencia: MediaPipe corre en su propio hilo y el loop de Tk
+# solo toma el resultado más reciente (síncrono en reproducción rápida)
+inferencia = InferenceWorker.para_dron(drone)
+inferencia.agregar('gestos', detectar_manos)
+inferencia.trazador = traza
+inferencia.iniciar()
+metricas.extras = lambda: {**inferencia.resumen(), 'cadencia': cadencia_manos.resumen()}
+ultimo_seq_gestos = 0
+
+
+def recibir_frame_gestos(frame, timestamp=None):
+    """Graba el frame de la cámara de gestos y lo encola para inferencia (no bloquea); regresa su secuencia."""
+    if grabador is not None:
+        grabador.frame(frame, timestamp, canal=CANAL_GESTOS, copiar=False)
+    return inferencia.enviar('gestos', frame, timestamp)
+
+
+# Hilo de captura de la cámara de gestos: cada frame va directo al worker.
+# En reproducción rápida no hay hilo y el loop lee la cámara (determinista)
+grabber_gestos = None
+if not inferencia.sincrono:
+    grabber_gestos = FrameGrabber(lambda: gesture_cap, en_vivo=not getattr(drone, 'reproduccion', False),
+                                  nombre="gestos")
+    # Cada frame capturado se envía al worker: la secuencia del grabber y la del worker coinciden
+    grabber_gestos.trazador = traza
+    grabber_gestos.al_capturar = lambda f: recibir_frame_gestos(f.imagen, f.timestamp)
+    grabber_gestos.iniciar()
+
+# Filtro temporal de gestos: un gesto es comando solo cuando se confirma
+# (puño sostenido 2.5 s para despegar/aterrizar; el resto, 0.15 s)
+filtro_gestos = FiltroGestos(ventana_s=0.3, confirmacion_s=0.15, por_gesto={'puno': 2.5},
+                             entrada=0.6, salida=0.35, liberacion_s=0.2)
 
 
 # =====================================================================
 # GUI TKINTER – dos paneles: feed del dron + feed de gestos
 # =====================================================================
-root = tk.Tk()
-root.title("🚀 Drone & Gesture Control (Optimizado)")
-
-# Frame del dron y trackbar
-frame_drone = tk.Frame(root)
-frame_drone.pack(side=tk.LEFT, padx=5, pady=5)
-
-drone_label = tk.Label(frame_drone)
-drone_label.pack()
-
-tk.Label(frame_drone, text="Speed").pack(pady=(5, 0))
-scale_speed = tk.Scale(frame_drone, from_=0, to=100, orient='horizontal', length=200, resolution=1)
-scale_speed.set(speed)
-scale_speed.pack(pady=(0, 10))
-
-# Nuevo: trackbar para ajustar altura máxima (cm)
-tk.Label(frame_drone, text="Max Altura (cm)").pack(pady=(5, 0))
-scale_max_height = tk.Scale(
-    frame_drone,
-    from_=0, to=500,
-    orient='horizontal',
-    length=200,
-    resolution=10
-)
-scale_max_height.set(MAX_HEIGHT_CM)
-scale_max_height.pack(pady=(0, 10))
-
-# Frame de gestos
-gesture_label = tk.Label(root)
-gesture_label.pack(side=tk.RIGHT, padx=5, pady=5)
+# (en headless: sin ventana y trackbars con valores fijos)
+root = crear_raiz(config, "🚀 Drone & Gesture Control (Optimizado)")
+
+# Runtime de asyncio: update_frame y la ventana son tareas; takeoff/land van
+# a un hilo aparte para que el video y los gestos sigan mientras el dron responde
+runtime = RuntimeAsyncio(root)
+
+if HEADLESS:
+    scale_speed = ValorFijo(config['parametros']['speed'])
+    scale_max_height = ValorFijo(config['parametros']['max_altura'])
+else:
+    import tkinter as tk
+
+    # Frame del dron y trackbar
+    frame_drone = tk.Frame(root)
+    frame_drone.pack(side=tk.LEFT, padx=5, pady=5)
+
+    drone_label = tk.Label(frame_drone)
+    drone_label.pack()
+    drone_panel = PanelTk(drone_label, DRONE_WIDTH, DRONE_HEIGHT)
+
+    tk.Label(frame_drone, text="Speed").pack(pady=(5, 0))
+    scale_speed = tk.Scale(frame_drone, from_=0, to=100, orient='horizontal', length=200, resolution=1)
+    scale_speed.set(config['parametros']['speed'])
+    scale_speed.pack(pady=(0, 10))
+
+    # Nuevo: trackbar para ajustar altura máxima (cm)
+    tk.Label(frame_drone, text="Max Altura (cm)").pack(pady=(5, 0))
+    scale_max_height = tk.Scale(
+        frame_drone,
+        from_=0, to=500,
+        orient='horizontal',
+        length=200,
+        resolution=10
+    )
+    scale_max_height.set(config['parametros']['max_altura'])
+    scale_max_height.pack(pady=(0, 10))
+
+    # Frame de gestos
+    gesture_label = tk.Label(root)
+    gesture_label.pack(side=tk.RIGHT, padx=5, pady=5)
+    gesture_panel = PanelTk(gesture_label, 320, 240)
 
 
 # =====================================================================
@@ -164,15 +238,36 @@ def clean_exit():
     """
     global flying
     print("\n🛑 Cerrando programa...")
+    runtime.terminar_accion()
     if flying:
+        rc.pausar()
+        time.sleep(0.3)
         try:
-            drone.send_rc_control(0, 0, 0, 0)
-            time.sleep(0.3)
             drone.land()
         except Exception:
             pass
         flying = False
 
+    rc.detener()
+    print(f"📡 Comandos rc: {rc.resumen()}")
+    print(f"⏱️ Runtime: {runtime.resumen()}")
+    metricas.cerrar()
+    if grabber_gestos is not None:
+        grabber_gestos.detener()
+    inferencia.detener()
+    detector_manos.cerrar()
+    telemetria.detener()
+    if traza.activo:
+        print(traza.tabla())
+        print(f"Trazas: {traza.exportar(config['trazas'])} tramos en {config['trazas']}")
+    if perfil.muestras:
+        print(perfil.tabla())
+        ruta = config.get('perfil') or 'perfil_p3.folded'
+        print(f"Perfil: {perfil.exportar(ruta)} pilas en {ruta}")
+    if grabador is not None:
+        grabador.detener()
+        print(f"💾 Grabación {grabador.ruta}: {grabador.resumen()}")
+    finalizar(drone)
     try:
         drone.streamoff()
         drone.end()
@@ -183,27 +278,69 @@ def clean_exit():
         gesture_cap.release()
 
     print("✅ Programa cerrado.")
-    root.destroy()
+    runtime.detener()
+
+
+def despegar():
+    """
+    takeoff en un hilo del runtime. Como antes, un error del SDK no cambia
+    el estado: flying se marca al pedirlo y el rc se reanuda al terminar.
+    """
+    global flying
+    if runtime.accion('takeoff', drone.takeoff, al_terminar=al_despegar) is not None:
+        flying = True
+
+
+def al_despegar(ok):
+    # Si se pidió aterrizar durante el despegue el land ya está en cola: sin rc
+    if runtime.accion_en_curso is None:
+        rc.reanudar()
+
+
+def aterrizar():
+    """Hover inmediato y land en un hilo del runtime 0.3 s después (en cola si el takeoff no ha regresado)."""
+    global flying
+    rc.pausar()
+    flying = False
+    runtime.accion('land', drone.land, espera_s=0.3, encolar=True)
 
 
+@perfil.medir
 def process_gestures_and_commands():
     """
-    Captura frame de la laptop (320×240), detecta:
-      - Puño (hold 1 s) → toggle takeoff/land
+    Toma el último resultado del worker de inferencia (frame de la laptop
+    320×240 + landmarks), detecta:
+      - Puño (hold 2.5 s) → toggle takeoff/land
       - Otros gestos: pulgar solo, meñique, cuernito, CW, conteo dedos (adelante/atrás/izq/der/CCW)
+    Los gestos pasan por filtro_gestos: solo el gesto confirmado mueve el dron.
     Actualiza: lr_vel, fb_vel, ud_vel, yaw_vel, flying
-    Retorna frame RGB 320×240 para mostrar en GUI.
+    Retorna frame BGR 320×240 para mostrar en GUI (None en headless o si
+    no hay un resultado nuevo: se conserva el setpoint actual).
     """
-    global fist_start_time, fist_confirmed, flying
+    global flying, ultimo_seq_gestos
     global lr_vel, fb_vel, ud_vel, yaw_vel, warning_msg, warning_time, key_active, speed
 
-    try:
-        ret, frame = gesture_cap.read()
-    except Exception:
-        return None
-
-    if not ret or frame is None:
+    # Sin hilo de captura (reproducción rápida): se lee aquí y el worker
+    # procesa el frame en la misma llamada
+    if grabber_gestos is None:
+        t_lectura = traza.reloj()
+        try:
+            ret, frame = gesture_cap.read()
+        except Exception:
+            return None
+        if not ret or frame is None:
+            return None
+        t_captura = traza.reloj()
+        seq = recibir_frame_gestos(frame, drone.ahora())
+        traza.registrar('decodificar', seq, t_lectura, t_captura)
+        traza.capturado(seq, t_captura)
+
+    # Resultado más reciente del worker; nunca se espera al modelo
+    res = inferencia.siguiente('gestos', ultimo_seq_gestos)
+    if res is None:
         return None
+    ultimo_seq_gestos = res.seq
+    frame, manos = res.salida
 
     # Leer valor de speed del trackbar
     speed = scale_speed.get()
@@ -211,19 +348,77 @@ def process_gestures_and_commands():
     # Leer valor de altura máxima del trackbar
     max_h = scale_max_height.get()
 
-    # Ya está en 320×240, no hace falta rescálalo. Solo flip + RGB:
-    frame = cv2.flip(frame, 1)
-    rgb_small = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    result = hands.process(rgb_small)
-
-    label = "No se detecta mano"
     tiempo_actual = time.time()
 
-    # Si no se detecta mano:
-    if not result.multi_hand_landmarks:
-        if not key_active:
-            # Sin gesto y sin tecla → detener movimientos
-            lr_vel = fb_vel = ud_vel = yaw_vel = 0
+    # Un gesto por mano (máscara de dedos extendidos leída directo de los
+    # landmarks de MediaPipe → tabla de tello_utils.gestos); el puño tiene
+    # prioridad y si no, la primera mano con gesto reconocido. Sin mano el
+    # voto es None.
+    with traza.tramo('gestos', res.seq):
+        gestos = [clasificar_mano(mano.crudo.landmark) for mano in manos]
+        crudo = PUNO if PUNO in gestos else next((g for g in gestos if g is not None), None)
+        cambio = filtro_gestos.actualizar(crudo, res.timestamp)
+    gesto = filtro_gestos.confirmado
+
+    # —— PUÑO confirmado = toggle estado vuelo (una vez por puño sostenido) ——
+    if cambio and gesto is PUNO:
+        # Toggle: si no vuela, takeoff; si vuela, land
+        if not flying:
+            if telemetria.actual().bateria > 15:
+                print("💥 Puño: Despegando")
+                despegar()
+            else:
+                msg = "⚠️ Batería <15%. NO despega."
+                print(f"\n{msg}")
+                warning_msg = msg
+                warning_time = tiempo_actual
+        else:
+            print("💀 Puño: Aterrizando")
+            aterrizar()
+
+    # —— OTROS GESTOS: solo el confirmado define el setpoint ——
+    if not key_active:
+        # Sin gesto confirmado y sin tecla → detener movimientos
+        lr_vel = fb_vel = ud_vel = yaw_vel = 0
+    if gesto is not None and gesto.eje is not None:
+        vel = gesto.signo * speed
+
+        # → Meñique levantado → SUBIR, respetando la altura máxima
+        if gesto is SUBIR and telemetria.actual().altura >= max_h:
+            vel = 0
+            warning_msg  = "⚠️ Tope altura alcanzado"
+            warning_time = tiempo_actual
+
+        # Cuernito/1-4 dedos/CW/CCW → un eje a ±speed (ver gestos.REGLAS)
+        if gesto.eje == 'lr':
+            lr_vel = vel
+        elif gesto.eje == 'fb':
+            fb_vel = vel
+        elif gesto.eje == 'ud':
+            ud_vel = vel
+        elif gesto.eje == 'yaw':
+            yaw_vel = vel
+
+    # Texto: gesto confirmado, o el candidato en espera con "..."
+    if gesto is not None:
+        label = gesto.etiqueta
+    elif filtro_gestos.candidato is not None:
+        label = f"{filtro_gestos.candidato.etiqueta}..."
+    elif not manos:
+        label = "No se detecta mano"
+    else:
+        label = ""
+
+    if HEADLESS:
+        return None
+    if not OVERLAY:
+        return frame
+
+    with traza.tramo('overlay', res.seq):
+        # Dibujar landmarks (en 320×240)
+        for mano in manos:
+            mp_draw.draw_landmarks(frame, mano.crudo, mp_hands.HAND_CONNECTIONS)
+
         # Overlay de estado de vuelo + texto de gesto
         estado_text = "VOLANDO" if flying else "EN TIERRA"
         color_estado = (0, 255, 0) if flying else (0, 0, 255)
@@ -231,210 +426,96 @@ def process_gestures_and_commands():
                     cv2.FONT_HERSHEY_SIMPLEX, 0.6, color_estado, 2)
         cv2.putText(frame, label, (10, 20),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-    # Si hay mano detectada:
-    manos = result.multi_hand_landmarks
-    puño_actual = any(is_fist(hand.landmark) for hand in manos)
-
-    # —— PUÑO (2.5 s hold) = toggle estado vuelo —— 
-    if puño_actual:
-        if fist_start_time is None:
-            fist_start_time = tiempo_actual
-            fist_confirmed = False
-        elif tiempo_actual - fist_start_time >= 2.5 and not fist_confirmed:
-            # Toggle: si no vuela, takeoff; si vuela, land
-            if not flying:
-                if drone.get_battery() > 15:
-                    print("💥 Puño: Despegando")
-                    try:
-                        drone.takeoff()
-                    except Exception:
-                        pass
-                    flying = True
-                else:
-                    msg = "⚠️ Batería <15%. NO despega."
-                    print(f"\n{msg}")
-                    warning_msg = msg
-                    warning_time = tiempo_actual
-            else:
-                print("💀 Puño: Aterrizando")
-                try:
-                    drone.send_rc_control(0, 0, 0, 0)
-                    time.sleep(0.3)
-                    drone.land()
-                except Exception:
-                    pass
-                flying = False
-
-            fist_confirmed = True
-
-        label = "PUÑO"  # Mientras se mantiene, muestra “PUÑO”
-    else:
-        # Reset para próximo puño
-        fist_start_time = None
-        fist_confirmed = False
-
-        # —— OTROS GESTOS (solo si no hay puño) ——
-        if not key_active:
-            lr_vel = fb_vel = ud_vel = yaw_vel = 0
-
-        for hand in manos:
-            lm = hand.landmark
-
-            # → Meñique levantado → SUBIR
-            if is_only_pinky(lm):
-                label = "SUBIR (Meñique)"
-                # ← bloque para máxima altura:
-                try:
-                    cur_h = drone.get_height()
-                except Exception:
-                    cur_h = 0
-                if cur_h < max_h:
-                    ud_vel = speed
-                else:
-                    ud_vel = 0
-                    warning_msg  = "⚠️ Tope altura alcanzado"
-                    warning_time = tiempo_actual
-                break
-
-            # → Cuernito → BAJAR
-            if is_cuernito(lm):
-                label = "BAJAR (Cuernito)"
-                ud_vel = -speed
-                break
-
-            # → CW → Girar derecha (Yaw +)
-            if is_CW(lm):
-                label = "CW (Girando)"
-                yaw_vel = speed
-                break
-
-            # → Conteo dedos (1-4) → adelante/atrás/izq/der o CCW
-            dedos = contar_dedos(lm)
-            if dedos == 1 and not pulgar_extendido(lm):
-                label = "ADELANTE (1 dedo)"
-                fb_vel = speed
-                break
-            elif dedos == 2:
-                label = "ATRÁS (2 dedos)"
-                fb_vel = -speed
-                break
-            elif dedos == 3:
-                label = "DERECHA (3 dedos)"
-                lr_vel = speed
-                break
-            elif dedos == 4:
-                if not pulgar_extendido(lm):
-                    label = "IZQUIERDA (4 dedos)"
-                    lr_vel = -speed
-                else:
-                    label = "CCW (Girando)"
-                    yaw_vel = -speed
-                break
-
-        # Dibujar landmarks (en 320×240)
-        for hand in manos:
-            mp_draw.draw_landmarks(frame, hand, mp_hands.HAND_CONNECTIONS)
-
-    # Overlay de estado de vuelo + texto de gesto
-    estado_text = "VOLANDO" if flying else "EN TIERRA"
-    color_estado = (0, 255, 0) if flying else (0, 0, 255)
-    cv2.putText(frame, f"🚩 {estado_text}", (10, 50),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.6, color_estado, 2)
-    cv2.putText(frame, label, (10, 20),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
 
-    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)  # RGB para Tkinter
+    return frame  # BGR; el panel de Tkinter hace la conversión
 
 # ---------------------------------------------------------------------
 # LOOP PRINCIPAL – refresca vídeo del dron y gestos, envía comandos
 # ---------------------------------------------------------------------
+@perfil.medir
 def update_frame():
     """
     Ciclo principal (cada 50 ms):
       1) Captura feed del dron y overlay de batería/altura/estado
-      2) Captura feed de la laptop con detección de gestos (320×240)
+      2) Toma el último resultado de gestos del worker de inferencia (320×240)
       3) Seguridad: si batería ≤ 10 % y está volando → land()
-      4) Envío rc_control según lr_vel, fb_vel, ud_vel, yaw_vel (si volando)
-      5) Programar próxima iteración (~50 ms)
+      4) Publica lr_vel, fb_vel, ud_vel, yaw_vel al programador de comandos rc
+      5) Fin de una sesión reproducida (el runtime agenda la próxima iteración)
     """
     global flying, warning_msg, warning_time
 
     try:
+        t_inicio = time.perf_counter()
+        gui_s = 0.0
+
+        # Un solo snapshot de telemetría para todo el ciclo
+        tele = telemetria.actual()
+
         # —— 1) STREAM DRON —— 
         try:
             drone_frame = drone.get_frame_read().frame
         except Exception:
             drone_frame = None
 
-        if drone_frame is not None:
+        if drone_frame is not None and grabador is not None:
+            grabador.frame(drone_frame, canal=CANAL_DRON)
+
+        # El feed del dron solo se despliega (no se procesa): en headless no se toca
+        t_gui = time.perf_counter()
+        if drone_frame is not None and not HEADLESS:
             drone_frame = cv2.resize(drone_frame, (DRONE_WIDTH, DRONE_HEIGHT))
-            drone_frame = cv2.cvtColor(drone_frame, cv2.COLOR_BGR2RGB)
 
-            bateria = drone.get_battery()
-            altura = drone.get_height()
+            bateria = tele.bateria
+            altura = tele.altura
             estado_text = "Volando" if flying else "Detenido"
 
-            cv2.putText(drone_frame, f'🔋 {bateria}%', (10, 20),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-            cv2.putText(drone_frame, f'📏 Altura: {altura} cm', (10, 45),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-            cv2.putText(drone_frame, f'🚩 {estado_text}', (10, 70),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+            if OVERLAY:
+                cv2.putText(drone_frame, f'🔋 {bateria}%', (10, 20),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+                cv2.putText(drone_frame, f'📏 Altura: {altura} cm', (10, 45),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+                cv2.putText(drone_frame, f'🚩 {estado_text}', (10, 70),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+                if not telemetria.vigente():
+                    cv2.putText(drone_frame, 'Telemetria sin actualizar', (DRONE_WIDTH - 250, 20),
+                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
 
             if warning_msg and time.time() - warning_time < WARNING_DURATION:
-                cv2.putText(drone_frame, warning_msg, (10, DRONE_HEIGHT - 30),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2)
+                if OVERLAY:
+                    cv2.putText(drone_frame, warning_msg, (10, DRONE_HEIGHT - 30),
+                                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
             else:
                 warning_msg = ""
 
-            img_drone = Image.fromarray(drone_frame)
-            imgtk_drone = ImageTk.PhotoImage(image=img_drone)
-            drone_label.imgtk = imgtk_drone
-            drone_label.configure(image=imgtk_drone)
+            drone_panel.mostrar(drone_frame)
+        gui_s += time.perf_counter() - t_gui
 
         # —— 2) STREAM LAPTOP (GESTOS) —— 
+        seq_previo = ultimo_seq_gestos
         disp_gesture = process_gestures_and_commands()
+        # Secuencia del frame de gestos que definió el setpoint (None si no hubo uno nuevo)
+        seq_gestos = ultimo_seq_gestos if ultimo_seq_gestos != seq_previo else None
+        t_gui = time.perf_counter()
         if disp_gesture is not None:
-            img_gesture = Image.fromarray(disp_gesture)
-            imgtk_gesture = ImageTk.PhotoImage(image=img_gesture)
-            gesture_label.imgtk = imgtk_gesture
-            gesture_label.configure(image=imgtk_gesture)
+            with traza.tramo('mostrar', seq_gestos):
+                gesture_panel.mostrar(disp_gesture)
+        gui_s += time.perf_counter() - t_gui
 
         # —— 3) SEGURIDAD: BATERÍA CRÍTICA —— 
-        try:
-            bateria_actual = drone.get_battery()
-        except Exception:
-            bateria_actual = 100
-
-        if flying and bateria_actual <= 10:
+        if flying and tele.bateria <= 10:
             adv = "⚠️ Batería ≤ 10 %. Aterrizando..."
             print(f"\n{adv}")
             warning_msg = adv
             warning_time = time.time()
-            try:
-                drone.land()
-            except Exception:
-                pass
-            flying = False
+            aterrizar()
 
-        # —— 4) ENVIAR COMANDOS RC_CONTROL —— 
-        if flying:
-            # Si no hay movimiento, mandar 0s (hover)
-            if lr_vel == 0 and fb_vel == 0 and ud_vel == 0 and yaw_vel == 0:
-                try:
-                    drone.send_rc_control(0, 0, 0, 0)
-                except Exception:
-                    pass
-            else:
-                try:
-                    drone.send_rc_control(lr_vel, fb_vel, ud_vel, yaw_vel)
-                except Exception:
-                    pass
+        # —— 4) PUBLICAR SETPOINT RC_CONTROL (lo envía el programador) —— 
+        rc.fijar(lr_vel, fb_vel, ud_vel, yaw_vel, seq=seq_gestos)
+        metricas.frame(time.perf_counter() - t_inicio - gui_s, gui_s)
 
-        # —— 5) PRÓXIMA ITERACIÓN —— 
-        root.after(50, update_frame)
+        # —— 5) FIN DE LA SESIÓN REPRODUCIDA (el runtime agenda la próxima iteración) —— 
+        if getattr(drone, 'terminado', False):
+            clean_exit()
 
     except Exception as e:
         print(f"Error en update_frame: {e}")
@@ -449,11 +530,15 @@ def key_press(event):
       - 'm': cerrar app (land si volando)
       - 't': takeoff manual (si batería >15 %)
       - 'l': land manual
+      - 'p': encender/apagar el perfilado
       - 'w','s','a','d','r','f','e','q': control direccional rc_control
     """
     global flying, fb_vel, lr_vel, ud_vel, yaw_vel, warning_msg, warning_time, key_active, speed
 
     key = event.keysym.lower()
+    if key == 'p':
+        perfil.alternar()
+        return
     key_active = True  # Hay una tecla presionada
     speed = scale_speed.get()
 
@@ -463,33 +548,19 @@ def key_press(event):
 
     elif key == 't':
         if not flying:
-            try:
-                bat = drone.get_battery()
-            except Exception:
-                bat = 100
-            if bat <= 15:
+            if telemetria.actual().bateria <= 15:
                 msg = "⚠️ Batería < 15 %. NO despega."
                 print(f"\n{msg}")
                 warning_msg = msg
                 warning_time = time.time()
             else:
                 print("🟢 KEY 't': Despegando...")
-                try:
-                    drone.takeoff()
-                except Exception:
-                    pass
-                flying = True
+                despegar()
 
     elif key == 'l':
         if flying:
             print("🔴 KEY 'l': Aterrizando...")
-            try:
-                drone.send_rc_control(0, 0, 0, 0)
-                time.sleep(0.3)
-                drone.land()
-            except Exception:
-                pass
-            flying = False
+            aterrizar()
 
     # Movimiento direccional manual
     elif key == 'w':
@@ -502,10 +573,7 @@ def key_press(event):
         lr_vel = speed
     elif key == 'r':
         # ← Leer altura máxima desde el trackbar:
-        try:
-            altura_actual = drone.get_height()
-        except Exception:
-            altura_actual = 0
+        altura_actual = telemetria.actual().altura
         max_h = scale_max_height.get()
 
         if altura_actual < max_h:
@@ -523,6 +591,7 @@ def key_press(event):
         yaw_vel = speed
     elif key == 'q':
         yaw_vel = -speed
+    rc.fijar(lr_vel, fb_vel, ud_vel, yaw_vel)
 
 
 def key_release(event):
@@ -539,6 +608,7 @@ def key_release(event):
         ud_vel = 0
     elif key in ['e', 'q']:
         yaw_vel = 0
+    rc.fijar(lr_vel, fb_vel, ud_vel, yaw_vel)
 
 
 # ---------------------------------------------------------------------
@@ -546,9 +616,11 @@ def key_release(event):
 # ---------------------------------------------------------------------
 root.bind("<KeyPress>", key_press)
 root.bind("<KeyRelease>", key_release)
-update_frame()
+if config['duracion_s']:
+    runtime.after(int(config['duracion_s'] * 1000), clean_exit)
+runtime.cada(PERIODO_MS / 1000, update_frame)
 
 try:
-    root.mainloop()
+    runtime.correr()
 except KeyboardInterrupt:
     clean_exit()
@@ -0,0 +1,9 @@
+"""
+Benchmarks de las rutas críticas de visión y control.
+
+Se ejecutan desde la raíz del repositorio, por ejemplo:
+    python -m benchmarks.bench_captura --video vuelo.mp4
+
+benchmarks.suite corre todas las rutas críticas a varias resoluciones, guarda
+los resultados en JSON y compara dos corridas para detectar regresiones.
+"""
@@ -0,0 +1,132 @@
+"""
+Benchmark: hueco máximo entre frames durante takeoff/land, after() vs asyncio.
+
+Uso:
+    python -m benchmarks.bench_asincrono [--despegue-s 3] [--aterrizaje-s 2] [--periodo-ms 5]
+
+Un dron falso tarda --despegue-s en regresar de takeoff() y --aterrizaje-s
+de land() (el SDK espera el "ok" del dron). El loop de frames es el de P2
+en headless: cada --periodo-ms redimensiona, convierte y segmenta un frame
+sintético de 960x720. A los 0.5 s llega la tecla 't' y 1 s después de que
+el dron confirma el despegue llega la 'l':
+  after():  BucleHeadless, los manejadores llaman takeoff()/land() y
+            time.sleep(0.5) en el mismo hilo, como hoy,
+  asyncio:  RuntimeAsyncio, los manejadores usan runtime.accion().
+Reporta frames procesados, periodo p50 y el hueco máximo entre frames.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.sinteticos import frames_sinteticos
+from tello_utils.asincrono import RuntimeAsyncio
+from tello_utils.comandos import CommandScheduler
+from tello_utils.interfaz import BucleHeadless
+from tello_utils.segmentacion import SegmentadorHSV
+
+WIDTH, HEIGHT = 640, 480
+LOWER, UPPER = (40, 50, 50), (80, 255, 255)
+
+
+class DronLento:
+    def __init__(self, despegue_s, aterrizaje_s):
+        self.despegue_s = despegue_s
+        self.aterrizaje_s = aterrizaje_s
+
+    def takeoff(self):
+        time.sleep(self.despegue_s)
+
+    def land(self):
+        time.sleep(self.aterrizaje_s)
+
+    def send_rc_control(self, lr, fb, ud, yaw):
+        pass
+
+
+def crear_loop(frames):
+    """update_frame tipo P2 que registra el instante de cada frame."""
+    segmentador = SegmentadorHSV(WIDTH, HEIGHT)
+    instantes = []
+
+    def update_frame():
+        frame = segmentador.redimensionar(frames[len(instantes) % len(frames)])
+        segmentador.segmentar(segmentador.convertir(frame), LOWER, UPPER)
+        instantes.append(time.perf_counter())
+    return update_frame, instantes
+
+
+def con_after(args, frames):
+    drone = DronLento(args.despegue_s, args.aterrizaje_s)
+    rc = CommandScheduler(drone).iniciar()
+    root = BucleHeadless()
+    update_frame, instantes = crear_loop(frames)
+
+    def bucle():
+        update_frame()
+        root.after(args.periodo_ms, bucle)
+
+    def tecla_t():
+        drone.takeoff()
+        rc.reanudar()
+        root.after(1000, tecla_l)
+
+    def tecla_l():
+        rc.pausar()
+        time.sleep(0.5)
+        drone.land()
+        root.after(1000, root.destroy)
+
+    root.after(500, tecla_t)
+    bucle()
+    root.mainloop()
+    rc.detener()
+    return instantes
+
+
+def con_asyncio(args, frames):
+    drone = DronLento(args.despegue_s, args.aterrizaje_s)
+    rc = CommandScheduler(drone).iniciar()
+    runtime = RuntimeAsyncio(BucleHeadless())
+    update_frame, instantes = crear_loop(frames)
+
+    def al_despegar(ok):
+        rc.reanudar()
+        runtime.after(1000, tecla_l)
+
+    def tecla_t():
+        runtime.accion('takeoff', drone.takeoff, al_terminar=al_despegar)
+
+    def tecla_l():
+        rc.pausar()
+        runtime.accion('land', drone.land, espera_s=0.5,
+                       al_terminar=lambda ok: runtime.after(1000, runtime.detener))
+
+    runtime.after(500, tecla_t)
+    runtime.cada(args.periodo_ms / 1000, update_frame)
+    runtime.correr()
+    rc.detener()
+    return instantes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--despegue-s", type=float, default=3.0)
+    parser.add_argument("--aterrizaje-s", type=float, default=2.0)
+    parser.add_argument("--periodo-ms", type=int, default=5)
+    args = parser.parse_args()
+
+    frames = frames_sinteticos(30, 960, 720)
+    print(f"takeoff {args.despegue_s:.1f} s, land {args.aterrizaje_s:.1f} s (+0.5 s de pausa), "
+          f"periodo {args.periodo_ms} ms")
+    print(f"{'modo':<10} {'frames':>7} {'segundos':>9} {'p50':>9} {'p99':>9} {'hueco máx':>11}")
+    for nombre, correr in (("after()", con_after), ("asyncio", con_asyncio)):
+        instantes = np.array(correr(args, frames))
+        huecos = np.diff(instantes) * 1000
+        print(f"{nombre:<10} {len(instantes):7d} {instantes[-1] - instantes[0]:9.2f} "
+              f"{np.percentile(huecos, 50):7.2f}ms {np.percentile(huecos, 99):7.2f}ms {huecos.max():9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Benchmark: modelo en cada frame vs CadenciaAdaptativa.
+
+Uso:
+    python -m benchmarks.bench_cadencia [--video clip.mp4] [--segundos 15] [--modelo-ms 25]
+
+Sin --video se genera un clip de 320x240 a 30 fps que alterna tramos con el
+cubo verde quieto (solo ruido de cámara) y tramos en movimiento, como la
+cámara de gestos con la mano quieta o moviéndose. Con --video se usa un
+clip grabado (p. ej. exportado de un .tlog).
+
+El "modelo" localiza el cubo (HSV + contorno más grande) y agrega una carga
+de OpenCV de ~--modelo-ms por frame, como un modelo de landmarks. Se corre
+en cada frame como referencia y con la cadencia adaptativa (sin límite y
+con presupuesto de CPU); el tiempo es el del clip, así que los resultados
+no dependen de la velocidad de la máquina salvo por el presupuesto.
+Reporta inferencias/s, fracción de frames inferidos, CPU del modelo (en
+núcleos) y exactitud contra la referencia: frames con la misma detección
+(centro a menos de 10 px, o ninguna en ambos) y error p95.
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.sinteticos import VERDE_BGR, posicion_cubo
+from tello_utils.cadencia import CadenciaAdaptativa
+
+WIDTH, HEIGHT = 320, 240
+TOLERANCIA_PX = 10.0
+
+
+def clip_sintetico(segundos, fps=30, seed=0):
+    """Frames BGR: tramos de 2 s quieto / 1.5 s en movimiento, con ruido de cámara."""
+    rng = np.random.default_rng(seed)
+    fondo = rng.integers(60, 140, size=(HEIGHT, WIDTH, 3), dtype=np.uint8)
+    fondo = cv2.GaussianBlur(fondo, (5, 5), 0)
+    pos = 0
+    for i in range(int(segundos * fps)):
+        if (i / fps) % 3.5 >= 2.0:
+            pos += 1                      # tramo en movimiento
+        frame = fondo.copy()
+        cx, cy, lado = posicion_cubo(pos * 3, WIDTH, HEIGHT)
+        cv2.rectangle(frame, (cx - lado // 2, cy - lado // 2), (cx + lado // 2, cy + lado // 2), VERDE_BGR, -1)
+        ruido = rng.integers(-3, 4, size=frame.shape, dtype=np.int16)
+        yield np.clip(frame + ruido, 0, 255).astype(np.uint8)
+
+
+def clip_video(ruta):
+    cap = cv2.VideoCapture(ruta)
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        yield cv2.resize(frame, (WIDTH, HEIGHT))
+    cap.release()
+
+
+def crear_modelo(modelo_ms):
+    # Calibra cuántas pasadas de filtro tardan ~modelo_ms en 320x240
+    muestra = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    inicio = time.perf_counter()
+    for _ in range(5):
+        cv2.GaussianBlur(muestra, (31, 31), 0)
+    pasadas = max(0, int(modelo_ms / ((time.perf_counter() - inicio) / 5 * 1000)))
+
+    def modelo(img):
+        for _ in range(pasadas):
+            cv2.GaussianBlur(img, (31, 31), 0)
+        mask = cv2.inRange(cv2.cvtColor(img, cv2.COLOR_BGR2HSV), (40, 50, 50), (80, 255, 255))
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        if not contours:
+            return None
+        x, y, w, h = cv2.boundingRect(max(contours, key=cv2.contourArea))
+        return x + w / 2, y + h / 2
+    return modelo
+
+
+def error_px(a, b):
+    if a is None or b is None:
+        return 0.0 if a is b else np.inf
+    return float(np.hypot(a[0] - b[0], a[1] - b[1]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="clip grabado (por defecto uno sintético)")
+    parser.add_argument("--segundos", type=float, default=15.0)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--modelo-ms", type=float, default=25.0)
+    args = parser.parse_args()
+
+    modelo = crear_modelo(args.modelo_ms)
+    configuraciones = {
+        "adaptativa": CadenciaAdaptativa(),
+        "adaptativa, 50% CPU": CadenciaAdaptativa(presupuesto_cpu=0.5),
+        "adaptativa, 25% CPU": CadenciaAdaptativa(presupuesto_cpu=0.25),
+    }
+    errores = {nombre: [] for nombre in configuraciones}
+    tiempo_referencia = 0.0
+    frames = clip_video(args.video) if args.video else clip_sintetico(args.segundos, args.fps)
+    n = 0
+    t = 0.0
+    for n, frame in enumerate(frames, 1):
+        t = (n - 1) / args.fps
+        inicio = time.perf_counter()
+        referencia = modelo(frame)
+        tiempo_referencia += time.perf_counter() - inicio
+        for nombre, cadencia in configuraciones.items():
+            salida = cadencia.procesar(frame, modelo, t=t)
+            errores[nombre].append(error_px(salida, referencia))
+
+    duracion = n / args.fps
+    print(f"Clip: {'sintético' if not args.video else args.video}, {n} frames ({duracion:.1f} s), "
+          f"modelo ~{tiempo_referencia / n * 1000:.1f} ms")
+    print(f"{'modo':<22} {'inf/s':>6} {'inferidos':>10} {'CPU':>6} {'exactitud':>10} {'error p95':>10}")
+    print(f"{'cada frame':<22} {n / duracion:6.1f} {1.0:10.0%} {tiempo_referencia / duracion:6.2f} "
+          f"{1.0:10.0%} {0.0:8.1f}px")
+    for nombre, cadencia in configuraciones.items():
+        r = cadencia.resumen(t=t + 1 / args.fps)
+        e = np.array(errores[nombre])
+        exactitud = np.mean(e < TOLERANCIA_PX)
+        p95 = np.percentile(e, 95)
+        print(f"{nombre:<22} {r['inferencias_s']:6.1f} {r['fraccion_inferida']:10.0%} {r['cpu_modelo']:6.2f} "
+              f"{exactitud:10.1%} {p95:8.1f}px")
+
+
+if __name__ == "__main__":
+    main()
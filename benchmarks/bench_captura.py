@@ -0,0 +1,117 @@
+"""
+Benchmark: captura serial (como el update_frame original) vs FrameGrabber.
+
+Uso:
+    python -m benchmarks.bench_captura [--video ruta.mp4] [--sin-pausa] [--carga-ms 25]
+
+Sin --video se genera un video sintético de 960x720 a 30 FPS. Por defecto
+el video se reproduce a su velocidad original para simular el stream del
+Tello; se reportan frames procesados por segundo, edad promedio/máxima del
+frame al procesarlo y frames descartados.
+"""
+
+import argparse
+import os
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.sinteticos import video_sintetico
+from tello_utils.captura import FrameGrabber
+
+WIDTH, HEIGHT = 640, 480
+LOWER = np.array([40, 50, 50])
+UPPER = np.array([80, 255, 255])
+
+
+def procesar(frame, carga_ms=0.0):
+    # Misma carga que update_frame en Practicas/2/main.py (sin Tk)
+    frame = cv2.resize(frame, (WIDTH, HEIGHT))
+    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    mask = cv2.inRange(hsv, LOWER, UPPER)
+    mask = cv2.erode(mask, None, iterations=1)
+    mask = cv2.dilate(mask, None, iterations=1)
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+    for cnt in contours:
+        if cv2.contourArea(cnt) > 300:
+            x, y, w, h = cv2.boundingRect(cnt)
+            cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 255), 2)
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    if carga_ms:
+        # Simula el costo del redibujado de Tk, que no libera el GIL
+        limite = time.perf_counter() + carga_ms / 1000.0
+        while time.perf_counter() < limite:
+            pass
+    return rgb
+
+
+def correr_serial(ruta, tiempo_real, carga_ms):
+    cap = cv2.VideoCapture(ruta)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    edades = []
+    procesados = 0
+    inicio = time.monotonic()
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        # En vivo el frame i "llega" en inicio + i/fps; si vamos atrasados
+        # el decodificador acumula frames y la edad crece.
+        llegada = inicio + procesados / fps if tiempo_real else time.monotonic()
+        ahora = time.monotonic()
+        if tiempo_real and ahora < llegada:
+            time.sleep(llegada - ahora)
+        procesar(frame, carga_ms)
+        edades.append(time.monotonic() - llegada)
+        procesados += 1
+    total = time.monotonic() - inicio
+    cap.release()
+    return procesados, total, edades, 0
+
+
+def correr_grabber(ruta, tiempo_real, carga_ms):
+    edades = []
+    procesados = 0
+    ultimo_seq = 0
+    with FrameGrabber.desde_video(ruta, tiempo_real=tiempo_real) as grabber:
+        inicio = time.monotonic()
+        while True:
+            paquete = grabber.esperar(ultimo_seq)
+            if paquete is None:
+                break
+            ultimo_seq = paquete.seq
+            procesar(paquete.imagen, carga_ms)
+            edades.append(time.monotonic() - paquete.timestamp)
+            procesados += 1
+        total = time.monotonic() - inicio
+        descartados = grabber.descartados
+    return procesados, total, edades, descartados
+
+
+def reportar(nombre, procesados, total, edades, descartados):
+    edades_ms = np.array(edades) * 1000.0
+    print(f"{nombre:<10} procesados={procesados:5d}  fps={procesados / total:7.1f}  "
+          f"edad_media={edades_ms.mean():6.1f} ms  edad_max={edades_ms.max():7.1f} ms  "
+          f"descartados={descartados}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="video grabado del Tello (por defecto uno sintético)")
+    parser.add_argument("--sin-pausa", action="store_true", help="decodificar tan rápido como sea posible")
+    parser.add_argument("--carga-ms", type=float, default=0.0,
+                        help="carga extra por frame en el hilo principal (simula Tk)")
+    args = parser.parse_args()
+
+    ruta = args.video or video_sintetico()
+    tiempo_real = not args.sin_pausa
+    print(f"Video: {ruta}  ({'tiempo real' if tiempo_real else 'sin pausa'})")
+    reportar("serial", *correr_serial(ruta, tiempo_real, args.carga_ms))
+    reportar("grabber", *correr_grabber(ruta, tiempo_real, args.carga_ms))
+    if not args.video:
+        os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: ClasificadorLUT vs cv2.inRange.
+
+Uso:
+    python -m benchmarks.bench_clasificador [--frames 200]
+
+Para 1, 2 y 3 rangos (presets "Verde Rubix", "Amarillo Rubix", "USB Azul")
+mide ms por frame de ambos caminos y verifica que las máscaras sean
+idénticas bit a bit. El camino inRange incluye construir los np.array de
+límites como lo hacía Practicas/2/main.py en cada frame.
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.sinteticos import RESOLUCIONES, frames_sinteticos
+from tello_utils.clasificador import PRESETS_HSV, ClasificadorLUT
+
+
+def mascaras_inrange(hsv, rangos):
+    return {nombre: cv2.inRange(hsv, np.array(lower), np.array(upper))
+            for nombre, (lower, upper) in rangos.items()}
+
+
+def medir(funcion, frames):
+    inicio = time.perf_counter()
+    for hsv in frames:
+        funcion(hsv)
+    return (time.perf_counter() - inicio) / len(frames) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    nombres = list(PRESETS_HSV)
+    print(f"{'resolución':<10} {'rangos':>6} {'inRange ms':>11} {'LUT ms':>8} {'idénticas':>10}")
+    for width, height in RESOLUCIONES:
+        frames = [cv2.cvtColor(f, cv2.COLOR_BGR2HSV) for f in frames_sinteticos(args.frames, width, height)]
+        for n in range(1, len(nombres) + 1):
+            rangos = {nombre: PRESETS_HSV[nombre] for nombre in nombres[:n]}
+            clasificador = ClasificadorLUT(rangos)
+
+            identicas = True
+            for hsv in frames[:20]:
+                esperadas = mascaras_inrange(hsv, rangos)
+                obtenidas = clasificador.mascaras(hsv)
+                identicas &= all(np.array_equal(esperadas[k], obtenidas[k]) for k in rangos)
+
+            ms_inrange = medir(lambda hsv: mascaras_inrange(hsv, rangos), frames)
+            ms_lut = medir(clasificador.mascaras, frames)
+            print(f"{width}x{height:<6} {n:>6} {ms_inrange:11.3f} {ms_lut:8.3f} {str(identicas):>10}")
+
+
+if __name__ == "__main__":
+    main()
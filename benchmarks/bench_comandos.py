@@ -0,0 +1,87 @@
+"""
+Benchmark: envío de rc por tick de render vs CommandScheduler.
+
+Uso:
+    python -m benchmarks.bench_comandos [--segundos 5] [--hz 30]
+
+Simula un loop de interfaz cuyo procesamiento por frame varía entre 10 y
+120 ms (picos de detección), un productor tipo teclado que cambia el
+setpoint cada 0.5 s y un dron falso cuyo send_rc_control tarda 0.2 ms.
+Se comparan los comandos enviados, cuántos repiten el anterior y el
+retraso desde que cambia el setpoint hasta que sale el comando.
+"""
+
+import argparse
+import random
+import threading
+import time
+
+import numpy as np
+
+from tello_utils.comandos import CommandScheduler
+
+
+class DronFalso:
+    def __init__(self):
+        self.envios = []          # (t, setpoint)
+        self._lock = threading.Lock()
+
+    def send_rc_control(self, lr, fb, ud, yaw):
+        time.sleep(0.0002)
+        with self._lock:
+            self.envios.append((time.monotonic(), (lr, fb, ud, yaw)))
+
+
+def correr(segundos, usar_programador, hz, seed=0):
+    rnd = random.Random(seed)
+    dron = DronFalso()
+    rc = CommandScheduler(dron, frecuencia=hz).iniciar() if usar_programador else None
+    if rc:
+        rc.reanudar()
+
+    # Productor tipo teclado: cambia el setpoint cada 0.5 s en su propio hilo
+    actual = [(0, 0, 0, 0)]
+    cambios = []              # (t del cambio, setpoint)
+
+    def teclado():
+        for i in range(int(segundos / 0.5)):
+            setpoint = (0, 0, 0, 20 * (i % 3 - 1))
+            actual[0] = setpoint
+            cambios.append((time.monotonic(), setpoint))
+            if rc:
+                rc.fijar(*setpoint)
+            time.sleep(0.5)
+
+    productor = threading.Thread(target=teclado)
+    productor.start()
+    while productor.is_alive():
+        # Render: el envío por tick solo ocurre al terminar de procesar el frame
+        if not rc:
+            dron.send_rc_control(*actual[0])
+        time.sleep(rnd.choice([0.010] * 8 + [0.060, 0.120]))
+    if rc:
+        rc.detener()
+
+    repetidos = sum(1 for a, b in zip(dron.envios, dron.envios[1:]) if a[1] == b[1])
+    retrasos = []
+    for t_cambio, setpoint in cambios:
+        salida = next((t for t, s in dron.envios if s == setpoint and t >= t_cambio), None)
+        if salida is not None:
+            retrasos.append((salida - t_cambio) * 1000)
+    return len(dron.envios), repetidos, np.mean(retrasos), np.max(retrasos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=5.0)
+    parser.add_argument("--hz", type=float, default=30.0)
+    args = parser.parse_args()
+
+    print(f"{'modo':<16} {'enviados':>8} {'repetidos':>9} {'retraso medio ms':>16} {'retraso máx ms':>14}")
+    for nombre, usar in (("por tick", False), (f"programador {args.hz:.0f}Hz", True)):
+        n, rep, medio, maximo = correr(args.segundos, usar, args.hz)
+        print(f"{nombre:<16} {n:8d} {rep:9d} {medio:16.1f} {maximo:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
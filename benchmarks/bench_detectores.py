@@ -0,0 +1,123 @@
+"""
+Benchmark: backends de tello_utils.detectores y frame compartido vs preparado por detector.
+
+Uso:
+    python -m benchmarks.bench_detectores [--frames 200] [--backends color,manos,rostros,pose]
+
+Frames sintéticos de 960x720 (el cubo verde sobre ruido), preparados a
+320x240 y 640x480 con espejo. Los backends de MediaPipe se omiten si no
+está instalado.
+
+Por backend: ms por frame (p50/p95) sobre un FrameCompartido, incluyendo
+las conversiones que ese backend necesita.
+
+Combinado: todos los backends disponibles (el de color partido en un
+detector por preset, como scripts independientes) sobre el mismo frame:
+  separado:   cada detector prepara su propio frame (resize, espejo y
+              cvtColor por detector, lo que hacía cada script),
+  compartido: un Preprocesador y un FrameCompartido para todos.
+Reporta ms por frame y conversiones de color por frame.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.sinteticos import frames_sinteticos
+from tello_utils.clasificador import PRESETS_HSV
+from tello_utils.detectores import (DetectorColor, DetectorManos, DetectorPose, DetectorRostros,
+                                    Preprocesador, detectar_todos)
+
+RESOLUCIONES = [(320, 240), (640, 480)]
+CONSTRUCTORES = {
+    'color': lambda: DetectorColor(PRESETS_HSV, area_min=100),
+    'manos': lambda: DetectorManos(max_manos=1),
+    'rostros': lambda: DetectorRostros(),
+    'pose': lambda: DetectorPose(),
+}
+
+
+def crear(nombre):
+    try:
+        return CONSTRUCTORES[nombre]()
+    except ImportError:
+        return None
+
+
+def por_backend(detector, frames, preprocesador):
+    tiempos = []
+    for f in frames:
+        frame = preprocesador.preparar(f)
+        inicio = time.perf_counter()
+        detector.detectar(frame)
+        tiempos.append(time.perf_counter() - inicio)
+    return np.array(tiempos) * 1000
+
+
+def combinado(detectores, frames, width, height, compartido):
+    preprocesador = Preprocesador(width, height, espejo=True)
+    tiempos = []
+    conversiones = 0
+    for f in frames:
+        inicio = time.perf_counter()
+        if compartido:
+            frame = preprocesador.preparar(f)
+            detectar_todos(detectores, frame)
+            conversiones += frame.conversiones
+        else:
+            for d in detectores:
+                frame = preprocesador.preparar(f)
+                d.detectar(frame)
+                conversiones += frame.conversiones
+        tiempos.append(time.perf_counter() - inicio)
+    return np.array(tiempos) * 1000, conversiones / len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--backends", default="color,manos,rostros,pose")
+    args = parser.parse_args()
+
+    frames = frames_sinteticos(args.frames, 960, 720)
+    nombres = [n.strip() for n in args.backends.split(",") if n.strip()]
+    disponibles = {}
+    for nombre in nombres:
+        detector = crear(nombre)
+        if detector is None:
+            print(f"{nombre}: omitido (mediapipe no está instalado)")
+        else:
+            disponibles[nombre] = detector
+
+    print(f"\n{'backend':<10} {'resolución':>10} {'p50':>8} {'p95':>8}")
+    for width, height in RESOLUCIONES:
+        for nombre, detector in disponibles.items():
+            t = por_backend(detector, frames, Preprocesador(width, height, espejo=True))
+            print(f"{nombre:<10} {width:>4}x{height:<5} {np.percentile(t, 50):6.2f}ms {np.percentile(t, 95):6.2f}ms")
+
+    # El de color, un detector por preset (como un script por color)
+    detectores = []
+    for nombre, detector in disponibles.items():
+        if nombre == 'color':
+            for preset, rango in PRESETS_HSV.items():
+                d = DetectorColor({preset: rango}, area_min=100)
+                d.nombre = f"color:{preset}"
+                detectores.append(d)
+        else:
+            detectores.append(detector)
+
+    print(f"\nCombinado: {len(detectores)} detectores ({', '.join(d.nombre for d in detectores)})")
+    print(f"{'modo':<11} {'resolución':>10} {'p50':>8} {'p95':>8} {'cvtColor/frame':>15}")
+    for width, height in RESOLUCIONES:
+        for modo, compartido in (("separado", False), ("compartido", True)):
+            t, conversiones = combinado(detectores, frames, width, height, compartido)
+            print(f"{modo:<11} {width:>4}x{height:<5} {np.percentile(t, 50):6.2f}ms {np.percentile(t, 95):6.2f}ms "
+                  f"{conversiones:15.1f}")
+
+    for d in disponibles.values():
+        d.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark: comandos falsos por gestos mal clasificados, sin filtro vs FiltroGestos.
+
+Uso:
+    python -m benchmarks.bench_filtro_gestos [--fps 30] [--repeticiones 20]
+
+Secuencia sintética de gestos "reales" (adelante, subir, atrás, puño
+sostenido 3 s, cuernito, sin mano...) a --fps, con una fracción de frames
+mal clasificados (otro gesto al azar o mano perdida), como pasa al bajar la
+confianza o la frecuencia del modelo de manos. Se compara:
+  sin filtro: cada cambio del gesto crudo es un cambio de comando y el puño
+              necesita 2.5 s seguidos (lo que hacía Practicas/3),
+  filtro:     FiltroGestos con los parámetros de Practicas/3.
+Reporta cambios de comando, cuántos son falsos (a un gesto de movimiento
+que no es el real en ese momento), paradas de más (a "sin gesto" mientras
+hay un gesto real), retardo de confirmación y si el puño se confirmó.
+"""
+
+import argparse
+
+import numpy as np
+
+from tello_utils import gestos as g
+
+SECUENCIA = [(None, 1.0), (g.ADELANTE, 2.0), (None, 1.0), (g.SUBIR, 2.0), (g.ATRAS, 1.5),
+             (g.PUNO, 3.0), (None, 1.0), (g.BAJAR, 2.0), (g.DERECHA, 1.5), (None, 1.0)]
+TODOS = [None, g.ADELANTE, g.ATRAS, g.SUBIR, g.BAJAR, g.DERECHA, g.IZQUIERDA, g.CW, g.CCW, g.PUNO]
+
+
+def crear_filtro():
+    """Mismos parámetros que Practicas/3."""
+    return g.FiltroGestos(ventana_s=0.3, confirmacion_s=0.15, por_gesto={'puno': 2.5},
+                          entrada=0.6, salida=0.35, liberacion_s=0.2)
+
+
+def generar(fps, error, rng):
+    """(t, gesto real, gesto crudo) por frame."""
+    frames = []
+    t = 0.0
+    for real, dur in SECUENCIA:
+        for _ in range(int(dur * fps)):
+            crudo = real
+            if rng.random() < error:
+                crudo = TODOS[rng.integers(len(TODOS))]
+            frames.append((t, real, crudo))
+            t += 1.0 / fps
+    return frames
+
+
+def evaluar(frames, filtro):
+    """(cambios, falsos, paradas, retardos, puño confirmado) de una corrida."""
+    cambios = falsos = paradas = 0
+    retardos = []
+    confirmado = None
+    inicio_real, real_anterior = 0.0, None
+    puno_desde, puno = None, False
+    for t, real, crudo in frames:
+        if real != real_anterior:
+            inicio_real, real_anterior = t, real
+        if filtro is None:
+            cambio = crudo != confirmado
+            confirmado = crudo
+            # Puño original: 2.5 s seguidos, se reinicia con cualquier otro frame
+            if crudo is g.PUNO:
+                puno_desde = t if puno_desde is None else puno_desde
+                puno = puno or t - puno_desde >= 2.5
+            else:
+                puno_desde = None
+        else:
+            cambio = filtro.actualizar(crudo, t)
+            confirmado = filtro.confirmado
+            puno = puno or confirmado is g.PUNO
+        if cambio:
+            cambios += 1
+            if confirmado == real:
+                retardos.append(t - inicio_real)
+            elif confirmado is None:
+                paradas += 1
+            else:
+                falsos += 1
+    return cambios, falsos, paradas, retardos, puno
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+
+    reales = sum(1 for i in range(1, len(SECUENCIA)) if SECUENCIA[i][0] != SECUENCIA[i - 1][0])
+    print(f"Secuencia: {len(SECUENCIA)} tramos ({reales} cambios reales), {args.fps:.0f} fps, "
+          f"{args.repeticiones} repeticiones")
+    print(f"{'error/frame':>11} {'modo':<11} {'cambios':>8} {'falsos':>7} {'paradas':>8} "
+          f"{'retardo p50':>12} {'puño ok':>8}")
+    for error in (0.0, 0.05, 0.15, 0.30):
+        for modo in ("sin filtro", "filtro"):
+            rng = np.random.default_rng(0)
+            cambios = falsos = paradas = puno = 0
+            retardos = []
+            for _ in range(args.repeticiones):
+                frames = generar(args.fps, error, rng)
+                c, f, s, r, p = evaluar(frames, crear_filtro() if modo == "filtro" else None)
+                cambios += c
+                falsos += f
+                paradas += s
+                retardos += r
+                puno += p
+            n = args.repeticiones
+            retardo = f"{np.median(retardos) * 1000:.0f} ms" if retardos else "-"
+            print(f"{error:11.0%} {modo:<11} {cambios / n:8.1f} {falsos / n:7.1f} {paradas / n:8.1f} "
+                  f"{retardo:>12} {puno / n:8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Benchmark: clasificación de gestos, predicados por atributo vs tabla de máscaras.
+
+Uso:
+    python -m benchmarks.bench_gestos [--manos 20000]
+
+Antes (Practicas/3): is_fist y luego is_only_pinky, is_cuernito, is_CW,
+contar_dedos y pulgar_extendido, cada uno leyendo lm[i].y / lm[i].x del
+objeto de MediaPipe. Después, con la misma tabla de máscaras
+(tello_utils.gestos): clasificar_mano() directo del objeto de MediaPipe (una
+mano, lo que usa Practicas/3), o landmarks_array y clasificar() en lote.
+
+Los landmarks sintéticos imitan la interfaz de MediaPipe (objetos con
+.landmark[i].x/.y/.z) con dedos extendidos o doblados al azar y ruido. Se
+comprueba que todas las rutas den el mismo gesto para cada mano y se reporta
+µs por mano de clasificar_mano(), de la conversión a arreglo, de la
+clasificación de una mano ya convertida y de la clasificación en lote.
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from tello_utils import gestos
+
+THUMB_TIP, THUMB_IP = 4, 3
+INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP = 8, 12, 16, 20
+
+
+# Predicados originales de Practicas/3
+def contar_dedos(lm):
+    return sum(lm[i].y < lm[i - 2].y for i in [INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
+
+
+def pulgar_extendido(lm):
+    return lm[THUMB_TIP].x < lm[THUMB_IP].x
+
+
+def is_fist(lm):
+    return all(lm[i].y > lm[i - 2].y for i in [INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
+
+
+def is_only_pinky(lm):
+    return (contar_dedos(lm) == 1 and lm[PINKY_TIP].y < lm[PINKY_TIP - 2].y)
+
+
+def is_cuernito(lm):
+    return (lm[INDEX_TIP].y < lm[INDEX_TIP - 2].y and
+            lm[PINKY_TIP].y < lm[PINKY_TIP - 2].y and
+            all(lm[i].y > lm[i - 2].y for i in [MIDDLE_TIP, RING_TIP]))
+
+
+def is_CW(lm):
+    return (pulgar_extendido(lm) and
+            lm[INDEX_TIP].y < lm[INDEX_TIP - 2].y and
+            all(lm[i].y > lm[i - 2].y for i in [MIDDLE_TIP, RING_TIP, PINKY_TIP]))
+
+
+def clasificar_antes(lm):
+    """Cadena de decisiones de process_gestures_and_commands para una mano."""
+    if is_fist(lm):
+        return 'puno'
+    if is_only_pinky(lm):
+        return 'subir'
+    if is_cuernito(lm):
+        return 'bajar'
+    if is_CW(lm):
+        return 'cw'
+    dedos = contar_dedos(lm)
+    if dedos == 1 and not pulgar_extendido(lm):
+        return 'adelante'
+    if dedos == 2:
+        return 'atras'
+    if dedos == 3:
+        return 'derecha'
+    if dedos == 4:
+        return 'izquierda' if not pulgar_extendido(lm) else 'ccw'
+    return None
+
+
+def manos_sinteticas(n, seed=0):
+    """Manos con la interfaz de MediaPipe: .landmark[i].x/.y/.z."""
+    rng = np.random.default_rng(seed)
+    manos = []
+    for _ in range(n):
+        pts = rng.uniform(0.3, 0.7, size=(21, 3)).astype(np.float32)
+        for tip in (INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP):
+            delta = rng.uniform(0.02, 0.1) * (1 if rng.random() < 0.5 else -1)
+            pts[tip, 1] = pts[tip - 2, 1] + delta
+        pts[THUMB_TIP, 0] = pts[THUMB_IP, 0] + rng.uniform(0.02, 0.1) * (1 if rng.random() < 0.5 else -1)
+        manos.append(SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z))
+                                               for x, y, z in pts]))
+    return manos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--manos", type=int, default=20000)
+    args = parser.parse_args()
+
+    manos = manos_sinteticas(args.manos)
+
+    inicio = time.perf_counter()
+    antes = [clasificar_antes(m.landmark) for m in manos]
+    t_antes = (time.perf_counter() - inicio) / len(manos) * 1e6
+
+    inicio = time.perf_counter()
+    directa = [gestos.clasificar_mano(m.landmark) for m in manos]
+    t_directa = (time.perf_counter() - inicio) / len(manos) * 1e6
+
+    inicio = time.perf_counter()
+    arreglos = [gestos.landmarks_array([m]) for m in manos]
+    t_conversion = (time.perf_counter() - inicio) / len(manos) * 1e6
+
+    inicio = time.perf_counter()
+    una = [gestos.clasificar(a)[0] for a in arreglos]
+    t_una = (time.perf_counter() - inicio) / len(manos) * 1e6
+
+    lm = gestos.landmarks_array(manos)
+    inicio = time.perf_counter()
+    lote = gestos.clasificar(lm)
+    t_lote = (time.perf_counter() - inicio) / len(manos) * 1e6
+
+    nombres = [g.nombre if g is not None else None for g in una]
+    iguales = nombres == antes and lote == una and directa == una
+    print(f"Mismo gesto en las {len(manos)} manos: {iguales}")
+    print(f"{'ruta':<48} {'µs/mano':>8}")
+    print(f"{'antes: predicados por atributo':<48} {t_antes:8.2f}")
+    print(f"{'después: clasificar_mano (1 mano, sin arreglo)':<48} {t_directa:8.2f}")
+    print(f"{'después: landmarks_array (1 mano)':<48} {t_conversion:8.2f}")
+    print(f"{'después: clasificar (1 mano ya convertida)':<48} {t_una:8.2f}")
+    print(f"{'después: clasificar en lote (ya convertidas)':<48} {t_lote:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
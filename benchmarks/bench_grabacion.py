@@ -0,0 +1,89 @@
+"""
+Benchmark: costo de grabar una sesión y de buscar por tiempo en el .tlog.
+
+Uso:
+    python -m benchmarks.bench_grabacion [--segundos 10] [--max-mb-s 4]
+
+Simula una sesión a 30 FPS (frames sintéticos de 960x720, como el Tello),
+telemetría a 10 Hz y comandos rc a 30 Hz. Reporta el costo por llamada en
+el productor (lo que paga el hilo de captura), registros descartados u
+omitidos, el ancho de banda resultante y la calidad JPEG final. Después
+compara ir a 100 instantes aleatorios con el índice (búsqueda binaria)
+contra reconstruir el índice recorriendo el archivo, como haría una sesión
+sin índice.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.sinteticos import frames_sinteticos
+from tello_utils.grabacion import GrabadorSesion, LectorSesion, FRAME
+from tello_utils.telemetria import Telemetria
+
+FPS = 30.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=10.0)
+    parser.add_argument("--max-mb-s", type=float, default=4.0)
+    args = parser.parse_args()
+
+    frames = frames_sinteticos(60, 960, 720)
+    ruta = os.path.join(tempfile.mkdtemp(), "bench.tlog")
+    grabador = GrabadorSesion(ruta, max_bytes_s=args.max_mb_s * 1e6).iniciar()
+
+    costos = []
+    n = int(args.segundos * FPS)
+    inicio = time.monotonic()
+    for i in range(n):
+        t = inicio + i / FPS
+        espera = t - time.monotonic()
+        if espera > 0:
+            time.sleep(espera)
+        c = time.perf_counter()
+        grabador.frame(frames[i % len(frames)], t)
+        costos.append(time.perf_counter() - c)
+        grabador.comando(t, (0, 0, 0, i % 40 - 20))
+        if i % 3 == 0:
+            grabador.telemetria(Telemetria(t, 80, 120, 0, 0, i % 360, 0, 0, 0, 45.0))
+    grabador.detener()
+    duracion = time.monotonic() - inicio
+
+    r = grabador.resumen()
+    print(f"Productor: {np.mean(costos) * 1e6:.0f} µs/frame (p99 {np.percentile(costos, 99) * 1e6:.0f} µs)")
+    print(f"Escritos: {r['escritos']}  descartados: {r['descartados']}  omitidos por ancho de banda: {r['omitidos']}")
+    print(f"Archivo: {r['MB']} MB  ({r['MB'] / duracion:.2f} MB/s, límite {args.max_mb_s} MB/s)  "
+          f"calidad JPEG final: {r['calidad']}")
+
+    rnd = random.Random(0)
+    with LectorSesion(ruta) as lector:
+        instantes = [rnd.uniform(lector.inicio, lector.fin) for _ in range(100)]
+        c = time.perf_counter()
+        for t in instantes:
+            lector.buscar(t)
+        busqueda = (time.perf_counter() - c) / len(instantes)
+
+        c = time.perf_counter()
+        for t in instantes:
+            registro = lector.frame_en(t)
+            assert registro is not None and registro.tipo == FRAME
+        frame_en = (time.perf_counter() - c) / len(instantes)
+
+        c = time.perf_counter()
+        lector._reconstruir_indice()
+        escaneo = time.perf_counter() - c
+    print(f"Búsqueda en el índice: {busqueda * 1e6:.1f} µs  "
+          f"(frame_en con lectura y decodificación JPEG: {frame_en * 1000:.2f} ms)")
+    print(f"Reconstruir el índice recorriendo el archivo: {escaneo * 1000:.1f} ms "
+          f"({len(lector)} registros)")
+    os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
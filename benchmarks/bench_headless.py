@@ -0,0 +1,125 @@
+"""
+Benchmark: cuánto frame rate cuesta la GUI frente al modo headless.
+
+Uso:
+    python -m benchmarks.bench_headless [--frames 300]
+
+Corre el pipeline de Practicas/2 (redimensionar, segmentación HSV, Kalman,
+PID) sobre frames sintéticos de 960x720, sin pausas, agregando las salidas
+una por una:
+  1. headless: solo procesamiento (lo que corre con TELLO_HEADLESS=1),
+  2. + overlay: guías, estado y detección dibujados en el frame,
+  3. + conversión: BGR→RGB y PIL.Image.fromarray,
+  4. + Tk: ImageTk.PhotoImage y Label.configure (solo si hay tkinter y
+     pantalla; en headless real no se puede medir).
+Reporta fps, ms por frame y el costo relativo al modo headless.
+"""
+
+import argparse
+import os
+import time
+
+import cv2
+
+from benchmarks.sinteticos import frames_sinteticos
+from tello_utils.kalman import FiltroKalmanObjetivo
+from tello_utils.pid import PID, GANANCIAS_SEGUIMIENTO
+from tello_utils.segmentacion import SegmentadorHSV, objetivo_de_mascara
+
+WIDTH, HEIGHT = 640, 480
+LOWER, UPPER = (40, 50, 50), (80, 255, 255)
+X_TH, Y_TH = int(0.15 * WIDTH), int(0.15 * HEIGHT)
+
+
+def dibujar_overlay(frame, objetivo, est):
+    """Lo que dibuja Practicas/2 por frame (guías, estado, detección)."""
+    for x in (WIDTH // 2 - X_TH, WIDTH // 2 + X_TH):
+        cv2.line(frame, (x, 0), (x, HEIGHT), (255, 0, 0), 2)
+    for y in (HEIGHT // 2 - Y_TH, HEIGHT // 2 + Y_TH):
+        cv2.line(frame, (0, y), (WIDTH, y), (255, 0, 0), 2)
+    cv2.putText(frame, 'Bateria: 90%', (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    cv2.putText(frame, 'Altura: 100cm', (10, 45), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    cv2.putText(frame, 'Estado: Volando', (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    cv2.putText(frame, 'Speed: 20', (WIDTH - 150, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+    if objetivo is not None:
+        x, y, w, h = objetivo.bbox
+        cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 255), 2)
+    if est is not None:
+        cx, cy = int(est.cx), int(est.cy)
+        cv2.line(frame, (WIDTH // 2, HEIGHT // 2), (cx, cy), (0, 0, 255), 2)
+        cv2.circle(frame, (cx, cy), 5, (255, 255, 0), cv2.FILLED)
+        cv2.putText(frame, f'Centro: ({cx}, {cy})', (10, HEIGHT - 45), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+        cv2.putText(frame, f'Area: {int(est.area)}', (10, HEIGHT - 75), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+
+
+def crear_label_tk():
+    """Label de Tk para medir PhotoImage, o None si no hay tkinter o pantalla."""
+    if os.name != 'nt' and not os.environ.get('DISPLAY'):
+        return None
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return None
+    label = tk.Label(root)
+    label.pack()
+    return label
+
+
+def correr(frames, overlay=False, conversion=False, label=None):
+    from PIL import Image
+    segmentador = SegmentadorHSV(WIDTH, HEIGHT)
+    kalman = FiltroKalmanObjetivo()
+    pid_yaw = PID(*GANANCIAS_SEGUIMIENTO['yaw'], limite=60, zona_muerta=5)
+    pid_ud = PID(*GANANCIAS_SEGUIMIENTO['ud'], limite=60, zona_muerta=5)
+
+    inicio = time.perf_counter()
+    for i, imagen in enumerate(frames):
+        t = i / 30.0
+        frame = segmentador.redimensionar(imagen)
+        objetivo = objetivo_de_mascara('cubo', segmentador.procesar(frame, LOWER, UPPER), 300)
+        if objetivo is not None:
+            kalman.corregir(objetivo.cx, objetivo.cy, objetivo.area, t)
+        est = kalman.predecir(t)
+        if est is not None:
+            pid_yaw.actualizar(est.cx - WIDTH // 2, t)
+            pid_ud.actualizar(HEIGHT // 2 - est.cy, t)
+        if overlay:
+            dibujar_overlay(frame, objetivo, est)
+        if conversion:
+            img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            if label is not None:
+                from PIL import ImageTk
+                imgtk = ImageTk.PhotoImage(image=img)
+                label.imgtk = imgtk
+                label.configure(image=imgtk)
+                label.update_idletasks()
+    return len(frames) / (time.perf_counter() - inicio)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    frames = frames_sinteticos(args.frames, 960, 720)
+    label = crear_label_tk()
+    modos = [("headless", {}),
+             ("+ overlay", {'overlay': True}),
+             ("+ conversión RGB/PIL", {'overlay': True, 'conversion': True})]
+    if label is not None:
+        modos.append(("+ Tk PhotoImage", {'overlay': True, 'conversion': True, 'label': label}))
+
+    correr(frames[:30])                      # calentamiento
+    print(f"{'salida':<22} {'fps':>7} {'ms/frame':>9} {'costo vs headless':>18}")
+    base = None
+    for nombre, opciones in modos:
+        fps = correr(frames, **opciones)
+        base = base or fps
+        print(f"{nombre:<22} {fps:7.1f} {1000 / fps:9.2f} {100 * (1 - fps / base):17.1f}%")
+    if label is None:
+        print("(sin tkinter o sin pantalla: no se midió ImageTk.PhotoImage)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark: inferencia dentro del tick de la interfaz vs InferenceWorker.
+
+Uso:
+    python -m benchmarks.bench_inferencia [--segundos 5] [--modelo-ms 25]
+
+Simula el loop de Practicas/3: un tick de Tk cada 50 ms y dos fuentes a
+30 fps (cámara de gestos 320x240 y feed del dron 640x480). El modelo es
+MediaPipe Hands si está instalado; si no, una carga de OpenCV que libera el
+GIL y tarda ~--modelo-ms por frame (como el grafo de MediaPipe).
+  en el tick: el tick corre el modelo sobre el frame de cada fuente (antes),
+  worker:     los frames van a InferenceWorker y el tick solo lee el
+              último resultado.
+Reporta la duración del tick (p50/p95/máx), tick real contra los 50 ms
+programados, y del worker: fps de inferencia, frames descartados, cola y
+latencia frame → resultado.
+"""
+
+import argparse
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.sinteticos import frames_sinteticos
+from tello_utils.inferencia import InferenceWorker
+
+TICK_S = 0.050
+
+
+def crear_modelo(modelo_ms):
+    """MediaPipe Hands, o una carga de OpenCV de duración parecida."""
+    try:
+        import mediapipe as mp
+        hands = mp.solutions.hands.Hands(max_num_hands=1, min_detection_confidence=0.6,
+                                         min_tracking_confidence=0.5)
+        return "MediaPipe Hands", lambda img: hands.process(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
+    except ImportError:
+        pass
+
+    # Calibra cuántas pasadas de filtro tardan ~modelo_ms en 320x240
+    muestra = frames_sinteticos(1, 320, 240)[0]
+    inicio = time.perf_counter()
+    for _ in range(5):
+        cv2.GaussianBlur(muestra, (31, 31), 0)
+    pasadas = max(1, int(modelo_ms / ((time.perf_counter() - inicio) / 5 * 1000)))
+
+    def modelo(img):
+        img = cv2.resize(img, (320, 240)) if img.shape[1] != 320 else img
+        for _ in range(pasadas):
+            img = cv2.GaussianBlur(img, (31, 31), 0)
+        return float(img.mean())
+    return f"carga OpenCV (~{modelo_ms:.0f} ms, sin mediapipe)", modelo
+
+
+class Fuente:
+    """Productor a 30 fps con el frame más reciente (como FrameGrabber)."""
+
+    def __init__(self, frames, fps=30.0, al_capturar=None):
+        self.frames = frames
+        self.periodo = 1.0 / fps
+        self.al_capturar = al_capturar
+        self.ultimo = None
+        self._corriendo = True
+        self._hilo = threading.Thread(target=self._bucle, daemon=True)
+        self._hilo.start()
+
+    def _bucle(self):
+        i = 0
+        while self._corriendo:
+            imagen = self.frames[i % len(self.frames)]
+            self.ultimo = (i, time.monotonic(), imagen)
+            if self.al_capturar is not None:
+                self.al_capturar(imagen)
+            i += 1
+            time.sleep(self.periodo)
+
+    def detener(self):
+        self._corriendo = False
+        self._hilo.join()
+
+
+def correr(modelo, segundos, con_worker):
+    gestos = frames_sinteticos(30, 320, 240)
+    dron = frames_sinteticos(30, 640, 480, seed=1)
+    worker = None
+    if con_worker:
+        worker = InferenceWorker()
+        worker.agregar('gestos', modelo).agregar('dron', modelo).iniciar()
+        fuentes = [Fuente(gestos, al_capturar=lambda img: worker.enviar('gestos', img)),
+                   Fuente(dron, al_capturar=lambda img: worker.enviar('dron', img))]
+    else:
+        fuentes = [Fuente(gestos), Fuente(dron)]
+
+    ticks = []
+    periodos = []
+    vistos = {'gestos': 0, 'dron': 0}
+    fin = time.monotonic() + segundos
+    anterior = None
+    while time.monotonic() < fin:
+        inicio = time.monotonic()
+        if anterior is not None:
+            periodos.append(inicio - anterior)
+        anterior = inicio
+        if worker is None:
+            for fuente in fuentes:
+                if fuente.ultimo is not None:
+                    modelo(fuente.ultimo[2])
+        else:
+            for nombre in vistos:
+                r = worker.siguiente(nombre, vistos[nombre])
+                if r is not None:
+                    vistos[nombre] = r.seq
+        ticks.append(time.monotonic() - inicio)
+        # root.after(50, ...): el siguiente tick se programa al terminar este
+        time.sleep(TICK_S)
+
+    for fuente in fuentes:
+        fuente.detener()
+    resumen = worker.resumen() if worker is not None else None
+    if worker is not None:
+        worker.detener()
+    return np.array(ticks) * 1000, np.array(periodos) * 1000, resumen
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=5.0)
+    parser.add_argument("--modelo-ms", type=float, default=25.0)
+    args = parser.parse_args()
+
+    nombre, modelo = crear_modelo(args.modelo_ms)
+    print(f"Modelo: {nombre}; tick programado cada {TICK_S * 1000:.0f} ms, 2 fuentes a 30 fps")
+    print(f"{'modo':<12} {'tick p50':>9} {'tick p95':>9} {'tick máx':>9} {'periodo real':>13}")
+    resumen = None
+    for modo, con_worker in (("en el tick", False), ("worker", True)):
+        ticks, periodos, r = correr(modelo, args.segundos, con_worker)
+        resumen = r or resumen
+        print(f"{modo:<12} {np.percentile(ticks, 50):7.1f}ms {np.percentile(ticks, 95):7.1f}ms "
+              f"{ticks.max():7.1f}ms {np.mean(periodos):11.1f}ms")
+
+    print("\nWorker por fuente:")
+    for fuente, r in resumen.items():
+        print(f"  {fuente:<7} {r['fps']:5.1f} fps de inferencia, {r['descartados']} descartados de "
+              f"{r['enviados']}, en cola {r['en_cola']}, modelo p50 {r['modelo_p50_ms']:.1f} ms, "
+              f"latencia p50 {r['latencia_p50_ms']:.1f} ms / p95 {r['latencia_p95_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
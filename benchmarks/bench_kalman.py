@@ -0,0 +1,82 @@
+"""
+Benchmark: detección en cada frame vs detección cada N frames + Kalman.
+
+Uso:
+    python -m benchmarks.bench_kalman [--frames 600]
+
+Usa la escena sintética (posición real del cubo conocida) a 30 FPS. Para
+N = 1, 2 y 3 reporta el tiempo por ciclo de control (detección cuando toca
++ filtro) y el error medio del centro usado por los controladores respecto
+a la posición real. N=1 sin filtro equivale al update_frame original.
+Cada 100 frames se simula un hueco de detección de 5 frames.
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.sinteticos import frames_sinteticos, posicion_cubo
+from tello_utils.kalman import FiltroKalmanObjetivo
+from tello_utils.segmentacion import SegmentadorHSV
+
+WIDTH, HEIGHT, FPS = 640, 480, 30.0
+LOWER, UPPER = (40, 50, 50), (80, 255, 255)
+
+
+def detectar(segmentador, frame):
+    mask = segmentador.procesar(frame, LOWER, UPPER)
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+    for cnt in contours:
+        a = cv2.contourArea(cnt)
+        if a > 300:
+            x, y, w, h = cv2.boundingRect(cnt)
+            return x + w // 2, y + h // 2, a
+    return None
+
+
+def correr(frames, cada, usar_filtro):
+    segmentador = SegmentadorHSV(WIDTH, HEIGHT)
+    kalman = FiltroKalmanObjetivo()
+    errores, tiempos, sin_estimacion = [], [], 0
+    for i, frame in enumerate(frames):
+        t = i / FPS
+        inicio = time.perf_counter()
+        medicion = None
+        hueco = i % 100 >= 95
+        if (i % cada == 0 or not kalman.inicializado) and not hueco:
+            medicion = detectar(segmentador, frame)
+        if usar_filtro:
+            if medicion is not None:
+                kalman.corregir(*medicion, t)
+            est = kalman.predecir(t)
+            centro = (est.cx, est.cy) if est is not None else None
+        else:
+            centro = medicion[:2] if medicion is not None else None
+        tiempos.append(time.perf_counter() - inicio)
+
+        cx, cy, _ = posicion_cubo(i, WIDTH, HEIGHT)
+        if centro is None:
+            sin_estimacion += 1
+        else:
+            errores.append(np.hypot(centro[0] - cx, centro[1] - cy))
+    return np.mean(tiempos) * 1000, np.mean(errores), sin_estimacion
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    frames = frames_sinteticos(args.frames, WIDTH, HEIGHT)
+    print(f"{'modo':<16} {'ms/ciclo':>9} {'error px':>9} {'ciclos sin centro':>18}")
+    ms, err, sin = correr(frames, 1, usar_filtro=False)
+    print(f"{'cada frame':<16} {ms:9.3f} {err:9.2f} {sin:18d}")
+    for cada in (1, 2, 3):
+        ms, err, sin = correr(frames, cada, usar_filtro=True)
+        print(f"{f'Kalman N={cada}':<16} {ms:9.3f} {err:9.2f} {sin:18d}")
+
+
+if __name__ == "__main__":
+    main()
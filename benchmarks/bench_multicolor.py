@@ -0,0 +1,55 @@
+"""
+Benchmark: N seguidores independientes vs SegmentadorMultiColor.
+
+Uso:
+    python -m benchmarks.bench_multicolor [--frames 200] [--blur 15]
+
+Compara el costo por frame de correr N pipelines completos (uno por color,
+cada uno con su conversión HSV y su desenfoque) contra el modo multicolor,
+que comparte la conversión y el desenfoque entre todos los perfiles.
+"""
+
+import argparse
+import time
+
+from benchmarks.sinteticos import frames_sinteticos
+from tello_utils.clasificador import PRESETS_HSV
+from tello_utils.segmentacion import SegmentadorHSV, SegmentadorMultiColor, objetivo_de_mascara
+
+WIDTH, HEIGHT = 640, 480
+
+
+def medir(funcion, frames):
+    for frame in frames[:10]:
+        funcion(frame)
+    inicio = time.perf_counter()
+    for frame in frames:
+        funcion(frame)
+    return (time.perf_counter() - inicio) / len(frames) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--blur", type=int, default=15, help="kernel gaussiano (0 = como Practicas/2)")
+    args = parser.parse_args()
+
+    frames = frames_sinteticos(args.frames, WIDTH, HEIGHT)
+    nombres = list(PRESETS_HSV)
+    print(f"{'colores':>7} {'N pipelines ms':>15} {'multicolor ms':>14}")
+    for n in range(1, len(nombres) + 1):
+        perfiles = {nombre: PRESETS_HSV[nombre] for nombre in nombres[:n]}
+
+        independientes = [(nombre, SegmentadorHSV(WIDTH, HEIGHT, blur_ksize=args.blur, iteraciones=2), rango)
+                          for nombre, rango in perfiles.items()]
+
+        def separados(frame):
+            return {nombre: objetivo_de_mascara(nombre, seg.procesar(frame, *rango))
+                    for nombre, seg, rango in independientes}
+
+        multicolor = SegmentadorMultiColor(WIDTH, HEIGHT, perfiles, blur_ksize=args.blur, iteraciones=2)
+        print(f"{n:>7} {medir(separados, frames):15.3f} {medir(multicolor.procesar, frames):14.3f}")
+
+
+if __name__ == "__main__":
+    main()
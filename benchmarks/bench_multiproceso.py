@@ -0,0 +1,157 @@
+"""
+Benchmark: update_frame en un solo hilo vs PipelineMultiproceso.
+
+Uso:
+    python -m benchmarks.bench_multiproceso [--frames 300] [--trabajadores 1,2,4] [--carga-ms 0]
+
+Un video sintético de 960x720 (el cubo verde sobre ruido) se procesa
+completo y lo más rápido posible:
+  un hilo:      el loop lee, redimensiona a 640x480, segmenta (HSV +
+                contorno más grande), dibuja el HUD y convierte para Tk,
+                todo en secuencia, como update_frame,
+  multiproceso: captura y detección en procesos aparte conectados por el
+                anillo de memoria compartida; el proceso principal solo
+                dibuja y convierte (sin_descartes, para comparar el mismo
+                trabajo).
+--carga-ms agrega a la detección una carga de OpenCV de ~ese tiempo (como
+un modelo de MediaPipe), que es la parte que se reparte entre núcleos; se
+calibra una vez antes de arrancar para que ambos modos hagan el mismo
+trabajo.
+
+Reporta fps, latencia captura → interfaz (p50/p95) y utilización de cada
+etapa (CPU de la etapa / tiempo transcurrido; en un hilo las etapas se
+reparten el mismo núcleo, así que su suma no pasa de 1).
+"""
+
+import argparse
+import os
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.sinteticos import video_sintetico
+from tello_utils.interfaz import ConversorRGBA
+from tello_utils.multiproceso import PipelineMultiproceso, detector_hsv
+
+WIDTH, HEIGHT = 640, 480
+PARAMETROS = (40, 50, 50, 80, 255, 255, 100)
+
+
+MUESTRA = np.zeros((HEIGHT // 2, WIDTH // 2, 3), dtype=np.uint8)
+
+
+def calibrar(carga_ms):
+    """Pasadas de GaussianBlur que tardan ~carga_ms."""
+    if not carga_ms:
+        return 0
+    inicio = time.perf_counter()
+    for _ in range(10):
+        cv2.GaussianBlur(MUESTRA, (31, 31), 0)
+    return int(carga_ms / ((time.perf_counter() - inicio) / 10 * 1000))
+
+
+def fabrica(pasadas):
+    """detector_hsv más `pasadas` de carga fija."""
+    def crear():
+        detectar = detector_hsv(WIDTH, HEIGHT)
+        muestra = MUESTRA.copy()
+
+        def con_carga(imagen, parametros):
+            for _ in range(pasadas):
+                cv2.GaussianBlur(muestra, (31, 31), 0)
+            return detectar(imagen, parametros)
+        return con_carga
+    return crear
+
+
+def desplegar(frame, objetivo, conversor):
+    if objetivo is not None:
+        x, y, w, h = objetivo.bbox
+        cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 255), 2)
+        cv2.putText(frame, f"Centro: ({objetivo.cx}, {objetivo.cy})", (10, HEIGHT - 45),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    conversor.convertir(frame)
+
+
+def un_hilo(ruta, pasadas):
+    detectar = fabrica(pasadas)()
+    conversor = ConversorRGBA(WIDTH, HEIGHT)
+    cap = cv2.VideoCapture(ruta)
+    ocupado = {'captura': 0.0, 'deteccion': 0.0, 'despliegue': 0.0}
+    latencias = []
+    frames = 0
+    inicio_total = time.perf_counter()
+    while True:
+        t0, c0 = time.perf_counter(), time.process_time()
+        ok, imagen = cap.read()
+        if not ok:
+            break
+        frame = cv2.resize(imagen, (WIDTH, HEIGHT))
+        c1 = time.process_time()
+        objetivo = detectar(frame, PARAMETROS)
+        t2, c2 = time.perf_counter(), time.process_time()
+        desplegar(frame, objetivo, conversor)
+        c3 = time.process_time()
+        ocupado['captura'] += c1 - c0
+        ocupado['deteccion'] += c2 - c1
+        ocupado['despliegue'] += c3 - c2
+        latencias.append(t2 - t0)
+        frames += 1
+    cap.release()
+    transcurrido = time.perf_counter() - inicio_total
+    utilizacion = {etapa: s / transcurrido for etapa, s in ocupado.items()}
+    return frames / transcurrido, np.array(latencias) * 1000, utilizacion
+
+
+def multiproceso(ruta, pasadas, trabajadores):
+    conversor = ConversorRGBA(WIDTH, HEIGHT)
+    pipeline = PipelineMultiproceso(lambda: cv2.VideoCapture(ruta), fabrica(pasadas), WIDTH, HEIGHT,
+                                    trabajadores=trabajadores, parametros=len(PARAMETROS), sin_descartes=True)
+    pipeline.fijar_parametros(PARAMETROS)
+    pipeline.iniciar()
+    seq = 0
+    while not pipeline.terminado:
+        paquete = pipeline.siguiente(seq)
+        if paquete is None:
+            time.sleep(0.0005)
+            continue
+        seq = paquete.seq
+        desplegar(paquete.imagen, paquete.deteccion, conversor)
+        pipeline.liberar()
+    r = pipeline.resumen()
+    pipeline.detener()
+    utilizacion = {'captura': r['captura']['utilizacion'],
+                   'deteccion': sum(r[f'deteccion-{i}']['utilizacion'] for i in range(trabajadores)),
+                   'despliegue': r['despliegue']['utilizacion']}
+    return r['despliegue']['fps'], r, utilizacion
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--trabajadores", default="1,2,4")
+    parser.add_argument("--carga-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    ruta = video_sintetico(args.frames)
+    pasadas = calibrar(args.carga_ms)
+    print(f"Núcleos disponibles: {len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()}, "
+          f"carga de detección: {args.carga_ms:.0f} ms")
+    print(f"{'modo':<16} {'fps':>7} {'p50':>9} {'p95':>9} {'captura':>8} {'detección':>10} {'despliegue':>11} "
+          f"{'descartados':>12}")
+    try:
+        fps, lat, u = un_hilo(ruta, pasadas)
+        print(f"{'un hilo':<16} {fps:7.1f} {np.percentile(lat, 50):7.2f}ms {np.percentile(lat, 95):7.2f}ms "
+              f"{u['captura']:8.0%} {u['deteccion']:10.0%} {u['despliegue']:11.0%} {0:12d}")
+        for n in [int(v) for v in args.trabajadores.split(",")]:
+            fps, r, u = multiproceso(ruta, pasadas, n)
+            print(f"{f'multiproceso x{n}':<16} {fps:7.1f} {r['latencia_p50_ms']:7.2f}ms {r['latencia_p95_ms']:7.2f}ms "
+                  f"{u['captura']:8.0%} {u['deteccion']:10.0%} {u['despliegue']:11.0%} "
+                  f"{r['despliegue']['descartados']:12d}")
+    finally:
+        os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
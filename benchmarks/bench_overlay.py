@@ -0,0 +1,139 @@
+"""
+Benchmark: costo por frame del HUD, dibujo directo vs Overlay con caché.
+
+Uso:
+    python -m benchmarks.bench_overlay [--frames 2000]
+
+HUD de Practicas/2 (4 guías, batería, altura, estado, speed, centro, área,
+dirección) más el panel de ayuda de Practicas/1 (7 líneas), sobre frames de
+640x480:
+    directo: todos los cv2.line/cv2.putText en cada frame (como antes),
+    overlay: guías y ayuda en capas estáticas, textos en campos que solo se
+             vuelven a dibujar cuando cambia su valor.
+Se mide con valores que cambian cada frame (peor caso: el centro se mueve
+siempre), cada 10 frames y cada 30 frames (telemetría a ~1 Hz con video a
+30 fps), y se comprueba que ambas rutas producen la misma imagen.
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.sinteticos import frames_sinteticos
+from tello_utils.overlay import Overlay
+
+WIDTH, HEIGHT = 640, 480
+X_TH, Y_TH = int(0.15 * WIDTH), int(0.15 * HEIGHT)
+AYUDA = ["Controles:", "W/S: Adelante / Atras", "A/D: Izquierda / Derecha",
+         "Arriba/Abajo: Subir / Bajar", "Izq/Der: Girar izq / der",
+         "R: Despegar   F: Aterrizar   M: Salir", "I/K/J/L: Flips (adelante / atras / izq / der)"]
+
+
+def valores(i, cada):
+    """Valores del HUD en el frame i, cambiando cada `cada` frames."""
+    k = i // cada
+    return {'bateria': 90 - k // 20, 'altura': 100 + k % 7, 'speed': 20,
+            'cx': 300 + (k * 13) % 60, 'cy': 200 + (k * 7) % 40, 'area': 5000 + (k * 31) % 500}
+
+
+def direccion(cx, cy):
+    dx = "Izquierda" if cx < WIDTH // 2 - X_TH else "Derecha" if cx > WIDTH // 2 + X_TH else "Centro X"
+    dy = "Arriba" if cy < HEIGHT // 2 - Y_TH else "Abajo" if cy > HEIGHT // 2 + Y_TH else "Centro Y"
+    return dx, dy
+
+
+def dibujar_directo(frame, v):
+    """Lo que hacían draw_guides, draw_status, draw_direction y draw_help por frame."""
+    for x in (WIDTH // 2 - X_TH, WIDTH // 2 + X_TH):
+        cv2.line(frame, (x, 0), (x, HEIGHT), (255, 0, 0), 2)
+    for y in (HEIGHT // 2 - Y_TH, HEIGHT // 2 + Y_TH):
+        cv2.line(frame, (0, y), (WIDTH, y), (255, 0, 0), 2)
+    y = 100
+    for linea in AYUDA:
+        cv2.putText(frame, linea, (10, y), cv2.FONT_HERSHEY_PLAIN, 1.1, (255, 255, 255), 1)
+        y += 18
+    dx, dy = direccion(v['cx'], v['cy'])
+    cv2.putText(frame, dx, (WIDTH - 200, 110), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+    cv2.putText(frame, dy, (WIDTH - 200, 135), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+    cv2.putText(frame, f"Bateria: {v['bateria']}%", (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    cv2.putText(frame, f"Altura: {v['altura']}cm", (10, 45), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    cv2.putText(frame, 'Estado: Volando', (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    cv2.putText(frame, f"Speed: {v['speed']}", (WIDTH - 150, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+    cv2.putText(frame, f"Centro: ({v['cx']}, {v['cy']})", (10, HEIGHT - 45), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    cv2.putText(frame, f"Area: {v['area']}", (10, HEIGHT - 75), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+
+
+def crear_overlay():
+    """Overlay equivalente a dibujar_directo; regresa la función por frame y el Overlay."""
+    hud = Overlay(WIDTH, HEIGHT)
+    guias = hud.capa('guias')
+    for x in (WIDTH // 2 - X_TH, WIDTH // 2 + X_TH):
+        guias.linea((x, 0), (x, HEIGHT), (255, 0, 0), 2)
+    for y in (HEIGHT // 2 - Y_TH, HEIGHT // 2 + Y_TH):
+        guias.linea((0, y), (WIDTH, y), (255, 0, 0), 2)
+    ayuda = hud.capa('ayuda')
+    for i, linea in enumerate(AYUDA):
+        ayuda.texto(linea, (10, 100 + 18 * i), 1.1, (255, 255, 255), 1, cv2.FONT_HERSHEY_PLAIN)
+    hud.campo('direccion_x', (WIDTH - 200, 110), escala=0.7)
+    hud.campo('direccion_y', (WIDTH - 200, 135), escala=0.7)
+    hud.campo('bateria', (10, 20))
+    hud.campo('altura', (10, 45))
+    hud.campo('estado', (10, 70))
+    hud.campo('speed', (WIDTH - 150, 50), color=(0, 255, 255))
+    hud.campo('centro', (10, HEIGHT - 45))
+    hud.campo('area', (10, HEIGHT - 75))
+
+    def dibujar(frame, v):
+        c = hud.campos
+        dx, dy = direccion(v['cx'], v['cy'])
+        c['direccion_x'].fijar(dx)
+        c['direccion_y'].fijar(dy)
+        c['bateria'].fijar(f"Bateria: {v['bateria']}%")
+        c['altura'].fijar(f"Altura: {v['altura']}cm")
+        c['estado'].fijar('Estado: Volando')
+        c['speed'].fijar(f"Speed: {v['speed']}")
+        c['centro'].fijar(f"Centro: ({v['cx']}, {v['cy']})")
+        c['area'].fijar(f"Area: {v['area']}")
+        hud.componer(frame)
+    return dibujar, hud
+
+
+def medir(dibujar, frames, n, cada):
+    """µs por frame de solo el dibujo del HUD (la copia del frame no cuenta)."""
+    total = 0.0
+    for i in range(n):
+        frame = frames[i % len(frames)].copy()
+        v = valores(i, cada)
+        inicio = time.perf_counter()
+        dibujar(frame, v)
+        total += time.perf_counter() - inicio
+    return total / n * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    frames = [cv2.resize(f, (WIDTH, HEIGHT)) for f in frames_sinteticos(30, 960, 720)]
+
+    # Misma imagen con ambas rutas
+    a, b = frames[0].copy(), frames[0].copy()
+    dibujar_directo(a, valores(0, 1))
+    crear_overlay()[0](b, valores(0, 1))
+    print(f"Imagen idéntica: {np.array_equal(a, b)}")
+
+    print(f"{'valores cambian':<18} {'directo µs':>11} {'overlay µs':>11} {'aceleración':>12} {'redibujos/frame':>16}")
+    for cada in (1, 10, 30):
+        directo = medir(dibujar_directo, frames, args.frames, cada)
+        dibujar, hud = crear_overlay()
+        cacheado = medir(dibujar, frames, args.frames, cada)
+        redibujos = sum(hud.redibujos().values()) / args.frames
+        print(f"{'cada ' + str(cada) + ' frames':<18} {directo:11.0f} {cacheado:11.0f} "
+              f"{directo / cacheado:11.1f}x {redibujos:16.2f}")
+
+
+if __name__ == "__main__":
+    main()
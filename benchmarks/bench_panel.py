@@ -0,0 +1,127 @@
+"""
+Benchmark: despliegue en Tk por frame, ruta original vs PanelTk.
+
+Uso:
+    python -m benchmarks.bench_panel [--frames 300]
+
+Ruta original (la que tenían las prácticas):
+    rgb = cv2.cvtColor(frame, BGR2RGB); Image.fromarray(rgb); ImageTk.PhotoImage(...)
+PanelTk:
+    resize/cvtColor a buffers preasignados, Image.frombuffer compartido y
+    paste sobre una PhotoImage persistente.
+
+Reporta ms por frame desplegado, memoria de numpy asignada por frame
+(tracemalloc) e imágenes nuevas de PIL por frame (Image.core.get_stats),
+para 960x720 sin escalar (P2 con el stream completo) y 960x720 → 1280x960
+(P1). Con tkinter y pantalla también mide PhotoImage/paste y el límite de
+redibujo de PanelTk con un productor a ~200 fps; sin ellos solo se mide la
+conversión.
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+
+import cv2
+from PIL import Image
+
+from benchmarks.sinteticos import frames_sinteticos
+from tello_utils.interfaz import ConversorRGBA, PanelTk
+
+
+def crear_label_tk():
+    """Label de Tk, o None si no hay tkinter o pantalla."""
+    if os.name != 'nt' and not os.environ.get('DISPLAY'):
+        return None
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return None
+    label = tk.Label(root)
+    label.pack()
+    return label
+
+
+def ruta_original(tam, label):
+    """Función por frame de la ruta original."""
+    def desplegar(frame):
+        if frame.shape[1::-1] != tam:
+            frame = cv2.resize(frame, tam)
+        img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        if label is not None:
+            from PIL import ImageTk
+            imgtk = ImageTk.PhotoImage(image=img)
+            label.imgtk = imgtk
+            label.configure(image=imgtk)
+            label.update_idletasks()
+    return desplegar
+
+
+def ruta_panel(tam, label):
+    """Función por frame con PanelTk (o solo su conversión si no hay Tk)."""
+    if label is None:
+        return ConversorRGBA(*tam).convertir
+    panel = PanelTk(label, *tam, hz=1e9)          # sin límite: se mide cada frame
+
+    def desplegar(frame):
+        panel.mostrar(frame)
+        label.update_idletasks()
+    return desplegar
+
+
+def medir(desplegar, frames):
+    """(ms por frame, KB de numpy asignados por frame, imágenes PIL nuevas por frame)."""
+    for frame in frames[:10]:                     # calentamiento
+        desplegar(frame)
+    pil_antes = Image.core.get_stats()['new_count']
+    inicio = time.perf_counter()
+    for frame in frames:
+        desplegar(frame)
+    ms = (time.perf_counter() - inicio) * 1000 / len(frames)
+    pil = (Image.core.get_stats()['new_count'] - pil_antes) / len(frames)
+
+    # Suma de los picos por llamada = memoria que numpy/Python asigna por frame
+    tracemalloc.start()
+    asignado = 0
+    for frame in frames[:50]:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        desplegar(frame)
+        asignado += tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return ms, asignado / min(len(frames), 50) / 1024, pil
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    frames = frames_sinteticos(min(args.frames, 60), 960, 720)
+    frames = [frames[i % len(frames)] for i in range(args.frames)]
+    label = crear_label_tk()
+    if label is None:
+        print("(sin tkinter o sin pantalla: se mide solo la conversión, sin PhotoImage/paste)")
+
+    print(f"{'caso':<24} {'ruta':<9} {'ms/frame':>9} {'KB numpy/frame':>15} {'Image PIL/frame':>16}")
+    for nombre, tam in (("960x720", (960, 720)), ("960x720 → 1280x960", (1280, 960))):
+        for ruta, crear in (("original", ruta_original), ("panel", ruta_panel)):
+            ms, kb, pil = medir(crear(tam, label), frames)
+            print(f"{nombre:<24} {ruta:<9} {ms:9.2f} {kb:15.0f} {pil:16.2f}")
+
+    if label is not None:
+        panel = PanelTk(label, 960, 720, hz=60)
+        inicio = time.perf_counter()
+        for frame in frames:
+            panel.mostrar(frame)
+            label.update_idletasks()
+            time.sleep(0.005)                     # productor a ~200 fps
+        segundos = time.perf_counter() - inicio
+        print(f"Límite de 60 Hz con productor a {len(frames) / segundos:.0f} fps: "
+              f"{panel.mostrados} mostrados, {panel.omitidos} omitidos")
+
+
+if __name__ == "__main__":
+    main()
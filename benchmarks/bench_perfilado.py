@@ -0,0 +1,116 @@
+"""
+Benchmark: costo de Perfilador.medir en un ciclo tipo P2.
+
+Uso:
+    python -m benchmarks.bench_perfilado [--frames 300] [--repeticiones 9] [--salida perfil_bench.folded]
+
+Frames sintéticos de 960x720; update_frame redimensiona a 640x480,
+convierte, llama a detect_and_draw (segmentar + contornos + dibujo) y a
+draw_status (textos), como Practicas/2. Se corre sin decorar, decorado y
+apagado, y decorado y encendido, alternando los modos en cada repetición
+y tomando la mejor de cada uno (la diferencia entre modos es menor que el
+ruido entre repeticiones). Reporta ms por frame y el sobrecosto contra la
+versión sin decorar, ns por llamada medida y el sobrecosto que eso implica
+con 3 llamadas por frame, e imprime la tabla y el archivo de pilas
+colapsadas de la corrida encendida.
+"""
+
+import argparse
+import time
+
+import cv2
+
+from benchmarks.sinteticos import frames_sinteticos
+from tello_utils.perfilado import Perfilador
+from tello_utils.segmentacion import SegmentadorHSV
+
+WIDTH, HEIGHT = 640, 480
+LOWER, UPPER = (40, 50, 50), (80, 255, 255)
+
+
+def crear_ciclo(medir):
+    """update_frame tipo P2 con sus funciones envueltas por medir."""
+    segmentador = SegmentadorHSV(WIDTH, HEIGHT)
+
+    @medir
+    def detect_and_draw(frame, hsv):
+        mask = segmentador.segmentar(hsv, LOWER, UPPER)
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+        if contours:
+            x, y, w, h = cv2.boundingRect(max(contours, key=cv2.contourArea))
+            cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
+            return x + w // 2, y + h // 2
+        return None
+
+    @medir
+    def draw_status(frame, centro):
+        cv2.putText(frame, f"Objetivo: {centro}", (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+        cv2.putText(frame, "Velocidad: 30", (10, 45), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+
+    @medir
+    def update_frame(imagen):
+        frame = segmentador.redimensionar(imagen)
+        hsv = segmentador.convertir(frame)
+        centro = detect_and_draw(frame, hsv)
+        draw_status(frame, centro)
+
+    return update_frame
+
+
+def correr(ciclo, frames):
+    inicio = time.perf_counter()
+    for f in frames:
+        ciclo(f)
+    return (time.perf_counter() - inicio) / len(frames) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--repeticiones", type=int, default=9)
+    parser.add_argument("--salida", default="perfil_bench.folded")
+    args = parser.parse_args()
+
+    frames = frames_sinteticos(args.frames, 960, 720)
+    apagado = Perfilador('apagado')
+    encendido = Perfilador('bench', activo=True)
+    modos = {
+        "sin decorar": crear_ciclo(lambda f: f),
+        "apagado": crear_ciclo(apagado.medir),
+        "encendido": crear_ciclo(encendido.medir),
+    }
+    for ciclo in modos.values():
+        correr(ciclo, frames[:20])          # calentamiento
+    tiempos = {nombre: [] for nombre in modos}
+    for _ in range(args.repeticiones):
+        for nombre, ciclo in modos.items():
+            tiempos[nombre].append(correr(ciclo, frames))
+
+    base = min(tiempos["sin decorar"])
+    print(f"{'modo':<12} {'ms/frame':>9} {'sobrecosto':>11}")
+    for nombre, t in tiempos.items():
+        print(f"{nombre:<12} {min(t):9.3f} {(min(t) - base) / base:+11.2%}")
+
+    # Costo por llamada medida, aislado del trabajo de la función
+    vacio = Perfilador('micro', activo=True, muestras=1000)
+    n = 200000
+    costos = {}
+    for nombre, medir in (("sin decorar", lambda f: f), ("apagado", Perfilador('micro').medir),
+                          ("encendido", vacio.medir)):
+        funcion = medir(lambda: None)
+        inicio = time.perf_counter()
+        for _ in range(n):
+            funcion()
+        costos[nombre] = (time.perf_counter() - inicio) / n * 1e9
+    print(f"\n{'llamada':<12} {'ns':>7} {'estimado':>9}")
+    for nombre, ns in costos.items():
+        estimado = 3 * (ns - costos["sin decorar"]) / (base * 1e6)
+        print(f"{nombre:<12} {ns:7.0f} {estimado:+9.2%}")
+
+    print()
+    print(encendido.tabla())
+    print(f"\n{encendido.exportar(args.salida)} pilas en {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
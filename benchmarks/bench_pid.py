@@ -0,0 +1,124 @@
+"""
+Benchmark: respuesta al escalón del seguimiento en yaw, bang-bang vs PID.
+
+Uso:
+    python -m benchmarks.bench_pid [--escalon 25] [--duracion 6] [--csv respuesta.csv]
+
+Simula el eje yaw del dron sin hardware: el comando rc se convierte en
+velocidad angular con un retraso de primer orden (TAU_YAW) y la cámara
+entrega el error en pixeles con LATENCIA_FRAMES de retraso a 30 FPS. En
+t=0 el objetivo aparece desplazado --escalon grados. Para cada controlador
+se reporta el tiempo en entrar a la zona central (x_threshold de
+Practicas/2), el tiempo de asentamiento (|error| < x_threshold/3 sin volver
+a salir), el sobrepaso, el error final y las inversiones del comando.
+Con --csv se guarda la respuesta completa (t, modo, error, comando).
+"""
+
+import argparse
+import csv
+from collections import deque
+
+import numpy as np
+
+from tello_utils.pid import PID, GANANCIAS_SEGUIMIENTO
+
+WIDTH, FPS = 640, 30.0
+FOV_GRADOS = 82.6                    # Campo de visión horizontal del Tello
+PX_POR_GRADO = WIDTH / FOV_GRADOS
+TAU_YAW = 0.2                        # s, respuesta del dron al comando
+GRADOS_POR_UNIDAD = 1.0              # (°/s) por unidad de rc en yaw
+LATENCIA_FRAMES = 3
+X_THRESHOLD = int(0.15 * WIDTH)
+BANDA_FINA = X_THRESHOLD // 3
+
+
+def bang_bang(speed):
+    def controlar(error, t):
+        if error < -X_THRESHOLD:
+            return -speed
+        if error > X_THRESHOLD:
+            return speed
+        return 0
+    return controlar
+
+
+def pid(speed):
+    controlador = PID(*GANANCIAS_SEGUIMIENTO['yaw'], limite=speed, zona_muerta=5)
+    return controlador.actualizar
+
+
+def simular(controlar, escalon, duracion):
+    """Regresa arreglos (t, error_px, comando) de la respuesta al escalón."""
+    dt = 1.0 / FPS
+    objetivo, yaw, omega = escalon, 0.0, 0.0
+    medidas = deque([escalon * PX_POR_GRADO] * LATENCIA_FRAMES, maxlen=LATENCIA_FRAMES)
+    ts, errores, comandos = [], [], []
+    for i in range(int(duracion * FPS)):
+        t = i * dt
+        error_real = float(np.clip((objetivo - yaw) * PX_POR_GRADO, -WIDTH / 2, WIDTH / 2))
+        medida = medidas[0]
+        medidas.append(error_real)
+        u = controlar(medida, t)
+
+        # Dinámica de yaw: primer orden hacia la velocidad pedida
+        omega += (u * GRADOS_POR_UNIDAD - omega) * dt / TAU_YAW
+        yaw += omega * dt
+
+        ts.append(t)
+        errores.append(error_real)
+        comandos.append(u)
+    return np.array(ts), np.array(errores), np.array(comandos)
+
+
+def metricas(t, error, comando):
+    abs_e = np.abs(error)
+    dentro = np.nonzero(abs_e <= X_THRESHOLD)[0]
+    t_banda = t[dentro[0]] if len(dentro) else float('nan')
+    fuera = np.nonzero(abs_e >= BANDA_FINA)[0]
+    if len(fuera) == 0:
+        t_asentamiento = 0.0
+    elif fuera[-1] + 1 < len(t):
+        t_asentamiento = t[fuera[-1] + 1]
+    else:
+        t_asentamiento = float('nan')
+    signo = np.sign(error[0])
+    sobrepaso = max(0.0, float(np.max(-signo * error)))
+    no_cero = comando[comando != 0]
+    inversiones = int(np.sum(np.sign(no_cero[1:]) != np.sign(no_cero[:-1])))
+    return t_banda, t_asentamiento, sobrepaso, abs_e[-1], inversiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--escalon", type=float, default=25.0, help="desplazamiento del objetivo en grados")
+    parser.add_argument("--duracion", type=float, default=6.0)
+    parser.add_argument("--csv", help="guardar la respuesta al escalón en este archivo")
+    args = parser.parse_args()
+
+    modos = [
+        ("bang-bang 20", bang_bang(20)),
+        ("bang-bang 60", bang_bang(60)),
+        ("PID lim 20", pid(20)),
+        ("PID lim 60", pid(60)),
+    ]
+    print(f"Escalón: {args.escalon:.0f}° ({args.escalon * PX_POR_GRADO:.0f} px)  "
+          f"latencia: {LATENCIA_FRAMES} frames  banda fina: ±{BANDA_FINA} px")
+    print(f"{'modo':<14} {'t zona (s)':>10} {'t asent. (s)':>12} {'sobrepaso px':>12} "
+          f"{'error final':>11} {'inversiones':>11}")
+    filas = []
+    for nombre, controlar in modos:
+        t, error, comando = simular(controlar, args.escalon, args.duracion)
+        t_banda, t_asent, sobrepaso, final, inversiones = metricas(t, error, comando)
+        print(f"{nombre:<14} {t_banda:10.2f} {t_asent:12.2f} {sobrepaso:12.1f} {final:11.1f} {inversiones:11d}")
+        filas.extend((f"{ti:.4f}", nombre, f"{e:.2f}", u) for ti, e, u in zip(t, error, comando))
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            escritor = csv.writer(f)
+            escritor.writerow(["t", "modo", "error_px", "comando"])
+            escritor.writerows(filas)
+        print(f"Respuesta guardada en {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: reproducción de una sesión en tiempo real vs reloj virtual.
+
+Uso:
+    python -m benchmarks.bench_reproduccion [--sesion vuelo.tlog] [--frames 300]
+
+Corre sobre la sesión el mismo pipeline de seguimiento de Practicas/2
+(segmentación HSV + Kalman + PID de yaw/vertical) alimentado por
+DronReproducido a través de FrameGrabber.desde_tello y CommandScheduler,
+igual que en vuelo. Reporta frames procesados, tiempo, aceleración
+respecto a la duración original y, para dos corridas con reloj virtual, la
+diferencia entre sus flujos de comandos (debe ser 0 %: son deterministas).
+Sin --sesion se genera una sesión sintética con el cubo verde.
+"""
+
+import argparse
+import os
+import time
+
+import cv2
+
+from benchmarks.sinteticos import sesion_sintetica
+from tello_utils.captura import FrameGrabber
+from tello_utils.comandos import CommandScheduler
+from tello_utils.kalman import FiltroKalmanObjetivo
+from tello_utils.pid import PID, GANANCIAS_SEGUIMIENTO
+from tello_utils.reproduccion import DronReproducido, comparar
+from tello_utils.segmentacion import SegmentadorHSV, objetivo_de_mascara
+
+WIDTH, HEIGHT = 640, 480
+LOWER, UPPER = (40, 50, 50), (80, 255, 255)
+
+
+def seguir(drone):
+    """Pipeline de seguimiento de Practicas/2 sin interfaz; regresa (frames, segundos, comandos)."""
+    grabber = FrameGrabber.desde_tello(drone).iniciar()
+    rc = CommandScheduler(drone, frecuencia=30).iniciar()
+    rc.reanudar()
+    segmentador = SegmentadorHSV(WIDTH, HEIGHT)
+    kalman = FiltroKalmanObjetivo()
+    pid_yaw = PID(*GANANCIAS_SEGUIMIENTO['yaw'], limite=60, zona_muerta=5)
+    pid_ud = PID(*GANANCIAS_SEGUIMIENTO['ud'], limite=60, zona_muerta=5)
+
+    inicio = time.perf_counter()
+    ultimo_seq = frames = 0
+    while True:
+        paquete = grabber.esperar(ultimo_seq, timeout=1.0)
+        if paquete is None:
+            break
+        ultimo_seq = paquete.seq
+        frames += 1
+        frame = segmentador.redimensionar(paquete.imagen)
+        mask = segmentador.procesar(frame, LOWER, UPPER)
+        objetivo = objetivo_de_mascara('cubo', mask, 300)
+        if objetivo is not None:
+            kalman.corregir(objetivo.cx, objetivo.cy, objetivo.area, paquete.timestamp)
+        est = kalman.predecir(paquete.timestamp)
+        if est is None:
+            pid_yaw.reiniciar()
+            pid_ud.reiniciar()
+            rc.fijar(0, 0, 0, 0)
+        else:
+            yaw = pid_yaw.actualizar(est.cx - WIDTH // 2, paquete.timestamp)
+            ud = pid_ud.actualizar(HEIGHT // 2 - est.cy, paquete.timestamp)
+            rc.fijar(0, 0, ud, yaw)
+    segundos = time.perf_counter() - inicio
+    rc.pausar()
+    rc.detener()
+    grabber.detener()
+    return frames, segundos, drone.comandos
+
+
+def comandos_relativos(drone, comandos):
+    import numpy as np
+    return np.array([(t - drone.lector.inicio, *c) for t, *c in comandos], dtype=float).reshape(-1, 5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sesion", help="sesión .tlog grabada (por defecto una sintética)")
+    parser.add_argument("--frames", type=int, default=300, help="frames de la sesión sintética")
+    args = parser.parse_args()
+
+    ruta = args.sesion or sesion_sintetica(n=args.frames)
+    resultados = {}
+    print(f"{'modo':<18} {'frames':>7} {'segundos':>9} {'x duración':>11} {'comandos':>9}")
+    for nombre, tiempo_real in (("tiempo real", True), ("rápido #1", False), ("rápido #2", False)):
+        drone = DronReproducido(ruta, tiempo_real=tiempo_real)
+        duracion = drone.lector.fin - drone.lector.inicio
+        frames, segundos, comandos = seguir(drone)
+        resultados[nombre] = comandos_relativos(drone, comandos)
+        drone.end()
+        print(f"{nombre:<18} {frames:7d} {segundos:9.2f} {duracion / segundos:10.1f}x {len(comandos):9d}")
+
+    print("rápido #1 vs #2:      ", comparar(resultados["rápido #1"], resultados["rápido #2"]))
+    print("tiempo real vs rápido:", comparar(resultados["tiempo real"], resultados["rápido #1"]))
+    if not args.sesion:
+        os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
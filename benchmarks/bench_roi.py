@@ -0,0 +1,107 @@
+"""
+Benchmark: búsqueda en frame completo vs ventana ROI alrededor del objetivo.
+
+Uso:
+    python -m benchmarks.bench_roi [--video ruta.mp4] [--lower 40 50 50] [--upper 80 255 255]
+
+Sin --video se genera un video sintético con el cubo verde en movimiento.
+La búsqueda en frame completo se toma como referencia: el hit rate es la
+fracción de frames con objeto (según la referencia) en los que el modo ROI
+también lo encontró con el centro a menos de 10 px. Se reporta el tiempo
+de segmentación + contornos por frame en cada modo.
+"""
+
+import argparse
+import os
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.sinteticos import video_sintetico
+from tello_utils.roi import RastreadorROI
+from tello_utils.segmentacion import SegmentadorHSV
+
+WIDTH, HEIGHT = 640, 480
+AREA_MIN = 0.001 * WIDTH * HEIGHT
+
+
+def detectar(segmentador, frame, lower, upper, ventana):
+    # Misma lógica que detect_and_draw en Practicas/2/main.py, sin dibujar
+    hsv = segmentador.convertir(frame, ventana)
+    mask = segmentador.segmentar(hsv, lower, upper)
+    offset = (ventana[0], ventana[1]) if ventana is not None else (0, 0)
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE, offset=offset)
+    bbox = None
+    for cnt in contours:
+        if cv2.contourArea(cnt) > AREA_MIN:
+            bbox = cv2.boundingRect(cnt)
+    return bbox
+
+
+def centro(bbox):
+    x, y, w, h = bbox
+    return x + w / 2, y + h / 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="video grabado del Tello (por defecto uno sintético)")
+    parser.add_argument("--lower", type=int, nargs=3, default=[40, 50, 50])
+    parser.add_argument("--upper", type=int, nargs=3, default=[80, 255, 255])
+    parser.add_argument("--max-fallos", type=int, default=5)
+    args = parser.parse_args()
+
+    ruta = args.video or video_sintetico(n=600)
+    lower, upper = tuple(args.lower), tuple(args.upper)
+    cap = cv2.VideoCapture(ruta)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    seg_completo = SegmentadorHSV(WIDTH, HEIGHT)
+    seg_roi = SegmentadorHSV(WIDTH, HEIGHT)
+    roi = RastreadorROI(WIDTH, HEIGHT, max_fallos=args.max_fallos)
+
+    tiempos_completo, tiempos_roi = [], []
+    con_objeto = aciertos = 0
+    areas_ventana = []
+    i = 0
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frame = cv2.resize(frame, (WIDTH, HEIGHT))
+        t = i / fps
+        i += 1
+
+        inicio = time.perf_counter()
+        referencia = detectar(seg_completo, frame, lower, upper, None)
+        tiempos_completo.append(time.perf_counter() - inicio)
+
+        inicio = time.perf_counter()
+        ventana = roi.ventana(t)
+        bbox = detectar(seg_roi, frame, lower, upper, ventana)
+        roi.actualizar(bbox, t, ventana)
+        tiempos_roi.append(time.perf_counter() - inicio)
+
+        if ventana is not None:
+            areas_ventana.append((ventana[2] - ventana[0]) * (ventana[3] - ventana[1]) / (WIDTH * HEIGHT))
+        if referencia is not None:
+            con_objeto += 1
+            if bbox is not None and np.hypot(*np.subtract(centro(bbox), centro(referencia))) < 10:
+                aciertos += 1
+    cap.release()
+    if not args.video:
+        os.remove(ruta)
+
+    completo_ms = np.mean(tiempos_completo) * 1000
+    roi_ms = np.mean(tiempos_roi) * 1000
+    print(f"Frames: {i}  con objeto: {con_objeto}")
+    print(f"frame completo: {completo_ms:6.3f} ms/frame")
+    print(f"ROI:            {roi_ms:6.3f} ms/frame  ({completo_ms / roi_ms:4.1f}x)")
+    print(f"hit rate ROI:   {aciertos / max(con_objeto, 1):6.1%}")
+    print(f"búsquedas en ventana: {roi.busquedas_roi}  completas: {roi.busquedas_completas}  "
+          f"área media de ventana: {np.mean(areas_ventana) if areas_ventana else 0:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: pipeline HSV original vs SegmentadorHSV con buffers preasignados.
+
+Uso:
+    python -m benchmarks.bench_segmentacion [--frames 300]
+
+Para cada resolución (320x240, 640x480, 960x720) reporta frames/segundo y
+el pico de memoria nueva por frame medido con tracemalloc (numpy registra
+sus asignaciones ahí, incluidas las que regresa OpenCV). Se usan los
+parámetros de Clases/ColorTracking/color_tracking.py: blur 15x15, dos
+iteraciones de erosión/dilatación y bitwise_and para la vista filtrada.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from benchmarks.sinteticos import RESOLUCIONES, frames_sinteticos
+from tello_utils.segmentacion import SegmentadorHSV
+
+LOWER = (50, 80, 60)
+UPPER = (80, 255, 255)
+
+
+def pipeline_original(frame):
+    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    blurred = cv2.GaussianBlur(hsv, (15, 15), 0)
+    mask = cv2.inRange(blurred, np.array(LOWER), np.array(UPPER))
+    mask = cv2.erode(mask, None, iterations=2)
+    mask = cv2.dilate(mask, None, iterations=2)
+    result = cv2.bitwise_and(frame, frame, mask=mask)
+    return mask, result
+
+
+def crear_pipeline_motor(width, height):
+    motor = SegmentadorHSV(width, height, blur_ksize=15, iteraciones=2)
+
+    def pipeline(frame):
+        mask = motor.procesar(frame, LOWER, UPPER)
+        return mask, motor.aplicar_mascara(frame, mask)
+    return pipeline
+
+
+def medir(pipeline, frames):
+    # Calentamiento (asignación de buffers, caches de OpenCV)
+    for frame in frames[:10]:
+        pipeline(frame)
+
+    inicio = time.perf_counter()
+    for frame in frames:
+        pipeline(frame)
+    fps = len(frames) / (time.perf_counter() - inicio)
+
+    tracemalloc.start()
+    picos = []
+    for frame in frames[:50]:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        salida = pipeline(frame)
+        _, pico = tracemalloc.get_traced_memory()
+        picos.append(pico - base)
+        del salida
+    tracemalloc.stop()
+    return fps, float(np.mean(picos))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    print(f"{'resolución':<10} {'pipeline':<10} {'fps':>8} {'bytes/frame':>12}")
+    for width, height in RESOLUCIONES:
+        frames = frames_sinteticos(args.frames, width, height)
+        for nombre, pipeline in (("original", pipeline_original),
+                                 ("motor", crear_pipeline_motor(width, height))):
+            fps, bytes_frame = medir(pipeline, frames)
+            print(f"{width}x{height:<6} {nombre:<10} {fps:8.1f} {bytes_frame:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Benchmark: latencia comando→movimiento y lazo cerrado contra el simulador.
+
+Uso:
+    python -m benchmarks.bench_simulador [--ensayos 20]
+
+Levanta SimuladorTello en puertos alternos (sin video, no requiere PyAV ni
+djitellopy) y le habla por UDP como lo haría djitellopy:
+  1. Latencia: desde el envío de "rc 0 0 0 ±60" hasta el primer paquete de
+     estado con el yaw cambiado y hasta el primer render en el que el cubo se
+     movió 2 px (a 30 FPS). Incluye red local, el paso del modelo (100 Hz),
+     la constante de tiempo TAU_S y el periodo de estado (10 Hz).
+  2. Lazo cerrado: el dron arranca girado 25° respecto al cubo y se centra
+     con la segmentación HSV + PID de yaw de Practicas/2 sobre los renders;
+     reporta el tiempo hasta quedar dentro de ±32 px y cuántos rc llegaron.
+"""
+
+import argparse
+import socket
+import time
+
+import numpy as np
+
+from tello_utils.pid import PID, GANANCIAS_SEGUIMIENTO
+from tello_utils.segmentacion import SegmentadorHSV, objetivo_de_mascara
+from tello_utils.simulador import SimuladorTello
+
+PUERTO_COMANDOS, PUERTO_ESTADO = 18889, 18890
+WIDTH, HEIGHT = 640, 480
+LOWER, UPPER = (40, 50, 50), (80, 255, 255)
+FPS = 30.0
+
+
+class ClienteUDP:
+    """Lo mínimo del lado de djitellopy: comandos a 8889 y estado en 8890."""
+
+    def __init__(self):
+        self.cmd = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.cmd.settimeout(5.0)
+        self.estado = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.estado.bind(('127.0.0.1', PUERTO_ESTADO))
+        self.estado.settimeout(1.0 / FPS)
+        self.rc_enviados = 0
+
+    def comando(self, texto):
+        self.cmd.sendto(texto.encode(), ('127.0.0.1', PUERTO_COMANDOS))
+        return self.cmd.recv(1024).decode()
+
+    def rc(self, lr, fb, ud, yaw):
+        self.cmd.sendto(f"rc {lr} {fb} {ud} {yaw}".encode(), ('127.0.0.1', PUERTO_COMANDOS))
+        self.rc_enviados += 1
+
+    def leer_estado(self):
+        """Diccionario del último paquete recibido (o None si no llegó ninguno)."""
+        try:
+            datos = self.estado.recv(1024).decode().strip()
+        except socket.timeout:
+            return None
+        return dict(campo.split(':') for campo in datos.split(';') if ':' in campo)
+
+    def cerrar(self):
+        self.cmd.close()
+        self.estado.close()
+
+
+def centro_cubo(sim, segmentador):
+    frame = segmentador.redimensionar(sim.renderizar())
+    objetivo = objetivo_de_mascara('cubo', segmentador.procesar(frame, LOWER, UPPER), 300)
+    return None if objetivo is None else objetivo.cx
+
+
+def medir_latencia(sim, cliente, segmentador, ensayos):
+    lat_estado, lat_imagen = [], []
+    for k in range(ensayos):
+        cliente.rc(0, 0, 0, 0)
+        time.sleep(0.6)
+        while cliente.leer_estado() is not None:     # vaciar paquetes viejos
+            pass
+        yaw0 = None
+        while yaw0 is None:
+            estado = cliente.leer_estado()
+            yaw0 = None if estado is None else int(estado['yaw'])
+        cx0 = centro_cubo(sim, segmentador)
+
+        t0 = time.perf_counter()
+        cliente.rc(0, 0, 0, 60 if k % 2 == 0 else -60)
+        t_estado = t_imagen = None
+        while (t_estado is None or t_imagen is None) and time.perf_counter() - t0 < 2.0:
+            estado = cliente.leer_estado()
+            ahora = time.perf_counter()
+            if t_estado is None and estado is not None and abs(int(estado['yaw']) - yaw0) >= 1:
+                t_estado = ahora - t0
+            cx = centro_cubo(sim, segmentador)
+            if t_imagen is None and cx is not None and cx0 is not None and abs(cx - cx0) >= 2:
+                t_imagen = ahora - t0
+        if t_estado is not None:
+            lat_estado.append(t_estado)
+        if t_imagen is not None:
+            lat_imagen.append(t_imagen)
+    cliente.rc(0, 0, 0, 0)
+    return lat_estado, lat_imagen
+
+
+def lazo_cerrado(sim, cliente, segmentador, limite=3.0):
+    sim.yaw = -25.0
+    pid = PID(*GANANCIAS_SEGUIMIENTO['yaw'], limite=60, zona_muerta=5)
+    inicio = time.perf_counter()
+    enviados0, recibidos0 = cliente.rc_enviados, sim.comandos_recibidos
+    centrado = None
+    while time.perf_counter() - inicio < limite:
+        t = time.perf_counter()
+        cx = centro_cubo(sim, segmentador)
+        if cx is None:
+            pid.reiniciar()
+            cliente.rc(0, 0, 0, 0)
+        else:
+            error = cx - WIDTH // 2
+            cliente.rc(0, 0, 0, pid.actualizar(error, t))
+            if abs(error) <= 32 and centrado is None:
+                centrado = t - inicio
+            elif abs(error) > 32:
+                centrado = None
+        espera = 1.0 / FPS - (time.perf_counter() - t)
+        if espera > 0:
+            time.sleep(espera)
+    cliente.rc(0, 0, 0, 0)
+    return centrado, cliente.rc_enviados - enviados0, sim.comandos_recibidos - recibidos0
+
+
+def percentiles(valores):
+    if not valores:
+        return "sin datos"
+    v = np.array(valores) * 1000
+    return f"p50 {np.percentile(v, 50):.0f} ms  p95 {np.percentile(v, 95):.0f} ms  max {v.max():.0f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ensayos", type=int, default=20)
+    args = parser.parse_args()
+
+    sim = SimuladorTello(puerto_comandos=PUERTO_COMANDOS, puerto_estado=PUERTO_ESTADO, video=False).iniciar()
+    cliente = ClienteUDP()
+    segmentador = SegmentadorHSV(WIDTH, HEIGHT)
+    try:
+        assert cliente.comando("command") == "ok"
+        print(f"takeoff: {cliente.comando('takeoff')}  (altura {sim.pos[2]:.0f} cm)")
+
+        lat_estado, lat_imagen = medir_latencia(sim, cliente, segmentador, args.ensayos)
+        print(f"rc → estado ({len(lat_estado)}/{args.ensayos}): {percentiles(lat_estado)}")
+        print(f"rc → imagen ({len(lat_imagen)}/{args.ensayos}): {percentiles(lat_imagen)}")
+
+        centrado, enviados, recibidos = lazo_cerrado(sim, cliente, segmentador)
+        texto = f"{centrado:.2f} s" if centrado is not None else "no se centró"
+        print(f"Lazo cerrado (25° de error inicial): centrado en {texto}; rc enviados {enviados}, recibidos {recibidos}")
+        print(f"land: {cliente.comando('land')}")
+    finally:
+        cliente.cerrar()
+        sim.detener()
+
+
+if __name__ == "__main__":
+    main()
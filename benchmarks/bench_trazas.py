@@ -0,0 +1,122 @@
+"""
+Benchmark: trazas por etapa y latencia vidrio → comando de un pipeline tipo P2.
+
+Uso:
+    python -m benchmarks.bench_trazas [--frames 300] [--salida traza_bench.json]
+
+Un video sintético de 960x720 a 30 fps (el cubo verde sobre ruido) se
+reproduce en tiempo real con FrameGrabber; el loop hace lo mismo que
+update_frame de Practicas/2 (redimensionar a 640x480, convertir, segmentar,
+contornos, control proporcional, overlay) y publica el setpoint con la
+secuencia del frame en un CommandScheduler a 30 Hz con un dron falso.
+
+Reporta la tabla de etapas (p50/p95/p99/máximo) con la latencia vidrio →
+comando al final, escribe el archivo de trazas (abrir en chrome://tracing o
+ui.perfetto.dev) y mide el costo de las trazas: ns por tramo activo e
+inactivo y ms por frame del loop con y sin trazas.
+"""
+
+import argparse
+import os
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.bench_comandos import DronFalso
+from benchmarks.sinteticos import video_sintetico
+from tello_utils.captura import FrameGrabber
+from tello_utils.comandos import CommandScheduler
+from tello_utils.segmentacion import SegmentadorHSV
+from tello_utils.trazas import VIDRIO_A_COMANDO, Trazador
+
+WIDTH, HEIGHT = 640, 480
+LOWER, UPPER = (40, 50, 50), (80, 255, 255)
+
+
+def correr(ruta, traza):
+    """Loop tipo P2 sobre el video; regresa ms por frame (sin esperar a la cámara)."""
+    grabber = FrameGrabber.desde_video(ruta)
+    grabber.trazador = traza
+    rc = CommandScheduler(DronFalso(), frecuencia=30)
+    rc.trazador = traza
+    rc.iniciar()
+    rc.reanudar()
+    segmentador = SegmentadorHSV(WIDTH, HEIGHT)
+    tiempos = []
+    seq = 0
+    grabber.iniciar()
+    while True:
+        paquete = grabber.esperar(seq)
+        if paquete is None:
+            break
+        seq = paquete.seq
+        inicio = time.perf_counter()
+        with traza.tramo('redimensionar', seq):
+            frame = segmentador.redimensionar(paquete.imagen)
+        with traza.tramo('convertir', seq):
+            hsv = segmentador.convertir(frame)
+        with traza.tramo('segmentar', seq):
+            mask = segmentador.segmentar(hsv, LOWER, UPPER)
+        with traza.tramo('contornos', seq):
+            contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+            cx = None
+            if contours:
+                x, y, w, h = cv2.boundingRect(max(contours, key=cv2.contourArea))
+                cx = x + w // 2
+        with traza.tramo('overlay', seq):
+            cv2.putText(frame, f"seq {seq}", (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+        t_control = traza.reloj()
+        yaw = 0 if cx is None else int(np.clip((cx - WIDTH // 2) * 0.3, -100, 100))
+        rc.fijar(0, 0, 0, yaw, seq=seq)
+        traza.registrar('control', seq, t_control, traza.reloj())
+        tiempos.append(time.perf_counter() - inicio)
+    # Deja salir el último comando antes de cerrar
+    time.sleep(0.1)
+    grabber.detener()
+    rc.detener()
+    return np.array(tiempos) * 1000
+
+
+def costo_tramo(traza, n=200000):
+    inicio = time.perf_counter()
+    for i in range(n):
+        with traza.tramo('vacio', i):
+            pass
+    return (time.perf_counter() - inicio) / n * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--salida", default="traza_bench.json")
+    args = parser.parse_args()
+
+    ruta = video_sintetico(args.frames)
+    try:
+        inactiva = correr(ruta, Trazador('bench', activo=False))
+        traza = Trazador('bench')
+        activa = correr(ruta, traza)
+    finally:
+        os.remove(ruta)
+
+    print(traza.tabla())
+    n = traza.exportar(args.salida)
+    print(f"\n{n} tramos en {args.salida}")
+    vidrio = traza.resumen().get(VIDRIO_A_COMANDO)
+    if vidrio:
+        print(f"Vidrio → comando: p50 {vidrio['p50_ms']:.2f} ms, p99 {vidrio['p99_ms']:.2f} ms "
+              f"({vidrio['n']} de {len(activa)} frames cambiaron el setpoint)")
+
+    activo_ns = costo_tramo(Trazador('micro', historial=1000))
+    inactivo_ns = costo_tramo(Trazador('micro', activo=False))
+    print(f"\nCosto por tramo: activo {activo_ns:.0f} ns, inactivo {inactivo_ns:.0f} ns")
+    print(f"{'trazas':<9} {'p50':>8} {'p95':>8}")
+    for nombre, t in (("inactivas", inactiva), ("activas", activa)):
+        print(f"{nombre:<9} {np.percentile(t, 50):6.2f}ms {np.percentile(t, 95):6.2f}ms")
+    sobrecosto = (np.median(activa) - np.median(inactiva)) / np.median(inactiva)
+    print(f"Sobrecosto (p50): {sobrecosto:+.1%}")
+
+
+if __name__ == "__main__":
+    main()
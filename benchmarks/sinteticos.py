@@ -0,0 +1,70 @@
+"""
+Generación de entradas sintéticas para los benchmarks.
+
+Escena: un cubo verde (dentro del rango "Verde Rubix") que se mueve sobre
+un fondo con ruido, similar a lo que ve el Tello al seguir el cubo.
+"""
+
+import os
+import tempfile
+
+import cv2
+import numpy as np
+
+RESOLUCIONES = [(320, 240), (640, 480), (960, 720)]
+
+VERDE_BGR = (40, 180, 40)
+
+
+def posicion_cubo(i, width, height):
+    # Trayectoria tipo Lissajous, suave como la de un objeto sostenido a mano
+    cx = int(width / 2 + 0.35 * width * np.sin(i * 0.05))
+    cy = int(height / 2 + 0.30 * height * np.sin(i * 0.031 + 1.0))
+    lado = int(0.12 * min(width, height) * (1.0 + 0.3 * np.sin(i * 0.017)))
+    return cx, cy, lado
+
+
+def frame_sintetico(i, width=640, height=480, rng=None):
+    rng = rng if rng is not None else np.random.default_rng(i)
+    fondo = rng.integers(60, 140, size=(height, width, 3), dtype=np.uint8)
+    cx, cy, lado = posicion_cubo(i, width, height)
+    cv2.rectangle(fondo, (cx - lado // 2, cy - lado // 2), (cx + lado // 2, cy + lado // 2), VERDE_BGR, -1)
+    return fondo
+
+
+def frames_sinteticos(n, width=640, height=480, seed=0):
+    rng = np.random.default_rng(seed)
+    return [frame_sintetico(i, width, height, rng) for i in range(n)]
+
+
+def video_sintetico(n=300, width=960, height=720, fps=30, ruta=None):
+    """Escribe un video sintético (mp4v) y regresa su ruta."""
+    if ruta is None:
+        fd, ruta = tempfile.mkstemp(suffix=".mp4", prefix="tello_sintetico_")
+        os.close(fd)
+    writer = cv2.VideoWriter(ruta, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+    rng = np.random.default_rng(0)
+    for i in range(n):
+        writer.write(frame_sintetico(i, width, height, rng))
+    writer.release()
+    return ruta
+
+
+def sesion_sintetica(n=300, width=960, height=720, fps=30, ruta=None):
+    """Escribe una sesión .tlog sintética (frames + telemetría a 10 Hz) y regresa su ruta."""
+    from tello_utils.grabacion import GrabadorSesion
+    from tello_utils.telemetria import Telemetria
+
+    if ruta is None:
+        fd, ruta = tempfile.mkstemp(suffix=".tlog", prefix="tello_sintetico_")
+        os.close(fd)
+    grabador = GrabadorSesion(ruta, calidad=90, max_bytes_s=1e12, cola=n * 2 + 8).iniciar()
+    rng = np.random.default_rng(0)
+    t0 = 1000.0
+    for i in range(n):
+        t = t0 + i / fps
+        grabador.frame(frame_sintetico(i, width, height, rng), t, copiar=False)
+        if i % 3 == 0:
+            grabador.telemetria(Telemetria(t, 90 - i // 300, 100, 0, 0, 0, 0, 0, 0, 40.0))
+    grabador.detener()
+    return ruta
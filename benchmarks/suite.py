@@ -0,0 +1,312 @@
+"""
+Suite de benchmarks: todas las rutas críticas de visión y control con un
+archivo de resultados legible por máquina, y comparación entre corridas.
+
+Uso:
+    python -m benchmarks.suite correr [--salida resultados.json] [--frames 200]
+                                      [--resoluciones 320x240,640x480,960x720]
+                                      [--casos color_tracking,detect_and_draw,...] [--video clip.mp4]
+    python -m benchmarks.suite comparar base.json nuevo.json [--umbral 0.10]
+                                        [--metricas p50_ms,fps,memoria_pico_kb]
+
+Casos (cada uno a cada resolución salvo gestos, que no usa frames):
+  color_tracking:  pipeline de Clases/ColorTracking (blur 15, 2 iteraciones,
+                   máscara aplicada, contornos y marcas),
+  detect_and_draw: el de Practicas/2 (convertir, segmentar, contornos,
+                   approxPolyDP y dibujo del objetivo),
+  gestos:          clasificar_mano() de una mano de MediaPipe (Practicas/3),
+  manos, rostros, pose: los detectores de MediaPipe de Clases/AI sobre un
+                   FrameCompartido (se omiten si mediapipe no está instalado),
+  overlay:         HUD de Practicas/2 con Overlay (guías en capa, 8 campos
+                   que cambian cada 10 frames),
+  panel_tk:        conversión BGR → imagen PIL RGBA de PanelTk (sin la
+                   PhotoImage, que necesita pantalla).
+
+Entradas: frames sintéticos (el cubo verde sobre ruido) generados a cada
+resolución, o con --video los frames de un clip grabado escalados.
+
+Por caso: fps (llamadas por segundo de cómputo), latencia p50/p95/p99 y
+memoria pico por llamada (tracemalloc en una pasada aparte, sin los buffers
+que el caso preasigna al construirse). `comparar` marca como regresión un
+cambio peor que --umbral (relativo) en las métricas elegidas (más fps es
+mejor; en las demás, menos) y regresa 1 si hubo alguna, para usarse en CI.
+Las diferencias de memoria menores a --minimo-kb no cuentan.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from benchmarks.bench_gestos import manos_sinteticas
+from benchmarks.sinteticos import RESOLUCIONES, frames_sinteticos
+from tello_utils import gestos
+from tello_utils.detectores import DetectorManos, DetectorPose, DetectorRostros, FrameCompartido
+from tello_utils.interfaz import ConversorRGBA
+from tello_utils.overlay import Overlay
+from tello_utils.segmentacion import SegmentadorHSV
+
+LOWER, UPPER = (40, 50, 50), (80, 255, 255)
+MENORES_MEJOR = ('p50_ms', 'p95_ms', 'p99_ms', 'memoria_pico_kb')
+
+
+# ---------------------------------------------------------------------
+# Casos: construir(width, height) -> funcion(frame, i)
+# ---------------------------------------------------------------------
+def color_tracking(width, height):
+    segmentador = SegmentadorHSV(width, height, blur_ksize=15, iteraciones=2)
+    area_min = 0.05 * width * height
+
+    def funcion(frame, i):
+        mask = segmentador.procesar(frame, LOWER, UPPER)
+        segmentador.aplicar_mascara(frame, mask)
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+        for contour in contours:
+            if cv2.contourArea(contour) < area_min:
+                cv2.drawContours(frame, contour, -1, (255, 0, 255), 7)
+                approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
+                x, y, w, h = cv2.boundingRect(approx)
+                cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 5)
+                cv2.circle(frame, (x + w // 2, y + h // 2), 5, (0, 0, 255), cv2.FILLED)
+    return funcion
+
+
+def detect_and_draw(width, height):
+    segmentador = SegmentadorHSV(width, height)
+    area_min = 0.002 * width * height
+
+    def funcion(frame, i):
+        mask = segmentador.segmentar(segmentador.convertir(frame), LOWER, UPPER)
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+        for cnt in contours:
+            if cv2.contourArea(cnt) > area_min:
+                approx = cv2.approxPolyDP(cnt, 0.02 * cv2.arcLength(cnt, True), True)
+                x, y, w, h = cv2.boundingRect(approx)
+                cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 255), 2)
+                cv2.line(frame, (width // 2, height // 2), (x + w // 2, y + h // 2), (0, 0, 255), 2)
+    return funcion
+
+
+def clasificar_gestos(width, height):
+    manos = [m.landmark for m in manos_sinteticas(256)]
+
+    def funcion(frame, i):
+        gestos.clasificar_mano(manos[i % len(manos)])
+    return funcion
+
+
+def detector_mediapipe(clase):
+    def construir(width, height):
+        detector = clase()
+        return lambda frame, i: detector.detectar(FrameCompartido(frame))
+    return construir
+
+
+def overlay(width, height):
+    hud = Overlay(width, height)
+    guias = hud.capa('guias')
+    x_th, y_th = int(0.15 * width), int(0.15 * height)
+    for x in (width // 2 - x_th, width // 2 + x_th):
+        guias.linea((x, 0), (x, height), (255, 0, 0), 2)
+    for y in (height // 2 - y_th, height // 2 + y_th):
+        guias.linea((0, y), (width, y), (255, 0, 0), 2)
+    for nombre, org in (('bateria', (10, 20)), ('altura', (10, 45)), ('estado', (10, 70)),
+                        ('speed', (width - 150, 50)), ('direccion_x', (width - 200, 110)),
+                        ('direccion_y', (width - 200, 135)), ('centro', (10, height - 45)),
+                        ('area', (10, height - 75))):
+        hud.campo(nombre, org)
+
+    def funcion(frame, i):
+        k = i // 10
+        c = hud.campos
+        c['bateria'].fijar(f"Bateria: {90 - k // 20}%")
+        c['altura'].fijar(f"Altura: {100 + k % 7}cm")
+        c['estado'].fijar("Estado: Volando")
+        c['speed'].fijar("Speed: 20")
+        c['direccion_x'].fijar("Izquierda" if k % 3 == 0 else "Centro X")
+        c['direccion_y'].fijar("Arriba" if k % 4 == 0 else "Centro Y")
+        c['centro'].fijar(f"Centro: ({300 + (k * 13) % 60}, {200 + (k * 7) % 40})")
+        c['area'].fijar(f"Area: {5000 + (k * 31) % 500}")
+        hud.componer(frame)
+    return funcion
+
+
+def panel_tk(width, height):
+    conversor = ConversorRGBA(width, height)
+    return lambda frame, i: conversor.convertir(frame)
+
+
+# nombre -> (construir, usa frames)
+CASOS = {
+    'color_tracking': (color_tracking, True),
+    'detect_and_draw': (detect_and_draw, True),
+    'gestos': (clasificar_gestos, False),
+    'manos': (detector_mediapipe(DetectorManos), True),
+    'rostros': (detector_mediapipe(DetectorRostros), True),
+    'pose': (detector_mediapipe(DetectorPose), True),
+    'overlay': (overlay, True),
+    'panel_tk': (panel_tk, True),
+}
+
+
+# ---------------------------------------------------------------------
+# Medición
+# ---------------------------------------------------------------------
+def medir(funcion, frames, n):
+    """fps, percentiles (ms) y memoria pico (KB) de n llamadas sobre los frames."""
+    for i in range(min(5, n)):
+        funcion(frames[i % len(frames)], i)     # calentamiento
+    tiempos = np.empty(n)
+    for i in range(n):
+        frame = frames[i % len(frames)]
+        inicio = time.perf_counter()
+        funcion(frame, i)
+        tiempos[i] = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    for i in range(min(30, n)):
+        funcion(frames[i % len(frames)], i)
+    pico = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(tiempos * 1000, [50, 95, 99])
+    return {'llamadas': n, 'fps': round(n / tiempos.sum(), 2), 'p50_ms': round(float(p50), 4),
+            'p95_ms': round(float(p95), 4), 'p99_ms': round(float(p99), 4),
+            'memoria_pico_kb': round(pico / 1024, 1)}
+
+
+def frames_video(ruta, n, width, height):
+    cap = cv2.VideoCapture(ruta)
+    frames = []
+    while len(frames) < n:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(cv2.resize(frame, (width, height)))
+    cap.release()
+    if not frames:
+        raise SystemExit(f"No se pudieron leer frames de {ruta}")
+    return frames
+
+
+def correr(args):
+    resoluciones = [tuple(int(v) for v in r.split('x')) for r in args.resoluciones.split(',')]
+    nombres = [c.strip() for c in args.casos.split(',')] if args.casos else list(CASOS)
+    resultados = {
+        'meta': {
+            'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'opencv': cv2.__version__,
+            'plataforma': platform.platform(),
+            'procesador': platform.processor() or platform.machine(),
+            'cpus': os.cpu_count(),
+            'entrada': args.video or 'sintética',
+            'frames': args.frames,
+        },
+        'casos': {},
+        'omitidos': {},
+    }
+
+    print(f"{'caso':<28} {'fps':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'pico':>9}")
+    for width, height in resoluciones:
+        if args.video:
+            base = frames_video(args.video, args.frames, width, height)
+        else:
+            base = frames_sinteticos(min(args.frames, 60), width, height)
+        for nombre in nombres:
+            construir, usa_frames = CASOS[nombre]
+            if not usa_frames and (width, height) != resoluciones[0]:
+                continue
+            clave = f"{nombre}@{width}x{height}" if usa_frames else nombre
+            try:
+                funcion = construir(width, height)
+            except ImportError as e:
+                resultados['omitidos'][nombre] = str(e)
+                continue
+            r = medir(funcion, [f.copy() for f in base], args.frames)
+            r.update(caso=nombre, resolucion=f"{width}x{height}" if usa_frames else None)
+            resultados['casos'][clave] = r
+            print(f"{clave:<28} {r['fps']:9.1f} {r['p50_ms']:7.3f}ms {r['p95_ms']:7.3f}ms "
+                  f"{r['p99_ms']:7.3f}ms {r['memoria_pico_kb']:7.1f}KB")
+
+    for nombre, motivo in resultados['omitidos'].items():
+        print(f"{nombre}: omitido ({motivo})")
+    with open(args.salida, 'w') as f:
+        json.dump(resultados, f, indent=2, ensure_ascii=False)
+    print(f"\nResultados en {args.salida}")
+
+
+# ---------------------------------------------------------------------
+# Comparación
+# ---------------------------------------------------------------------
+def comparar_resultados(base, nuevo, umbral, metricas, minimo_kb=16.0):
+    """Lista de (caso, métrica, antes, después, cambio relativo, regresión)."""
+    filas = []
+    for clave in sorted(set(base['casos']) & set(nuevo['casos'])):
+        for m in metricas:
+            antes, despues = base['casos'][clave][m], nuevo['casos'][clave][m]
+            cambio = (despues - antes) / antes if antes else 0.0
+            peor = cambio > umbral if m in MENORES_MEJOR else cambio < -umbral
+            if m == 'memoria_pico_kb' and abs(despues - antes) < minimo_kb:
+                peor = False
+            filas.append((clave, m, antes, despues, cambio, peor))
+    return filas
+
+
+def comparar(args):
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.nuevo) as f:
+        nuevo = json.load(f)
+    metricas = [m.strip() for m in args.metricas.split(',')]
+
+    filas = comparar_resultados(base, nuevo, args.umbral, metricas, args.minimo_kb)
+    print(f"{'caso':<28} {'métrica':<16} {'antes':>10} {'después':>10} {'cambio':>8}")
+    for clave, m, antes, despues, cambio, peor in filas:
+        marca = "  REGRESIÓN" if peor else ""
+        print(f"{clave:<28} {m:<16} {antes:10.3f} {despues:10.3f} {cambio:+8.1%}{marca}")
+    for clave in sorted(set(base['casos']) ^ set(nuevo['casos'])):
+        print(f"{clave}: solo en {args.base if clave in base['casos'] else args.nuevo}")
+    if base['meta'].get('procesador') != nuevo['meta'].get('procesador'):
+        print("Aviso: los resultados son de máquinas distintas")
+
+    regresiones = sum(1 for fila in filas if fila[5])
+    print(f"\n{regresiones} regresiones (umbral {args.umbral:.0%})")
+    return 1 if regresiones else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("correr", help="corre la suite y escribe los resultados")
+    p.add_argument("--salida", default="resultados.json")
+    p.add_argument("--frames", type=int, default=200, help="llamadas por caso y resolución")
+    p.add_argument("--resoluciones", default=",".join(f"{w}x{h}" for w, h in RESOLUCIONES))
+    p.add_argument("--casos", help=f"subconjunto de: {', '.join(CASOS)}")
+    p.add_argument("--video", help="clip grabado en lugar de frames sintéticos")
+
+    p = sub.add_parser("comparar", help="compara dos archivos de resultados")
+    p.add_argument("base")
+    p.add_argument("nuevo")
+    p.add_argument("--umbral", type=float, default=0.10)
+    p.add_argument("--metricas", default="p50_ms,fps,memoria_pico_kb")
+    p.add_argument("--minimo-kb", type=float, default=16.0)
+
+    args = parser.parse_args()
+    if args.comando == "correr":
+        correr(args)
+    else:
+        sys.exit(comparar(args))
+
+
+if __name__ == "__main__":
+    main()
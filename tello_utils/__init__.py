@@ -0,0 +1,6 @@
+"""
+Utilidades compartidas para las prácticas con el dron Tello.
+
+Los scripts de Practicas/ y Clases/ importan estos módulos agregando la
+raíz del repositorio al sys.path.
+"""
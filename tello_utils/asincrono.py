@@ -0,0 +1,239 @@
+"""
+Runtime de asyncio para los scripts: tareas independientes en lugar de after().
+
+Con root.after() todo lo que corre en el hilo de la interfaz hace fila: un
+drone.takeoff() (el SDK espera el "ok" del dron, varios segundos) o un
+time.sleep(0.5) en un manejador de tecla congela el video hasta que
+regresan. RuntimeAsyncio envuelve la raíz de crear_raiz() y corre todo en
+un loop de asyncio:
+  - tareas periódicas (cada()): el procesamiento de frames de cada script,
+    con el hueco entre ejecuciones medido,
+  - la interfaz: una tarea atiende los eventos de Tk con raiz.update() a
+    hz_ui (en headless no hay eventos que atender),
+  - acciones de vuelo (accion()): takeoff/land se mandan a un hilo del
+    ejecutor y regresan una tarea que se puede esperar con await; mientras
+    tanto el loop sigue procesando frames. Con encolar=True una acción
+    pedida durante otra (land durante el takeoff) corre cuando esa termine.
+
+La captura (FrameGrabber), la telemetría (TelemetryCache), el envío de rc
+(CommandScheduler) y la inferencia (InferenceWorker) ya corren en sus
+propios hilos y nunca bloquean al loop, así que el runtime no los
+reemplaza. Las tareas, after() y al_terminar corren en el hilo del loop
+(el mismo de Tk): pueden tocar widgets y globales como antes.
+
+    runtime = RuntimeAsyncio(root)
+    runtime.cada(0.005, update_frame)
+    runtime.accion('takeoff', drone.takeoff, al_terminar=al_despegar)
+    runtime.correr()                        # en lugar de root.mainloop()
+
+resumen() da, por tarea periódica, ejecuciones, periodo p50 y el peor hueco
+entre dos ejecuciones (lo que se congeló el video), y por acción cuántas
+hubo y la más larga.
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+class RuntimeAsyncio:
+    """
+    raiz:         tk.Tk o BucleHeadless (crear_raiz()); con Tk se atiende
+                  desde una tarea en lugar de mainloop().
+    hz_ui:        veces por segundo que se atienden los eventos de Tk.
+    trabajadores: hilos para las acciones bloqueantes.
+    historial:    intervalos guardados por tarea periódica.
+    """
+
+    def __init__(self, raiz, hz_ui=100, trabajadores=2, historial=2000):
+        self.raiz = raiz
+        self.loop = asyncio.new_event_loop()
+        self._hz_ui = hz_ui
+        self._historial = historial
+        self._ejecutor = ThreadPoolExecutor(max_workers=trabajadores, thread_name_prefix="accion")
+        self._tareas = set()
+        self._fin = None                 # asyncio.Event, se crea dentro del loop
+        self._detenido = False
+
+        # Acción de vuelo en curso (una a la vez)
+        self._accion = None              # concurrent.futures.Future
+        self._nombre_accion = None
+
+        # Estadísticas
+        self.ejecuciones = {}            # tarea periódica -> veces que corrió
+        self.intervalos = {}             # tarea -> deque de segundos entre ejecuciones
+        self.acciones = {}               # nombre -> [veces, duración máxima]
+
+    # -----------------------------------------------------------------
+    # Interfaz de la raíz (bind/title/after como tk.Tk)
+    # -----------------------------------------------------------------
+    def bind(self, *args):
+        return self.raiz.bind(*args)
+
+    def title(self, *args):
+        return self.raiz.title(*args)
+
+    def after(self, ms, fn, *args):
+        """Llama fn(*args) en ms milisegundos desde el loop (regresa un handle con cancel())."""
+        return self.loop.call_later(ms / 1000.0, fn, *args)
+
+    # -----------------------------------------------------------------
+    # Tareas
+    # -----------------------------------------------------------------
+    def tarea(self, coro, nombre=None):
+        """Agenda una corrutina en el loop; los errores se imprimen, no se pierden."""
+        t = self.loop.create_task(coro, name=nombre)
+        self._tareas.add(t)
+        t.add_done_callback(self._tarea_terminada)
+        return t
+
+    def _tarea_terminada(self, t):
+        self._tareas.discard(t)
+        # SystemExit (sys.exit() en clean_exit) sale de correr() sin reportarse
+        if not t.cancelled() and isinstance(t.exception(), Exception):
+            print(f"Error en la tarea {t.get_name()}: {t.exception()}")
+
+    def cada(self, periodo_s, fn, nombre=None):
+        """Tarea que llama fn() y espera periodo_s, como fn reagendándose con after()."""
+        nombre = nombre or fn.__name__
+        intervalos = self.intervalos.setdefault(nombre, deque(maxlen=self._historial))
+        self.ejecuciones.setdefault(nombre, 0)
+
+        async def bucle():
+            anterior = None
+            while True:
+                ahora = time.perf_counter()
+                if anterior is not None:
+                    intervalos.append(ahora - anterior)
+                anterior = ahora
+                self.ejecuciones[nombre] += 1
+                fn()
+                await asyncio.sleep(periodo_s)
+        return self.tarea(bucle(), nombre)
+
+    async def _atender_ui(self):
+        periodo = 1.0 / self._hz_ui
+        while True:
+            try:
+                self.raiz.update()
+            except Exception:
+                # La ventana se cerró (TclError)
+                self.detener()
+                return
+            await asyncio.sleep(periodo)
+
+    # -----------------------------------------------------------------
+    # Acciones de vuelo
+    # -----------------------------------------------------------------
+    def accion(self, nombre, fn, *args, espera_s=0.0, al_terminar=None, encolar=False):
+        """
+        Corre fn(*args) (takeoff, land, ...) en un hilo del ejecutor, tras
+        espera_s (p. ej. para que el hover de rc.pausar() llegue antes del
+        land). al_terminar(ok) se llama en el loop al terminar. Regresa una
+        tarea awaitable con el resultado, o None si ya hay otra acción en
+        curso; con encolar=True en ese caso corre en cuanto la otra termine
+        (aunque haya fallado), salvo que la pendiente sea la misma acción.
+        """
+        previa = self._accion if self.accion_en_curso is not None else None
+        if previa is not None and (not encolar or self._nombre_accion == nombre):
+            print(f"{nombre} ignorado: {self._nombre_accion} en curso")
+            return None
+        inicio = [time.perf_counter()]
+
+        def ejecutar():
+            if previa is not None:
+                try:
+                    previa.result()
+                except Exception:
+                    pass
+                inicio[0] = time.perf_counter()
+            if espera_s:
+                time.sleep(espera_s)
+            return fn(*args)
+
+        # Se envía ya (no al correr la tarea): terminar_accion() lo ve aunque el loop no avance
+        futuro = self._ejecutor.submit(ejecutar)
+        self._accion, self._nombre_accion = futuro, nombre
+
+        async def esperar():
+            try:
+                resultado, ok = await asyncio.wrap_future(futuro), True
+            except Exception as e:
+                print(f"Error en {nombre}: {e}")
+                resultado, ok = None, False
+            veces, maximo = self.acciones.get(nombre, (0, 0.0))
+            self.acciones[nombre] = [veces + 1, max(maximo, time.perf_counter() - inicio[0])]
+            if al_terminar is not None:
+                al_terminar(ok)
+            return resultado
+        return self.tarea(esperar(), nombre)
+
+    @property
+    def accion_en_curso(self):
+        """Nombre de la acción que aún no termina (la última pedida si hay una en cola), o None."""
+        if self._accion is None or self._accion.done():
+            return None
+        return self._nombre_accion
+
+    def terminar_accion(self, timeout=10.0):
+        """Bloquea hasta que terminen la acción en curso y las encoladas (al salir, antes de aterrizar)."""
+        if self._accion is None:
+            return
+        try:
+            self._accion.result(timeout=timeout)
+        except Exception:
+            pass
+
+    # -----------------------------------------------------------------
+    # Ciclo de vida
+    # -----------------------------------------------------------------
+    def correr(self):
+        """Bloquea hasta detener() o hasta que se cierre la ventana; reemplaza a mainloop()."""
+        try:
+            self.loop.run_until_complete(self.tarea(self._principal(), "principal"))
+        finally:
+            # También si se salió por sys.exit() o Ctrl+C desde una tarea
+            pendientes = [t for t in self._tareas if not t.done()]
+            for t in pendientes:
+                t.cancel()
+            if pendientes:
+                # gather() sin tareas tomaría el loop por defecto, no self.loop
+                self.loop.run_until_complete(asyncio.gather(*pendientes, return_exceptions=True))
+            self._ejecutor.shutdown(wait=False)
+            self.loop.close()
+
+    async def _principal(self):
+        self._fin = asyncio.Event()
+        if self._detenido:
+            self._fin.set()
+        if hasattr(self.raiz, 'update'):
+            self.tarea(self._atender_ui(), "ui")
+        await self._fin.wait()
+
+    def detener(self):
+        """Termina correr() y destruye la raíz (se puede llamar desde una tarea o un callback)."""
+        if self._detenido:
+            return
+        self._detenido = True
+        if self._fin is not None:
+            self._fin.set()
+        self.raiz.destroy()
+
+    def resumen(self):
+        """Por tarea periódica: ejecuciones, periodo p50 y hueco máximo (ms); por acción: veces y máximo (s)."""
+        r = {}
+        for nombre, intervalos in self.intervalos.items():
+            if not intervalos:
+                continue
+            ms = np.array(intervalos) * 1000
+            r[nombre] = {
+                'ejecuciones': self.ejecuciones[nombre],
+                'periodo_p50_ms': round(float(np.percentile(ms, 50)), 2),
+                'hueco_max_ms': round(float(ms.max()), 2),
+            }
+        r['acciones'] = {nombre: {'veces': veces, 'max_s': round(maximo, 2)}
+                         for nombre, (veces, maximo) in self.acciones.items()}
+        return r
@@ -0,0 +1,172 @@
+"""
+Cadencia adaptativa para modelos de landmarks (MediaPipe Hands/Face/Pose).
+
+Antes los scripts corrían el modelo completo en cada frame capturado aunque
+la escena no hubiera cambiado. CadenciaAdaptativa decide frame por frame si
+vale la pena correrlo:
+  - mide el movimiento con una miniatura (32x24 por defecto) contra la
+    miniatura del último frame inferido: la fracción de celdas en las que
+    algún canal cambió más de `umbral_nivel` niveles (en color, porque un
+    objeto verde sobre fondo gris casi no cambia la luminancia). La
+    miniatura sale de muestrear una rejilla 4 veces más fina (INTER_NEAREST)
+    y promediarla (INTER_AREA): ~0.1 ms en 640x480 contra ~0.5 ms con
+    INTER_AREA sobre el frame completo,
+  - con movimiento, o si el último resultado no fue confiable, corre el
+    modelo (cadencia completa),
+  - con la escena quieta y un resultado confiable, reutiliza la última
+    salida y solo refresca cada intervalo_inicial_s, duplicando el
+    intervalo en cada refresco sin cambios hasta intervalo_max_s,
+  - presupuesto_cpu limita la fracción de un núcleo que puede usar el
+    modelo: con su duración promedio se calcula el periodo mínimo entre
+    inferencias, aun con movimiento (None = sin límite).
+
+procesar() regresa la salida nueva o la reutilizada, así que el código que
+la consume no cambia. Los tiempos vienen de `reloj` (time.monotonic por
+defecto; drone.ahora en una reproducción con reloj virtual).
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+
+def confianza_manos(result):
+    """Resultado de MediaPipe Hands → confianza (score de handedness); 1.0 si no hay manos."""
+    if not result.multi_hand_landmarks:
+        return 1.0
+    return min(h.classification[0].score for h in result.multi_handedness)
+
+
+def confianza_rostros(results):
+    """Resultado de MediaPipe Face Detection → score mínimo de las detecciones; 1.0 si no hay."""
+    if not results.detections:
+        return 1.0
+    return min(d.score[0] for d in results.detections)
+
+
+def confianza_pose(results):
+    """Resultado de MediaPipe Pose → visibilidad promedio de los landmarks; 1.0 si no hay pose."""
+    if not results.pose_landmarks:
+        return 1.0
+    return float(np.mean([p.visibility for p in results.pose_landmarks.landmark]))
+
+
+class CadenciaAdaptativa:
+    """
+    umbral_movimiento: fracción de celdas de la miniatura que deben cambiar
+                       para considerar que hubo movimiento.
+    umbral_nivel:      diferencia (0-255) a partir de la cual cambia una celda.
+    confianza_min:     por debajo, el resultado no se reutiliza.
+    presupuesto_cpu:   fracción de un núcleo para el modelo (None = sin límite).
+    """
+
+    def __init__(self, umbral_movimiento=0.005, umbral_nivel=12, confianza_min=0.6,
+                 intervalo_inicial_s=0.1, intervalo_max_s=0.5, presupuesto_cpu=None,
+                 miniatura=(32, 24), reloj=time.monotonic):
+        self.umbral_movimiento = umbral_movimiento
+        self.umbral_nivel = umbral_nivel
+        self.confianza_min = confianza_min
+        self.intervalo_inicial_s = intervalo_inicial_s
+        self.intervalo_max_s = intervalo_max_s
+        self.presupuesto_cpu = presupuesto_cpu
+        self.reloj = reloj
+        self._tam = miniatura
+        self._rejilla = (4 * miniatura[0], 4 * miniatura[1])
+        self._miniatura = None
+        self._referencia = None              # miniatura del último frame inferido
+        self._salida = None
+        self._inferido = False
+        self._confiable = False
+        self._t_inferencia = None
+        self._intervalo = 0.0
+        self._modelo_s = None                # promedio exponencial de la duración del modelo
+        self.movimiento = 0.0
+        self.frames = 0
+        self.inferencias = 0
+        self.por_presupuesto = 0             # frames con movimiento que esperaron por el presupuesto
+        self.tiempo_modelo = 0.0
+        self._t_primero = None
+
+    def _medir_movimiento(self, imagen):
+        rejilla = cv2.resize(imagen, self._rejilla, interpolation=cv2.INTER_NEAREST)
+        self._miniatura = cv2.resize(rejilla, self._tam, interpolation=cv2.INTER_AREA)
+        if self._referencia is None or self._referencia.shape != self._miniatura.shape:
+            return 1.0
+        diferencia = cv2.absdiff(self._miniatura, self._referencia)
+        if diferencia.ndim == 3:
+            diferencia = diferencia.max(axis=2)
+        return np.count_nonzero(diferencia > self.umbral_nivel) / diferencia.size
+
+    def periodo_minimo(self):
+        """Segundos mínimos entre inferencias para respetar presupuesto_cpu."""
+        if self.presupuesto_cpu is None or self._modelo_s is None:
+            return 0.0
+        return self._modelo_s / self.presupuesto_cpu
+
+    def _debe_inferir(self, imagen, t):
+        """Mide el movimiento del frame y decide si toca correr el modelo."""
+        self.movimiento = self._medir_movimiento(imagen)
+        if self._t_inferencia is None:
+            return True
+        transcurrido = t - self._t_inferencia
+        urgente = self.movimiento >= self.umbral_movimiento or not self._confiable
+        if transcurrido < self.periodo_minimo():
+            self.por_presupuesto += urgente
+            return False
+        if urgente:
+            self._intervalo = 0.0
+            return True
+        # Escena quieta y resultado confiable: refresco cada vez más espaciado
+        if transcurrido >= self._intervalo:
+            self._intervalo = min(max(2 * self._intervalo, self.intervalo_inicial_s), self.intervalo_max_s)
+            return True
+        return False
+
+    def procesar(self, imagen, modelo, confianza=None, t=None):
+        """
+        Salida de modelo(imagen), o la última si no hace falta volver a
+        correrlo. confianza: función salida -> [0, 1] (None = siempre confiable).
+        """
+        t = self.reloj() if t is None else t
+        self.frames += 1
+        if self._t_primero is None:
+            self._t_primero = t
+        self._inferido = self._debe_inferir(imagen, t)
+        if not self._inferido:
+            return self._salida
+
+        inicio = time.perf_counter()
+        self._salida = modelo(imagen)
+        duracion = time.perf_counter() - inicio
+        self.tiempo_modelo += duracion
+        self._modelo_s = duracion if self._modelo_s is None else 0.8 * self._modelo_s + 0.2 * duracion
+        self.inferencias += 1
+        self._t_inferencia = t
+        self._confiable = confianza is None or confianza(self._salida) >= self.confianza_min
+        # La miniatura de este frame es la nueva referencia de movimiento
+        self._referencia = self._miniatura
+        return self._salida
+
+    @property
+    def inferido(self):
+        """True si el último procesar() corrió el modelo."""
+        return self._inferido
+
+    def reiniciar(self):
+        """Olvida la última salida: el siguiente frame corre el modelo."""
+        self._salida = self._referencia = self._t_inferencia = None
+        self._intervalo = 0.0
+
+    def resumen(self, t=None):
+        """Frames, inferencias, fracción inferida, inferencias/s y CPU del modelo (fracción de un núcleo)."""
+        t = self.reloj() if t is None else t
+        segundos = t - self._t_primero if self._t_primero is not None else 0.0
+        return {
+            'frames': self.frames,
+            'inferencias': self.inferencias,
+            'fraccion_inferida': round(self.inferencias / self.frames, 3) if self.frames else 0.0,
+            'inferencias_s': round(self.inferencias / segundos, 2) if segundos > 0 else 0.0,
+            'cpu_modelo': round(self.tiempo_modelo / segundos, 3) if segundos > 0 else 0.0,
+            'por_presupuesto': self.por_presupuesto,
+        }
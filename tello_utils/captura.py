@@ -0,0 +1,243 @@
+"""
+Captura de video en un hilo dedicado.
+
+El hilo de captura es el dueño del decodificador (cv2.VideoCapture) y solo
+conserva el frame más reciente en un buffer de una posición. Cada frame
+lleva un número de secuencia y la marca de tiempo de captura, de modo que
+el loop de control puede saltarse los frames que ya procesó en lugar de
+repetir el trabajo sobre la misma imagen.
+
+Funciona igual con el stream UDP del Tello que con un video grabado, lo
+que permite medir la ganancia de throughput sin volar el dron.
+
+Orden de canales: cv2.VideoCapture decodifica en BGR, pero los scripts y sus
+rangos HSV se escribieron sobre drone.get_frame_read().frame, que en
+djitellopy es RGB (np.array(frame.to_image())). CapturaTello convierte el
+stream del dron a RGB para que FrameGrabber.desde_tello entregue lo mismo
+que get_frame_read(); desde_video entrega el BGR del archivo.
+"""
+
+import threading
+import time
+from typing import NamedTuple, Optional
+
+import cv2
+import numpy as np
+
+
+class Frame(NamedTuple):
+    """Frame capturado: secuencia, tiempo de captura (time.monotonic) e imagen (orden de la fuente)."""
+    seq: int
+    timestamp: float
+    imagen: np.ndarray
+
+
+class CapturaTello:
+    """cv2.VideoCapture del stream UDP del Tello que entrega RGB, como get_frame_read().frame."""
+
+    def __init__(self, direccion):
+        self._cap = cv2.VideoCapture(direccion, cv2.CAP_FFMPEG)
+
+    def isOpened(self):
+        return self._cap.isOpened()
+
+    def get(self, prop):
+        return self._cap.get(prop)
+
+    def set(self, prop, valor):
+        return self._cap.set(prop, valor)
+
+    def read(self):
+        ok, imagen = self._cap.read()
+        if ok and imagen is not None:
+            # En su lugar: read() ya regresa un arreglo nuevo por frame
+            cv2.cvtColor(imagen, cv2.COLOR_BGR2RGB, dst=imagen)
+        return ok, imagen
+
+    def release(self):
+        self._cap.release()
+
+
+class FrameGrabber:
+    """
+    Hilo de captura con buffer de un solo slot (último frame gana).
+
+    El productor solo reemplaza la referencia self._ultimo; en CPython la
+    asignación de una referencia es atómica, así que el consumidor nunca ve
+    un frame a medias y no hace falta un lock en la ruta crítica.
+    """
+
+    def __init__(self, abrir_captura, tiempo_real=False, en_vivo=False, nombre="captura",
+                 sin_descartes=False, reloj=time.monotonic):
+        """
+        abrir_captura: función sin argumentos que regresa un objeto tipo
+                       cv2.VideoCapture (read()/release()/get()).
+        tiempo_real:   si es True y la fuente es un archivo, respeta los FPS
+                       del video para simular un stream en vivo.
+        en_vivo:       si es True, una lectura fallida no termina la captura
+                       (el stream UDP tiene huecos mientras llega un keyframe).
+        sin_descartes: si es True, no se reemplaza un frame que el consumidor
+                       no ha terminado de usar: el productor decodifica el
+                       siguiente y espera a que el consumidor vuelva a pedir
+                       (reproducción offline, determinista).
+        reloj:         función que da la marca de tiempo de cada frame.
+        """
+        self._abrir_captura = abrir_captura
+        self._tiempo_real = tiempo_real
+        self._en_vivo = en_vivo
+        self._nombre = nombre
+        self._sin_descartes = sin_descartes
+        self._reloj = reloj
+        self._consumido = threading.Event()
+        self._cap = None
+        self._hilo = None
+        self._corriendo = False
+        self._ultimo: Optional[Frame] = None
+        self._nuevo = threading.Event()
+        # Callback opcional llamado desde el hilo de captura con cada Frame
+        # (p. ej. GrabadorSesion); no debe bloquear
+        self.al_capturar = None
+        # Trazador opcional: tramo 'decodificar' e instante de captura de cada frame
+        self.trazador = None
+
+        # Estadísticas
+        self.capturados = 0      # frames decodificados por el productor
+        self.consumidos = 0      # frames entregados al consumidor
+        self.descartados = 0     # frames reemplazados antes de ser leídos
+        self.terminado = False   # True cuando un archivo llegó al final
+
+    # -----------------------------------------------------------------
+    # Constructores
+    # -----------------------------------------------------------------
+    @classmethod
+    def desde_tello(cls, drone):
+        """
+        Decodifica directamente el stream UDP del Tello (requiere streamon()).
+        Los frames salen en RGB, el mismo orden que drone.get_frame_read().frame
+        (ver CapturaTello); una sesión grabada regresa los frames tal como se
+        grabaron desde aquí.
+        """
+        if getattr(drone, 'reproduccion', False):
+            # Sesión grabada (DronReproducido): frames y marcas de tiempo de la sesión
+            return cls(lambda: drone.abrir_captura(avanza_reloj=False), nombre="reproduccion",
+                       sin_descartes=drone.reloj_virtual, reloj=drone.publicar_frame)
+        direccion = drone.get_udp_video_address()
+        return cls(lambda: CapturaTello(direccion), en_vivo=True, nombre="tello")
+
+    @classmethod
+    def desde_video(cls, ruta, tiempo_real=True):
+        """Reproduce un video grabado como si fuera el stream del dron."""
+        return cls(lambda: cv2.VideoCapture(ruta), tiempo_real=tiempo_real, nombre=str(ruta))
+
+    # -----------------------------------------------------------------
+    # Ciclo de vida
+    # -----------------------------------------------------------------
+    def iniciar(self):
+        self._cap = self._abrir_captura()
+        if not self._cap.isOpened():
+            raise RuntimeError(f"No se pudo abrir la fuente de video: {self._nombre}")
+        self._corriendo = True
+        self._consumido.set()
+        self._hilo = threading.Thread(target=self._bucle, name=f"FrameGrabber-{self._nombre}", daemon=True)
+        self._hilo.start()
+        return self
+
+    def detener(self):
+        self._corriendo = False
+        self._consumido.set()
+        if self._hilo is not None:
+            self._hilo.join(timeout=1.0)
+            self._hilo = None
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.detener()
+
+    # -----------------------------------------------------------------
+    # Productor
+    # -----------------------------------------------------------------
+    def _bucle(self):
+        fps = self._cap.get(cv2.CAP_PROP_FPS) if self._tiempo_real else 0
+        periodo = 1.0 / fps if fps and fps > 0 else 0.0
+        siguiente = time.monotonic()
+
+        while self._corriendo:
+            inicio = self.trazador.reloj() if self.trazador is not None else None
+            ok, imagen = self._cap.read()
+            if not ok or imagen is None:
+                if self._en_vivo:
+                    # Stream en vivo: puede haber huecos mientras llega un keyframe
+                    time.sleep(0.005)
+                    continue
+                self.terminado = True
+                self._nuevo.set()
+                break
+
+            if self._sin_descartes:
+                # El siguiente frame ya está decodificado; se publica cuando el
+                # consumidor termina con el anterior (vuelve a pedir)
+                while self._corriendo and not self._consumido.wait(0.1):
+                    pass
+                self._consumido.clear()
+
+            self.capturados += 1
+            if self.trazador is not None:
+                fin = self.trazador.reloj()
+                self.trazador.registrar('decodificar', self.capturados, inicio, fin)
+                self.trazador.capturado(self.capturados, fin)
+            frame = Frame(self.capturados, self._reloj(), imagen)
+            self._ultimo = frame
+            self._nuevo.set()
+            if self.al_capturar is not None:
+                self.al_capturar(frame)
+
+            if periodo:
+                siguiente += periodo
+                espera = siguiente - time.monotonic()
+                if espera > 0:
+                    time.sleep(espera)
+                else:
+                    siguiente = time.monotonic()
+
+    # -----------------------------------------------------------------
+    # Consumidor
+    # -----------------------------------------------------------------
+    def ultimo(self) -> Optional[Frame]:
+        """Regresa el frame más reciente (o None si aún no hay ninguno)."""
+        return self._ultimo
+
+    def siguiente(self, ultimo_seq) -> Optional[Frame]:
+        """
+        Regresa el frame más reciente solo si es más nuevo que ultimo_seq;
+        si no hay frame nuevo regresa None para que el llamador se lo salte.
+        """
+        frame = self._ultimo
+        if frame is None or frame.seq <= ultimo_seq:
+            # El consumidor ya terminó con ultimo_seq (ver sin_descartes)
+            self._consumido.set()
+            return None
+        self.consumidos += 1
+        self.descartados += frame.seq - ultimo_seq - 1
+        return frame
+
+    def esperar(self, ultimo_seq, timeout=1.0) -> Optional[Frame]:
+        """Como siguiente(), pero bloquea hasta que llegue un frame nuevo (uso offline)."""
+        limite = time.monotonic() + timeout
+        while True:
+            frame = self.siguiente(ultimo_seq)
+            if frame is not None or self.terminado:
+                return frame
+            restante = limite - time.monotonic()
+            if restante <= 0:
+                return None
+            self._nuevo.clear()
+            # Volver a revisar tras limpiar el evento para no perder un set() intermedio
+            frame = self.siguiente(ultimo_seq)
+            if frame is not None:
+                return frame
+            self._nuevo.wait(restante)
@@ -0,0 +1,134 @@
+"""
+Clasificador de color HSV por tablas de consulta (LUT).
+
+Los rangos HSV se compilan en una tabla por canal (256 entradas x 3
+canales) donde el bit k de cada entrada indica si ese valor cae dentro del
+rango k. Clasificar un frame es entonces una sola consulta cv2.LUT más el
+AND de los tres canales, sin importar cuántos rangos haya. La tabla solo se
+reconstruye cuando algún límite cambia de verdad, así que leer los
+trackbars en cada frame ya no cuesta nada si el usuario no los mueve.
+
+Con un solo rango cv2.inRange (vectorizado con SIMD) suele seguir siendo
+más rápido; la tabla conviene al clasificar varios rangos a la vez. Ver
+benchmarks/bench_clasificador.py para comparar en cada máquina.
+
+Las máscaras son idénticas bit a bit a las de cv2.inRange (límites
+inclusivos; un rango con min > max no selecciona nada).
+
+Los buffers internos se asignan para el frame más grande visto y cada
+llamada trabaja sobre vistas [:h, :w], como SegmentadorHSV: ventanas (ROI)
+de tamaño variable no vuelven a asignar memoria.
+"""
+
+import cv2
+import numpy as np
+
+# Rangos HSV calibrados en clase (antes comentados en los scripts)
+PRESETS_HSV = {
+    'Verde Rubix': ((40, 50, 50), (80, 255, 255)),
+    'Amarillo Rubix': ((20, 148, 89), (40, 255, 255)),
+    'USB Azul': ((90, 50, 80), (150, 200, 170)),
+}
+
+
+class ClasificadorLUT:
+    """
+    Clasificador de hasta 8 rangos HSV con nombre.
+
+    Con un solo rango la máscara sale directamente de la tabla (valores
+    0/255). Con varios, clasificar() regresa un mapa de bits por pixel y
+    mascara() extrae el bit de cada rango.
+    """
+
+    MAX_RANGOS = 8
+
+    def __init__(self, rangos=None):
+        self._rangos = {}                 # nombre -> (lower, upper)
+        self._bits = {}                   # nombre -> bit asignado
+        self._lut = np.zeros((1, 256, 3), np.uint8)
+        self._buf3 = None
+        self._canales = None
+        self._mapa = None
+        self._tmp = None
+        self._mascaras = {}
+        self.compilaciones = 0            # veces que se reconstruyó la tabla
+        for nombre, (lower, upper) in (rangos or {}).items():
+            self.definir(nombre, lower, upper)
+
+    @property
+    def nombres(self):
+        return list(self._rangos)
+
+    def definir(self, nombre, lower, upper):
+        """
+        Agrega o actualiza un rango. Regresa True si la tabla se reconstruyó
+        (es decir, si los límites realmente cambiaron).
+        """
+        rango = (tuple(int(v) for v in lower), tuple(int(v) for v in upper))
+        if self._rangos.get(nombre) == rango:
+            return False
+        if nombre not in self._rangos and len(self._rangos) >= self.MAX_RANGOS:
+            raise ValueError(f"Máximo {self.MAX_RANGOS} rangos por clasificador")
+        self._rangos[nombre] = rango
+        self._compilar()
+        return True
+
+    def quitar(self, nombre):
+        if self._rangos.pop(nombre, None) is not None:
+            self._compilar()
+
+    def _compilar(self):
+        valores = np.arange(256)
+        lut = np.zeros((256, 3), np.uint8)
+        self._bits = {}
+        unico = len(self._rangos) == 1
+        for k, (nombre, (lower, upper)) in enumerate(self._rangos.items()):
+            bit = 0xFF if unico else (1 << k)
+            self._bits[nombre] = bit
+            for c in range(3):
+                dentro = (valores >= lower[c]) & (valores <= upper[c])
+                lut[dentro, c] |= bit
+        self._lut = lut.reshape(1, 256, 3)
+        self.compilaciones += 1
+
+    def _buffers(self, h, w):
+        """Crece los buffers solo si el frame excede el máximo visto (nunca se encogen)."""
+        if self._buf3 is not None and h <= self._buf3.shape[0] and w <= self._buf3.shape[1]:
+            return
+        if self._buf3 is not None:
+            h, w = max(h, self._buf3.shape[0]), max(w, self._buf3.shape[1])
+        self._buf3 = np.empty((h, w, 3), np.uint8)
+        self._canales = [np.empty((h, w), np.uint8) for _ in range(3)]
+        self._mapa = np.empty((h, w), np.uint8)
+        self._tmp = np.empty((h, w), np.uint8)
+        self._mascaras = {}
+
+    def clasificar(self, hsv):
+        """
+        Una consulta a la tabla para todos los rangos. Regresa el mapa de
+        bits por pixel (vista de un buffer interno del tamaño de hsv; con
+        un solo rango ya es la máscara).
+        """
+        h, w = hsv.shape[:2]
+        self._buffers(h, w)
+        buf3 = cv2.LUT(hsv, self._lut, dst=self._buf3[:h, :w])
+        canales = cv2.split(buf3, [c[:h, :w] for c in self._canales])
+        mapa = cv2.bitwise_and(canales[0], canales[1], dst=self._mapa[:h, :w])
+        return cv2.bitwise_and(mapa, canales[2], dst=mapa)
+
+    def mascara(self, mapa, nombre):
+        """Extrae la máscara 0/255 de un rango a partir del mapa de clasificar()."""
+        bit = self._bits[nombre]
+        if bit == 0xFF:
+            return mapa
+        h, w = mapa.shape[:2]
+        dst = self._mascaras.get(nombre)
+        if dst is None:
+            dst = self._mascaras[nombre] = np.empty(self._mapa.shape, np.uint8)
+        tmp = cv2.bitwise_and(mapa, bit, dst=self._tmp[:h, :w])
+        return cv2.compare(tmp, 0, cv2.CMP_GT, dst=dst[:h, :w])
+
+    def mascaras(self, hsv):
+        """Clasifica el frame y regresa {nombre: máscara} para todos los rangos."""
+        mapa = self.clasificar(hsv)
+        return {nombre: self.mascara(mapa, nombre) for nombre in self._rangos}
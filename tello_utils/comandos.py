@@ -0,0 +1,184 @@
+"""
+Programador de comandos rc a frecuencia fija.
+
+Antes cada script llamaba send_rc_control() una vez por tick de la interfaz,
+dentro del callback de render: el ritmo de los comandos dependía de cuánto
+tardara procesar el frame y se mandaban ceros repetidos en cada tick. Con
+este módulo los productores (teclado, gestos, seguidores) solo publican el
+setpoint más reciente con fijar(), y un hilo propio lo envía a frecuencia
+fija:
+  - se coalescen los setpoints: entre dos ticks solo cuenta el último,
+  - un setpoint igual al último enviado no se repite, salvo el keep-alive
+    (el Tello se detiene si deja de recibir rc por unos segundos),
+  - se registran la latencia de cada envío y los errores, en lugar de
+    descartarlos en silencio.
+"""
+
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+ALTO = (0, 0, 0, 0)
+
+
+def _limitar(v):
+    return int(max(-100, min(100, v)))
+
+
+class CommandScheduler:
+    """
+    frecuencia: envíos por segundo como máximo (20–50 Hz es razonable).
+    keepalive:  segundos tras los cuales se reenvía el mismo setpoint.
+    historial:  latencias guardadas para el resumen.
+
+    Con un dron de reloj virtual (reproducción rápida) no hay hilo: fijar()
+    envía de inmediato cada cambio, para que el flujo de comandos sea
+    determinista y no dependa de la velocidad de la máquina.
+    """
+
+    def __init__(self, drone, frecuencia=30.0, keepalive=0.5, historial=2000):
+        self._drone = drone
+        self.periodo = 1.0 / frecuencia
+        self.keepalive = keepalive
+        self._setpoint = ALTO
+        self._pendiente = False          # hay un setpoint nuevo sin enviar
+        self._ultimo_enviado = None
+        self._t_ultimo_envio = 0.0
+        # Reentrante: pausar() y el tick del hilo revisan _habilitado y envían bajo el mismo lock
+        self._lock_envio = threading.RLock()
+        self._habilitado = False
+        self.sincrono = getattr(drone, 'reloj_virtual', False)
+        self._hilo = None
+        self._corriendo = False
+        # Callback opcional (t, setpoint) tras cada envío exitoso (p. ej. GrabadorSesion)
+        self.al_enviar = None
+        # Trazador opcional: tramo 'enviar' y latencia vidrio → comando (ver fijar(seq=...))
+        self.trazador = None
+        self._seq = None                 # frame del que salió el setpoint pendiente
+
+        # Estadísticas
+        self.enviados = 0
+        self.suprimidos = 0              # ticks sin envío por repetir el setpoint
+        self.coalescidos = 0             # setpoints reemplazados antes de enviarse
+        self.errores = 0
+        self.ultimo_error = None
+        self.latencias = deque(maxlen=historial)
+
+    def iniciar(self):
+        if self.sincrono:
+            return self
+        self._corriendo = True
+        self._hilo = threading.Thread(target=self._bucle, name="CommandScheduler", daemon=True)
+        self._hilo.start()
+        return self
+
+    def detener(self):
+        self._corriendo = False
+        if self._hilo is not None:
+            self._hilo.join(timeout=1.0)
+            self._hilo = None
+
+    def fijar(self, lr, fb, ud, yaw, seq=None):
+        """
+        Publica el setpoint más reciente (lo puede llamar cualquier hilo).
+        seq: frame del que salió el setpoint, para la latencia vidrio → comando.
+        """
+        setpoint = (_limitar(lr), _limitar(fb), _limitar(ud), _limitar(yaw))
+        if setpoint == self._setpoint:
+            return
+        if self._pendiente:
+            self.coalescidos += 1
+        self._seq = seq
+        # Asignación atómica de la tupla: el hilo de envío lee una u otra, nunca una mezcla
+        self._setpoint = setpoint
+        self._pendiente = True
+        if self.sincrono and self._habilitado:
+            self._pendiente = False
+            self._enviar(setpoint, self._tomar_seq())
+
+    def reanudar(self):
+        """Empieza a enviar (p. ej. después de takeoff), partiendo de hover."""
+        with self._lock_envio:
+            self._setpoint = ALTO
+            self._pendiente = True
+            self._habilitado = True
+            if self.sincrono:
+                self._pendiente = False
+                self._enviar(ALTO)
+
+    def pausar(self):
+        """
+        Manda hover de inmediato y deja de enviar (p. ej. antes de land). Al
+        regresar, el hilo ya no puede mandar un setpoint anterior al hover.
+        """
+        with self._lock_envio:
+            self._habilitado = False
+            self._setpoint = ALTO
+            self._pendiente = False
+            self._enviar(ALTO)
+
+    def _tomar_seq(self):
+        seq, self._seq = self._seq, None
+        return seq
+
+    def _enviar(self, setpoint, seq=None):
+        with self._lock_envio:
+            inicio = time.perf_counter()
+            t_traza = self.trazador.reloj() if self.trazador is not None else None
+            try:
+                self._drone.send_rc_control(*setpoint)
+            except Exception as e:
+                self.errores += 1
+                if str(e) != str(self.ultimo_error):
+                    print(f"Error enviando rc {setpoint}: {e}")
+                self.ultimo_error = e
+                return
+            self.latencias.append(time.perf_counter() - inicio)
+            if self.trazador is not None:
+                self.trazador.comando(seq, t_traza, self.trazador.reloj())
+            self.enviados += 1
+            self._ultimo_enviado = setpoint
+            self._t_ultimo_envio = time.monotonic()
+            if self.al_enviar is not None:
+                self.al_enviar(self._t_ultimo_envio, setpoint)
+
+    def _bucle(self):
+        siguiente = time.monotonic()
+        while self._corriendo:
+            siguiente += self.periodo
+            self._tick()
+            espera = siguiente - time.monotonic()
+            if espera > 0:
+                time.sleep(espera)
+            else:
+                # Tick atrasado (p. ej. un envío lento): no acumular ráfagas
+                siguiente = time.monotonic()
+
+    def _tick(self):
+        # Revisar _habilitado y leer el setpoint dentro del lock: si pausar()
+        # llega en medio, no se manda el setpoint viejo después del hover
+        with self._lock_envio:
+            if not self._habilitado:
+                return
+            setpoint = self._setpoint
+            self._pendiente = False
+            vencido = time.monotonic() - self._t_ultimo_envio >= self.keepalive
+            if setpoint != self._ultimo_enviado or vencido:
+                self._enviar(setpoint, self._tomar_seq())
+            else:
+                self.suprimidos += 1
+
+    def resumen(self):
+        """Diccionario con contadores y latencias de envío (ms)."""
+        lat = np.array(self.latencias) * 1000 if self.latencias else np.zeros(1)
+        return {
+            'enviados': self.enviados,
+            'suprimidos': self.suprimidos,
+            'coalescidos': self.coalescidos,
+            'errores': self.errores,
+            'latencia_p50_ms': float(np.percentile(lat, 50)),
+            'latencia_p95_ms': float(np.percentile(lat, 95)),
+            'latencia_max_ms': float(lat.max()),
+        }
@@ -0,0 +1,52 @@
+"""
+Elección de la fuente del dron y de la cámara de gestos.
+
+Los scripts crean el dron con crear_dron() en lugar de Tello(); según las
+variables de entorno se obtiene el dron real o una sesión grabada:
+
+    TELLO_REPRODUCIR=sesion.tlog    reproduce la sesión en lugar de volar
+    TELLO_REPRODUCIR_MODO=rapido    sin esperas, reloj virtual (por defecto: real)
+    TELLO_COMANDOS=salida.csv       al terminar, guarda los comandos rc emitidos
+    TELLO_SIMULADOR=1               se conecta al simulador local (python -m tello_utils.simulador)
+"""
+
+import os
+
+import cv2
+
+from tello_utils.grabacion import CANAL_GESTOS
+
+
+def crear_dron():
+    ruta = os.environ.get('TELLO_REPRODUCIR')
+    if ruta:
+        from tello_utils.reproduccion import DronReproducido
+        rapido = os.environ.get('TELLO_REPRODUCIR_MODO', 'real') == 'rapido'
+        print(f"Reproduciendo {ruta} ({'rápido' if rapido else 'tiempo real'})")
+        return DronReproducido(ruta, tiempo_real=not rapido)
+
+    from djitellopy import Tello
+    if os.environ.get('TELLO_SIMULADOR'):
+        from tello_utils.simulador import HOST, PUERTO_COMANDOS
+        print(f"Usando el simulador local del Tello ({HOST}:{PUERTO_COMANDOS})")
+        drone = Tello(host=HOST)
+        # djitellopy manda a (host, 8889), que su propio socket cliente ya ocupa
+        # en esta máquina: los comandos van al puerto del simulador
+        drone.address = (HOST, PUERTO_COMANDOS)
+        return drone
+    return Tello()
+
+
+def crear_captura_gestos(drone, indice=0):
+    """Cámara de la laptop, o el canal de gestos de la sesión si se está reproduciendo."""
+    if getattr(drone, 'reproduccion', False):
+        return drone.abrir_captura(CANAL_GESTOS)
+    return cv2.VideoCapture(indice)
+
+
+def finalizar(drone):
+    """Guarda los comandos emitidos durante una reproducción (si se pidió con TELLO_COMANDOS)."""
+    ruta = os.environ.get('TELLO_COMANDOS')
+    if ruta and getattr(drone, 'reproduccion', False):
+        drone.guardar_comandos(ruta)
+        print(f"Comandos rc guardados en {ruta}")
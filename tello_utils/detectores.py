@@ -0,0 +1,265 @@
+"""
+Interfaz común de detectores (color HSV, rostros, manos, pose).
+
+Antes cada script tenía su propio loop de captura, su espejo, su resize y su
+cvtColor: correr dos detectores sobre el mismo frame convertía el frame dos
+veces. Aquí:
+  - Preprocesador.preparar() redimensiona y espeja el frame una vez y
+    regresa un FrameCompartido,
+  - FrameCompartido calcula cada vista (rgb, hsv, gris) la primera vez que
+    un detector la pide y la reutiliza para los demás,
+  - cada backend implementa Detector.detectar(frame) -> [Deteccion], con
+    coordenadas en pixeles del frame preparado, así que cualquier
+    combinación de detectores corre sobre el mismo frame sin conversiones
+    repetidas (detectar_todos).
+
+Los backends de MediaPipe importan mediapipe al construirse (es opcional
+para el resto del paquete) y aceptan una CadenciaAdaptativa para no correr
+el modelo con la escena quieta.
+
+Cada FrameCompartido es dueño de sus arreglos: se puede mandar a otro hilo
+(p. ej. de InferenceWorker a la interfaz) sin que el siguiente frame lo
+sobrescriba.
+"""
+
+from typing import Any, NamedTuple, Optional
+
+import cv2
+import numpy as np
+
+from tello_utils.cadencia import confianza_manos, confianza_pose, confianza_rostros
+from tello_utils.segmentacion import SegmentadorMultiColor, objetivo_de_mascara
+
+
+class Deteccion(NamedTuple):
+    """Resultado de un detector, en pixeles del frame preparado."""
+    tipo: str                               # 'color', 'rostro', 'mano', 'pose'
+    etiqueta: str                           # perfil de color, 'Left'/'Right', ...
+    cx: int
+    cy: int
+    bbox: tuple                             # (x, y, w, h)
+    confianza: float = 1.0
+    area: float = 0.0
+    landmarks: Optional[np.ndarray] = None  # (n, 3) normalizados, como los da MediaPipe
+    crudo: Any = None                       # objeto original (p. ej. para mp_draw.draw_landmarks)
+
+
+class FrameCompartido:
+    """Frame BGR ya preparado con sus vistas calculadas al primer uso."""
+
+    def __init__(self, bgr, timestamp=None, seq=None):
+        self.bgr = bgr
+        self.timestamp = timestamp
+        self.seq = seq
+        self.conversiones = 0       # cvtColor hechos para este frame
+        self._rgb = None
+        self._hsv = None
+        self._gris = None
+
+    @property
+    def shape(self):
+        return self.bgr.shape
+
+    def _convertir(self, codigo):
+        self.conversiones += 1
+        return cv2.cvtColor(self.bgr, codigo)
+
+    @property
+    def rgb(self):
+        if self._rgb is None:
+            self._rgb = self._convertir(cv2.COLOR_BGR2RGB)
+        return self._rgb
+
+    @property
+    def hsv(self):
+        if self._hsv is None:
+            self._hsv = self._convertir(cv2.COLOR_BGR2HSV)
+        return self._hsv
+
+    @property
+    def gris(self):
+        if self._gris is None:
+            self._gris = self._convertir(cv2.COLOR_BGR2GRAY)
+        return self._gris
+
+
+class Preprocesador:
+    """
+    Frame crudo de la cámara → FrameCompartido.
+
+    width, height: tamaño al que se redimensiona (None = el del frame).
+    espejo:        flip horizontal (cámara de la laptop).
+    """
+
+    def __init__(self, width=None, height=None, espejo=False):
+        self.width = width
+        self.height = height
+        self.espejo = espejo
+        self.frames = 0
+
+    def preparar(self, frame, timestamp=None):
+        if self.width is not None and (frame.shape[1], frame.shape[0]) != (self.width, self.height):
+            frame = cv2.resize(frame, (self.width, self.height))
+        if self.espejo:
+            frame = cv2.flip(frame, 1)
+        self.frames += 1
+        return FrameCompartido(frame, timestamp, self.frames)
+
+
+class Detector:
+    """
+    Interfaz de los backends. nombre identifica al detector en
+    detectar_todos() y en los benchmarks.
+    """
+    nombre = "detector"
+
+    def detectar(self, frame: FrameCompartido):
+        """Lista de Deteccion del frame (vacía si no hay nada)."""
+        raise NotImplementedError
+
+    def cerrar(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def detectar_todos(detectores, frame):
+    """{nombre: [Deteccion]} de varios detectores sobre el mismo FrameCompartido."""
+    return {d.nombre: d.detectar(frame) for d in detectores}
+
+
+def _caja_de_landmarks(puntos, width, height):
+    """Caja (x, y, w, h) en pixeles de landmarks normalizados (n, 3)."""
+    x0, y0 = np.clip(puntos[:, :2].min(axis=0), 0.0, 1.0)
+    x1, y1 = np.clip(puntos[:, :2].max(axis=0), 0.0, 1.0)
+    return int(x0 * width), int(y0 * height), int((x1 - x0) * width), int((y1 - y0) * height)
+
+
+def _landmarks(lista):
+    return np.array([c for p in lista for c in (p.x, p.y, p.z)], dtype=np.float32).reshape(-1, 3)
+
+
+class DetectorColor(Detector):
+    """
+    Perfiles HSV con nombre sobre frame.hsv (la misma conversión para todos
+    los perfiles y para cualquier otro detector que use hsv). Una detección
+    por perfil: su contorno más grande por encima de area_min.
+    """
+    nombre = "color"
+
+    def __init__(self, perfiles, area_min=0, iteraciones=1, kernel_size=3):
+        self.perfiles = dict(perfiles)
+        self.area_min = area_min
+        self._params = dict(iteraciones=iteraciones, kernel_size=kernel_size)
+        self._multicolor = None
+        self._tam = None
+
+    def detectar(self, frame):
+        # Los buffers del segmentador se crean con el tamaño del primer frame
+        h, w = frame.shape[:2]
+        if self._tam != (w, h):
+            self._multicolor = SegmentadorMultiColor(w, h, self.perfiles, **self._params)
+            self._tam = (w, h)
+        detecciones = []
+        for nombre, mask in self._multicolor.mascaras(frame.hsv).items():
+            obj = objetivo_de_mascara(nombre, mask, self.area_min)
+            if obj is not None:
+                detecciones.append(Deteccion('color', nombre, obj.cx, obj.cy, obj.bbox, area=obj.area))
+        return detecciones
+
+
+class _DetectorMediaPipe(Detector):
+    """Base de los backends de MediaPipe: modelo sobre frame.rgb, opcionalmente con cadencia."""
+
+    def __init__(self, modelo, confianza=None, cadencia=None):
+        self._modelo = modelo
+        self._confianza = confianza
+        self.cadencia = cadencia
+
+    def _procesar(self, frame):
+        if self.cadencia is None:
+            return self._modelo.process(frame.rgb)
+        # frame.rgb solo se calcula si la cadencia decide correr el modelo
+        return self.cadencia.procesar(frame.bgr, lambda _: self._modelo.process(frame.rgb), self._confianza)
+
+    def cerrar(self):
+        self._modelo.close()
+
+
+class DetectorManos(_DetectorMediaPipe):
+    """MediaPipe Hands: una detección por mano con sus 21 landmarks y la lateralidad."""
+    nombre = "manos"
+
+    def __init__(self, max_manos=1, confianza_deteccion=0.6, confianza_seguimiento=0.5,
+                 complejidad=1, cadencia=None):
+        import mediapipe as mp
+        modelo = mp.solutions.hands.Hands(max_num_hands=max_manos, model_complexity=complejidad,
+                                          min_detection_confidence=confianza_deteccion,
+                                          min_tracking_confidence=confianza_seguimiento)
+        super().__init__(modelo, confianza_manos, cadencia)
+
+    def detectar(self, frame):
+        result = self._procesar(frame)
+        if not result.multi_hand_landmarks:
+            return []
+        h, w = frame.shape[:2]
+        detecciones = []
+        for mano, lado in zip(result.multi_hand_landmarks, result.multi_handedness):
+            puntos = _landmarks(mano.landmark)
+            x, y, bw, bh = _caja_de_landmarks(puntos, w, h)
+            clase = lado.classification[0]
+            detecciones.append(Deteccion('mano', clase.label, x + bw // 2, y + bh // 2, (x, y, bw, bh),
+                                         clase.score, float(bw * bh), puntos, mano))
+        return detecciones
+
+
+class DetectorRostros(_DetectorMediaPipe):
+    """MediaPipe Face Detection: una detección por rostro (caja relativa → pixeles)."""
+    nombre = "rostros"
+
+    def __init__(self, modelo=0, confianza_deteccion=0.6, cadencia=None):
+        import mediapipe as mp
+        super().__init__(mp.solutions.face_detection.FaceDetection(
+            model_selection=modelo, min_detection_confidence=confianza_deteccion), confianza_rostros, cadencia)
+
+    def detectar(self, frame):
+        results = self._procesar(frame)
+        if not results.detections:
+            return []
+        h, w = frame.shape[:2]
+        detecciones = []
+        for d in results.detections:
+            caja = d.location_data.relative_bounding_box
+            x, y = int(caja.xmin * w), int(caja.ymin * h)
+            bw, bh = int(caja.width * w), int(caja.height * h)
+            detecciones.append(Deteccion('rostro', 'rostro', x + bw // 2, y + bh // 2, (x, y, bw, bh),
+                                         d.score[0], float(bw * bh), crudo=d))
+        return detecciones
+
+
+class DetectorPose(_DetectorMediaPipe):
+    """MediaPipe Pose: una detección con los 33 landmarks (confianza = visibilidad promedio)."""
+    nombre = "pose"
+
+    def __init__(self, confianza_deteccion=0.5, confianza_seguimiento=0.5, complejidad=1, cadencia=None):
+        import mediapipe as mp
+        super().__init__(mp.solutions.pose.Pose(model_complexity=complejidad,
+                                                min_detection_confidence=confianza_deteccion,
+                                                min_tracking_confidence=confianza_seguimiento),
+                         confianza_pose, cadencia)
+
+    def detectar(self, frame):
+        results = self._procesar(frame)
+        if not results.pose_landmarks:
+            return []
+        h, w = frame.shape[:2]
+        lista = results.pose_landmarks.landmark
+        puntos = _landmarks(lista)
+        x, y, bw, bh = _caja_de_landmarks(puntos, w, h)
+        visibilidad = float(np.mean([p.visibility for p in lista]))
+        return [Deteccion('pose', 'pose', x + bw // 2, y + bh // 2, (x, y, bw, bh),
+                          visibilidad, float(bw * bh), puntos, results.pose_landmarks)]
@@ -0,0 +1,253 @@
+"""
+Clasificación de gestos de la mano sobre un arreglo de landmarks.
+
+Antes cada predicado (contar_dedos, is_fist, is_only_pinky, is_cuernito,
+is_CW) recorría los landmarks de MediaPipe atributo por atributo y
+Practicas/3 los llamaba varias veces por mano y por frame. Aquí:
+  - los 21 landmarks de cada mano se convierten una sola vez a un arreglo
+    (manos, 21, 3) float32,
+  - con dos comparaciones vectorizadas se obtiene, para todas las manos, una
+    máscara de 5 bits con los dedos extendidos (pulgar, índice, medio,
+    anular, meñique),
+  - una tabla de 32 entradas traduce cada máscara a su Gesto.
+
+Con una sola mano (Practicas/3 usa max_manos=1) la conversión a arreglo
+cuesta más que la clasificación: clasificar_mano() arma la máscara
+directo de .landmark[i].x/.y con cinco comparaciones y usa la misma tabla.
+
+La tabla se arma con REGLAS (en orden de prioridad, gana la primera que
+coincide), así que agregar un gesto es agregar una regla.
+
+FiltroGestos confirma cada gesto en el tiempo (ventana de votos, tiempo de
+confirmación por gesto e histéresis) antes de que se vuelva un comando.
+
+Criterios (los mismos de Practicas/3): un dedo está extendido si la punta
+está más arriba (y menor) que su articulación PIP; el pulgar, si la punta
+está a la izquierda (x menor) de la articulación IP, con la imagen espejada.
+"""
+
+from collections import deque
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+# Índices fijos de MediaPipe Hands
+THUMB_IP = 3
+THUMB_TIP = 4
+PUNTAS = np.array([8, 12, 16, 20])       # índice, medio, anular, meñique
+PIPS = PUNTAS - 2
+
+# Bits de la máscara de dedos extendidos
+INDICE, MEDIO, ANULAR, MENIQUE, PULGAR = 1, 2, 4, 8, 16
+
+# Una sola comparación para los 5 bits sobre el arreglo aplanado (manos, 63):
+# columnas y de las puntas y x de la punta del pulgar contra y de las PIP y
+# x de la IP del pulgar (extendido = menor)
+_IZQ = np.array([*(PUNTAS * 3 + 1), THUMB_TIP * 3])
+_DER = np.array([*(PIPS * 3 + 1), THUMB_IP * 3])
+_PESOS = np.array([INDICE, MEDIO, ANULAR, MENIQUE, PULGAR], dtype=np.int64)
+
+
+class Gesto(NamedTuple):
+    """nombre: identificador; eje: 'lr'/'fb'/'ud'/'yaw' (None = sin movimiento); signo: ±1."""
+    nombre: str
+    etiqueta: str
+    eje: Optional[str] = None
+    signo: int = 0
+
+
+PUNO = Gesto('puno', "PUÑO")
+SUBIR = Gesto('subir', "SUBIR (Meñique)", 'ud', 1)
+BAJAR = Gesto('bajar', "BAJAR (Cuernito)", 'ud', -1)
+CW = Gesto('cw', "CW (Girando)", 'yaw', 1)
+ADELANTE = Gesto('adelante', "ADELANTE (1 dedo)", 'fb', 1)
+ATRAS = Gesto('atras', "ATRÁS (2 dedos)", 'fb', -1)
+DERECHA = Gesto('derecha', "DERECHA (3 dedos)", 'lr', 1)
+IZQUIERDA = Gesto('izquierda', "IZQUIERDA (4 dedos)", 'lr', -1)
+CCW = Gesto('ccw', "CCW (Girando)", 'yaw', -1)
+
+# Reglas en orden de prioridad: (patrón, gesto).
+# Patrón de 5 caracteres: pulgar, índice, medio, anular, meñique, con
+# '1' = extendido, '0' = doblado, '-' = cualquiera. En lugar del patrón se
+# puede dar (n, pulgar): n dedos extendidos sin contar el pulgar.
+REGLAS = [
+    ('-0000', PUNO),
+    ('-0001', SUBIR),
+    ('-1001', BAJAR),
+    ('11000', CW),
+    ((1, '0'), ADELANTE),
+    ((2, '-'), ATRAS),
+    ((3, '-'), DERECHA),
+    ((4, '0'), IZQUIERDA),
+    ((4, '1'), CCW),
+]
+
+
+def _coincide(patron, mascara):
+    pulgar = '1' if mascara & PULGAR else '0'
+    if isinstance(patron, tuple):
+        n, p = patron
+        return bin(mascara & ~PULGAR).count('1') == n and p in ('-', pulgar)
+    bits = [pulgar] + ['1' if mascara & b else '0' for b in (INDICE, MEDIO, ANULAR, MENIQUE)]
+    return all(c in ('-', b) for c, b in zip(patron, bits))
+
+
+def construir_tabla(reglas=REGLAS):
+    """Lista de 32 entradas: máscara → Gesto (o None si ninguna regla coincide)."""
+    tabla = [None] * 32
+    for mascara in range(32):
+        for patron, gesto in reglas:
+            if _coincide(patron, mascara):
+                tabla[mascara] = gesto
+                break
+    return tabla
+
+
+TABLA = construir_tabla()
+
+
+def landmarks_array(multi_hand_landmarks):
+    """Landmarks de MediaPipe (result.multi_hand_landmarks) → arreglo (manos, 21, 3) float32."""
+    if not multi_hand_landmarks:
+        return np.empty((0, 21, 3), dtype=np.float32)
+    # Lista plana de floats: np.array no tiene que inferir la forma de listas anidadas
+    valores = [c for mano in multi_hand_landmarks for p in mano.landmark for c in (p.x, p.y, p.z)]
+    return np.array(valores, dtype=np.float32).reshape(-1, 21, 3)
+
+
+def landmarks_de_detecciones(manos):
+    """Detecciones de detectores.DetectorManos → arreglo (manos, 21, 3) float32."""
+    if not manos:
+        return np.empty((0, 21, 3), dtype=np.float32)
+    return np.stack([m.landmarks for m in manos])
+
+
+def mascaras(lm):
+    """Máscara de dedos extendidos de cada mano; lm: (manos, 21, 3) o (21, 3)."""
+    plano = lm.reshape(-1, 63)
+    # take() en lugar de indexado avanzado: mucho menos overhead con pocas manos
+    return np.dot(plano.take(_IZQ, axis=1) < plano.take(_DER, axis=1), _PESOS)
+
+
+def clasificar(lm, tabla=TABLA):
+    """Gesto (o None) de cada mano, en el orden de las manos."""
+    return [tabla[m] for m in mascaras(lm).tolist()]
+
+
+def mascara_mano(landmark):
+    """Máscara de una mano leída de los landmarks de MediaPipe (mano.landmark), sin arreglo."""
+    m = 0
+    if landmark[8].y < landmark[6].y:
+        m |= INDICE
+    if landmark[12].y < landmark[10].y:
+        m |= MEDIO
+    if landmark[16].y < landmark[14].y:
+        m |= ANULAR
+    if landmark[20].y < landmark[18].y:
+        m |= MENIQUE
+    if landmark[THUMB_TIP].x < landmark[THUMB_IP].x:
+        m |= PULGAR
+    return m
+
+
+def clasificar_mano(landmark, tabla=TABLA):
+    """Gesto (o None) de una mano de MediaPipe; misma tabla que clasificar()."""
+    return tabla[mascara_mano(landmark)]
+
+
+class FiltroGestos:
+    """
+    Máquina de estados que confirma gestos en el tiempo antes de convertirlos
+    en comandos: un frame mal clasificado ya no cambia el setpoint.
+
+    Cada frame vota con su gesto (o None si no hay mano / gesto) y se
+    consideran los votos de los últimos ventana_s segundos:
+      - un gesto pasa a candidato cuando tiene al menos la fracción
+        `entrada` de los votos y se confirma si sigue siendo candidato
+        durante su tiempo de confirmación (por_gesto[nombre], o
+        confirmacion_s); deja de ser candidato si cae por debajo de
+        `salida` o si otro gesto llega a `entrada` como líder,
+      - el gesto confirmado se suelta (pasa a None) cuando su fracción cae
+        por debajo de `salida` durante liberacion_s (los votos None nunca
+        son candidato, solo le quitan fracción); con salida < entrada
+        hay histéresis y el gesto no parpadea en el borde,
+      - actualizar() regresa True solo en las transiciones, así que una
+        acción de un solo disparo (despegar/aterrizar) ocurre una vez por
+        gesto sostenido.
+    Los tiempos son los del frame (timestamp del resultado), no los de
+    pared, para que una reproducción dé las mismas transiciones.
+    """
+
+    def __init__(self, ventana_s=0.5, confirmacion_s=0.25, por_gesto=None,
+                 entrada=0.6, salida=0.35, liberacion_s=0.2):
+        self.ventana_s = ventana_s
+        self.confirmacion_s = confirmacion_s
+        self.por_gesto = dict(por_gesto or {})
+        self.entrada = entrada
+        self.salida = salida
+        self.liberacion_s = liberacion_s
+        self.confirmado: Optional[Gesto] = None
+        self.candidato: Optional[Gesto] = None     # gesto con mayoría esperando su confirmación
+        self._votos = deque()                       # (t, gesto)
+        self._conteo = {}
+        self._candidato_desde = None
+        self._debajo_desde = None
+        self.frames = 0
+        self.transiciones = 0
+
+    def _espera(self, gesto):
+        return self.por_gesto.get(gesto.nombre, self.confirmacion_s)
+
+    def actualizar(self, gesto, t):
+        """Agrega el voto del frame en el tiempo t; True si cambió el gesto confirmado."""
+        self.frames += 1
+        self._votos.append((t, gesto))
+        self._conteo[gesto] = self._conteo.get(gesto, 0) + 1
+        while self._votos[0][0] < t - self.ventana_s:
+            _, viejo = self._votos.popleft()
+            self._conteo[viejo] -= 1
+        n = len(self._votos)
+
+        # Líder de la ventana (en empate gana el confirmado: no hay cambio)
+        lider = max(self._conteo, key=lambda g: (self._conteo[g], g == self.confirmado))
+        if lider == self.confirmado:
+            self.candidato = None
+        elif lider is None:
+            # "Sin gesto" nunca es candidato (None en candidato = no hay): soltar
+            # el confirmado le toca a la histéresis de abajo, con liberacion_s
+            if self.candidato is not None and self._conteo[self.candidato] < self.salida * n:
+                self.candidato = None
+        elif lider == self.candidato:
+            # Histéresis también para el candidato: se mantiene mientras no caiga de `salida`
+            if self._conteo[lider] < self.salida * n:
+                self.candidato = None
+            elif t - self._candidato_desde >= self._espera(lider):
+                return self._confirmar(lider)
+        elif self._conteo[lider] >= self.entrada * n:
+            self.candidato, self._candidato_desde = lider, t
+
+        # Histéresis: el confirmado se suelta si se queda por debajo de `salida`
+        if self.confirmado is not None:
+            if self._conteo.get(self.confirmado, 0) < self.salida * n:
+                if self._debajo_desde is None:
+                    self._debajo_desde = t
+                elif t - self._debajo_desde >= self.liberacion_s:
+                    return self._confirmar(None)
+            else:
+                self._debajo_desde = None
+        return False
+
+    def _confirmar(self, gesto):
+        self.confirmado = gesto
+        if gesto == self.candidato:
+            self.candidato = None
+        # (al soltar a None, un candidato en espera conserva su tiempo)
+        self._debajo_desde = None
+        self.transiciones += 1
+        return True
+
+    def reiniciar(self):
+        self.confirmado = self.candidato = None
+        self._votos.clear()
+        self._conteo = {}
+        self._candidato_desde = self._debajo_desde = None
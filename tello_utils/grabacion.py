@@ -0,0 +1,382 @@
+"""
+Grabación de sesiones de vuelo en un contenedor indexado (.tlog).
+
+Un solo archivo guarda los frames (JPEG), los snapshots de telemetría (JSON)
+y los comandos rc enviados, cada uno con su marca de tiempo
+(time.monotonic(), la misma que usan FrameGrabber, TelemetryCache y
+CommandScheduler). Con la sesión grabada se pueden ajustar los rangos HSV o
+los umbrales de gestos sin volver a volar.
+
+Formato:
+    cabecera   b'TLOG' + <HH versión, reservado>
+    registros  <BBHdI tipo, canal, reservado, timestamp, tamaño> + datos
+    índice     arreglo (timestamp, offset, tipo, canal) ordenado por tiempo
+    cola       <QQ8s offset del índice, número de registros, b'TLOGIDX1'>
+
+El índice se escribe al cerrar; si la sesión se cortó (no hay cola), el
+lector lo reconstruye recorriendo los registros. Con el índice, ir a un
+instante es una búsqueda binaria, sin leer el archivo completo (los frames
+de cada canal tienen su propio arreglo de tiempos).
+
+La escritura no bloquea la ruta de captura: los productores solo encolan
+(cola acotada) y un hilo codifica y escribe. El ancho de banda a disco se
+acota bajando la calidad JPEG y, si aún así se excede, omitiendo frames
+hasta el siguiente segundo. Cada registro descartado (cola llena) u omitido
+(ancho de banda) deja un registro HUECO con su tiempo, canal y tipo, así
+que la reproducción sabe dónde faltan datos. Con sin_descartes=True los
+productores esperan lugar en la cola y no se omiten frames (solo baja la
+calidad): para grabar de un archivo o cuando no puede faltar nada.
+"""
+
+import argparse
+import dataclasses
+import json
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+from collections import deque
+from typing import Any, NamedTuple
+
+import cv2
+import numpy as np
+
+# Tipos de registro
+FRAME = 1
+TELEMETRIA = 2
+COMANDO = 3
+HUECO = 4           # registro que no se grabó: datos = (tipo, motivo)
+
+# Motivos de un HUECO
+MOTIVO_COLA = 1     # cola llena en el productor
+MOTIVO_ANCHO = 2    # límite de ancho de banda
+
+# Canales de video
+CANAL_DRON = 0
+CANAL_GESTOS = 1
+
+_MAGIA = b'TLOG'
+_VERSION = 1
+_CABECERA = struct.Struct('<4sHH')
+_REGISTRO = struct.Struct('<BBHdI')
+_COLA = struct.Struct('<QQ8s')
+_MAGIA_INDICE = b'TLOGIDX1'
+_DTYPE_INDICE = np.dtype([('t', '<f8'), ('offset', '<u8'), ('tipo', 'u1'), ('canal', 'u1')])
+
+
+class Registro(NamedTuple):
+    tipo: int
+    canal: int
+    timestamp: float
+    datos: Any          # ndarray BGR, dict de telemetría, (lr, fb, ud, yaw) o (tipo, motivo)
+
+
+class GrabadorSesion:
+    """
+    ruta:         archivo .tlog de salida.
+    calidad:      calidad JPEG inicial (y máxima).
+    calidad_min:  calidad mínima al adaptarse al ancho de banda.
+    max_bytes_s:  límite de escritura a disco (bytes por segundo).
+    cola:         registros pendientes antes de empezar a descartar.
+    sin_descartes: los productores esperan lugar en la cola y el límite de
+                  ancho de banda solo baja la calidad (no omite frames).
+    """
+
+    def __init__(self, ruta, calidad=80, calidad_min=30, max_bytes_s=4_000_000, cola=128,
+                 sin_descartes=False):
+        self.ruta = ruta
+        self.calidad_max = calidad
+        self.calidad_min = calidad_min
+        self.calidad = calidad
+        self.max_bytes_s = max_bytes_s
+        self.sin_descartes = sin_descartes
+        self._cola = queue.Queue(maxsize=cola)
+        self._huecos = deque()           # (tipo, canal, t, motivo) descartados por el productor
+        self._archivo = None
+        self._hilo = None
+        self._indice = []
+        self._ultima_telemetria = None
+
+        # Estadísticas
+        self.escritos = 0
+        self.descartados = 0         # cola llena en el productor
+        self.omitidos = 0            # frames omitidos por el límite de ancho de banda
+        self.huecos = 0              # registros HUECO escritos (descartados + omitidos)
+        self.bytes = 0
+
+    # -----------------------------------------------------------------
+    # Ciclo de vida
+    # -----------------------------------------------------------------
+    def iniciar(self):
+        self._archivo = open(self.ruta, 'wb', buffering=1 << 20)
+        self._archivo.write(_CABECERA.pack(_MAGIA, _VERSION, 0))
+        self._hilo = threading.Thread(target=self._bucle, name="GrabadorSesion", daemon=True)
+        self._hilo.start()
+        return self
+
+    def detener(self):
+        """Escribe lo pendiente, el índice y cierra el archivo."""
+        if self._hilo is None:
+            return
+        self._cola.put(None)
+        self._hilo.join()
+        self._hilo = None
+
+        indice = np.array(self._indice, dtype=_DTYPE_INDICE)
+        indice = indice[np.argsort(indice['t'], kind='stable')]
+        offset = self._archivo.tell()
+        self._archivo.write(indice.tobytes())
+        self._archivo.write(_COLA.pack(offset, len(indice), _MAGIA_INDICE))
+        self._archivo.close()
+        self._archivo = None
+
+    def conectar(self, grabber=None, telemetria=None, rc=None, canal=CANAL_DRON):
+        """Engancha el grabador a las fuentes del loop (captura, telemetría y comandos)."""
+        if grabber is not None:
+            # Se copia: el loop puede dibujar sobre la misma imagen si no la redimensiona
+            grabber.al_capturar = lambda f: self.frame(f.imagen, f.timestamp, canal)
+        if telemetria is not None:
+            telemetria.al_recibir = self.telemetria
+        if rc is not None:
+            rc.al_enviar = self.comando
+        return self
+
+    # -----------------------------------------------------------------
+    # Productores (no bloquean)
+    # -----------------------------------------------------------------
+    def _encolar(self, elemento):
+        if self.sin_descartes:
+            self._cola.put(elemento)
+            return True
+        try:
+            self._cola.put_nowait(elemento)
+            return True
+        except queue.Full:
+            self.descartados += 1
+            # El hilo de escritura deja constancia en el archivo (deque.append es atómico)
+            self._huecos.append((elemento[0], elemento[1], elemento[2], MOTIVO_COLA))
+            return False
+
+    def frame(self, imagen, t=None, canal=CANAL_DRON, copiar=True):
+        """
+        Encola un frame BGR. Con copiar=False el llamador garantiza que no
+        modificará la imagen (p. ej. los frames recién decodificados).
+        """
+        t = time.monotonic() if t is None else t
+        return self._encolar((FRAME, canal, t, imagen.copy() if copiar else imagen))
+
+    def telemetria(self, snapshot):
+        """Encola un snapshot de Telemetria (los repetidos se ignoran)."""
+        if snapshot is None or snapshot is self._ultima_telemetria:
+            return True
+        self._ultima_telemetria = snapshot
+        return self._encolar((TELEMETRIA, 0, snapshot.timestamp, dataclasses.asdict(snapshot)))
+
+    def comando(self, t, setpoint):
+        """Encola un comando rc enviado (firma de CommandScheduler.al_enviar)."""
+        return self._encolar((COMANDO, 0, t, tuple(setpoint)))
+
+    # -----------------------------------------------------------------
+    # Hilo de escritura
+    # -----------------------------------------------------------------
+    def _escribir(self, tipo, canal, t, datos):
+        offset = self._archivo.tell()
+        self._archivo.write(_REGISTRO.pack(tipo, canal, 0, t, len(datos)))
+        self._archivo.write(datos)
+        self._indice.append((t, offset, tipo, canal))
+        n = _REGISTRO.size + len(datos)
+        self.bytes += n
+        return n
+
+    def _escribir_hueco(self, tipo, canal, t, motivo):
+        self.huecos += 1
+        return self._escribir(HUECO, canal, t, struct.pack('<BB', tipo, motivo))
+
+    def _bucle(self):
+        inicio_ventana = time.monotonic()
+        bytes_ventana = 0
+        while True:
+            elemento = self._cola.get()
+            while self._huecos:
+                bytes_ventana += self._escribir_hueco(*self._huecos.popleft())
+            if elemento is None:
+                break
+            tipo, canal, t, dato = elemento
+
+            ahora = time.monotonic()
+            if ahora - inicio_ventana >= 1.0:
+                # Ajuste de calidad una vez por segundo según el ancho de banda usado
+                tasa = bytes_ventana / (ahora - inicio_ventana)
+                if tasa > self.max_bytes_s:
+                    self.calidad = max(self.calidad_min, self.calidad - 10)
+                elif tasa < 0.6 * self.max_bytes_s:
+                    self.calidad = min(self.calidad_max, self.calidad + 5)
+                inicio_ventana, bytes_ventana = ahora, 0
+
+            if tipo == FRAME:
+                if bytes_ventana >= self.max_bytes_s and not self.sin_descartes:
+                    self.omitidos += 1
+                    bytes_ventana += self._escribir_hueco(tipo, canal, t, MOTIVO_ANCHO)
+                    continue
+                ok, buf = cv2.imencode('.jpg', dato, [cv2.IMWRITE_JPEG_QUALITY, self.calidad])
+                if not ok:
+                    continue
+                datos = buf.tobytes()
+            elif tipo == TELEMETRIA:
+                datos = json.dumps(dato).encode()
+            else:
+                datos = struct.pack('<4h', *dato)
+
+            bytes_ventana += self._escribir(tipo, canal, t, datos)
+            self.escritos += 1
+
+    def resumen(self):
+        return {
+            'escritos': self.escritos,
+            'descartados': self.descartados,
+            'omitidos': self.omitidos,
+            'huecos': self.huecos,
+            'MB': round(self.bytes / 1e6, 2),
+            'calidad': self.calidad,
+        }
+
+
+class LectorSesion:
+    """Acceso aleatorio por tiempo a una sesión .tlog (mapeada en memoria)."""
+
+    def __init__(self, ruta):
+        self._f = open(ruta, 'rb')
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        magia, version, _ = _CABECERA.unpack_from(self._mm, 0)
+        if magia != _MAGIA or version != _VERSION:
+            raise ValueError(f"{ruta} no es una sesión .tlog v{_VERSION}")
+        self.reconstruido = False
+        self.indice = self._leer_indice()
+        if self.indice is None:
+            self.indice = self._reconstruir_indice()
+            self.reconstruido = True
+        self._tiempos = self.indice['t']
+        # Posiciones y tiempos de los frames de cada canal, una sola vez
+        self._frames = {}
+        es_frame = self.indice['tipo'] == FRAME
+        for canal in np.unique(self.indice['canal'][es_frame]):
+            posiciones = np.nonzero(es_frame & (self.indice['canal'] == canal))[0]
+            self._frames[int(canal)] = (posiciones, self._tiempos[posiciones])
+
+    def _leer_indice(self):
+        if len(self._mm) < _CABECERA.size + _COLA.size:
+            return None
+        offset, n, magia = _COLA.unpack_from(self._mm, len(self._mm) - _COLA.size)
+        if magia != _MAGIA_INDICE:
+            return None
+        return np.frombuffer(self._mm, dtype=_DTYPE_INDICE, count=n, offset=offset).copy()
+
+    def _reconstruir_indice(self):
+        """Recorre los registros (sesión cortada sin índice); ignora un último registro truncado."""
+        entradas = []
+        pos, fin = _CABECERA.size, len(self._mm)
+        while pos + _REGISTRO.size <= fin:
+            tipo, canal, _, t, n = _REGISTRO.unpack_from(self._mm, pos)
+            if tipo not in (FRAME, TELEMETRIA, COMANDO, HUECO) or pos + _REGISTRO.size + n > fin:
+                break
+            entradas.append((t, pos, tipo, canal))
+            pos += _REGISTRO.size + n
+        indice = np.array(entradas, dtype=_DTYPE_INDICE)
+        return indice[np.argsort(indice['t'], kind='stable')]
+
+    def __len__(self):
+        return len(self.indice)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        self._mm.close()
+        self._f.close()
+
+    @property
+    def inicio(self):
+        return float(self._tiempos[0]) if len(self) else 0.0
+
+    @property
+    def fin(self):
+        return float(self._tiempos[-1]) if len(self) else 0.0
+
+    def buscar(self, t):
+        """Posición en el índice del primer registro con timestamp >= t (búsqueda binaria)."""
+        return int(np.searchsorted(self._tiempos, t, side='left'))
+
+    def leer(self, i) -> Registro:
+        entrada = self.indice[i]
+        offset = int(entrada['offset'])
+        tipo, canal, _, t, n = _REGISTRO.unpack_from(self._mm, offset)
+        crudo = self._mm[offset + _REGISTRO.size: offset + _REGISTRO.size + n]
+        if tipo == FRAME:
+            datos = cv2.imdecode(np.frombuffer(crudo, np.uint8), cv2.IMREAD_COLOR)
+        elif tipo == TELEMETRIA:
+            datos = json.loads(crudo)
+        elif tipo == HUECO:
+            datos = struct.unpack('<BB', crudo)
+        else:
+            datos = struct.unpack('<4h', crudo)
+        return Registro(tipo, canal, t, datos)
+
+    def registros(self, desde=None, hasta=None, tipo=None, canal=None):
+        """Itera en orden de tiempo los registros en [desde, hasta) que cumplan el filtro."""
+        i = self.buscar(desde) if desde is not None else 0
+        fin = self.buscar(hasta) if hasta is not None else len(self)
+        for j in range(i, fin):
+            entrada = self.indice[j]
+            if tipo is not None and entrada['tipo'] != tipo:
+                continue
+            if canal is not None and entrada['canal'] != canal:
+                continue
+            yield self.leer(j)
+
+    def frames(self, canal=CANAL_DRON):
+        """(posiciones en el índice, timestamps) de los frames del canal."""
+        vacio = np.zeros(0, dtype=np.int64)
+        return self._frames.get(canal, (vacio, self._tiempos[vacio]))
+
+    def frame_en(self, t, canal=CANAL_DRON):
+        """Último frame del canal con timestamp <= t (o None)."""
+        posiciones, tiempos = self.frames(canal)
+        i = int(np.searchsorted(tiempos, t, side='right')) - 1
+        return self.leer(posiciones[i]) if i >= 0 else None
+
+    def huecos(self, tipo=None, canal=None):
+        """[(timestamp, tipo, canal, motivo)] de los registros que no se grabaron."""
+        return [(r.timestamp, r.datos[0], r.canal, r.datos[1]) for r in self.registros(tipo=HUECO)
+                if (tipo is None or r.datos[0] == tipo) and (canal is None or r.canal == canal)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resumen de una sesión .tlog")
+    parser.add_argument("ruta")
+    parser.add_argument("--en", type=float, help="segundo (desde el inicio) cuyo frame se exporta a JPG")
+    args = parser.parse_args()
+
+    with LectorSesion(args.ruta) as lector:
+        nombres = {FRAME: 'frames', TELEMETRIA: 'telemetría', COMANDO: 'comandos', HUECO: 'huecos'}
+        print(f"{args.ruta}: {len(lector)} registros, {lector.fin - lector.inicio:.1f} s, "
+              f"{os.path.getsize(args.ruta) / 1e6:.1f} MB"
+              + (" (índice reconstruido)" if lector.reconstruido else ""))
+        for tipo, nombre in nombres.items():
+            for canal in np.unique(lector.indice['canal'][lector.indice['tipo'] == tipo]):
+                n = int(np.sum((lector.indice['tipo'] == tipo) & (lector.indice['canal'] == canal)))
+                print(f"  {nombre:<11} canal {canal}: {n}")
+        if args.en is not None:
+            registro = lector.frame_en(lector.inicio + args.en)
+            if registro is not None:
+                salida = f"frame_{args.en:.2f}s.jpg"
+                cv2.imwrite(salida, registro.datos)
+                print(f"Frame en {args.en:.2f} s guardado en {salida}")
+
+
+if __name__ == "__main__":
+    main()
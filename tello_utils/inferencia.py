@@ -0,0 +1,210 @@
+"""
+Inferencia de modelos (MediaPipe, detectores) fuera del hilo de la interfaz.
+
+Antes Practicas/3 llamaba hands.process() dentro del mismo tick de Tk que
+despliega el video: mientras corría el modelo la ventana no respondía y el
+tick se alargaba. Aquí un hilo de inferencia atiende varias fuentes (cámara
+de gestos, feed del dron...):
+  - cada fuente tiene su cola acotada (por defecto de una posición: el frame
+    nuevo reemplaza al que no se alcanzó a procesar y se cuenta como
+    descartado), así que enviar() nunca bloquea,
+  - el hilo toma un lote con el frame pendiente de cada fuente y corre el
+    modelo de cada una por turnos, de modo que una fuente rápida no deja sin
+    servicio a la otra,
+  - el último Resultado de cada fuente se publica con la secuencia y la
+    marca de tiempo del frame; la interfaz lo lee con siguiente() igual que
+    los frames de FrameGrabber.
+
+MediaPipe y OpenCV liberan el GIL mientras procesan, así que un hilo basta
+para que el modelo corra en paralelo con el loop de Tk.
+
+Con un dron de reloj virtual (reproducción rápida) no hay hilo: enviar()
+corre el modelo de inmediato, para que el flujo de comandos siga siendo
+determinista (igual que CommandScheduler).
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+
+
+class Resultado(NamedTuple):
+    """Salida del modelo para un frame de una fuente."""
+    fuente: str
+    seq: int
+    timestamp: float     # marca de tiempo del frame (la que dio el productor)
+    salida: Any          # lo que regresó el modelo
+    latencia: float      # segundos desde enviar() hasta la publicación del resultado
+
+
+class _Fuente:
+    def __init__(self, nombre, modelo, profundidad, historial):
+        self.nombre = nombre
+        self.modelo = modelo
+        self.cola = deque(maxlen=profundidad)      # (seq, timestamp, t_envio, imagen)
+        self.ultimo: Optional[Resultado] = None
+        self.enviados = 0
+        self.procesados = 0
+        self.descartados = 0
+        self.errores = 0
+        self.latencias = deque(maxlen=historial)
+        self.tiempos_modelo = deque(maxlen=historial)
+        self.t_primero = None
+
+
+class InferenceWorker:
+    """
+    profundidad: frames pendientes por fuente (1 = solo el más reciente).
+    sincrono:    si es True no hay hilo y enviar() procesa de inmediato.
+    historial:   latencias guardadas por fuente para el resumen.
+    """
+
+    def __init__(self, nombre="inferencia", profundidad=1, sincrono=False, historial=500):
+        self._nombre = nombre
+        self._profundidad = profundidad
+        self._historial = historial
+        self.sincrono = sincrono
+        self._fuentes = {}
+        self._cond = threading.Condition()
+        self._hilo = None
+        self._corriendo = False
+        # Trazador opcional: tramos 'cola:<fuente>' e 'inferencia:<fuente>' por frame
+        self.trazador = None
+
+    @classmethod
+    def para_dron(cls, drone, **kwargs):
+        """Worker síncrono si el dron es una reproducción con reloj virtual."""
+        return cls(sincrono=getattr(drone, 'reloj_virtual', False), **kwargs)
+
+    def agregar(self, fuente, modelo):
+        """modelo: función imagen -> salida, llamada desde el hilo de inferencia."""
+        self._fuentes[fuente] = _Fuente(fuente, modelo, self._profundidad, self._historial)
+        return self
+
+    # -----------------------------------------------------------------
+    # Ciclo de vida
+    # -----------------------------------------------------------------
+    def iniciar(self):
+        if self.sincrono:
+            return self
+        self._corriendo = True
+        self._hilo = threading.Thread(target=self._bucle, name=f"InferenceWorker-{self._nombre}", daemon=True)
+        self._hilo.start()
+        return self
+
+    def detener(self):
+        with self._cond:
+            self._corriendo = False
+            self._cond.notify_all()
+        if self._hilo is not None:
+            self._hilo.join(timeout=2.0)
+            self._hilo = None
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.detener()
+
+    # -----------------------------------------------------------------
+    # Productores (no bloquean)
+    # -----------------------------------------------------------------
+    def enviar(self, fuente, imagen, timestamp=None):
+        """
+        Encola un frame de la fuente; si la cola está llena se descarta el
+        más viejo. La imagen no debe modificarse después de enviarla.
+        Regresa la secuencia asignada al frame.
+        """
+        f = self._fuentes[fuente]
+        t_envio = time.monotonic()
+        with self._cond:
+            f.enviados += 1
+            seq = f.enviados
+            if len(f.cola) == f.cola.maxlen:
+                f.descartados += 1
+            f.cola.append((seq, t_envio if timestamp is None else timestamp, t_envio, imagen))
+            if not self.sincrono:
+                self._cond.notify()
+        if self.sincrono:
+            with self._cond:
+                pendiente = f.cola.popleft()
+            self._procesar(f, pendiente)
+        return seq
+
+    # -----------------------------------------------------------------
+    # Hilo de inferencia
+    # -----------------------------------------------------------------
+    def _bucle(self):
+        while True:
+            with self._cond:
+                while self._corriendo and not any(f.cola for f in self._fuentes.values()):
+                    self._cond.wait(0.1)
+                if not self._corriendo:
+                    return
+                # Lote: el frame pendiente de cada fuente, atendidas por turnos
+                lote = [(f, f.cola.popleft()) for f in self._fuentes.values() if f.cola]
+            for f, pendiente in lote:
+                self._procesar(f, pendiente)
+
+    def _procesar(self, f, pendiente):
+        seq, timestamp, t_envio, imagen = pendiente
+        inicio = time.monotonic()
+        try:
+            salida = f.modelo(imagen)
+        except Exception as e:
+            f.errores += 1
+            print(f"Error en el modelo de '{f.nombre}': {e}")
+            return
+        fin = time.monotonic()
+        if self.trazador is not None:
+            self.trazador.registrar(f"cola:{f.nombre}", seq, t_envio, inicio)
+            self.trazador.registrar(f"inferencia:{f.nombre}", seq, inicio, fin)
+        f.tiempos_modelo.append(fin - inicio)
+        f.latencias.append(fin - t_envio)
+        f.procesados += 1
+        if f.t_primero is None:
+            f.t_primero = fin
+        # Asignación atómica: el consumidor ve el resultado anterior o este, completo
+        f.ultimo = Resultado(f.nombre, seq, timestamp, salida, fin - t_envio)
+
+    # -----------------------------------------------------------------
+    # Consumidor
+    # -----------------------------------------------------------------
+    def resultado(self, fuente) -> Optional[Resultado]:
+        """Último resultado publicado de la fuente (o None)."""
+        return self._fuentes[fuente].ultimo
+
+    def siguiente(self, fuente, ultimo_seq) -> Optional[Resultado]:
+        """El último resultado solo si es más nuevo que ultimo_seq; si no, None."""
+        r = self._fuentes[fuente].ultimo
+        if r is None or r.seq <= ultimo_seq:
+            return None
+        return r
+
+    def en_cola(self, fuente):
+        """Frames de la fuente esperando al modelo."""
+        return len(self._fuentes[fuente].cola)
+
+    def resumen(self):
+        """Por fuente: frames enviados/procesados/descartados, fps de inferencia, cola y latencias (ms)."""
+        ahora = time.monotonic()
+        r = {}
+        for nombre, f in self._fuentes.items():
+            lat = np.array(f.latencias) * 1000 if f.latencias else np.zeros(1)
+            modelo = np.array(f.tiempos_modelo) * 1000 if f.tiempos_modelo else np.zeros(1)
+            segundos = ahora - f.t_primero if f.t_primero is not None else 0.0
+            r[nombre] = {
+                'enviados': f.enviados,
+                'procesados': f.procesados,
+                'descartados': f.descartados,
+                'errores': f.errores,
+                'fps': round((f.procesados - 1) / segundos, 2) if segundos > 0 else 0.0,
+                'en_cola': len(f.cola),
+                'modelo_p50_ms': round(float(np.percentile(modelo, 50)), 2),
+                'latencia_p50_ms': round(float(np.percentile(lat, 50)), 2),
+                'latencia_p95_ms': round(float(np.percentile(lat, 95)), 2),
+            }
+        return r
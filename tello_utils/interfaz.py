@@ -0,0 +1,258 @@
+"""
+Interfaz opcional de las prácticas: ventana, controles, overlay y métricas.
+
+Los scripts leen su configuración con cargar_config() y crean la raíz con
+crear_raiz(). En modo headless no se importa tkinter ni se abren ventanas
+de OpenCV: la raíz es un BucleHeadless con la misma interfaz after()/
+mainloop()/destroy() que tk.Tk, los trackbars se sustituyen por valores
+fijos del archivo y el pipeline corre sin convertir frames a PhotoImage,
+imprimiendo solo métricas.
+
+Con ventana, cada panel de video es un PanelTk: una sola PhotoImage por
+panel que se actualiza en su lugar, en vez de crear Image + PhotoImage por
+frame.
+
+    TELLO_CONFIG=p2.json python Practicas/2/main.py
+    TELLO_HEADLESS=1 python Practicas/2/main.py       (headless con valores por defecto)
+
+Ejemplo de archivo (todas las claves son opcionales):
+
+    {
+        "headless": true,
+        "overlay": false,
+        "duracion_s": 60,
+        "metricas": "metricas_p2.json",
+        "metricas_cada_s": 5,
+        "trazas": "traza_p2.json",
+        "perfil": "perfil_p2.folded",
+        "multiproceso": 2,
+        "parametros": {"speed": 30, "h_min": 40, "h_max": 80}
+    }
+
+"parametros" son los valores que en la GUI vienen de los trackbars; cada
+script define los suyos y sus valores por defecto.
+"""
+
+import heapq
+import json
+import os
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+
+def cargar_config(parametros=None):
+    """
+    Configuración de ejecución: valores por defecto, luego el JSON de
+    TELLO_CONFIG y por último TELLO_HEADLESS=1. En headless el overlay está
+    apagado y las métricas se imprimen cada 5 s, salvo que el archivo diga
+    otra cosa.
+    """
+    archivo = {}
+    ruta = os.environ.get('TELLO_CONFIG')
+    if ruta:
+        with open(ruta) as f:
+            archivo = json.load(f)
+    headless = bool(archivo.get('headless', False)) or bool(os.environ.get('TELLO_HEADLESS'))
+
+    config = {
+        'headless': headless,
+        'overlay': not headless,
+        'duracion_s': None,
+        'metricas': None,
+        'metricas_cada_s': 5.0 if headless else 0.0,
+    }
+    config.update({k: v for k, v in archivo.items() if k != 'parametros'})
+    config['headless'] = headless
+    config['parametros'] = dict(parametros or {})
+    config['parametros'].update(archivo.get('parametros', {}))
+    return config
+
+
+class BucleHeadless:
+    """Sustituto de tk.Tk sin ventana: ejecuta los callbacks de after() en orden de tiempo."""
+
+    def __init__(self):
+        self._pendientes = []            # heap de (t, n, fn, args)
+        self._n = 0
+        self._corriendo = False
+
+    def title(self, *args):
+        pass
+
+    def bind(self, *args):
+        pass
+
+    def after(self, ms, fn, *args):
+        self._n += 1
+        heapq.heappush(self._pendientes, (time.monotonic() + ms / 1000.0, self._n, fn, args))
+        return self._n
+
+    def mainloop(self):
+        self._corriendo = True
+        while self._corriendo and self._pendientes:
+            t, _, fn, args = heapq.heappop(self._pendientes)
+            espera = t - time.monotonic()
+            if espera > 0:
+                time.sleep(espera)
+            fn(*args)
+
+    def destroy(self):
+        self._corriendo = False
+        self._pendientes = []
+
+
+class ValorFijo:
+    """Sustituto de un tk.Scale en headless: get() regresa el valor del archivo."""
+
+    def __init__(self, valor):
+        self._valor = valor
+
+    def get(self):
+        return self._valor
+
+    def set(self, valor):
+        self._valor = valor
+
+
+def crear_raiz(config, titulo):
+    """tk.Tk() con título, o un BucleHeadless en modo headless."""
+    if config['headless']:
+        return BucleHeadless()
+    import tkinter as tk
+    root = tk.Tk()
+    root.title(titulo)
+    return root
+
+
+class ConversorRGBA:
+    """
+    BGR (cualquier tamaño) → imagen PIL RGBA de width x height sin asignar
+    memoria por frame: el resize y la conversión escriben en buffers
+    preasignados y la imagen PIL comparte la memoria del buffer RGBA
+    (Image.frombuffer; con RGB PIL copiaría porque guarda 4 bytes por pixel).
+    """
+
+    def __init__(self, width, height):
+        from PIL import Image
+        self.width = width
+        self.height = height
+        self._bgr = np.empty((height, width, 3), dtype=np.uint8)
+        self._rgba = np.empty((height, width, 4), dtype=np.uint8)
+        self.imagen = Image.frombuffer('RGBA', (width, height), self._rgba, 'raw', 'RGBA', 0, 1)
+
+    def convertir(self, frame_bgr):
+        """Actualiza self.imagen (la misma instancia siempre) y la regresa."""
+        if frame_bgr.shape[:2] != (self.height, self.width):
+            frame_bgr = cv2.resize(frame_bgr, (self.width, self.height), dst=self._bgr)
+        cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGBA, dst=self._rgba)
+        return self.imagen
+
+
+class PanelTk:
+    """
+    Panel de video en un Label de Tk con una PhotoImage persistente: cada
+    frame se pega (paste) sobre la misma foto en lugar de crear una nueva.
+
+    label:   tk.Label donde se muestra el video.
+    width, height: tamaño del panel (el frame se escala si es distinto).
+    hz:      redibujos por segundo como máximo (la tasa del monitor); los
+             frames que llegan antes se omiten sin convertirlos, así que el
+             procesamiento puede ir más rápido que el despliegue.
+    """
+
+    def __init__(self, label, width, height, hz=60.0):
+        from PIL import ImageTk
+        self._conversor = ConversorRGBA(width, height)
+        self._foto = ImageTk.PhotoImage('RGBA', (width, height))
+        label.configure(image=self._foto)
+        label.imgtk = self._foto                # Tk no guarda la referencia
+        self.periodo = 1.0 / hz
+        self._t_ultimo = 0.0
+        self.mostrados = 0
+        self.omitidos = 0
+
+    def mostrar(self, frame_bgr):
+        """Despliega el frame BGR si ya toca redibujar; regresa True si se mostró."""
+        ahora = time.monotonic()
+        if ahora - self._t_ultimo < self.periodo:
+            self.omitidos += 1
+            return False
+        self._t_ultimo = ahora
+        self._foto.paste(self._conversor.convertir(frame_bgr))
+        self.mostrados += 1
+        return True
+
+
+class Metricas:
+    """
+    Tiempos por frame del loop principal, separados en procesamiento y GUI
+    (overlay + conversión y despliegue). Con la fracción de GUI se estima el
+    frame rate que tendría el mismo loop en headless.
+
+    nombre:  prefijo de las líneas impresas.
+    cada_s:  periodo del reporte en consola (0 = solo el resumen final).
+    ruta:    JSON donde se escribe el resumen al cerrar (opcional).
+    extras:  función sin argumentos que regresa un dict con datos de otros
+             componentes (p. ej. InferenceWorker.resumen) para el reporte.
+    """
+
+    def __init__(self, nombre, cada_s=0.0, ruta=None, historial=2000, extras=None):
+        self.nombre = nombre
+        self.cada_s = cada_s
+        self.ruta = ruta
+        self.extras = extras
+        self.proceso = deque(maxlen=historial)
+        self.gui = deque(maxlen=historial)
+        self.frames = 0
+        self._gui_total = 0.0
+        self._inicio = None
+        self._ultimo_reporte = None
+        self._frames_reporte = 0
+
+    def frame(self, proceso_s, gui_s=0.0):
+        ahora = time.monotonic()
+        if self._inicio is None:
+            self._inicio = self._ultimo_reporte = ahora
+        self.frames += 1
+        self.proceso.append(proceso_s)
+        self.gui.append(gui_s)
+        self._gui_total += gui_s
+        if self.cada_s and ahora - self._ultimo_reporte >= self.cada_s:
+            fps = (self.frames - self._frames_reporte) / (ahora - self._ultimo_reporte)
+            self._ultimo_reporte, self._frames_reporte = ahora, self.frames
+            proceso = np.array(self.proceso) * 1000
+            print(f"[{self.nombre}] {fps:5.1f} fps  proceso p50 {np.percentile(proceso, 50):.1f} ms "
+                  f"p95 {np.percentile(proceso, 95):.1f} ms  GUI {np.mean(self.gui) * 1000:.1f} ms")
+            if self.extras is not None:
+                print(f"[{self.nombre}] {self.extras()}")
+
+    def resumen(self):
+        if not self.frames:
+            return {'frames': 0}
+        extras = self.extras() if self.extras is not None else {}
+        segundos = max(time.monotonic() - self._inicio, 1e-9)
+        proceso = np.array(self.proceso) * 1000
+        gui = np.array(self.gui) * 1000
+        fraccion_gui = min(self._gui_total / segundos, 0.99)
+        return {
+            'frames': self.frames,
+            'segundos': round(segundos, 2),
+            'fps': round(self.frames / segundos, 2),
+            'proceso_p50_ms': round(float(np.percentile(proceso, 50)), 2),
+            'proceso_p95_ms': round(float(np.percentile(proceso, 95)), 2),
+            'gui_p50_ms': round(float(np.percentile(gui, 50)), 2),
+            'gui_%': round(100.0 * fraccion_gui, 1),
+            'fps_estimado_sin_gui': round(self.frames / segundos / (1.0 - fraccion_gui), 2),
+            **extras,
+        }
+
+    def cerrar(self):
+        r = self.resumen()
+        print(f"[{self.nombre}] {r}")
+        if self.ruta:
+            with open(self.ruta, 'w') as f:
+                json.dump(r, f, indent=2)
+        return r
@@ -0,0 +1,111 @@
+"""
+Estimador de estado del objetivo con filtro de Kalman de velocidad constante.
+
+Estado: [cx, cy, area, vx, vy, va] (pixeles, pixeles², y sus tasas por
+segundo). Medición: [cx, cy, area] de la detección por color.
+
+El filtro suaviza el centroide y el área que usan los controladores de
+seguimiento, predice la posición durante huecos cortos de detección y
+permite correr la detección a menor frecuencia que el control: entre dos
+detecciones los comandos se calculan con la predicción.
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+
+class Estimacion(NamedTuple):
+    cx: float
+    cy: float
+    area: float
+    vx: float
+    vy: float
+    va: float
+    edad: float          # segundos desde la última medición
+
+
+class FiltroKalmanObjetivo:
+    """
+    ruido_proceso:   desviación de la aceleración (px/s²) del objetivo.
+    ruido_medicion:  desviación de la medición de centroide (px); el área
+                     usa ruido_medicion_area (px²).
+    max_prediccion:  segundos que se sigue prediciendo sin mediciones antes
+                     de declarar el objetivo perdido.
+    """
+
+    def __init__(self, ruido_proceso=800.0, ruido_medicion=4.0, ruido_medicion_area=400.0,
+                 max_prediccion=0.5):
+        self.ruido_proceso = ruido_proceso
+        self.max_prediccion = max_prediccion
+        self._x = np.zeros(6)
+        self._P = np.eye(6)
+        self._R = np.diag([ruido_medicion ** 2, ruido_medicion ** 2, ruido_medicion_area ** 2])
+        self._H = np.hstack([np.eye(3), np.zeros((3, 3))])
+        self._I = np.eye(6)
+        self._t = None               # tiempo del estado actual
+        self._t_medicion = None      # tiempo de la última medición
+        self.inicializado = False
+
+    def reiniciar(self):
+        self.inicializado = False
+        self._t = None
+        self._t_medicion = None
+
+    def predecir(self, t) -> Optional[Estimacion]:
+        """Avanza el estado hasta el tiempo t y regresa la estimación (o None si está perdido)."""
+        if not self.inicializado:
+            return None
+        dt = t - self._t
+        if dt > 0:
+            F = np.eye(6)
+            F[0, 3] = F[1, 4] = F[2, 5] = dt
+            # Modelo de aceleración blanca discreta por eje
+            q = self.ruido_proceso ** 2
+            dt2, dt3, dt4 = dt * dt, dt ** 3 / 2, dt ** 4 / 4
+            Q = np.zeros((6, 6))
+            for i in range(3):
+                # El área cambia mucho más que la posición: escala su ruido
+                escala = 100.0 if i == 2 else 1.0
+                Q[i, i] = dt4 * q * escala
+                Q[i, i + 3] = Q[i + 3, i] = dt3 * q * escala
+                Q[i + 3, i + 3] = dt2 * q * escala
+            self._x = F @ self._x
+            self._P = F @ self._P @ F.T + Q
+            self._t = t
+        return self.estimacion(t)
+
+    def corregir(self, cx, cy, area, t):
+        """Incorpora una medición tomada en el tiempo t."""
+        z = np.array([cx, cy, area], dtype=float)
+        if self.inicializado and t - self._t_medicion > self.max_prediccion:
+            # Tras un hueco el estado ya está perdido: la medición reinicia el
+            # filtro en lugar de corregir una extrapolación vieja
+            self.reiniciar()
+        if not self.inicializado:
+            self._x = np.concatenate([z, np.zeros(3)])
+            self._P = np.diag([self._R[0, 0], self._R[1, 1], self._R[2, 2], 1e4, 1e4, 1e8])
+            self._t = t
+            self._t_medicion = t
+            self.inicializado = True
+            return self.estimacion(t)
+
+        self.predecir(t)
+        y = z - self._H @ self._x
+        S = self._H @ self._P @ self._H.T + self._R
+        K = self._P @ self._H.T @ np.linalg.inv(S)
+        self._x = self._x + K @ y
+        self._P = (self._I - K @ self._H) @ self._P
+        self._t_medicion = t
+        return self.estimacion(t)
+
+    def estimacion(self, t=None) -> Optional[Estimacion]:
+        """Estado actual; None si no hay medición reciente (más de max_prediccion segundos)."""
+        if not self.inicializado:
+            return None
+        edad = (self._t if t is None else t) - self._t_medicion
+        if edad > self.max_prediccion:
+            self.reiniciar()
+            return None
+        cx, cy, area, vx, vy, va = self._x
+        return Estimacion(cx, cy, max(area, 0.0), vx, vy, va, edad)
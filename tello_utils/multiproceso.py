@@ -0,0 +1,319 @@
+"""
+Pipeline multiproceso: captura, detección y despliegue en procesos aparte.
+
+En update_frame todo corre en el hilo de Tk: captura (en su hilo, pero con
+el GIL), segmentación, contornos y despliegue comparten un núcleo. Aquí:
+  - un proceso de captura decodifica el stream y escribe cada frame,
+    ya redimensionado, en un slot libre de un AnilloFrames (un bloque de
+    multiprocessing.shared_memory con slots de tamaño fijo),
+  - N procesos de detección toman (seq, slot, t) de una cola, leen el
+    frame directo del slot y publican solo el registro de la detección
+    (una tupla pequeña) en la cola de resultados: los frames nunca se
+    serializan,
+  - el proceso principal (la interfaz) toma con siguiente() el resultado
+    más reciente con la vista de su slot y lo devuelve al anillo al
+    terminar (liberar(), o el siguiente siguiente()).
+
+Un slot pertenece a una sola etapa a la vez: libre → captura → detección →
+despliegue → libre. Si no hay slot libre la captura descarta el frame
+(sin_descartes=True la hace esperar, para archivos y benchmarks), y los
+resultados que llegan tarde o fuera de orden se devuelven sin desplegarse.
+
+Los parámetros que cambian en vivo (rango HSV de los sliders) van en un
+vector compartido que los detectores leen en cada frame (fijar_parametros).
+
+Los procesos se crean con fork (no se vuelve a importar el script, que se
+conecta al dron al cargarse): el pipeline se inicia antes de abrir la
+ventana. En Windows no hay fork y este modo no está disponible.
+
+resumen() reporta por etapa frames, fps, descartados y utilización: CPU
+usada por la etapa / tiempo transcurrido (time.process_time en los procesos
+de captura y detección, time.thread_time del hilo de la interfaz entre
+siguiente() y liberar()), así que esperar al stream o a la cola no cuenta y
+una etapa que satura un núcleo se acerca a 1.
+"""
+
+import multiprocessing as mp
+import queue
+import time
+from collections import deque
+from multiprocessing import shared_memory
+from typing import Any, NamedTuple
+
+import cv2
+import numpy as np
+
+from tello_utils.segmentacion import SegmentadorHSV, objetivo_de_mascara
+
+# Columnas de las estadísticas compartidas (una fila por proceso)
+_OCUPADO, _FRAMES, _DESCARTADOS = range(3)
+
+
+class Paquete(NamedTuple):
+    """Frame procesado: imagen es la vista del slot, válida hasta liberarlo."""
+    seq: int
+    timestamp: float     # time.monotonic() al decodificar (mismo reloj en todos los procesos)
+    imagen: np.ndarray
+    deteccion: Any       # lo que regresó el detector
+    latencia: float      # segundos desde la captura hasta siguiente()
+
+
+class AnilloFrames:
+    """Slots de frames de tamaño fijo en un bloque de memoria compartida."""
+
+    def __init__(self, slots, width, height, canales=3):
+        self.slots = slots
+        self.forma = (height, width, canales)
+        self._shm = shared_memory.SharedMemory(create=True, size=slots * height * width * canales)
+        self._frames = np.ndarray((slots, *self.forma), dtype=np.uint8, buffer=self._shm.buf)
+
+    def vista(self, slot):
+        return self._frames[slot]
+
+    def escribir(self, slot, imagen):
+        """Copia (o redimensiona) la imagen directo en el slot."""
+        destino = self._frames[slot]
+        if imagen.shape == self.forma:
+            np.copyto(destino, imagen)
+        else:
+            cv2.resize(imagen, (self.forma[1], self.forma[0]), dst=destino)
+
+    def cerrar(self):
+        self._frames = None
+        self._shm.unlink()
+        try:
+            self._shm.close()
+        except BufferError:
+            # Aún hay vistas vivas (p. ej. el último Paquete); el bloque ya no tiene nombre
+            pass
+
+
+def _capturar(abrir_captura, anillo, libres, trabajos, fin, estadisticas, trabajadores, en_vivo, sin_descartes):
+    fila = 0
+    cap = abrir_captura()
+    seq = 0
+    try:
+        while not fin.is_set():
+            inicio = time.process_time()
+            ok, imagen = cap.read()
+            if not ok or imagen is None:
+                if en_vivo:
+                    time.sleep(0.005)
+                    continue
+                break
+            t = time.monotonic()
+            ocupado = time.process_time() - inicio
+            slot = None
+            while slot is None and not fin.is_set():
+                try:
+                    slot = libres.get(timeout=0.2) if sin_descartes else libres.get_nowait()
+                except queue.Empty:
+                    if not sin_descartes:
+                        break
+            if slot is None:
+                estadisticas[fila + _DESCARTADOS] += 1
+                estadisticas[fila + _OCUPADO] += ocupado
+                continue
+            inicio = time.process_time()
+            anillo.escribir(slot, imagen)
+            seq += 1
+            trabajos.put((seq, slot, t))
+            estadisticas[fila + _OCUPADO] += ocupado + time.process_time() - inicio
+            estadisticas[fila + _FRAMES] += 1
+    finally:
+        cap.release()
+        for _ in range(trabajadores):
+            trabajos.put(None)
+
+
+def _detectar(fabrica, anillo, trabajos, resultados, parametros, estadisticas, fila):
+    fila *= 3
+    detectar = fabrica()
+    while True:
+        trabajo = trabajos.get()
+        if trabajo is None:
+            resultados.put(None)
+            return
+        seq, slot, t = trabajo
+        inicio = time.process_time()
+        try:
+            registro = detectar(anillo.vista(slot), parametros[:])
+        except Exception as e:
+            print(f"Error en el detector: {e}")
+            registro = None
+        estadisticas[fila + _OCUPADO] += time.process_time() - inicio
+        estadisticas[fila + _FRAMES] += 1
+        resultados.put((seq, slot, t, registro))
+
+
+class PipelineMultiproceso:
+    """
+    abrir_captura: función sin argumentos que regresa un objeto tipo
+                   cv2.VideoCapture (se llama en el proceso de captura).
+    fabrica:       función sin argumentos que, en cada proceso de detección,
+                   crea detectar(imagen, parametros) -> registro pequeño.
+    width, height: tamaño de los slots (la captura redimensiona ahí).
+    trabajadores:  procesos de detección.
+    slots:         frames en el anillo (por defecto 2 por trabajador + 2).
+    parametros:    tamaño del vector compartido (ver fijar_parametros).
+    en_vivo:       una lectura fallida no termina la captura.
+    sin_descartes: la captura espera un slot libre en lugar de descartar.
+    historial:     latencias guardadas para el resumen.
+    """
+
+    def __init__(self, abrir_captura, fabrica, width, height, trabajadores=2, slots=None,
+                 parametros=0, en_vivo=False, sin_descartes=False, historial=500):
+        self.trabajadores = trabajadores
+        self._abrir_captura = abrir_captura
+        self._fabrica = fabrica
+        self._en_vivo = en_vivo
+        self._sin_descartes = sin_descartes
+        self._ctx = mp.get_context('fork')
+        self._anillo = AnilloFrames(slots or 2 * trabajadores + 2, width, height)
+        self._libres = self._ctx.Queue()
+        self._trabajos = self._ctx.Queue()
+        self._resultados = self._ctx.Queue()
+        self._fin = self._ctx.Event()
+        self._parametros = self._ctx.Array('d', max(parametros, 1), lock=False)
+        # Una fila (ocupado, frames, descartados) para la captura y una por detector
+        self._estadisticas = self._ctx.Array('d', 3 * (1 + trabajadores), lock=False)
+        self._procesos = []
+        self._actual = None              # slot que tiene la interfaz
+        self._t_entrega = None
+        self._terminados = 0
+        self._t_inicio = None
+
+        # Estadísticas del despliegue (proceso principal)
+        self.entregados = 0
+        self.descartados = 0             # resultados que no llegaron a desplegarse
+        self.ocupado_despliegue = 0.0
+        self.latencias = deque(maxlen=historial)
+
+    # -----------------------------------------------------------------
+    # Ciclo de vida
+    # -----------------------------------------------------------------
+    def iniciar(self):
+        for slot in range(self._anillo.slots):
+            self._libres.put(slot)
+        self._procesos.append(self._ctx.Process(
+            target=_capturar, name="captura", daemon=True,
+            args=(self._abrir_captura, self._anillo, self._libres, self._trabajos, self._fin,
+                  self._estadisticas, self.trabajadores, self._en_vivo, self._sin_descartes)))
+        for i in range(self.trabajadores):
+            self._procesos.append(self._ctx.Process(
+                target=_detectar, name=f"deteccion-{i}", daemon=True,
+                args=(self._fabrica, self._anillo, self._trabajos, self._resultados,
+                      self._parametros, self._estadisticas, i + 1)))
+        self._t_inicio = time.perf_counter()
+        for p in self._procesos:
+            p.start()
+        return self
+
+    def detener(self):
+        self._fin.set()
+        for p in self._procesos:
+            p.join(timeout=1.0)
+            if p.is_alive():
+                p.terminate()
+                p.join(timeout=1.0)
+        self._procesos = []
+        for q in (self._libres, self._trabajos, self._resultados):
+            q.cancel_join_thread()
+            q.close()
+        self._anillo.cerrar()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.detener()
+
+    # -----------------------------------------------------------------
+    # Interfaz (proceso principal)
+    # -----------------------------------------------------------------
+    def fijar_parametros(self, valores):
+        """Vector que los detectores reciben en cada frame (p. ej. rango HSV y área mínima)."""
+        self._parametros[:len(valores)] = valores
+
+    def siguiente(self, ultimo_seq=0):
+        """
+        Resultado más reciente con seq > ultimo_seq (o None). Libera el slot
+        del paquete anterior y devuelve al anillo los resultados atrasados.
+        """
+        nuevo = None
+        while True:
+            try:
+                r = self._resultados.get_nowait()
+            except queue.Empty:
+                break
+            if r is None:
+                self._terminados += 1
+                continue
+            if r[0] <= ultimo_seq or (nuevo is not None and r[0] < nuevo[0]):
+                self._devolver(r[1])
+                continue
+            if nuevo is not None:
+                self._devolver(nuevo[1])
+            nuevo = r
+        if nuevo is None:
+            return None
+        self.liberar()
+        seq, slot, t, registro = nuevo
+        self._actual = slot
+        self._t_entrega = time.thread_time()
+        self.entregados += 1
+        latencia = time.monotonic() - t
+        self.latencias.append(latencia)
+        return Paquete(seq, t, self._anillo.vista(slot), registro, latencia)
+
+    def liberar(self):
+        """La interfaz terminó con el último paquete: su slot vuelve a la captura."""
+        if self._actual is None:
+            return
+        self.ocupado_despliegue += time.thread_time() - self._t_entrega
+        self._libres.put(self._actual)
+        self._actual = None
+
+    def _devolver(self, slot):
+        self.descartados += 1
+        self._libres.put(slot)
+
+    @property
+    def terminado(self):
+        """True cuando la fuente se acabó y todos los detectores terminaron."""
+        return self._terminados == self.trabajadores
+
+    def resumen(self):
+        """Por etapa: frames, fps, descartados y utilización; latencia captura → interfaz (ms)."""
+        transcurrido = time.perf_counter() - self._t_inicio if self._t_inicio is not None else 0.0
+        e = self._estadisticas[:]
+
+        def etapa(ocupado, frames, descartados=0):
+            return {'frames': int(frames), 'descartados': int(descartados),
+                    'fps': round(frames / transcurrido, 2) if transcurrido > 0 else 0.0,
+                    'utilizacion': round(ocupado / transcurrido, 3) if transcurrido > 0 else 0.0}
+
+        r = {'captura': etapa(*e[0:3])}
+        for i in range(self.trabajadores):
+            r[f'deteccion-{i}'] = etapa(*e[3 * (i + 1):3 * (i + 2)])
+        r['despliegue'] = etapa(self.ocupado_despliegue, self.entregados, self.descartados)
+        lat = np.array(self.latencias) * 1000 if self.latencias else np.zeros(1)
+        r['latencia_p50_ms'] = round(float(np.percentile(lat, 50)), 2)
+        r['latencia_p95_ms'] = round(float(np.percentile(lat, 95)), 2)
+        return r
+
+
+def detector_hsv(width, height, iteraciones=1, kernel_size=3):
+    """
+    Fábrica para PipelineMultiproceso: segmentación HSV + contorno más grande.
+    parametros: (h_min, s_min, v_min, h_max, s_max, v_max, area_min);
+    regresa un Objetivo o None.
+    """
+    segmentador = SegmentadorHSV(width, height, iteraciones=iteraciones, kernel_size=kernel_size)
+
+    def detectar(imagen, parametros):
+        lower = tuple(int(v) for v in parametros[0:3])
+        upper = tuple(int(v) for v in parametros[3:6])
+        mask = segmentador.segmentar(segmentador.convertir(imagen), lower, upper)
+        return objetivo_de_mascara('objetivo', mask, parametros[6])
+    return detectar
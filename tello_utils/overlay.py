@@ -0,0 +1,204 @@
+"""
+Compositor de overlay (HUD) con capas estáticas y campos cacheados.
+
+Antes cada frame repetía todos los cv2.putText/cv2.line del HUD aunque el
+texto no cambiara. Aquí:
+  - una Capa estática (guías, ayuda, etiquetas) se dibuja una sola vez:
+    cada elemento queda recortado a su caja (colores + máscara) y por frame
+    solo se copia con cv2.copyTo sobre esa caja; los fondos translúcidos se
+    mezclan solo dentro de su caja,
+  - un CampoTexto (batería, altura, centro, área...) guarda el recorte del
+    último texto y solo lo vuelve a dibujar cuando cambia su valor o color.
+
+Las líneas y textos se dibujan sin antialiasing (LINE_8, como en las
+prácticas), así que la máscara es exacta y el resultado es idéntico al de
+dibujar directamente sobre el frame. Los colores van en el orden de canales
+del frame (BGR en general).
+"""
+
+import cv2
+import numpy as np
+
+FUENTE = cv2.FONT_HERSHEY_SIMPLEX
+
+
+class _Recorte:
+    """
+    Elemento opaco ya dibujado, recortado a su caja: colores BGR y máscara.
+    Se compone con cv2.copyTo sobre la vista del frame en esa caja (la
+    vista comparte memoria, así que escribe en el frame sin copias).
+    """
+
+    def __init__(self, bgra, x, y, width=None, height=None):
+        """bgra: lienzo con alfa > 0 donde hay dibujo, colocado en (x, y) del frame."""
+        alfa = cv2.extractChannel(bgra, 3)
+        bx, by, w, h = cv2.boundingRect(alfa)
+        x0, y0, x1, y1 = x + bx, y + by, x + bx + w, y + by + h
+        if width is not None:
+            x0, y0 = max(x0, 0), max(y0, 0)
+            x1, y1 = min(x1, width), min(y1, height)
+        self.vacio = x0 >= x1 or y0 >= y1
+        self.caja = (slice(y0, y1), slice(x0, x1))
+        if not self.vacio:
+            ry, rx = slice(y0 - y, y1 - y), slice(x0 - x, x1 - x)
+            # cvtColor/copy en vez de copiar vistas con stride: mucho más rápido
+            self.bgr = cv2.cvtColor(bgra[ry, rx], cv2.COLOR_BGRA2BGR)
+            self.mascara = alfa[ry, rx].copy()
+
+    def componer(self, frame):
+        if not self.vacio:
+            cv2.copyTo(self.bgr, self.mascara, frame[self.caja])
+
+
+class _Translucido:
+    """Recorte con transparencia (p. ej. fondo de un panel): se mezcla en su caja."""
+
+    def __init__(self, bgra, x, y):
+        self.x, self.y = x, y
+        a = bgra[:, :, 3:4].astype(np.float32) / 255.0
+        self.inversa = 1.0 - a
+        self.premultiplicado = bgra[:, :, :3].astype(np.float32) * a + 0.5   # +0.5: redondeo al truncar
+
+    def componer(self, frame):
+        h, w = self.inversa.shape[:2]
+        x0, y0 = max(self.x, 0), max(self.y, 0)
+        x1, y1 = min(self.x + w, frame.shape[1]), min(self.y + h, frame.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return
+        ry, rx = slice(y0 - self.y, y1 - self.y), slice(x0 - self.x, x1 - self.x)
+        roi = frame[y0:y1, x0:x1]
+        roi[:] = (roi * self.inversa[ry, rx] + self.premultiplicado[ry, rx]).astype(np.uint8)
+
+
+def _color(color, alfa=1.0):
+    return tuple(int(c) for c in color[:3]) + (int(round(255 * alfa)),)
+
+
+def _lienzo_texto(texto, escala, color, grosor, fuente):
+    """Texto en un lienzo BGRA del tamaño justo; regresa (lienzo, dx, dy) respecto a org."""
+    (tw, th), base = cv2.getTextSize(texto, fuente, escala, grosor)
+    # Algunos glifos (paréntesis, diagonales) salen de la caja de getTextSize;
+    # si el lienzo los recortara, cv2 los rasterizaría distinto que en el frame
+    margen = grosor + int(8 * escala) + 2
+    lienzo = np.zeros((th + base + 2 * margen, tw + 2 * margen, 4), dtype=np.uint8)
+    cv2.putText(lienzo, texto, (margen, margen + th), fuente, escala, _color(color), grosor)
+    return lienzo, -margen, -margen - th
+
+
+class Capa:
+    """Elementos fijos; se dibujan al agregarlos y por frame solo se componen."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.visible = True
+        self._opacos = []
+        self._translucidos = []
+
+    def _agregar(self, dibujar, alfa=1.0):
+        lienzo = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+        dibujar(lienzo)
+        if alfa >= 1.0:
+            self._opacos.append(_Recorte(lienzo, 0, 0))
+        else:
+            x, y, w, h = cv2.boundingRect(lienzo[:, :, 3])
+            if w and h:
+                self._translucidos.append(_Translucido(lienzo[y:y + h, x:x + w], x, y))
+        return self
+
+    def linea(self, p0, p1, color, grosor=1):
+        return self._agregar(lambda l: cv2.line(l, p0, p1, _color(color), grosor))
+
+    def rectangulo(self, p0, p1, color, grosor=-1, alfa=1.0):
+        return self._agregar(lambda l: cv2.rectangle(l, p0, p1, _color(color, alfa), grosor), alfa)
+
+    def texto(self, texto, org, escala=0.6, color=(0, 255, 0), grosor=2, fuente=FUENTE):
+        lienzo, dx, dy = _lienzo_texto(texto, escala, color, grosor, fuente)
+        self._opacos.append(_Recorte(lienzo, org[0] + dx, org[1] + dy, self.width, self.height))
+        return self
+
+    def limpiar(self):
+        self._opacos = []
+        self._translucidos = []
+
+    def componer(self, frame):
+        if not self.visible:
+            return
+        # Primero los fondos translúcidos, encima las líneas y textos
+        for recorte in self._translucidos:
+            recorte.componer(frame)
+        for recorte in self._opacos:
+            recorte.componer(frame)
+
+
+class CampoTexto:
+    """Texto que cambia: se vuelve a dibujar solo cuando cambia (texto, color)."""
+
+    def __init__(self, org, escala=0.6, color=(0, 255, 0), grosor=2, fuente=FUENTE, limites=(None, None)):
+        """limites: (width, height) del frame para recortar el texto que se salga."""
+        self.org = org
+        self.limites = limites
+        self.escala = escala
+        self.color = color
+        self.grosor = grosor
+        self.fuente = fuente
+        self._clave = None
+        self._recorte = None
+        self.visible = False
+        self.redibujos = 0
+
+    def fijar(self, texto, color=None):
+        """texto=None (o vacío) oculta el campo sin descartar el último dibujo."""
+        self.visible = bool(texto)
+        if not texto:
+            return
+        clave = (texto, color or self.color)
+        if clave == self._clave:
+            return
+        self._clave = clave
+        lienzo, dx, dy = _lienzo_texto(texto, self.escala, clave[1], self.grosor, self.fuente)
+        self._recorte = _Recorte(lienzo, self.org[0] + dx, self.org[1] + dy, *self.limites)
+        self.redibujos += 1
+
+    def ocultar(self):
+        self.visible = False
+
+    def componer(self, frame):
+        if self.visible:
+            self._recorte.componer(frame)
+
+
+class Overlay:
+    """Capas estáticas (en orden de creación) y después los campos de texto."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.capas = {}
+        self.campos = {}
+
+    def capa(self, nombre):
+        if nombre not in self.capas:
+            self.capas[nombre] = Capa(self.width, self.height)
+        return self.capas[nombre]
+
+    def campo(self, nombre, org, escala=0.6, color=(0, 255, 0), grosor=2, fuente=FUENTE):
+        if nombre not in self.campos:
+            self.campos[nombre] = CampoTexto(org, escala, color, grosor, fuente, (self.width, self.height))
+        return self.campos[nombre]
+
+    def ocultar(self, *nombres):
+        """Oculta los campos dados (todos si no se indica ninguno)."""
+        for nombre in nombres or self.campos:
+            self.campos[nombre].ocultar()
+
+    def redibujos(self):
+        """Veces que se volvió a dibujar cada campo (para ver qué tanto cambia)."""
+        return {nombre: campo.redibujos for nombre, campo in self.campos.items()}
+
+    def componer(self, frame):
+        for capa in self.capas.values():
+            capa.componer(frame)
+        for campo in self.campos.values():
+            campo.componer(frame)
+        return frame
@@ -0,0 +1,150 @@
+"""
+Perfilado de las funciones calientes de los scripts, encendido en caliente.
+
+Perfilador.medir decora una función (update_frame, detect_and_draw,
+draw_status, process_gestures_and_commands, ...). Apagado, la envoltura
+solo revisa una bandera y llama a la función. Encendido, cada llamada deja
+una muestra en un anillo de tamaño fijo (no hay prints en el ciclo):
+  - ruta:    pila de funciones medidas, p. ej. 'update_frame;draw_status',
+  - tiempo:  total de la llamada y propio (sin las funciones medidas que
+             llamó), con time.perf_counter,
+  - objetos: objetos netos con seguimiento del recolector (listas, dicts,
+             tuplas, instancias...) creados durante la llamada, del
+             contador de la generación 0 de gc más lo que se llevó cada
+             recolección. Es global: incluye lo que hagan otros hilos
+             mientras tanto. Los arreglos de numpy/OpenCV no se cuentan
+             (sys.getallocatedblocks sí los vería pasar por el asignador,
+             pero recorre todas las arenas: ~70 µs por llamada).
+
+Los scripts lo encienden con la tecla 'p' (alternar()) o desde el inicio
+con {"perfil": "perfil_p2.folded"} en la configuración. Al salir imprimen
+tabla() y exportar() escribe el tiempo propio por ruta en formato de pilas
+colapsadas (flamegraph.pl, speedscope, inferno).
+
+La pila es por hilo, así que una función medida en otro hilo (p. ej. el
+modelo en InferenceWorker) aparece como su propia raíz.
+"""
+
+import functools
+import gc
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+# Objetos de la generación 0 que se llevaron las recolecciones anteriores
+_recolectados = [0]
+
+
+def _al_recolectar(fase, info):
+    # Cualquier recolección reinicia el contador de la generación 0
+    if fase == 'start':
+        _recolectados[0] += gc.get_count()[0]
+
+
+def _objetos():
+    """Objetos netos con seguimiento del recolector desde que se registró el callback."""
+    return _recolectados[0] + gc.get_count()[0]
+
+
+class Perfilador:
+    """
+    nombre:   identifica al script en la tabla.
+    activo:   estado inicial (se cambia con alternar()).
+    muestras: tamaño del anillo de muestras.
+    """
+
+    def __init__(self, nombre="tello", activo=False, muestras=8192):
+        self.nombre = nombre
+        self.activo = activo
+        self._muestras = deque(maxlen=muestras)     # (ruta, total_s, propio_s, objetos)
+        self._llamadas = {}                         # función -> llamadas medidas (fuera del anillo también)
+        self._local = threading.local()
+        if _al_recolectar not in gc.callbacks:
+            gc.callbacks.append(_al_recolectar)
+
+    def alternar(self):
+        """Enciende o apaga el perfilado; regresa el nuevo estado."""
+        self.activo = not self.activo
+        print(f"Perfilado {self.nombre}: {'encendido' if self.activo else 'apagado'}")
+        return self.activo
+
+    def medir(self, funcion):
+        """Decorador: mide cada llamada a funcion mientras el perfilador esté activo."""
+        nombre = funcion.__name__
+
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not self.activo:
+                return funcion(*args, **kwargs)
+            return self._llamar(nombre, funcion, args, kwargs)
+        return envoltura
+
+    def _llamar(self, nombre, funcion, args, kwargs):
+        pila = getattr(self._local, 'pila', None)
+        if pila is None:
+            pila = self._local.pila = []
+        # Marco: [ruta, tiempo de las funciones medidas que llamó]
+        marco = [pila[-1][0] + ';' + nombre if pila else nombre, 0.0]
+        pila.append(marco)
+        objetos = _objetos()
+        inicio = time.perf_counter()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            total = time.perf_counter() - inicio
+            objetos = _objetos() - objetos
+            pila.pop()
+            if pila:
+                pila[-1][1] += total
+            self._muestras.append((marco[0], total, total - marco[1], objetos))
+            self._llamadas[nombre] = self._llamadas.get(nombre, 0) + 1
+
+    # -----------------------------------------------------------------
+    # Reporte
+    # -----------------------------------------------------------------
+    def resumen(self):
+        """
+        {función: {llamadas, muestras, total_ms, media_ms, p95_ms, propio_ms,
+        objetos}} sobre las muestras del anillo (objetos: promedio por llamada).
+        """
+        por_funcion = {}
+        for ruta, total, propio, objetos in list(self._muestras):
+            por_funcion.setdefault(ruta.rsplit(';', 1)[-1], []).append((total, propio, objetos))
+        r = {}
+        for nombre, filas in sorted(por_funcion.items(), key=lambda x: -sum(f[1] for f in x[1])):
+            total, propio, objetos = (np.array(c) for c in zip(*filas))
+            r[nombre] = {
+                'llamadas': self._llamadas.get(nombre, 0),
+                'muestras': len(filas),
+                'total_ms': round(float(total.sum() * 1000), 3),
+                'media_ms': round(float(total.mean() * 1000), 3),
+                'p95_ms': round(float(np.percentile(total, 95) * 1000), 3),
+                'propio_ms': round(float(propio.sum() * 1000), 3),
+                'objetos': round(float(objetos.mean()), 1),
+            }
+        return r
+
+    def tabla(self):
+        """Resumen como texto, ordenado por tiempo propio."""
+        lineas = [f"{'función':<30} {'llamadas':>8} {'media':>9} {'p95':>9} {'propio':>10} {'objetos':>8}"]
+        for nombre, r in self.resumen().items():
+            lineas.append(f"{nombre:<30} {r['llamadas']:8d} {r['media_ms']:7.2f}ms {r['p95_ms']:7.2f}ms "
+                          f"{r['propio_ms']:8.1f}ms {r['objetos']:8.1f}")
+        return "\n".join(lineas)
+
+    def exportar(self, ruta):
+        """Pilas colapsadas ('a;b <µs propios>' por línea); regresa cuántas rutas."""
+        propios = {}
+        for pila, _, propio, _ in list(self._muestras):
+            propios[pila] = propios.get(pila, 0.0) + propio
+        with open(ruta, 'w') as f:
+            for pila, propio in sorted(propios.items()):
+                f.write(f"{pila} {max(1, round(propio * 1e6))}\n")
+        return len(propios)
+
+    @property
+    def muestras(self):
+        """Muestras guardadas en el anillo."""
+        return len(self._muestras)
@@ -0,0 +1,80 @@
+"""
+Controlador PID por eje para el seguimiento de objetivos.
+
+Sustituye los escalones -speed / 0 / +speed de los seguidores por una
+salida proporcional al error, con:
+  - dt tomado de la marca de tiempo de cada frame (no del reloj del loop),
+  - derivada filtrada con un pasa-bajas de primer orden,
+  - anti-windup por integración condicional (no se integra mientras la
+    salida está saturada en la dirección del error),
+  - salida entera limitada al rango de send_rc_control (±100).
+
+Las ganancias de GANANCIAS_SEGUIMIENTO están dadas para un frame de 640x480
+y se ajustaron con benchmarks/bench_pid.py.
+"""
+
+# (kp, ki, kd) por eje. yaw/ud: error en pixeles del centro del frame.
+# fb: error en raíz del área (proporcional a la distancia al objeto).
+GANANCIAS_SEGUIMIENTO = {
+    'yaw': (0.30, 0.02, 0.02),
+    'ud':  (0.30, 0.02, 0.02),
+    'fb':  (1.00, 0.05, 0.05),
+}
+
+
+def error_distancia(area, area_objetivo):
+    """Error frontal: positivo si el objeto se ve más chico (lejos) que el objetivo."""
+    return area_objetivo ** 0.5 - max(area, 0.0) ** 0.5
+
+
+class PID:
+    """
+    kp, ki, kd:  ganancias (velocidad rc por pixel de error, por pixel·s, por pixel/s).
+    limite:      salida máxima en valor absoluto (se puede cambiar en vivo,
+                 p. ej. con el trackbar de Speed).
+    tau_d:       constante de tiempo (s) del filtro de la derivada.
+    zona_muerta: errores menores a este valor se tratan como cero.
+    """
+
+    def __init__(self, kp, ki=0.0, kd=0.0, limite=100, tau_d=0.05, zona_muerta=0.0):
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.limite = limite
+        self.tau_d = tau_d
+        self.zona_muerta = zona_muerta
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Olvida integral y derivada (p. ej. al perder el objetivo o con control manual)."""
+        self._integral = 0.0
+        self._derivada = 0.0
+        self._error_prev = None
+        self._t_prev = None
+
+    def actualizar(self, error, t):
+        """Calcula la salida para el error medido en el tiempo t (segundos)."""
+        if abs(error) < self.zona_muerta:
+            error = 0.0
+        limite = min(abs(self.limite), 100)
+
+        dt = 0.0 if self._t_prev is None else t - self._t_prev
+        if dt > 0 and self._error_prev is not None:
+            # Derivada del error con pasa-bajas: alpha = dt / (tau + dt)
+            alpha = dt / (self.tau_d + dt)
+            crudo = (error - self._error_prev) / dt
+            self._derivada += alpha * (crudo - self._derivada)
+
+        salida = self.kp * error + self.ki * self._integral + self.kd * self._derivada
+
+        # Anti-windup: solo integrar si no se está empujando contra la saturación
+        if dt > 0 and self.ki:
+            saturada_arriba = salida >= limite and error > 0
+            saturada_abajo = salida <= -limite and error < 0
+            if not (saturada_arriba or saturada_abajo):
+                self._integral += error * dt
+                salida = self.kp * error + self.ki * self._integral + self.kd * self._derivada
+
+        self._error_prev = error
+        self._t_prev = t
+        return int(max(-limite, min(limite, round(salida))))
@@ -0,0 +1,316 @@
+"""
+Reproducción de sesiones .tlog con la misma interfaz que el dron en vivo.
+
+DronReproducido imita la parte de djitellopy.Tello que usan las prácticas
+(connect/streamon/get_frame_read/get_current_state/send_rc_control/...) y
+alimenta los frames y la telemetría grabados. CapturaReproducida imita un
+cv2.VideoCapture (para FrameGrabber o la cámara de gestos).
+
+Dos modos:
+  - tiempo real: los frames salen al ritmo de sus marcas de tiempo
+    originales; el reloj de la reproducción avanza con el reloj de pared.
+  - rápido (reloj virtual): sin esperas; cada lectura entrega el siguiente
+    frame y el reloj es la marca de tiempo del último frame entregado.
+    FrameGrabber no descarta frames y CommandScheduler envía de forma
+    síncrona, de modo que dos corridas del mismo código producen el mismo
+    flujo de comandos y se pueden comparar entre versiones.
+
+Los comandos rc recibidos se guardan con la hora de la reproducción y se
+pueden escribir a CSV y comparar:
+    python -m tello_utils.reproduccion comparar antes.csv despues.csv
+    python -m tello_utils.reproduccion comparar sesion.tlog despues.csv
+"""
+
+import argparse
+import csv
+import threading
+import time
+
+import numpy as np
+
+from tello_utils.grabacion import LectorSesion, FRAME, TELEMETRIA, COMANDO, CANAL_DRON
+
+# Claves del estado de djitellopy a partir del snapshot de Telemetria grabado
+_CLAVES_ESTADO = {'bateria': 'bat', 'altura': 'h', 'pitch': 'pitch', 'roll': 'roll', 'yaw': 'yaw',
+                  'vgx': 'vgx', 'vgy': 'vgy', 'vgz': 'vgz'}
+
+
+class _Flujo:
+    """Frames de un canal de la sesión, en orden de tiempo."""
+
+    def __init__(self, lector, canal):
+        self._lector = lector
+        self._pos, self.tiempos = lector.frames(canal)
+        # Frames que no se grabaron (cola llena o ancho de banda)
+        self.huecos = [t for t, *_ in lector.huecos(tipo=FRAME, canal=canal)]
+        self.siguiente_i = 0
+        self._cache = (None, None)         # (i, imagen) del último frame decodificado
+
+    def __len__(self):
+        return len(self._pos)
+
+    def imagen(self, i):
+        if self._cache[0] != i:
+            self._cache = (i, self._lector.leer(self._pos[i]).datos)
+        return self._cache[1]
+
+    def en(self, t):
+        """Índice del último frame con timestamp <= t (o None)."""
+        i = int(np.searchsorted(self.tiempos, t, side='right')) - 1
+        return i if i >= 0 else None
+
+
+class DronReproducido:
+    """
+    ruta:        sesión .tlog grabada con GrabadorSesion.
+    tiempo_real: True respeta las marcas de tiempo; False usa reloj virtual.
+    velocidad:   factor de velocidad en tiempo real (2.0 = el doble de rápido).
+    """
+
+    def __init__(self, ruta, tiempo_real=True, velocidad=1.0):
+        self.ruta = ruta
+        self.lector = LectorSesion(ruta)
+        self.tiempo_real = tiempo_real
+        self.reloj_virtual = not tiempo_real
+        self.velocidad = velocidad
+        self.reproduccion = True
+        self.comandos = []                 # (t, lr, fb, ud, yaw)
+        self.terminado = False
+        # Registros que se perdieron al grabar: (t, tipo, canal, motivo)
+        self.huecos = self.lector.huecos()
+        if self.huecos:
+            print(f"La sesión tiene {len(self.huecos)} registros sin grabar (huecos)")
+
+        indice = self.lector.indice
+        self._pos_tele = np.nonzero(indice['tipo'] == TELEMETRIA)[0]
+        self._t_tele = indice['t'][self._pos_tele]
+        self._estados = {}                 # i -> dict (misma identidad mientras no cambie)
+        self._flujos = {}
+        self._lock = threading.Lock()
+        self._t_virtual = self.lector.inicio
+        self._t_leido = {}                     # canal -> último frame leído de ese canal
+        self._t0_pared = None
+
+    # -----------------------------------------------------------------
+    # Reloj de la reproducción
+    # -----------------------------------------------------------------
+    def ahora(self):
+        if self.reloj_virtual:
+            return self._t_virtual
+        if self._t0_pared is None:
+            self._t0_pared = time.monotonic()
+        return self.lector.inicio + (time.monotonic() - self._t0_pared) * self.velocidad
+
+    def _avanzar(self, t):
+        with self._lock:
+            self._t_virtual = max(self._t_virtual, t)
+
+    def publicar_frame(self, canal=CANAL_DRON):
+        """
+        Reloj de FrameGrabber: marca de tiempo del frame que se publica (el
+        último leído de ese canal; leer el canal de gestos no lo mueve). Con
+        reloj virtual el tiempo de la reproducción avanza hasta ese frame.
+        """
+        t = self._t_leido.get(canal, self.lector.inicio)
+        if self.reloj_virtual:
+            self._avanzar(t)
+        return t
+
+    def flujo(self, canal):
+        if canal not in self._flujos:
+            self._flujos[canal] = _Flujo(self.lector, canal)
+        return self._flujos[canal]
+
+    # -----------------------------------------------------------------
+    # Interfaz tipo djitellopy.Tello
+    # -----------------------------------------------------------------
+    def connect(self):
+        self.ahora()
+
+    def streamon(self):
+        pass
+
+    def streamoff(self):
+        pass
+
+    def takeoff(self):
+        pass
+
+    def land(self):
+        pass
+
+    def end(self):
+        self.lector.cerrar()
+
+    def send_rc_control(self, lr, fb, ud, yaw):
+        self.comandos.append((self.ahora(), lr, fb, ud, yaw))
+
+    def get_current_state(self):
+        i = int(np.searchsorted(self._t_tele, self.ahora(), side='right')) - 1
+        if i < 0:
+            i = 0 if len(self._pos_tele) else None
+        if i is None:
+            return {}
+        if i not in self._estados:
+            snapshot = self.lector.leer(self._pos_tele[i]).datos
+            estado = {clave: snapshot[campo] for campo, clave in _CLAVES_ESTADO.items()}
+            estado['templ'] = estado['temph'] = snapshot['temperatura']
+            self._estados = {i: estado}
+        return self._estados[i]
+
+    def get_battery(self):
+        return int(self.get_current_state().get('bat', 0))
+
+    def get_height(self):
+        return int(self.get_current_state().get('h', 0))
+
+    def get_frame_read(self):
+        return _LecturaFrame(self, CANAL_DRON)
+
+    def abrir_captura(self, canal=CANAL_DRON, avanza_reloj=True):
+        """Captura tipo cv2.VideoCapture del canal (la usa FrameGrabber.desde_tello)."""
+        return CapturaReproducida(self, canal, avanza_reloj)
+
+    def guardar_comandos(self, ruta):
+        with open(ruta, 'w', newline='') as f:
+            escritor = csv.writer(f)
+            escritor.writerow(['t', 'lr', 'fb', 'ud', 'yaw'])
+            escritor.writerows((f"{t - self.lector.inicio:.4f}", *c) for t, *c in self.comandos)
+
+
+class _LecturaFrame:
+    """Imita BackgroundFrameRead: .frame es el frame vigente (o el siguiente, con reloj virtual)."""
+
+    def __init__(self, dron, canal):
+        self._dron = dron
+        self._flujo = dron.flujo(canal)
+        self._i = None
+
+    @property
+    def frame(self):
+        flujo = self._flujo
+        if self._dron.reloj_virtual:
+            if flujo.siguiente_i < len(flujo):
+                self._i = flujo.siguiente_i
+                flujo.siguiente_i += 1
+                self._dron._avanzar(flujo.tiempos[self._i])
+            else:
+                self._dron.terminado = True
+        else:
+            ahora = self._dron.ahora()
+            self._i = flujo.en(ahora)
+            if not len(flujo) or ahora > flujo.tiempos[-1]:
+                self._dron.terminado = True
+        return flujo.imagen(self._i) if self._i is not None else None
+
+
+class CapturaReproducida:
+    """Imita cv2.VideoCapture sobre un canal de la sesión."""
+
+    def __init__(self, dron, canal=CANAL_DRON, avanza_reloj=True):
+        """
+        avanza_reloj: False cuando el frame no se usa al leerse sino al
+                      publicarse (FrameGrabber llama a publicar_frame()).
+        """
+        self._dron = dron
+        self._canal = canal
+        self._flujo = dron.flujo(canal)
+        self._avanza_reloj = avanza_reloj
+        self._abierta = len(self._flujo) > 0
+
+    def isOpened(self):
+        return self._abierta
+
+    def set(self, prop, valor):
+        return False
+
+    def get(self, prop):
+        if len(self._flujo) > 1:
+            return (len(self._flujo) - 1) / (self._flujo.tiempos[-1] - self._flujo.tiempos[0])
+        return 0.0
+
+    def read(self):
+        flujo = self._flujo
+        if not self._abierta or flujo.siguiente_i >= len(flujo):
+            self._dron.terminado = True
+            return False, None
+        i = flujo.siguiente_i
+        flujo.siguiente_i += 1
+        t = flujo.tiempos[i]
+        self._dron._t_leido[self._canal] = t
+        if self._dron.reloj_virtual:
+            if self._avanza_reloj:
+                self._dron._avanzar(t)
+        else:
+            espera = (t - self._dron.ahora()) / self._dron.velocidad
+            if espera > 0:
+                time.sleep(espera)
+        return True, flujo.imagen(i).copy()
+
+    def release(self):
+        self._abierta = False
+
+
+# ---------------------------------------------------------------------
+# Comparación de flujos de comandos
+# ---------------------------------------------------------------------
+def cargar_comandos(ruta):
+    """(t relativo, lr, fb, ud, yaw) de un CSV de guardar_comandos o de una sesión .tlog."""
+    if str(ruta).endswith('.tlog'):
+        with LectorSesion(ruta) as lector:
+            filas = [(r.timestamp - lector.inicio, *r.datos) for r in lector.registros(tipo=COMANDO)]
+    else:
+        with open(ruta, newline='') as f:
+            filas = [tuple(float(v) for v in fila) for fila in list(csv.reader(f))[1:]]
+    return np.array(filas, dtype=float).reshape(-1, 5)
+
+
+def comparar(a, b, hz=30.0, tolerancia=0):
+    """
+    Compara dos flujos de comandos muestreándolos a hz (cada comando se
+    mantiene hasta el siguiente). Regresa un diccionario con el porcentaje de
+    muestras distintas, la diferencia máxima por eje y la primera divergencia.
+    """
+    if len(a) == 0 or len(b) == 0:
+        return {'comandos_a': len(a), 'comandos_b': len(b)}
+    inicio = min(a[0, 0], b[0, 0])
+    fin = max(a[-1, 0], b[-1, 0])
+    rejilla = np.arange(inicio, fin + 1e-9, 1.0 / hz)
+
+    def muestrear(flujo):
+        i = np.searchsorted(flujo[:, 0], rejilla, side='right') - 1
+        valores = flujo[np.clip(i, 0, None), 1:]
+        valores[i < 0] = 0
+        return valores
+
+    va, vb = muestrear(a), muestrear(b)
+    diferencia = np.abs(va - vb)
+    distintas = np.any(diferencia > tolerancia, axis=1)
+    primera = float(rejilla[np.argmax(distintas)]) if distintas.any() else None
+    return {
+        'comandos_a': len(a),
+        'comandos_b': len(b),
+        'muestras': len(rejilla),
+        'distintas_%': round(100.0 * distintas.mean(), 2),
+        'max_dif': dict(zip(('lr', 'fb', 'ud', 'yaw'), diferencia.max(axis=0).astype(int).tolist())),
+        'primera_divergencia_s': primera,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Herramientas de reproducción de sesiones .tlog")
+    sub = parser.add_subparsers(dest="accion", required=True)
+    p = sub.add_parser("comparar", help="compara dos flujos de comandos (CSV o .tlog)")
+    p.add_argument("a")
+    p.add_argument("b")
+    p.add_argument("--hz", type=float, default=30.0)
+    p.add_argument("--tolerancia", type=int, default=0)
+    args = parser.parse_args()
+
+    resultado = comparar(cargar_comandos(args.a), cargar_comandos(args.b), args.hz, args.tolerancia)
+    for clave, valor in resultado.items():
+        print(f"{clave}: {valor}")
+
+
+if __name__ == "__main__":
+    main()
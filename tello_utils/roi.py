@@ -0,0 +1,106 @@
+"""
+Ventana de búsqueda (ROI) alrededor del último objetivo conocido.
+
+Cuando el objeto ya se encontró en los frames anteriores, no hace falta
+segmentar los 640x480 pixeles: se predice su siguiente posición a partir
+de su movimiento reciente y se segmenta solo una ventana ampliada a su
+alrededor. Si el objeto no aparece en la ventana, ésta crece con cada
+fallo y, tras max_fallos consecutivos, se vuelve a buscar en todo el frame.
+"""
+
+from collections import deque
+
+
+class RastreadorROI:
+    """
+    width, height: tamaño del frame completo.
+    margen:        fracción del tamaño del objeto que se agrega a cada lado.
+    margen_min:    pixeles mínimos agregados a cada lado (crece con los fallos).
+    max_fallos:    fallos consecutivos antes de volver a la búsqueda completa.
+    historial:     detecciones usadas para estimar la velocidad.
+    """
+
+    def __init__(self, width, height, margen=1.0, margen_min=32, max_fallos=5, historial=5):
+        self.width = width
+        self.height = height
+        self.margen = margen
+        self.margen_min = margen_min
+        self.max_fallos = max_fallos
+        self._historial = deque(maxlen=historial)   # (t, cx, cy, w, h)
+        self.fallos = 0
+
+        # Estadísticas
+        self.busquedas_roi = 0
+        self.aciertos_roi = 0
+        self.busquedas_completas = 0
+
+    def _velocidad(self):
+        """Velocidad (px/s) entre la detección más vieja y la más reciente del historial."""
+        if len(self._historial) < 2:
+            return 0.0, 0.0
+        t0, x0, y0, _, _ = self._historial[0]
+        t1, x1, y1, _, _ = self._historial[-1]
+        dt = t1 - t0
+        if dt <= 0:
+            return 0.0, 0.0
+        return (x1 - x0) / dt, (y1 - y0) / dt
+
+    def prediccion(self, t):
+        """Centro predicho del objetivo en el tiempo t (o None si no hay historial)."""
+        if not self._historial:
+            return None
+        t_u, cx, cy, _, _ = self._historial[-1]
+        vx, vy = self._velocidad()
+        return cx + vx * (t - t_u), cy + vy * (t - t_u)
+
+    def ventana(self, t):
+        """
+        Ventana (x0, y0, x1, y1) donde buscar en el tiempo t, o None si hay
+        que buscar en todo el frame.
+        """
+        if not self._historial or self.fallos >= self.max_fallos:
+            return None
+        px, py = self.prediccion(t)
+        _, _, _, w, h = self._historial[-1]
+        crecimiento = 1 + self.fallos
+        mx = w * (1 + self.margen) / 2 + self.margen_min * crecimiento
+        my = h * (1 + self.margen) / 2 + self.margen_min * crecimiento
+
+        x0 = max(0, int(px - mx))
+        y0 = max(0, int(py - my))
+        x1 = min(self.width, int(px + mx))
+        y1 = min(self.height, int(py + my))
+        if x1 - x0 < 8 or y1 - y0 < 8:
+            return None
+        # Si la ventana ya cubre casi todo el frame no vale la pena recortar
+        if (x1 - x0) * (y1 - y0) > 0.6 * self.width * self.height:
+            return None
+        return x0, y0, x1, y1
+
+    def actualizar(self, bbox, t, ventana):
+        """
+        Registra el resultado de la búsqueda en el tiempo t.
+
+        bbox:    (x, y, w, h) del objetivo en coordenadas del frame completo, o None.
+        ventana: la ventana que se usó (None = búsqueda completa).
+        """
+        if ventana is None:
+            self.busquedas_completas += 1
+        else:
+            self.busquedas_roi += 1
+
+        if bbox is None:
+            self.fallos += 1
+            if self.fallos >= self.max_fallos:
+                self._historial.clear()
+            return
+
+        if ventana is not None:
+            self.aciertos_roi += 1
+        self.fallos = 0
+        x, y, w, h = bbox
+        self._historial.append((t, x + w / 2, y + h / 2, w, h))
+
+    def reiniciar(self):
+        self._historial.clear()
+        self.fallos = 0
@@ -0,0 +1,186 @@
+"""
+Segmentación HSV con buffers preasignados.
+
+El pipeline original (cvtColor → GaussianBlur → inRange → erode → dilate →
+bitwise_and) crea un arreglo nuevo en cada paso y en cada frame. Aquí todos
+los pasos escriben con dst= en buffers del tamaño del stream que se crean
+una sola vez, y la erosión + dilatación se hacen en una sola apertura
+morfológica con un elemento estructurante precalculado.
+
+SegmentadorMultiColor segmenta varios perfiles HSV con una sola
+conversión (y un solo desenfoque) por frame.
+"""
+
+from typing import NamedTuple
+
+import cv2
+import numpy as np
+
+
+class Objetivo(NamedTuple):
+    """Objeto detectado para un perfil de color."""
+    nombre: str
+    cx: int
+    cy: int
+    area: float
+    bbox: tuple        # (x, y, w, h)
+
+
+def objetivo_de_mascara(nombre, mask, area_min=0):
+    """Contorno externo más grande de la máscara (o None si ninguno supera area_min)."""
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    mejor = None
+    mejor_area = area_min
+    for cnt in contours:
+        a = cv2.contourArea(cnt)
+        if a > mejor_area:
+            mejor, mejor_area = cnt, a
+    if mejor is None:
+        return None
+    x, y, w, h = cv2.boundingRect(mejor)
+    return Objetivo(nombre, x + w // 2, y + h // 2, mejor_area, (x, y, w, h))
+
+
+def elegir_objetivo(objetivos, prioridad):
+    """Primer objetivo detectado según el orden de prioridad (lista de nombres)."""
+    for nombre in prioridad:
+        objetivo = objetivos.get(nombre)
+        if objetivo is not None:
+            return objetivo
+    return None
+
+
+class SegmentadorHSV:
+    """
+    Motor de segmentación reutilizable para un tamaño de frame fijo.
+
+    width, height: resolución del stream (después de redimensionar).
+    blur_ksize:    tamaño del kernel gaussiano (0 = sin desenfoque).
+    iteraciones:   iteraciones de erosión y de dilatación.
+    kernel_size:   lado del elemento estructurante rectangular
+                   (3 equivale al kernel por defecto de cv2.erode(mask, None)).
+    clasificador:  ClasificadorLUT opcional que sustituye a cv2.inRange; la
+                   tabla solo se recompila cuando cambian los límites.
+    """
+
+    def __init__(self, width, height, blur_ksize=0, iteraciones=1, kernel_size=3, clasificador=None):
+        self.width = width
+        self.height = height
+        self.blur_ksize = blur_ksize
+        self.iteraciones = iteraciones
+        self.clasificador = clasificador
+        self.kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, kernel_size))
+
+        # Buffers preasignados (se reutilizan en cada frame)
+        self._frame = np.empty((height, width, 3), np.uint8)
+        self._hsv = np.empty((height, width, 3), np.uint8)
+        self._blur = np.empty((height, width, 3), np.uint8) if blur_ksize else None
+        self._mask = np.empty((height, width), np.uint8)
+        self._tmp = np.empty((height, width), np.uint8)
+        self._resultado = np.empty((height, width, 3), np.uint8)
+
+    def redimensionar(self, frame):
+        """Redimensiona el frame al tamaño del motor sobre el buffer interno."""
+        if frame.shape[1] == self.width and frame.shape[0] == self.height:
+            return frame
+        return cv2.resize(frame, (self.width, self.height), dst=self._frame)
+
+    def convertir(self, frame, ventana=None):
+        """
+        BGR → HSV (y desenfoque, si está configurado) sobre buffers internos.
+
+        ventana: (x0, y0, x1, y1) opcional; solo se convierte esa región y el
+                 resultado ocupa la esquina superior izquierda de los buffers.
+        """
+        if ventana is not None:
+            x0, y0, x1, y1 = ventana
+            frame = frame[y0:y1, x0:x1]
+        h, w = frame.shape[:2]
+        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV, dst=self._hsv[:h, :w])
+        if self._blur is not None:
+            return cv2.GaussianBlur(hsv, (self.blur_ksize, self.blur_ksize), 0, dst=self._blur[:h, :w])
+        return hsv
+
+    def segmentar(self, hsv, lower, upper):
+        """
+        inRange + apertura morfológica. lower/upper pueden ser tuplas (h, s, v);
+        no hace falta construir np.array en cada frame. hsv puede ser el
+        resultado de convertir() con ventana (la máscara tiene su tamaño).
+        """
+        h, w = hsv.shape[:2]
+        if self.clasificador is not None:
+            self.clasificador.definir('objetivo', lower, upper)
+            crudo = self.clasificador.clasificar(hsv)
+        else:
+            crudo = cv2.inRange(hsv, lower, upper, dst=self._tmp[:h, :w])
+        if self.iteraciones:
+            # erode(n) seguido de dilate(n) == apertura con n iteraciones
+            return cv2.morphologyEx(crudo, cv2.MORPH_OPEN, self.kernel, dst=self._mask[:h, :w],
+                                    iterations=self.iteraciones)
+        return crudo
+
+    def procesar(self, frame, lower, upper):
+        """Pipeline completo: regresa la máscara (buffer interno, se sobrescribe en el siguiente frame)."""
+        return self.segmentar(self.convertir(frame), lower, upper)
+
+    def aplicar_mascara(self, frame, mask):
+        """Equivalente a cv2.bitwise_and(frame, frame, mask=mask) sin asignar memoria."""
+        self._resultado[:] = 0
+        return cv2.bitwise_and(frame, frame, dst=self._resultado, mask=mask)
+
+
+class SegmentadorMultiColor:
+    """
+    Segmenta N perfiles HSV con nombre en una sola pasada del frame.
+
+    La conversión a HSV y el desenfoque (la parte cara del pipeline) se
+    hacen una vez; cada perfil solo agrega su inRange, su apertura y su
+    búsqueda de contornos, sobre buffers propios preasignados.
+
+    perfiles: {nombre: (lower, upper)}, por ejemplo PRESETS_HSV.
+    """
+
+    def __init__(self, width, height, perfiles, blur_ksize=0, iteraciones=1, kernel_size=3, area_min=0):
+        self._base = SegmentadorHSV(width, height, blur_ksize=blur_ksize,
+                                    iteraciones=iteraciones, kernel_size=kernel_size)
+        self.area_min = area_min
+        self.perfiles = {}
+        self._crudas = {}
+        self._mascaras = {}
+        for nombre, (lower, upper) in perfiles.items():
+            self.definir(nombre, lower, upper)
+
+    def definir(self, nombre, lower, upper):
+        """Agrega o actualiza un perfil de color."""
+        self.perfiles[nombre] = (tuple(lower), tuple(upper))
+        if nombre not in self._mascaras:
+            forma = (self._base.height, self._base.width)
+            self._crudas[nombre] = np.empty(forma, np.uint8)
+            self._mascaras[nombre] = np.empty(forma, np.uint8)
+
+    def redimensionar(self, frame):
+        return self._base.redimensionar(frame)
+
+    def convertir(self, frame):
+        return self._base.convertir(frame)
+
+    def mascaras(self, hsv):
+        """{nombre: máscara} de todos los perfiles (buffers internos)."""
+        base = self._base
+        resultado = {}
+        for nombre, (lower, upper) in self.perfiles.items():
+            mask = cv2.inRange(hsv, lower, upper, dst=self._crudas[nombre])
+            if base.iteraciones:
+                mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, base.kernel, dst=self._mascaras[nombre],
+                                        iterations=base.iteraciones)
+            resultado[nombre] = mask
+        return resultado
+
+    def segmentar(self, hsv):
+        """{nombre: Objetivo o None} a partir de un frame ya convertido a HSV."""
+        return {nombre: objetivo_de_mascara(nombre, mask, self.area_min)
+                for nombre, mask in self.mascaras(hsv).items()}
+
+    def procesar(self, frame):
+        """Pipeline completo desde BGR: una conversión, N máscaras y N objetivos."""
+        return self.segmentar(self.convertir(frame))
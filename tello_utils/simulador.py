@@ -0,0 +1,372 @@
+"""
+Simulador local del Tello (protocolo UDP del SDK) para probar sin dron.
+
+    python -m tello_utils.simulador [--objetivo-movil] [--sin-video]
+
+y en otra terminal, por ejemplo:
+
+    TELLO_SIMULADOR=1 python Practicas/2/main.py
+
+Escucha comandos de texto en 127.0.0.1:9889 y responde como el Tello
+("ok", valores de consultas; rc no tiene respuesta). No usa el 8889 del
+Tello porque djitellopy ocupa ("", 8889) con su socket cliente al crear
+cualquier Tello; conexion.crear_dron() apunta el cliente a PUERTO_COMANDOS.
+A la dirección que mandó el último comando le envía:
+  - paquetes de estado al puerto 8890 a 10 Hz (mismo formato de texto),
+  - video H.264 al puerto 11111 en datagramas de 1460 bytes, codificado
+    con PyAV (libx264, zerolatency) a partir de una escena sintética: un
+    cubo del rango "Verde Rubix" frente al dron, fijo o moviéndose de lado.
+
+El dron sigue un modelo cinemático simple: cada eje de rc (±100) pide una
+velocidad (VEL_MAX_CM_S, YAW_MAX_DEG_S) a la que se llega con un retraso de
+primer orden (TAU_S); la cámara es una proyección pinhole con el campo de
+visión del Tello.
+"""
+
+import argparse
+import math
+import socket
+import threading
+import time
+from fractions import Fraction
+
+import cv2
+import numpy as np
+
+VEL_MAX_CM_S = 100.0          # cm/s con rc = 100 en lr/fb/ud
+YAW_MAX_DEG_S = 100.0         # °/s con rc = 100 en yaw
+TAU_S = 0.2                   # constante de tiempo de la respuesta al rc
+ALTURA_DESPEGUE_CM = 80.0
+FOV_GRADOS = 82.6
+VERDE_BGR = (40, 180, 40)
+TAM_DATAGRAMA = 1460
+HOST = '127.0.0.1'
+PUERTO_COMANDOS = 9889
+
+
+class SimuladorTello:
+    """
+    width, height:  resolución del video (la del Tello es 960x720).
+    fps:            cuadros por segundo del video.
+    hz_estado:      paquetes de estado por segundo.
+    video:          False para no codificar video (no requiere PyAV).
+    objetivo_movil: el cubo oscila de lado a lado frente al dron.
+    """
+
+    def __init__(self, host=HOST, puerto_comandos=PUERTO_COMANDOS, puerto_estado=8890, puerto_video=11111,
+                 width=960, height=720, fps=30, hz_estado=10, video=True, objetivo_movil=False):
+        self.host = host
+        self.puerto_comandos = puerto_comandos
+        self.puerto_estado = puerto_estado
+        self.puerto_video = puerto_video
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.hz_estado = hz_estado
+        self.video = video
+        self.objetivo_movil = objetivo_movil
+
+        # Estado del dron (cm, grados) y velocidades actuales
+        self.pos = np.array([0.0, 0.0, 0.0])        # x adelante, y derecha, z arriba
+        self.yaw = 0.0                               # horario positivo
+        self.vel = np.array([0.0, 0.0, 0.0, 0.0])   # lr, fb, ud (cm/s), yaw (°/s) en marco del dron
+        self.rc = (0, 0, 0, 0)
+        self.volando = False
+        self.stream = False
+        self.bateria = 100.0
+        self._vel_auto = 0.0                         # ud automático de takeoff/land
+        self._t_inicio = time.monotonic()
+
+        # Cubo objetivo (coordenadas del mundo, cm)
+        self.objetivo = np.array([300.0, 0.0, ALTURA_DESPEGUE_CM])
+        self.lado_objetivo = 30.0
+
+        self._cliente = None
+        self._sock_cmd = None
+        self._sock_salida = None
+        self._hilos = []
+        self._corriendo = False
+        self._lock = threading.Lock()
+        self._fondo = self._crear_fondo()
+        self._f = (width / 2) / math.tan(math.radians(FOV_GRADOS / 2))
+
+        # Estadísticas
+        self.comandos_recibidos = 0
+        self.frames_enviados = 0
+        self.ultimo_rc_t = None                      # time.monotonic() del último rc recibido
+
+    # -----------------------------------------------------------------
+    # Ciclo de vida
+    # -----------------------------------------------------------------
+    def iniciar(self):
+        self._sock_cmd = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock_cmd.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock_cmd.bind((self.host, self.puerto_comandos))
+        self._sock_cmd.settimeout(0.2)
+        self._sock_salida = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._corriendo = True
+        objetivos = [self._bucle_comandos, self._bucle_fisica]
+        if self.video:
+            objetivos.append(self._bucle_video)
+        for objetivo in objetivos:
+            hilo = threading.Thread(target=objetivo, name=f"Simulador{objetivo.__name__}", daemon=True)
+            hilo.start()
+            self._hilos.append(hilo)
+        return self
+
+    def detener(self):
+        self._corriendo = False
+        for hilo in self._hilos:
+            hilo.join(timeout=1.0)
+        self._hilos = []
+        for sock in (self._sock_cmd, self._sock_salida):
+            if sock is not None:
+                sock.close()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.detener()
+
+    # -----------------------------------------------------------------
+    # Comandos
+    # -----------------------------------------------------------------
+    def _responder(self, texto, destino):
+        try:
+            self._sock_cmd.sendto(texto.encode(), destino)
+        except OSError:
+            pass
+
+    def _bucle_comandos(self):
+        while self._corriendo:
+            try:
+                datos, origen = self._sock_cmd.recvfrom(1024)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            self._cliente = origen[0]
+            self.comandos_recibidos += 1
+            respuesta = self._ejecutar(datos.decode(errors='ignore').strip(), origen)
+            if respuesta is not None:
+                self._responder(respuesta, origen)
+
+    def _ejecutar(self, comando, origen):
+        partes = comando.split()
+        if not partes:
+            return 'error'
+        nombre, args = partes[0], partes[1:]
+
+        if nombre == 'rc' and len(args) == 4:
+            self.rc = tuple(max(-100, min(100, int(float(a)))) for a in args)
+            self.ultimo_rc_t = time.monotonic()
+            return None
+        if nombre in ('command', 'speed', 'wifi', 'mon', 'moff', 'downvision'):
+            return 'ok'
+        if nombre == 'streamon':
+            self.stream = True
+            return 'ok'
+        if nombre == 'streamoff':
+            self.stream = False
+            return 'ok'
+        if nombre == 'takeoff':
+            self.volando = True
+            self._vel_auto = VEL_MAX_CM_S
+            # El Tello responde cuando termina de subir
+            duracion = ALTURA_DESPEGUE_CM / VEL_MAX_CM_S + TAU_S
+            threading.Timer(duracion, self._responder, ('ok', origen)).start()
+            return None
+        if nombre in ('land', 'emergency'):
+            self.rc = (0, 0, 0, 0)
+            self._vel_auto = -VEL_MAX_CM_S
+            duracion = self.pos[2] / VEL_MAX_CM_S + TAU_S
+            threading.Timer(duracion, self._responder, ('ok', origen)).start()
+            return None
+        if nombre in ('up', 'down', 'left', 'right', 'forward', 'back', 'cw', 'ccw') and args:
+            self._mover(nombre, float(args[0]))
+            return 'ok'
+        if nombre == 'battery?':
+            return str(int(self.bateria))
+        if nombre == 'height?':
+            return f"{int(self.pos[2] / 10)}dm"
+        if nombre == 'time?':
+            return f"{int(time.monotonic() - self._t_inicio)}s"
+        if nombre == 'temp?':
+            return '60~62C'
+        if nombre == 'sdk?':
+            return '30'
+        if nombre == 'sn?':
+            return 'SIMULADOR0001'
+        if nombre == 'wifi?':
+            return '90'
+        return 'error'
+
+    def _mover(self, nombre, valor):
+        """Movimientos discretos del SDK: se aplican de inmediato."""
+        with self._lock:
+            if nombre in ('cw', 'ccw'):
+                self.yaw += valor if nombre == 'cw' else -valor
+                return
+            rad = math.radians(self.yaw)
+            adelante = np.array([math.cos(rad), math.sin(rad), 0.0])
+            derecha = np.array([-math.sin(rad), math.cos(rad), 0.0])
+            direccion = {'forward': adelante, 'back': -adelante, 'right': derecha, 'left': -derecha,
+                         'up': np.array([0, 0, 1.0]), 'down': np.array([0, 0, -1.0])}[nombre]
+            self.pos = self.pos + direccion * valor
+            self.pos[2] = max(self.pos[2], 0.0)
+
+    # -----------------------------------------------------------------
+    # Modelo cinemático y paquetes de estado
+    # -----------------------------------------------------------------
+    def _paso(self, dt):
+        with self._lock:
+            if self.volando:
+                lr, fb, ud, yaw = self.rc
+                pedida = np.array([lr, fb, ud, yaw], dtype=float) / 100.0
+                pedida *= [VEL_MAX_CM_S, VEL_MAX_CM_S, VEL_MAX_CM_S, YAW_MAX_DEG_S]
+                if self._vel_auto:
+                    pedida[2] = self._vel_auto
+            else:
+                pedida = np.zeros(4)
+            self.vel += (pedida - self.vel) * min(1.0, dt / TAU_S)
+
+            rad = math.radians(self.yaw)
+            adelante = np.array([math.cos(rad), math.sin(rad)])
+            derecha = np.array([-math.sin(rad), math.cos(rad)])
+            self.pos[:2] += (adelante * self.vel[1] + derecha * self.vel[0]) * dt
+            self.pos[2] += self.vel[2] * dt
+            self.yaw = (self.yaw + self.vel[3] * dt + 180.0) % 360.0 - 180.0
+
+            if self._vel_auto > 0 and self.pos[2] >= ALTURA_DESPEGUE_CM:
+                self._vel_auto = 0.0
+            if self.pos[2] <= 0.0:
+                self.pos[2] = 0.0
+                if self._vel_auto < 0:
+                    self._vel_auto = 0.0
+                    self.volando = False
+                    self.vel[:] = 0.0
+
+            if self.volando:
+                self.bateria = max(0.0, self.bateria - dt / 30.0)   # ~1 % cada 30 s
+
+            if self.objetivo_movil:
+                t = time.monotonic() - self._t_inicio
+                self.objetivo[1] = 80.0 * math.sin(2 * math.pi * t / 8.0)
+
+    def estado_texto(self):
+        """Paquete de estado con el formato del Tello (SDK 2.0)."""
+        vgx, vgy = int(self.vel[1] / 10), int(self.vel[0] / 10)
+        vgz = int(self.vel[2] / 10)
+        vuelo = int(time.monotonic() - self._t_inicio) if self.volando else 0
+        return (f"pitch:0;roll:0;yaw:{int(round(self.yaw))};vgx:{vgx};vgy:{vgy};vgz:{vgz};"
+                f"templ:60;temph:62;tof:{int(self.pos[2]) + 10};h:{int(round(self.pos[2]))};"
+                f"bat:{int(self.bateria)};baro:{self.pos[2] / 100:.2f};time:{vuelo};"
+                f"agx:0.00;agy:0.00;agz:-1000.00;\r\n")
+
+    def _bucle_fisica(self):
+        dt = 0.01
+        pasos_estado = max(1, int(round(1.0 / (self.hz_estado * dt))))
+        siguiente = time.monotonic()
+        i = 0
+        while self._corriendo:
+            self._paso(dt)
+            i += 1
+            if i % pasos_estado == 0 and self._cliente is not None:
+                try:
+                    self._sock_salida.sendto(self.estado_texto().encode(), (self._cliente, self.puerto_estado))
+                except OSError:
+                    pass
+            siguiente += dt
+            espera = siguiente - time.monotonic()
+            if espera > 0:
+                time.sleep(espera)
+            else:
+                siguiente = time.monotonic()
+
+    # -----------------------------------------------------------------
+    # Escena y video
+    # -----------------------------------------------------------------
+    def _crear_fondo(self):
+        rng = np.random.default_rng(0)
+        fondo = rng.integers(70, 130, size=(self.height, self.width, 3), dtype=np.uint8)
+        # Piso más oscuro en la mitad inferior para dar referencia de horizonte
+        fondo[self.height // 2:] //= 2
+        return fondo
+
+    def renderizar(self):
+        """Imagen BGR de lo que vería la cámara frontal en el estado actual."""
+        imagen = self._fondo.copy()
+        with self._lock:
+            rel = self.objetivo - self.pos
+            rad = math.radians(self.yaw)
+        adelante = rel[0] * math.cos(rad) + rel[1] * math.sin(rad)
+        derecha = -rel[0] * math.sin(rad) + rel[1] * math.cos(rad)
+        if adelante > 10.0:
+            u = self.width / 2 + self._f * derecha / adelante
+            v = self.height / 2 - self._f * rel[2] / adelante
+            medio = self._f * self.lado_objetivo / adelante / 2
+            p0 = (int(u - medio), int(v - medio))
+            p1 = (int(u + medio), int(v + medio))
+            cv2.rectangle(imagen, p0, p1, VERDE_BGR, -1)
+        return imagen
+
+    def _bucle_video(self):
+        try:
+            import av
+        except ImportError:
+            print("Simulador: PyAV (av) no está instalado; se corre sin video")
+            return
+
+        codec = av.CodecContext.create('libx264', 'w')
+        codec.width, codec.height = self.width, self.height
+        codec.pix_fmt = 'yuv420p'
+        codec.framerate = Fraction(self.fps, 1)
+        # Keyframe cada segundo y SPS/PPS repetidos para que un cliente pueda unirse tarde
+        codec.options = {'preset': 'ultrafast', 'tune': 'zerolatency', 'g': str(self.fps),
+                         'x264-params': 'repeat-headers=1'}
+
+        periodo = 1.0 / self.fps
+        siguiente = time.monotonic()
+        while self._corriendo:
+            if self.stream and self._cliente is not None:
+                frame = av.VideoFrame.from_ndarray(self.renderizar(), format='bgr24')
+                for paquete in codec.encode(frame):
+                    datos = bytes(paquete)
+                    for i in range(0, len(datos), TAM_DATAGRAMA):
+                        try:
+                            self._sock_salida.sendto(datos[i:i + TAM_DATAGRAMA],
+                                                     (self._cliente, self.puerto_video))
+                        except OSError:
+                            pass
+                self.frames_enviados += 1
+            siguiente += periodo
+            espera = siguiente - time.monotonic()
+            if espera > 0:
+                time.sleep(espera)
+            else:
+                siguiente = time.monotonic()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objetivo-movil", action="store_true", help="el cubo oscila de lado a lado")
+    parser.add_argument("--sin-video", action="store_true", help="no codificar video (no requiere PyAV)")
+    parser.add_argument("--fps", type=int, default=30)
+    args = parser.parse_args()
+
+    sim = SimuladorTello(fps=args.fps, video=not args.sin_video, objetivo_movil=args.objetivo_movil).iniciar()
+    print(f"Simulador del Tello en {sim.host}:{sim.puerto_comandos} (Ctrl+C para salir)")
+    try:
+        while True:
+            time.sleep(1.0)
+            print(f"\rh={sim.pos[2]:5.0f} cm  yaw={sim.yaw:6.1f}°  rc={sim.rc}  "
+                  f"comandos={sim.comandos_recibidos}  frames={sim.frames_enviados}", end="")
+    except KeyboardInterrupt:
+        print()
+    finally:
+        sim.detener()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Caché de telemetría del Tello.
+
+djitellopy recibe los paquetes de estado (puerto 8890) en su propio hilo y
+guarda el último como un diccionario. En lugar de que cada función del
+loop llame get_battery()/get_height() por separado, un hilo de este módulo
+lee ese diccionario una sola vez por paquete y publica un snapshot
+inmutable con marca de tiempo. Todos los consumidores (overlay, chequeos
+de seguridad, manejadores de teclado) leen el mismo snapshot sin tocar el
+SDK en la ruta crítica.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Telemetria:
+    """Snapshot inmutable del estado del dron."""
+    timestamp: float      # time.monotonic() cuando se recibió el paquete (reloj de la reproducción con reloj virtual)
+    bateria: int          # %
+    altura: int           # cm
+    pitch: int            # grados
+    roll: int
+    yaw: int
+    vgx: int              # dm/s
+    vgy: int
+    vgz: int
+    temperatura: float    # °C (promedio de templ/temph)
+
+    def edad(self, ahora=None):
+        """Segundos transcurridos desde que se recibió el snapshot."""
+        return (time.monotonic() if ahora is None else ahora) - self.timestamp
+
+    @classmethod
+    def desde_estado(cls, estado, timestamp):
+        """Construye el snapshot a partir del diccionario de estado de djitellopy."""
+        return cls(
+            timestamp=timestamp,
+            bateria=int(estado.get('bat', 0)),
+            altura=int(estado.get('h', 0)),
+            pitch=int(estado.get('pitch', 0)),
+            roll=int(estado.get('roll', 0)),
+            yaw=int(estado.get('yaw', 0)),
+            vgx=int(estado.get('vgx', 0)),
+            vgy=int(estado.get('vgy', 0)),
+            vgz=int(estado.get('vgz', 0)),
+            temperatura=(float(estado.get('templ', 0)) + float(estado.get('temph', 0))) / 2,
+        )
+
+
+class TelemetryCache:
+    """
+    Hilo que ingiere el estado del Tello y publica el último snapshot.
+
+    periodo:  cada cuánto se revisa si llegó un paquete nuevo (el Tello
+              envía estado a ~10 Hz).
+    max_edad: segundos tras los cuales el snapshot se considera viejo.
+
+    Con un dron de reloj virtual (reproducción rápida) no hay hilo: actual()
+    ingiere el estado en el instante del reloj de la reproducción
+    (drone.ahora), igual que CommandScheduler envía de forma síncrona, para
+    que la telemetría no dependa de la velocidad de la máquina.
+    """
+
+    def __init__(self, drone, periodo=0.05, max_edad=1.0):
+        self._drone = drone
+        self._periodo = periodo
+        self.max_edad = max_edad
+        self._estado_previo = None
+        self._snapshot: Optional[Telemetria] = None
+        self._hilo = None
+        self._corriendo = False
+        self.sincrono = getattr(drone, 'reloj_virtual', False)
+        self._reloj = drone.ahora if self.sincrono else time.monotonic
+        # Callback opcional con cada snapshot nuevo (p. ej. GrabadorSesion)
+        self.al_recibir = None
+
+    def iniciar(self):
+        # Primer snapshot síncrono (connect() ya esperó el primer paquete de estado)
+        self._ingerir()
+        if self.sincrono:
+            return self
+        self._corriendo = True
+        self._hilo = threading.Thread(target=self._bucle, name="TelemetryCache", daemon=True)
+        self._hilo.start()
+        return self
+
+    def detener(self):
+        self._corriendo = False
+        if self._hilo is not None:
+            self._hilo.join(timeout=1.0)
+            self._hilo = None
+
+    def _ingerir(self):
+        estado = self._drone.get_current_state()
+        # djitellopy reemplaza el diccionario completo con cada paquete, así
+        # que basta comparar identidad para saber si llegó uno nuevo
+        if estado is self._estado_previo or not estado:
+            return
+        self._estado_previo = estado
+        self._snapshot = Telemetria.desde_estado(estado, self._reloj())
+        if self.al_recibir is not None:
+            self.al_recibir(self._snapshot)
+
+    def _bucle(self):
+        while self._corriendo:
+            try:
+                self._ingerir()
+            except Exception as e:
+                print(f"Error leyendo telemetría: {e}")
+            time.sleep(self._periodo)
+
+    def actual(self) -> Telemetria:
+        """Último snapshot recibido (puede estar viejo, ver vigente())."""
+        if self.sincrono:
+            self._ingerir()
+        return self._snapshot
+
+    def vigente(self, ahora=None):
+        """True si el snapshot actual tiene menos de max_edad segundos."""
+        snapshot = self.actual()
+        return snapshot is not None and snapshot.edad(self._reloj() if ahora is None else ahora) <= self.max_edad
@@ -0,0 +1,170 @@
+"""
+Trazas por frame: cuánto tarda cada etapa y cuánto pasa desde que un frame
+sale del decodificador hasta que su comando rc se envía al dron.
+
+Cada frame se identifica por su secuencia (la de FrameGrabber o la de
+InferenceWorker). Las etapas registran tramos (etapa, seq, inicio, fin, hilo)
+con time.monotonic:
+  - FrameGrabber registra 'decodificar' y marca el instante de captura,
+  - InferenceWorker registra 'cola:<fuente>' e 'inferencia:<fuente>' en su hilo,
+  - los scripts envuelven sus etapas con `with traza.tramo('segmentar', seq):`,
+  - CommandScheduler registra 'enviar' y, si el setpoint vino de un frame
+    (fijar(..., seq=...)), la latencia vidrio → comando de ese frame.
+
+resumen() da n, p50/p95/p99 y máximo (ms) por etapa; exportar() escribe los
+últimos tramos en formato Chrome trace (chrome://tracing o Perfetto), un
+carril por hilo y la secuencia del frame en los argumentos de cada tramo.
+
+Con activo=False tramo() regresa un contexto vacío y el costo es una llamada.
+
+    TELLO_CONFIG=p2.json  con  {"trazas": "traza_p2.json"}
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
+
+VIDRIO_A_COMANDO = 'vidrio_a_comando'
+
+
+class _Tramo:
+    __slots__ = ('_traza', '_etapa', '_seq', '_inicio')
+
+    def __init__(self, traza, etapa, seq):
+        self._traza = traza
+        self._etapa = etapa
+        self._seq = seq
+
+    def __enter__(self):
+        self._inicio = self._traza.reloj()
+        return self
+
+    def __exit__(self, *exc):
+        self._traza.registrar(self._etapa, self._seq, self._inicio, self._traza.reloj())
+
+
+class _TramoVacio:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_VACIO = _TramoVacio()
+
+
+class Trazador:
+    """
+    nombre:     proceso en el archivo de trazas.
+    activo:     si es False no se registra nada.
+    historial:  tramos guardados para exportar y duraciones por etapa para
+                los percentiles.
+    capturas:   frames recientes cuyo instante de captura se recuerda para
+                la latencia vidrio → comando.
+    """
+
+    def __init__(self, nombre="tello", activo=True, historial=20000, capturas=256, reloj=time.monotonic):
+        self.nombre = nombre
+        self.activo = activo
+        self.reloj = reloj
+        self._historial = historial
+        self._tramos = deque(maxlen=historial)        # (etapa, seq, inicio, fin, hilo)
+        self._duraciones = {}                          # etapa -> deque de segundos
+        self._capturas = OrderedDict()                 # seq -> instante de captura
+        self._max_capturas = capturas
+        self._lock = threading.Lock()
+        self._hilos = {}                               # ident -> nombre
+        self._t0 = reloj()
+
+    # -----------------------------------------------------------------
+    # Registro (cualquier hilo)
+    # -----------------------------------------------------------------
+    def tramo(self, etapa, seq=None):
+        """Contexto que registra la duración de la etapa para el frame seq."""
+        if not self.activo:
+            return _VACIO
+        return _Tramo(self, etapa, seq)
+
+    def registrar(self, etapa, seq, inicio, fin):
+        """Tramo medido por fuera (inicio y fin con self.reloj)."""
+        if not self.activo:
+            return
+        hilo = threading.get_ident()
+        with self._lock:
+            if hilo not in self._hilos:
+                self._hilos[hilo] = threading.current_thread().name
+            self._tramos.append((etapa, seq, inicio, fin, hilo))
+            duraciones = self._duraciones.get(etapa)
+            if duraciones is None:
+                duraciones = self._duraciones[etapa] = deque(maxlen=self._historial)
+            duraciones.append(fin - inicio)
+
+    def capturado(self, seq, t=None):
+        """Marca el instante en que el frame seq salió del decodificador."""
+        if not self.activo:
+            return
+        with self._lock:
+            self._capturas[seq] = self.reloj() if t is None else t
+            if len(self._capturas) > self._max_capturas:
+                self._capturas.popitem(last=False)
+
+    def comando(self, seq, inicio, fin):
+        """Envío de un comando: tramo 'enviar' y, si vino del frame seq, su latencia vidrio → comando."""
+        if not self.activo:
+            return
+        self.registrar('enviar', seq, inicio, fin)
+        if seq is None:
+            return
+        with self._lock:
+            captura = self._capturas.pop(seq, None)
+            if captura is None:
+                return
+            duraciones = self._duraciones.get(VIDRIO_A_COMANDO)
+            if duraciones is None:
+                duraciones = self._duraciones[VIDRIO_A_COMANDO] = deque(maxlen=self._historial)
+            duraciones.append(fin - captura)
+
+    # -----------------------------------------------------------------
+    # Reporte
+    # -----------------------------------------------------------------
+    def resumen(self):
+        """{etapa: {n, p50_ms, p95_ms, p99_ms, max_ms}}; vidrio_a_comando al final."""
+        with self._lock:
+            duraciones = {etapa: np.array(d) * 1000 for etapa, d in self._duraciones.items() if d}
+        r = {}
+        for etapa in sorted(duraciones, key=lambda e: e == VIDRIO_A_COMANDO):
+            ms = duraciones[etapa]
+            p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+            r[etapa] = {'n': len(ms), 'p50_ms': round(float(p50), 3), 'p95_ms': round(float(p95), 3),
+                        'p99_ms': round(float(p99), 3), 'max_ms': round(float(ms.max()), 3)}
+        return r
+
+    def tabla(self):
+        """Resumen como texto, una etapa por línea."""
+        lineas = [f"{'etapa':<18} {'n':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'máx':>9}"]
+        for etapa, r in self.resumen().items():
+            lineas.append(f"{etapa:<18} {r['n']:6d} {r['p50_ms']:7.2f}ms {r['p95_ms']:7.2f}ms "
+                          f"{r['p99_ms']:7.2f}ms {r['max_ms']:7.2f}ms")
+        return "\n".join(lineas)
+
+    def exportar(self, ruta):
+        """Escribe los tramos guardados en formato Chrome trace (JSON); regresa cuántos."""
+        with self._lock:
+            tramos = list(self._tramos)
+            hilos = dict(self._hilos)
+        eventos = [{'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': self.nombre}}]
+        eventos += [{'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': hilo, 'args': {'name': nombre}}
+                    for hilo, nombre in hilos.items()]
+        for etapa, seq, inicio, fin, hilo in tramos:
+            eventos.append({'name': etapa, 'ph': 'X', 'pid': 1, 'tid': hilo,
+                            'ts': round((inicio - self._t0) * 1e6, 1), 'dur': round((fin - inicio) * 1e6, 1),
+                            'args': {'seq': seq}})
+        with open(ruta, 'w') as f:
+            json.dump({'traceEvents': eventos, 'displayTimeUnit': 'ms'}, f)
+        return len(tramos)
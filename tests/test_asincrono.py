@@ -0,0 +1,68 @@
+import threading
+import time
+
+from tello_utils.asincrono import RuntimeAsyncio
+from tello_utils.interfaz import BucleHeadless
+
+
+class DronLento:
+    def __init__(self, despegue_s=0.3):
+        self.despegue_s = despegue_s
+        self.llamadas = []
+        self._lock = threading.Lock()
+
+    def _registrar(self, nombre):
+        with self._lock:
+            self.llamadas.append((nombre, time.perf_counter()))
+
+    def takeoff(self):
+        time.sleep(self.despegue_s)
+        self._registrar('takeoff')
+
+    def land(self):
+        self._registrar('land')
+
+
+def test_land_durante_un_takeoff_lento_queda_en_cola():
+    drone = DronLento()
+    runtime = RuntimeAsyncio(BucleHeadless())
+    terminados = []
+
+    def pedir_land():
+        # Como aterrizar() de los scripts: el takeoff todavía no regresa
+        assert runtime.accion_en_curso == 'takeoff'
+        assert runtime.accion('land', drone.land, espera_s=0.05, encolar=True,
+                              al_terminar=lambda ok: terminados.append(('land', ok))) is not None
+        # Un segundo land pendiente no se repite
+        assert runtime.accion('land', drone.land, encolar=True) is None
+
+    def al_despegar(ok):
+        # El land ya está en cola: el script no reanuda el rc
+        terminados.append(('takeoff', ok, runtime.accion_en_curso))
+
+    runtime.accion('takeoff', drone.takeoff, al_terminar=al_despegar)
+    runtime.after(50, pedir_land)
+    runtime.after(1000, runtime.detener)
+    runtime.correr()
+
+    assert [n for n, _ in drone.llamadas] == ['takeoff', 'land']
+    # El land sale tras el takeoff y su espera
+    assert drone.llamadas[1][1] - drone.llamadas[0][1] >= 0.05
+    assert terminados == [('takeoff', True, 'land'), ('land', True)]
+    assert runtime.resumen()['acciones']['land']['veces'] == 1
+
+
+def test_terminar_accion_espera_la_cola():
+    drone = DronLento(despegue_s=0.2)
+    runtime = RuntimeAsyncio(BucleHeadless())
+    try:
+        runtime.accion('takeoff', drone.takeoff)
+        runtime.accion('land', drone.land, encolar=True)
+        # Sin encolar se sigue ignorando
+        assert runtime.accion('takeoff', drone.takeoff) is None
+        runtime.terminar_accion(timeout=2.0)
+        assert [n for n, _ in drone.llamadas] == ['takeoff', 'land']
+        assert runtime.accion_en_curso is None
+    finally:
+        runtime.detener()
+        runtime.correr()
@@ -0,0 +1,38 @@
+import cv2
+import numpy as np
+import pytest
+
+from tello_utils.captura import CapturaTello, FrameGrabber
+
+
+@pytest.fixture
+def video_rojo(tmp_path):
+    """Video corto de un frame rojo puro (BGR 0, 0, 255)."""
+    ruta = str(tmp_path / "rojo.avi")
+    escritor = cv2.VideoWriter(ruta, cv2.VideoWriter_fourcc(*'MJPG'), 30, (64, 48))
+    if not escritor.isOpened():
+        pytest.skip("OpenCV sin escritor MJPG")
+    for _ in range(5):
+        escritor.write(np.full((48, 64, 3), (0, 0, 255), dtype=np.uint8))
+    escritor.release()
+    return ruta
+
+
+def test_captura_tello_entrega_rgb_como_get_frame_read(video_rojo):
+    cap = CapturaTello(video_rojo)
+    try:
+        assert cap.isOpened()
+        ok, imagen = cap.read()
+        assert ok
+        # Rojo en el canal 0, como np.array(frame.to_image()) de djitellopy
+        r, g, b = imagen[24, 32].astype(int)
+        assert r > 200 and g < 50 and b < 50
+    finally:
+        cap.release()
+
+
+def test_desde_video_conserva_bgr(video_rojo):
+    with FrameGrabber.desde_video(video_rojo, tiempo_real=False) as grabber:
+        frame = grabber.esperar(0)
+    b, g, r = frame.imagen[24, 32].astype(int)
+    assert r > 200 and g < 50 and b < 50
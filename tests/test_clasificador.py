@@ -0,0 +1,32 @@
+import cv2
+import numpy as np
+import pytest
+
+from tello_utils.clasificador import ClasificadorLUT, PRESETS_HSV
+
+VENTANAS = [(480, 640), (100, 120), (237, 301), (50, 640), (480, 640), (101, 33)]
+
+
+@pytest.fixture
+def hsv():
+    return np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("rangos", [PRESETS_HSV, {'Verde Rubix': PRESETS_HSV['Verde Rubix']}])
+def test_ventanas_de_tamano_variable_igual_que_inrange(hsv, rangos):
+    clasificador = ClasificadorLUT(rangos)
+    for h, w in VENTANAS:
+        ventana = hsv[7:7 + h, 3:3 + w] if h + 7 <= 480 and w + 3 <= 640 else hsv[:h, :w]
+        for nombre, mascara in clasificador.mascaras(ventana).items():
+            assert mascara.shape == (h, w)
+            assert np.array_equal(mascara, cv2.inRange(ventana, *rangos[nombre]))
+
+
+def test_ventanas_reutilizan_los_buffers(hsv):
+    clasificador = ClasificadorLUT(PRESETS_HSV)
+    primeras = clasificador.mascaras(hsv)
+    for h, w in VENTANAS:
+        mascaras = clasificador.mascaras(hsv[:h, :w])
+        # Vistas del mismo buffer del frame más grande: sin asignar por ventana
+        for nombre, mascara in mascaras.items():
+            assert np.shares_memory(mascara, primeras[nombre])
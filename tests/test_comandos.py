@@ -0,0 +1,107 @@
+import threading
+import time
+
+from tello_utils.comandos import ALTO, CommandScheduler
+
+
+class DronFalso:
+    """Registra cada send_rc_control; al_recibir(setpoint) corre dentro del envío."""
+
+    def __init__(self):
+        self.envios = []
+        self.al_recibir = None
+        self._lock = threading.Lock()
+
+    def send_rc_control(self, lr, fb, ud, yaw):
+        with self._lock:
+            self.envios.append((lr, fb, ud, yaw))
+        if self.al_recibir is not None:
+            self.al_recibir((lr, fb, ud, yaw))
+
+
+def esperar(condicion, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condicion() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return condicion()
+
+
+def test_pausar_durante_un_envio_no_deja_pasar_setpoints_viejos():
+    dron = DronFalso()
+    rc = CommandScheduler(dron, frecuencia=200).iniciar()
+    pausas = []
+    enviados_al_pausar = []
+
+    def pausar():
+        rc.pausar()
+        enviados_al_pausar.append(len(dron.envios))
+
+    def al_recibir(setpoint):
+        # Mientras el hilo de envío está mandando: llega un setpoint nuevo y
+        # otro hilo pide pausar()
+        if setpoint == (0, 40, 0, 0) and not pausas:
+            rc.fijar(0, 80, 0, 0)
+            hilo = threading.Thread(target=pausar)
+            hilo.start()
+            pausas.append(hilo)
+            hilo.join(timeout=0.05)
+
+    dron.al_recibir = al_recibir
+    try:
+        rc.reanudar()
+        rc.fijar(0, 40, 0, 0)
+        assert esperar(lambda: pausas)
+        pausas[0].join(timeout=2.0)
+        assert not pausas[0].is_alive()
+        time.sleep(0.05)
+    finally:
+        rc.detener()
+    # Cuando pausar() regresa su hover ya salió y es lo último que recibe el
+    # dron: el setpoint que llegó durante el envío puede salir antes, no después
+    n = enviados_al_pausar[0]
+    assert dron.envios[n - 1] == ALTO
+    assert dron.envios[n:] == []
+    assert dron.envios.index((0, 40, 0, 0)) < n - 1
+
+
+def test_pausar_en_carrera_con_fijar():
+    dron = DronFalso()
+    rc = CommandScheduler(dron, frecuencia=1000, keepalive=0.001).iniciar()
+    corriendo = True
+
+    def productor():
+        i = 0
+        while corriendo:
+            i += 1
+            rc.fijar(0, 0, 0, 10 + i % 50)
+            time.sleep(0.0001)
+
+    hilo = threading.Thread(target=productor, daemon=True)
+    hilo.start()
+    try:
+        for _ in range(100):
+            rc.reanudar()
+            time.sleep(0.002)
+            rc.pausar()
+            n = len(dron.envios)
+            assert dron.envios[n - 1] == ALTO
+            time.sleep(0.003)
+            assert dron.envios[n:] == []
+    finally:
+        corriendo = False
+        hilo.join()
+        rc.detener()
+
+
+def test_fijar_coalesce_hasta_el_siguiente_tick():
+    dron = DronFalso()
+    rc = CommandScheduler(dron, frecuencia=20).iniciar()
+    try:
+        rc.reanudar()
+        rc.fijar(10, 0, 0, 0)
+        rc.fijar(20, 0, 0, 0)
+        time.sleep(0.15)
+        assert dron.envios[-1] == (20, 0, 0, 0)
+        assert (10, 0, 0, 0) not in dron.envios
+    finally:
+        rc.detener()
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from tello_utils import gestos
+from tello_utils.gestos import INDICE, MEDIO, ANULAR, MENIQUE, PULGAR, TABLA
+
+
+def mano_con_mascara(mascara, rng):
+    """Landmarks con la interfaz de MediaPipe cuyos dedos extendidos son los de la máscara."""
+    pts = rng.uniform(0.3, 0.7, size=(21, 3)).astype(np.float32)
+    for punta, bit in ((8, INDICE), (12, MEDIO), (16, ANULAR), (20, MENIQUE)):
+        pts[punta, 1] = pts[punta - 2, 1] + (-0.05 if mascara & bit else 0.05)
+    pts[gestos.THUMB_TIP, 0] = pts[gestos.THUMB_IP, 0] + (-0.05 if mascara & PULGAR else 0.05)
+    return SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in pts])
+
+
+def test_clasificar_mano_coincide_con_el_lote():
+    rng = np.random.default_rng(0)
+    manos = [mano_con_mascara(m, rng) for m in range(32) for _ in range(3)]
+    lote = gestos.clasificar(gestos.landmarks_array(manos))
+    assert [gestos.mascara_mano(m.landmark) for m in manos] == [m for m in range(32) for _ in range(3)]
+    assert [gestos.clasificar_mano(m.landmark) for m in manos] == lote
+    assert [TABLA[m] for m in range(32) for _ in range(3)] == lote
+
+
+def fraccion(votos, gesto, t, ventana_s):
+    en_ventana = [g for tv, g in votos if t - ventana_s <= tv <= t]
+    return en_ventana.count(gesto) / len(en_ventana)
+
+
+def test_filtro_suelta_el_gesto_tras_liberacion_s():
+    filtro = gestos.FiltroGestos(ventana_s=0.5, confirmacion_s=0.25, entrada=0.6, salida=0.35, liberacion_s=0.2)
+    votos, t_confirmado, t_suelto = [], None, None
+    for i in range(90):
+        t = i / 30
+        gesto = gestos.PUNO if t < 1.0 else None
+        votos.append((t, gesto))
+        if filtro.actualizar(gesto, t):
+            if filtro.confirmado is gestos.PUNO:
+                t_confirmado = t
+            else:
+                assert filtro.confirmado is None and t_suelto is None
+                t_suelto = t
+    assert t_confirmado is not None and t_confirmado < 1.0
+    # Primer frame por debajo de `salida` y, desde ahí, liberacion_s completos
+    t_debajo = next(t for t, _ in votos if t >= 1.0 and fraccion(votos, gestos.PUNO, t, 0.5) < 0.35)
+    assert t_suelto == next(t for t, _ in votos if t - t_debajo >= 0.2)
+    assert filtro.candidato is None and filtro.transiciones == 2
+
+
+def test_filtro_aguanta_una_interrupcion_breve():
+    filtro = gestos.FiltroGestos(ventana_s=0.5, confirmacion_s=0.25, entrada=0.6, salida=0.35, liberacion_s=0.2)
+    for i in range(90):
+        t = i / 30
+        # Puño con 0.2 s sin mano a la mitad: no llega a soltarse
+        gesto = None if 1.0 <= t < 1.2 else gestos.PUNO
+        filtro.actualizar(gesto, t)
+        if t > 0.5:
+            assert filtro.confirmado is gestos.PUNO
+    assert filtro.transiciones == 1
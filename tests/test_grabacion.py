@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from tello_utils.grabacion import (GrabadorSesion, LectorSesion, FRAME, HUECO, CANAL_DRON, CANAL_GESTOS,
+                                   MOTIVO_ANCHO, MOTIVO_COLA)
+
+
+def imagen(i):
+    return np.full((24, 32, 3), i % 256, dtype=np.uint8)
+
+
+@pytest.fixture
+def ruta(tmp_path):
+    return str(tmp_path / "sesion.tlog")
+
+
+def test_frame_en_por_canal(ruta):
+    grabador = GrabadorSesion(ruta, sin_descartes=True, max_bytes_s=1e12).iniciar()
+    for i in range(60):
+        grabador.frame(imagen(i), 100.0 + i * 0.1, CANAL_DRON, copiar=False)
+        if i % 3 == 0:
+            grabador.frame(imagen(200 + i), 100.0 + i * 0.1 + 0.05, CANAL_GESTOS, copiar=False)
+    grabador.detener()
+
+    with LectorSesion(ruta) as lector:
+        assert lector.frame_en(99.0) is None
+        for t in (100.0, 100.04, 100.55, 103.3, 200.0):
+            esperado = max(i for i in range(60) if 100.0 + i * 0.1 <= t + 1e-9)
+            r = lector.frame_en(t)
+            assert r.canal == CANAL_DRON
+            assert r.timestamp == pytest.approx(100.0 + esperado * 0.1)
+            assert int(r.datos[0, 0, 0]) == pytest.approx(esperado, abs=2)
+        r = lector.frame_en(100.36, CANAL_GESTOS)
+        assert r.canal == CANAL_GESTOS and r.timestamp == pytest.approx(100.35)
+        assert lector.frame_en(100.0, CANAL_GESTOS) is None
+
+
+def test_cola_llena_deja_huecos(ruta):
+    grabador = GrabadorSesion(ruta, cola=2, max_bytes_s=1e12)
+    # Sin hilo de escritura todavía: solo caben 2 frames
+    resultados = [grabador.frame(imagen(i), 10.0 + i, copiar=False) for i in range(5)]
+    assert resultados == [True, True, False, False, False]
+    grabador.iniciar()
+    grabador.detener()
+    assert grabador.resumen()['descartados'] == 3
+    assert grabador.resumen()['huecos'] == 3
+
+    with LectorSesion(ruta) as lector:
+        assert [r.timestamp for r in lector.registros(tipo=FRAME)] == [10.0, 11.0]
+        assert lector.huecos() == [(12.0, FRAME, CANAL_DRON, MOTIVO_COLA), (13.0, FRAME, CANAL_DRON, MOTIVO_COLA),
+                                   (14.0, FRAME, CANAL_DRON, MOTIVO_COLA)]
+
+
+def test_ancho_de_banda_deja_huecos(ruta):
+    grabador = GrabadorSesion(ruta, max_bytes_s=1, cola=16)
+    for i in range(4):
+        grabador.frame(imagen(i), 10.0 + i, copiar=False)
+    grabador.iniciar()
+    grabador.detener()
+    assert grabador.omitidos == 3
+
+    with LectorSesion(ruta) as lector:
+        assert len(list(lector.registros(tipo=FRAME))) == 1
+        assert [(t, m) for t, _, _, m in lector.huecos(tipo=FRAME)] == [(11.0, MOTIVO_ANCHO), (12.0, MOTIVO_ANCHO),
+                                                                       (13.0, MOTIVO_ANCHO)]
+        assert len(list(lector.registros(tipo=HUECO))) == 3
+
+
+def test_sin_descartes_graba_todo(ruta):
+    grabador = GrabadorSesion(ruta, cola=1, max_bytes_s=1, sin_descartes=True).iniciar()
+    for i in range(50):
+        assert grabador.frame(imagen(i), 10.0 + i, copiar=False)
+    grabador.detener()
+    assert grabador.resumen()['huecos'] == 0
+
+    with LectorSesion(ruta) as lector:
+        assert len(list(lector.registros(tipo=FRAME))) == 50
+        assert lector.huecos() == []
@@ -0,0 +1,27 @@
+import pytest
+
+from tello_utils.kalman import FiltroKalmanObjetivo
+
+
+def test_reengancha_con_la_primera_medicion_tras_un_hueco():
+    filtro = FiltroKalmanObjetivo(max_prediccion=0.5)
+    for i in range(10):
+        filtro.corregir(100.0 + i, 200.0, 5000.0, i * 0.033)
+    assert filtro.predecir(0.4) is not None
+
+    # Objetivo perdido 2 s; vuelve en otra posición
+    estimacion = filtro.corregir(400.0, 50.0, 9000.0, 2.3)
+    assert estimacion is not None
+    assert (estimacion.cx, estimacion.cy, estimacion.area) == (400.0, 50.0, 9000.0)
+    assert (estimacion.vx, estimacion.vy, estimacion.va) == (0.0, 0.0, 0.0)
+    assert estimacion.edad == 0.0
+    # Y sigue corrigiendo normalmente
+    assert filtro.corregir(401.0, 50.0, 9000.0, 2.333).cx == pytest.approx(401.0, abs=1.0)
+
+
+def test_hueco_dentro_de_max_prediccion_corrige():
+    filtro = FiltroKalmanObjetivo(max_prediccion=0.5)
+    filtro.corregir(100.0, 100.0, 5000.0, 0.0)
+    filtro.corregir(110.0, 100.0, 5000.0, 0.1)
+    estimacion = filtro.corregir(130.0, 100.0, 5000.0, 0.4)
+    assert estimacion is not None and estimacion.vx > 0
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from tello_utils.grabacion import GrabadorSesion, CANAL_DRON, CANAL_GESTOS
+from tello_utils.reproduccion import DronReproducido
+from tello_utils.telemetria import Telemetria, TelemetryCache
+
+
+def imagen(i):
+    return np.full((24, 32, 3), i % 256, dtype=np.uint8)
+
+
+@pytest.fixture
+def ruta(tmp_path):
+    """Sesión de 3 s: frames del dron a 10 Hz, de gestos a 5 Hz y telemetría con bateria = decisegundo."""
+    ruta = str(tmp_path / "sesion.tlog")
+    grabador = GrabadorSesion(ruta, sin_descartes=True, max_bytes_s=1e12).iniciar()
+    for i in range(30):
+        t = 100.0 + i * 0.1
+        grabador.telemetria(Telemetria(t, i, 0, 0, 0, 0, 0, 0, 0, 20.0))
+        grabador.frame(imagen(i), t, CANAL_DRON, copiar=False)
+        if i % 2 == 0:
+            grabador.frame(imagen(100 + i), t + 0.05, CANAL_GESTOS, copiar=False)
+    grabador.detener()
+    return ruta
+
+
+def test_leer_gestos_no_mueve_el_reloj_del_dron(ruta):
+    dron = DronReproducido(ruta, tiempo_real=False)
+    video = dron.abrir_captura(CANAL_DRON, avanza_reloj=False)
+    gestos = dron.abrir_captura(CANAL_GESTOS)
+    try:
+        for _ in range(3):
+            assert video.read()[0]
+        for _ in range(10):
+            assert gestos.read()[0]
+        # El canal de gestos va en 101.85; el frame publicado del dron sigue siendo el tercero
+        assert dron.publicar_frame() == pytest.approx(100.2)
+        assert dron.publicar_frame(CANAL_GESTOS) == pytest.approx(101.85)
+    finally:
+        dron.end()
+
+
+def test_telemetria_sigue_el_reloj_virtual(ruta):
+    dron = DronReproducido(ruta, tiempo_real=False)
+    cache = TelemetryCache(dron, max_edad=0.5).iniciar()
+    video = dron.abrir_captura(CANAL_DRON, avanza_reloj=False)
+    try:
+        assert cache.sincrono and cache._hilo is None
+        for i in range(30):
+            assert video.read()[0]
+            dron.publicar_frame()
+            snapshot = cache.actual()
+            # Determinista: el snapshot del mismo instante de la sesión, sin importar la velocidad
+            assert snapshot.bateria == i
+            assert snapshot.timestamp == pytest.approx(100.0 + i * 0.1)
+            assert cache.vigente()
+        assert not cache.vigente(ahora=dron.ahora() + 1.0)
+    finally:
+        cache.detener()
+        dron.end()
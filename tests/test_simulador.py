@@ -0,0 +1,35 @@
+import time
+
+import pytest
+
+from tello_utils.conexion import crear_dron
+from tello_utils.simulador import SimuladorTello
+
+pytest.importorskip('djitellopy')
+
+
+def esperar(condicion, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condicion() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condicion()
+
+
+def test_crear_dron_se_conecta_al_simulador(monkeypatch):
+    monkeypatch.setenv('TELLO_SIMULADOR', '1')
+    monkeypatch.delenv('TELLO_REPRODUCIR', raising=False)
+    with SimuladorTello(video=False) as sim:
+        # El cliente real de djitellopy: su socket en ("", 8889) no choca con el simulador
+        drone = crear_dron()
+        try:
+            drone.connect()
+            assert drone.get_battery() == 100
+            drone.takeoff()
+            assert sim.volando and drone.get_height() > 0
+            drone.send_rc_control(0, 0, 0, 50)
+            assert esperar(lambda: sim.rc == (0, 0, 0, 50))
+            drone.land()
+            # El simulador baja a VEL_MAX_CM_S hasta tocar el suelo
+            assert esperar(lambda: not sim.volando)
+        finally:
+            drone.end()